@@ -0,0 +1,35 @@
+"""
+Admin Controller
+
+Operational endpoints that are not part of the public OpenAPI contract.
+"""
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from api.dependencies import get_exercise_catalog
+from infrastructure.catalog import ExerciseCatalog
+from infrastructure.config.settings import get_settings
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], include_in_schema=False)
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Allow the request only with the configured ADMIN_TOKEN"""
+    expected = get_settings().admin_token
+    if not expected:
+        # Admin endpoints are disabled unless a token is configured
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@router.post("/catalog/reload", dependencies=[Depends(require_admin_token)])
+async def reload_exercise_catalog(
+    catalog: ExerciseCatalog = Depends(get_exercise_catalog),
+) -> dict:
+    """Reload the in-memory exercise catalog from MongoDB"""
+    snapshot = await catalog.reload()
+    return {"version": snapshot.version, "exercises": len(snapshot)}
@@ -0,0 +1,34 @@
+"""API dependencies package"""
+from .container import (
+    COUNT_CACHE,
+    DASHBOARD_CACHE,
+    Container,
+    build_container,
+    container,
+    get_authentication_api,
+    get_exercise_catalog,
+    get_exercises_api,
+    get_mesocycles_api,
+    get_progress_api,
+    get_progression_api,
+    get_tracking_api,
+    get_users_api,
+    get_workouts_api,
+)
+
+__all__ = [
+    "COUNT_CACHE",
+    "DASHBOARD_CACHE",
+    "Container",
+    "build_container",
+    "container",
+    "get_authentication_api",
+    "get_exercise_catalog",
+    "get_exercises_api",
+    "get_mesocycles_api",
+    "get_progress_api",
+    "get_progression_api",
+    "get_tracking_api",
+    "get_users_api",
+    "get_workouts_api",
+]
@@ -0,0 +1,312 @@
+"""
+Dependency Container
+
+Builds repositories and API implementations once per process and hands
+them to the generated routers through FastAPI dependencies.
+"""
+from typing import Any, Callable, Dict, Hashable
+
+from fastapi import HTTPException
+
+from infrastructure.cache import (
+    CachedUserRepository,
+    TTLCache,
+    UsernameFilter,
+    VersionedCache,
+)
+from infrastructure.catalog import ExerciseCatalog
+from infrastructure.config.database import get_database_config
+from infrastructure.config.settings import get_settings
+from infrastructure.security import PasswordHasher, TokenVerifier
+from infrastructure.persistence.repositories import (
+    ExerciseRepository,
+    ExerciseStateRepository,
+    MesocycleRepository,
+    MirroredProgressRepository,
+    ProgressRepository,
+    TimeSeriesProgressRepository,
+    TrainingSessionRepository,
+    UserRepository,
+    VersionCounterRepository,
+    WeeklyRollupRepository,
+    WorkoutRepository,
+)
+from openapi_server.apis.authentication_api_base import BaseAuthenticationApi
+from openapi_server.apis.exercises_api_base import BaseExercisesApi
+from openapi_server.apis.mesocycles_api_base import BaseMesocyclesApi
+from openapi_server.apis.progress_api_base import BaseProgressApi
+from openapi_server.apis.progression_api_base import BaseProgressionApi
+from openapi_server.apis.tracking_api_base import BaseTrackingApi
+from openapi_server.apis.users_api_base import BaseUsersApi
+from openapi_server.apis.workouts_api_base import BaseWorkoutsApi
+from openapi_server.utils.auth import ALGORITHM, SECRET_KEY
+
+
+Provider = Callable[["Container"], Any]
+
+# Progress repository per ``progress_backend`` setting
+PROGRESS_BACKENDS = {
+    "collection": ProgressRepository,
+    "dual": MirroredProgressRepository,
+    "timeseries": TimeSeriesProgressRepository,
+}
+
+# Keys for shared services that are not identified by a class
+COUNT_CACHE = "count_cache"
+DASHBOARD_CACHE = "dashboard_cache"
+
+
+class Container:
+    """Process-wide registry of lazily built singletons.
+    
+    Each key maps to a provider that receives the container, so providers
+    can resolve their own dependencies. A provider runs at most once; later
+    lookups are a single dict access.
+    """
+    
+    def __init__(self):
+        self._providers: Dict[Hashable, Provider] = {}
+        self._instances: Dict[Hashable, Any] = {}
+    
+    def register(self, key: Hashable, provider: Provider) -> None:
+        """Register (or replace) the provider for a key"""
+        self._providers[key] = provider
+        self._instances.pop(key, None)
+    
+    def resolve(self, key: Hashable) -> Any:
+        """Return the singleton for a key, building it on first use"""
+        try:
+            return self._instances[key]
+        except KeyError:
+            pass
+        instance = self._providers[key](self)
+        self._instances[key] = instance
+        return instance
+    
+    def reset(self) -> None:
+        """Drop every built instance (e.g. after the database is closed)"""
+        self._instances.clear()
+    
+    @property
+    def database(self):
+        """Database of the process-wide MongoDB client"""
+        return get_database_config().database
+
+
+def _implementation(base: type) -> type:
+    """Concrete implementation registered for a generated Base*Api class"""
+    if not base.subclasses:
+        raise HTTPException(status_code=500, detail="Not implemented")
+    return base.subclasses[0]
+
+
+def _exercise_source(c: Container) -> Any:
+    """In-memory catalog or the MongoDB repository, per settings"""
+    if get_settings().exercise_catalog_enabled:
+        return c.resolve(ExerciseCatalog)
+    return c.resolve(ExerciseRepository)
+
+
+def _user_source(c: Container) -> Any:
+    """Cached or plain user repository, per settings"""
+    if get_settings().user_cache_enabled:
+        return c.resolve(CachedUserRepository)
+    return c.resolve(UserRepository)
+
+
+def build_container() -> Container:
+    """Create a container with every repository and API implementation"""
+    c = Container()
+    
+    # Shared services
+    c.register(COUNT_CACHE, lambda c: TTLCache(
+        get_settings().count_cache_ttl_seconds,
+        get_settings().count_cache_max_entries,
+    ))
+    
+    # Repositories
+    c.register(
+        UserRepository,
+        lambda c: UserRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(CachedUserRepository, lambda c: CachedUserRepository(
+        c.resolve(UserRepository),
+        get_settings().user_cache_ttl_seconds,
+        get_settings().user_cache_version_ttl_seconds,
+        get_settings().user_cache_max_entries,
+    ))
+    c.register(
+        ExerciseRepository,
+        lambda c: ExerciseRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(
+        MesocycleRepository,
+        lambda c: MesocycleRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(
+        WorkoutRepository,
+        lambda c: WorkoutRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(
+        ProgressRepository,
+        lambda c: ProgressRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(
+        TimeSeriesProgressRepository,
+        lambda c: TimeSeriesProgressRepository(c.database, c.resolve(COUNT_CACHE)),
+    )
+    c.register(
+        MirroredProgressRepository,
+        lambda c: MirroredProgressRepository(
+            c.resolve(ProgressRepository),
+            c.resolve(TimeSeriesProgressRepository),
+        ),
+    )
+    c.register(
+        TrainingSessionRepository,
+        lambda c: TrainingSessionRepository(c.database),
+    )
+    c.register(
+        ExerciseStateRepository,
+        lambda c: ExerciseStateRepository(c.database),
+    )
+    c.register(
+        WeeklyRollupRepository,
+        lambda c: WeeklyRollupRepository(c.database),
+    )
+    c.register(
+        VersionCounterRepository,
+        lambda c: VersionCounterRepository(c.database),
+    )
+    c.register(
+        ExerciseCatalog,
+        lambda c: ExerciseCatalog(c.resolve(ExerciseRepository)),
+    )
+    c.register(UsernameFilter, lambda c: UsernameFilter(
+        c.resolve(UserRepository),
+        get_settings().username_filter_capacity,
+        get_settings().username_filter_error_rate,
+    ))
+    c.register(PasswordHasher, lambda c: PasswordHasher(
+        get_settings().bcrypt_rounds,
+        get_settings().password_hash_workers,
+        get_settings().password_hash_max_pending,
+    ))
+    # Same key and algorithm create_access_token signs with
+    c.register(TokenVerifier, lambda c: TokenVerifier(
+        SECRET_KEY,
+        ALGORITHM,
+        get_settings().token_cache_max_entries,
+    ))
+    c.register(DASHBOARD_CACHE, lambda c: VersionedCache(
+        c.resolve(VersionCounterRepository),
+        "dashboard",
+        get_settings().dashboard_version_ttl_seconds,
+        get_settings().dashboard_cache_max_entries,
+    ))
+    
+    # API implementations
+    c.register(
+        BaseAuthenticationApi,
+        lambda c: _implementation(BaseAuthenticationApi)(
+            _user_source(c),
+            c.resolve(PasswordHasher),
+            c.resolve(UsernameFilter),
+        ),
+    )
+    c.register(
+        BaseExercisesApi,
+        lambda c: _implementation(BaseExercisesApi)(
+            _exercise_source(c),
+            estimated_totals=get_settings().list_estimated_totals,
+        ),
+    )
+    c.register(
+        BaseMesocyclesApi,
+        lambda c: _implementation(BaseMesocyclesApi)(
+            c.resolve(MesocycleRepository),
+            estimated_totals=get_settings().list_estimated_totals,
+            exercises=_exercise_source(c),
+            rollups=c.resolve(WeeklyRollupRepository),
+            dashboard_cache=c.resolve(DASHBOARD_CACHE),
+        ),
+    )
+    c.register(
+        BaseProgressApi,
+        lambda c: _implementation(BaseProgressApi)(
+            c.resolve(PROGRESS_BACKENDS[get_settings().progress_backend]),
+            estimated_totals=get_settings().list_estimated_totals,
+        ),
+    )
+    c.register(BaseProgressionApi, lambda c: _implementation(BaseProgressionApi)())
+    c.register(
+        BaseTrackingApi,
+        lambda c: _implementation(BaseTrackingApi)(
+            c.resolve(TrainingSessionRepository),
+            c.resolve(MesocycleRepository),
+            c.resolve(ExerciseStateRepository),
+            exercises=_exercise_source(c),
+            rollups=c.resolve(WeeklyRollupRepository),
+            dashboard_cache=c.resolve(DASHBOARD_CACHE),
+        ),
+    )
+    c.register(
+        BaseUsersApi,
+        lambda c: _implementation(BaseUsersApi)(
+            _user_source(c),
+        ),
+    )
+    c.register(
+        BaseWorkoutsApi,
+        lambda c: _implementation(BaseWorkoutsApi)(
+            c.resolve(WorkoutRepository),
+            estimated_totals=get_settings().list_estimated_totals,
+            mesocycles=c.resolve(MesocycleRepository),
+            rollups=c.resolve(WeeklyRollupRepository),
+            dashboard_cache=c.resolve(DASHBOARD_CACHE),
+        ),
+    )
+    
+    return c
+
+
+container = build_container()
+
+
+# FastAPI dependencies. They are coroutines so FastAPI calls them inline
+# instead of dispatching a plain function to its threadpool.
+
+async def get_exercise_catalog() -> ExerciseCatalog:
+    return container.resolve(ExerciseCatalog)
+
+
+async def get_authentication_api() -> BaseAuthenticationApi:
+    return container.resolve(BaseAuthenticationApi)
+
+
+async def get_exercises_api() -> BaseExercisesApi:
+    return container.resolve(BaseExercisesApi)
+
+
+async def get_mesocycles_api() -> BaseMesocyclesApi:
+    return container.resolve(BaseMesocyclesApi)
+
+
+async def get_progress_api() -> BaseProgressApi:
+    return container.resolve(BaseProgressApi)
+
+
+async def get_progression_api() -> BaseProgressionApi:
+    return container.resolve(BaseProgressionApi)
+
+
+async def get_tracking_api() -> BaseTrackingApi:
+    return container.resolve(BaseTrackingApi)
+
+
+async def get_users_api() -> BaseUsersApi:
+    return container.resolve(BaseUsersApi)
+
+
+async def get_workouts_api() -> BaseWorkoutsApi:
+    return container.resolve(BaseWorkoutsApi)
@@ -0,0 +1,87 @@
+"""
+Benchmark: in-memory exercise catalog reads
+
+Builds a catalog the size of the real one (~450 exercises) and reports the
+per-call latency of the read paths the exercises API uses. Every read is
+served from the snapshot, so there is no database round trip to measure;
+the target is well under 100 µs per call.
+
+No MongoDB server is needed.
+
+    PYTHONPATH=src:. python benchmarks/bench_catalog.py
+"""
+import asyncio
+import random
+import time
+
+from domain.entities import Exercise, ExerciseType, MuscleGroup
+from domain.repositories import ReadProfile
+from infrastructure.catalog import ExerciseCatalog
+
+EXERCISES = 450
+ITERATIONS = 20_000
+LEVELS = ("beginner", "intermediate", "advanced")
+
+
+class SyntheticSource:
+    """Catalog source with generated exercises"""
+
+    def __init__(self, size: int):
+        rng = random.Random(7)
+        groups, types = list(MuscleGroup), list(ExerciseType)
+        self.exercises = [
+            Exercise(
+                id=i,
+                name=f"Ejercicio {rng.randrange(10_000):04d}",
+                number=str(i),
+                muscle_group=rng.choice(groups),
+                primary_muscles=["musculo principal"],
+                type=rng.choice(types),
+                secondary_muscles=["musculo secundario"] if i % 2 else [],
+                execution="Descripcion de la ejecucion " * 8,
+                difficulty=rng.choice(LEVELS),
+            )
+            for i in range(1, size + 1)
+        ]
+
+    async def load_all(self):
+        return self.exercises
+
+    async def fingerprint(self):
+        return str(len(self.exercises))
+
+
+async def timed(label: str, make_call, iterations: int = ITERATIONS) -> None:
+    for _ in range(min(iterations, 100)):
+        await make_call()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await make_call()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed / iterations * 1e6:>10.2f}")
+
+
+async def main() -> None:
+    catalog = ExerciseCatalog(SyntheticSource(EXERCISES))
+    start = time.perf_counter()
+    await catalog.reload()
+    print(f"snapshot build: {(time.perf_counter() - start) * 1e3:.2f} ms for {EXERCISES} exercises\n")
+
+    cursor = (await catalog.find_page(limit=20)).next_cursor
+
+    print(f"{'read':<34}{'µs/call':>10}")
+    await timed("find_by_id", lambda: catalog.find_by_id(123))
+    await timed("page with total (summary)", lambda: catalog.find_page_with_total(
+        limit=20, offset=100, profile=ReadProfile.SUMMARY))
+    await timed("page with total, group+type", lambda: catalog.find_page_with_total(
+        MuscleGroup.BACK, ExerciseType.CABLE, limit=20, profile=ReadProfile.SUMMARY))
+    await timed("cursor page (summary)", lambda: catalog.find_page(
+        limit=20, cursor=cursor, profile=ReadProfile.SUMMARY))
+    await timed("recommended by muscle group", lambda: catalog.find_recommended_by_muscle_group(
+        MuscleGroup.LEGS, "advanced"))
+    await timed("count, group filter", lambda: catalog.count(MuscleGroup.ABS))
+    await timed("reload (full rebuild)", catalog.reload, iterations=20)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark: per-request impl dispatch
+
+Compares the old router pattern (``BaseXApi.subclasses[0]()`` on every
+request, which also rebuilt the repository) with resolving the singleton
+from the dependency container. Reports time and allocations per request.
+
+No MongoDB server is needed: Motor clients connect lazily.
+
+    PYTHONPATH=src:. python benchmarks/bench_dispatch.py
+"""
+import timeit
+import tracemalloc
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from api.dependencies import build_container
+from infrastructure.persistence.repositories import MesocycleRepository
+from openapi_server.apis.mesocycles_api_base import BaseMesocyclesApi
+import openapi_server.impl  # noqa: F401  (registers the impl subclasses)
+
+ITERATIONS = 200_000
+
+
+def main() -> None:
+    client = AsyncIOMotorClient("mongodb://localhost:27017", uuidRepresentation="standard")
+    database = client.mesocycle_planner
+
+    def per_request():
+        # What every request used to do
+        impl_cls = BaseMesocyclesApi.subclasses[0]
+        return impl_cls(MesocycleRepository(database))
+
+    container = build_container()
+    container.register(MesocycleRepository, lambda c: MesocycleRepository(database))
+
+    def singleton():
+        return container.resolve(BaseMesocyclesApi)
+
+    print(f"{'strategy':<14}{'ns/request':>12}{'bytes/request':>16}{'blocks/request':>16}")
+    for name, fn in (("per-request", per_request), ("container", singleton)):
+        fn()  # warm up
+        seconds = min(timeit.repeat(fn, number=ITERATIONS, repeat=5))
+
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+        kept = [fn() for _ in range(1000)]
+        snapshot_after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats = snapshot_after.compare_to(snapshot_before, "filename")
+        size = sum(s.size_diff for s in stats) - sum(
+            s.size_diff for s in stats if s.traceback[0].filename == __file__
+        )
+        blocks = sum(s.count_diff for s in stats) - sum(
+            s.count_diff for s in stats if s.traceback[0].filename == __file__
+        )
+        del kept
+
+        print(f"{name:<14}{seconds / ITERATIONS * 1e9:>12.0f}{size / 1000:>16.0f}{blocks / 1000:>16.1f}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: deep-page listing, skip/limit vs keyset cursor
+
+Seeds one user with many mesocycles and times fetching the page at several
+depths, once with ``offset`` (skip) and once by resuming from the cursor of
+the previous page. Skip latency grows with depth; keyset stays flat.
+
+Needs MongoDB at ``MONGODB_URL``; uses the ``mesocycle_planner_bench``
+database and drops it when done.
+
+    PYTHONPATH=src:. python benchmarks/bench_pagination.py [documents]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.pagination import encode_cursor
+from infrastructure.persistence.repositories import MesocycleRepository
+
+DATABASE = "mesocycle_planner_bench"
+LIMIT = 20
+ROUNDS = 20
+
+
+async def seed(collection, user_id, documents: int) -> None:
+    start = datetime(2020, 1, 1)
+    batch = []
+    for i in range(documents):
+        batch.append({
+            "_id": uuid4(),
+            "user_id": user_id,
+            "name": f"Mesocycle {i}",
+            "periodization_model": "linear",
+            "goal": "strength",
+            "duration_weeks": 8,
+            "start_date": start,
+            "end_date": start + timedelta(weeks=8),
+            "status": "completed",
+            "training_level": "intermediate",
+            "weekly_frequency": 4,
+            "deload_weeks": [],
+            # Clusters of equal timestamps exercise the _id tie-break
+            "created_at": start + timedelta(minutes=i // 3),
+            "updated_at": start,
+        })
+        if len(batch) == 5_000:
+            await collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+
+
+async def timed(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+async def main(documents: int) -> None:
+    config = MongoDBConfig(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), DATABASE)
+    await config.connect()
+    db = config.database
+    await db.mesocycles.drop()
+    user_id = uuid4()
+    try:
+        await apply_index_migrations(db)
+        await seed(db.mesocycles, user_id, documents)
+        repository = MesocycleRepository(db)
+
+        print(f"{documents} documents, limit {LIMIT}, median of {ROUNDS}")
+        print(f"{'page':>8}{'skip ms':>12}{'keyset ms':>12}")
+        depth = 1
+        while depth * LIMIT < documents:
+            offset = (depth - 1) * LIMIT
+            # Cursor of the previous page, as a client following next_cursor holds it
+            cursor = None
+            if offset:
+                prev = await db.mesocycles.find({"user_id": user_id}).sort(
+                    [("created_at", -1), ("_id", -1)]
+                ).skip(offset - 1).limit(1).to_list(length=1)
+                cursor = encode_cursor("created_at", prev[0]["created_at"], prev[0]["_id"])
+
+            skip_ms = await timed(lambda: repository.find_page_by_user_id(user_id, limit=LIMIT, offset=offset))
+            keyset_ms = await timed(lambda: repository.find_page_by_user_id(user_id, limit=LIMIT, cursor=cursor))
+            print(f"{depth:>8}{skip_ms:>12.2f}{keyset_ms:>12.2f}")
+            depth *= 4
+    finally:
+        await config.client.drop_database(DATABASE)
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
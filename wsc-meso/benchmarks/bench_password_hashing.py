@@ -0,0 +1,92 @@
+"""
+Benchmark: logins/s and latency of other requests during a login burst
+
+Runs ``CLIENTS`` concurrent clients that log in back to back for a few
+seconds, while a probe stands in for unrelated endpoints: every 5 ms it
+awaits one event loop turn and records how long that took. Compares
+checking the password inline on the event loop (as before) with the
+bounded ``PasswordHasher`` pool; logins the pool rejects (503) are
+counted apart. Uses no database and the configured bcrypt cost unless
+one is given.
+
+    PYTHONPATH=src:. python benchmarks/bench_password_hashing.py [rounds]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from infrastructure.config.settings import get_settings
+from infrastructure.security import HasherBusyError, PasswordHasher, hash_password, verify_password
+
+CLIENTS = 32
+SECONDS = 5.0
+PROBE_INTERVAL = 0.005
+
+
+def percentile(samples, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def probe(latencies, stop: asyncio.Event) -> None:
+    """Unrelated endpoint: time one trip through the event loop"""
+    while not stop.is_set():
+        began = time.perf_counter()
+        await asyncio.sleep(0)
+        latencies.append((time.perf_counter() - began) * 1000)
+        await asyncio.sleep(PROBE_INTERVAL)
+
+
+async def run(verify) -> tuple:
+    """Logins completed and rejected per second, and probe latencies"""
+    hashed = hash_password("s3cret", ROUNDS)
+    counts = {"ok": 0, "busy": 0}
+    latencies = []
+    stop = asyncio.Event()
+
+    async def client() -> None:
+        while not stop.is_set():
+            try:
+                assert await verify("s3cret", hashed)
+                counts["ok"] += 1
+                # Next request: the response and the new request go through the loop
+                await asyncio.sleep(0)
+            except HasherBusyError:
+                counts["busy"] += 1
+                # A client honouring Retry-After would back off longer
+                await asyncio.sleep(0.05)
+
+    tasks = [asyncio.create_task(client()) for _ in range(CLIENTS)]
+    tasks.append(asyncio.create_task(probe(latencies, stop)))
+    began = time.perf_counter()
+    await asyncio.sleep(SECONDS)
+    stop.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - began
+    return counts["ok"] / elapsed, counts["busy"] / elapsed, latencies
+
+
+async def inline(plain_password: str, hashed_password: str) -> bool:
+    """Baseline: bcrypt on the event loop thread"""
+    return verify_password(plain_password, hashed_password)
+
+
+async def main() -> None:
+    settings = get_settings()
+    hasher = PasswordHasher(ROUNDS, settings.password_hash_workers, settings.password_hash_max_pending)
+    print(f"bcrypt cost {ROUNDS}, {CLIENTS} clients for {SECONDS:.0f} s, {os.cpu_count()} CPUs, "
+          f"pool of {hasher.workers} (max {hasher.max_pending} pending)")
+    print(f"{'mode':>8}{'logins/s':>10}{'503/s':>8}{'probe p50 ms':>14}{'p99 ms':>9}{'max ms':>9}")
+    for label, verify in (("inline", inline), ("pool", hasher.verify)):
+        logins, busy, latencies = await run(verify)
+        print(f"{label:>8}{logins:>10.1f}{busy:>8.1f}{statistics.median(latencies):>14.2f}"
+              f"{percentile(latencies, 0.99):>9.2f}{max(latencies):>9.2f}")
+    hasher.close()
+
+
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else get_settings().bcrypt_rounds
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark: periodization engine
+
+Reports the time to generate a full plan (prescription grid plus the week,
+day and exercise objects built from it) for every periodization model at
+the largest size the API accepts, 16 weeks × 6 days, with an exercise pool
+per split. The target is under 5 ms per plan at p95; p99 also catches the
+interpreter's occasional full garbage collection, whose cost depends on
+everything else alive in the process rather than on the plan. The last line is the cost of
+a memoized lookup (``materialize_plan`` cache hit), which is what
+``get_microcycle`` pays for configurations already seen.
+
+No MongoDB server is needed.
+
+    PYTHONPATH=src:. python benchmarks/bench_periodization.py
+"""
+import statistics
+import time
+
+from domain.entities.mesocycle import PeriodizationModel, TrainingGoal
+from domain.entities.workout import TrainingSplit
+from domain.services import freeze_exercise_pool, generate_plan, materialize_plan
+
+WEEKS = 16
+DAYS = 6
+ITERATIONS = 2_000
+TARGET_MS = 5.0
+
+POOL = {split: list(range(100 * i, 100 * i + 30)) for i, split in enumerate(TrainingSplit)}
+
+
+def run(model: PeriodizationModel) -> list:
+    def generate():
+        return generate_plan(model, TrainingGoal.HYPERTROPHY, "advanced", WEEKS, DAYS, exercise_pool=POOL)
+
+    for _ in range(100):
+        generate()  # warm up
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        generate()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return samples
+
+
+def main() -> None:
+    plan = generate_plan(PeriodizationModel.LINEAR, TrainingGoal.HYPERTROPHY, "advanced", WEEKS, DAYS,
+                         exercise_pool=POOL)
+    prescriptions = sum(len(day.exercises) for week in plan.weeks for day in week.days)
+    print(f"{WEEKS} weeks × {DAYS} days, {prescriptions} prescriptions per plan\n")
+
+    print(f"{'model':<20}{'median ms':>12}{'p95 ms':>10}{'p99 ms':>10}")
+    for model in PeriodizationModel:
+        samples = sorted(run(model))
+        median = statistics.median(samples)
+        p95 = samples[int(len(samples) * 0.95)]
+        p99 = samples[int(len(samples) * 0.99)]
+        flag = "" if p95 < TARGET_MS else f"  (over {TARGET_MS} ms)"
+        print(f"{model.value:<20}{median:>12.3f}{p95:>10.3f}{p99:>10.3f}{flag}")
+
+    pool = freeze_exercise_pool(POOL)
+    args = (PeriodizationModel.LINEAR, TrainingGoal.HYPERTROPHY, "advanced", WEEKS, DAYS, (4, 8, 12, 16))
+    materialize_plan(*args, pool)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        materialize_plan(*args, freeze_exercise_pool(POOL))
+    elapsed = (time.perf_counter() - start) / ITERATIONS
+    print(f"\ncache hit (incl. pool freeze): {elapsed * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: progress analytics over ten years of daily weigh-ins
+
+Builds a 3650-point body-weight series (a slow drift, daily noise and a few
+mis-typed entries) and times ``analyze_series`` alone and the whole
+``get_progress_analytics`` response, serialized to JSON, for several point
+budgets with and without a 7-day moving average. The repository is an
+in-memory stand-in, so the figures exclude the MongoDB read.
+
+    PYTHONPATH=src:. python benchmarks/bench_progress_analytics.py
+"""
+import asyncio
+import statistics
+import time
+from datetime import date
+
+import numpy as np
+
+from domain.entities.progress import ProgressSeries
+from domain.services.analytics import analyze_series
+from openapi_server.impl.progress_impl import ProgressApiImpl
+
+DAYS = 3650
+ROUNDS = 200
+
+
+def weigh_ins() -> ProgressSeries:
+    rng = np.random.default_rng(19)
+    first = np.datetime64(date(2015, 1, 1), "D").astype(np.int64)
+    values = 82 - np.linspace(0, 6, DAYS) + rng.normal(0, 0.6, DAYS)
+    values[rng.choice(DAYS, 20, replace=False)] *= 10  # typos: 800 kg
+    return ProgressSeries(np.arange(first, first + DAYS), values)
+
+
+class SeriesRepository:
+    def __init__(self, series: ProgressSeries):
+        self.series = series
+
+    async def find_series(self, user_id, metric_type, start_date=None, end_date=None) -> ProgressSeries:
+        return self.series
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+
+async def main() -> None:
+    series = weigh_ins()
+    api = ProgressApiImpl(SeriesRepository(series))
+    print(f"{DAYS} daily points, {ROUNDS} rounds")
+    print(f"{'points':>7}{'avg days':>10}{'analyze p50 ms':>16}{'p95':>8}{'response p50 ms':>17}{'p95':>8}")
+    for max_points in (200, 500, 1000):
+        for window in (None, 7):
+            analyze, respond = [], []
+            for _ in range(ROUNDS):
+                began = time.perf_counter()
+                analyze_series(series, max_points, window)
+                analyze.append((time.perf_counter() - began) * 1000)
+                began = time.perf_counter()
+                response = await api.get_progress_analytics("weight", None, None, max_points, window)
+                response.model_dump_json(by_alias=True)
+                respond.append((time.perf_counter() - began) * 1000)
+            label = window or "-"
+            print(f"{max_points:>7}{label:>10}{percentiles(analyze)[0]:>16.2f}{percentiles(analyze)[1]:>8.2f}"
+                  f"{percentiles(respond)[0]:>17.2f}{percentiles(respond)[1]:>8.2f}")
+    analysis = analyze_series(series, 500)
+    print(f"trend {analysis.trend}, {analysis.slope_per_day * 7:.4f} kg/week despite the typos")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Benchmark: progress storage, regular collection vs time-series collection
+
+Seeds the same entries into ``progress`` and ``progress_timeseries``: 200
+users with three years of daily weigh-ins and weekly body-fat and
+measurement entries. Reports data and index size of each collection, then
+times, for one user, the first listing page (``find_page_by_user_id``, 20
+entries), a year of one metric (``find_by_user_id``) and the whole
+three-year series (``find_series``).
+
+Needs MongoDB 7.0+ at ``MONGODB_URL``; uses the ``mesocycle_planner_bench``
+database and drops it when done.
+
+    PYTHONPATH=src:. python benchmarks/bench_progress_backends.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+from domain.entities.progress import MetricType, Progress
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.repositories import ProgressRepository, TimeSeriesProgressRepository
+
+DATABASE = "mesocycle_planner_bench"
+USERS = 200
+DAYS = 3 * 365
+ROUNDS = 50
+
+
+def entries(user_id, first: date):
+    rng = random.Random(user_id.int)
+    for day in range(DAYS):
+        when = first + timedelta(days=day)
+        yield Progress.create(user_id, when, MetricType.WEIGHT, round(82 - day / 300 + rng.gauss(0, 0.5), 1), unit="kg")
+        if day % 7 == 0:
+            yield Progress.create(user_id, when, MetricType.BODY_FAT, round(18 - day / 200 + rng.gauss(0, 0.3), 1), unit="%")
+            yield Progress.create(user_id, when, MetricType.MEASUREMENT, round(90 + rng.gauss(0, 1), 1), unit="cm")
+
+
+async def storage(db, name: str) -> dict:
+    stats = await db[name].aggregate([{"$collStats": {"storageStats": {}}}]).to_list(length=1)
+    storage_stats = stats[0]["storageStats"]
+    return {
+        "storage": storage_stats.get("storageSize", 0),
+        "indexes": storage_stats.get("totalIndexSize", 0),
+    }
+
+
+async def timed(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    config = MongoDBConfig(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), DATABASE)
+    await config.connect()
+    db = config.database
+    await config.client.drop_database(DATABASE)
+    first = date.today() - timedelta(days=DAYS)
+    try:
+        await apply_index_migrations(db)
+        backends = {
+            "collection": ProgressRepository(db),
+            "timeseries": TimeSeriesProgressRepository(db),
+        }
+        users = [uuid4() for _ in range(USERS)]
+        count = 0
+        for user_id in users:
+            batch = list(entries(user_id, first))
+            count += len(batch)
+            for repository in backends.values():
+                await repository.save_many(batch)
+        print(f"{count} entries for {USERS} users, median of {ROUNDS}")
+
+        print(f"{'backend':>12}{'data MiB':>10}{'index MiB':>11}")
+        for name, repository in backends.items():
+            sizes = await storage(db, repository.collection.name)
+            print(f"{name:>12}{sizes['storage'] / 2**20:>10.2f}{sizes['indexes'] / 2**20:>11.2f}")
+
+        user_id = users[USERS // 2]
+        year_ago = date.today() - timedelta(days=365)
+        queries = {
+            "first page": lambda r: r.find_page_by_user_id(user_id, limit=20),
+            "1y weight": lambda r: r.find_by_user_id(user_id, MetricType.WEIGHT, year_ago, date.today(), limit=400),
+            "3y series": lambda r: r.find_series(user_id, MetricType.WEIGHT),
+        }
+        print(f"{'query':>12}" + "".join(f"{name + ' ms':>16}" for name in backends))
+        for label, query in queries.items():
+            row = [await timed(lambda: query(repository)) for repository in backends.values()]
+            print(f"{label:>12}" + "".join(f"{ms:>16.2f}" for ms in row))
+    finally:
+        await config.client.drop_database(DATABASE)
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""
+Benchmark: progress statistics, daily rollups vs hydrating sessions
+
+Seeds one user with three years of sessions (four a week, five exercises,
+four sets each), records their daily rollups as logging does, and times
+the statistics for 12, 26 and 52 weeks, for all exercises and for one.
+The rollup read returns one stored row per training day; the baseline
+loads every session with ``find_by_user_and_date_range``, builds each
+``SetPerformed`` and sums in Python.
+
+Needs MongoDB at ``MONGODB_URL``; uses the ``mesocycle_planner_bench``
+database and drops it when done.
+
+    PYTHONPATH=src:. python benchmarks/bench_progress_stats.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from uuid import uuid4
+
+from domain.entities.training_session import ExercisePerformed, SetPerformed, TrainingSession
+from domain.entities.weekly_rollup import DailyRollup
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.repositories import TrainingSessionRepository, WeeklyRollupRepository
+
+DATABASE = "mesocycle_planner_bench"
+YEARS = 3
+DAYS = (0, 1, 3, 4)
+EXERCISES = 5
+SETS = 4
+ROUNDS = 20
+
+
+def history(user_id, end: date):
+    rng = random.Random(3)
+    start = end - timedelta(weeks=52 * YEARS)
+    mesocycle_id = uuid4()
+    for week in range(52 * YEARS):
+        if week % 12 == 0:
+            mesocycle_id = uuid4()
+        for day in DAYS:
+            yield TrainingSession(
+                id=week * 10 + day,
+                mesocycle_id=mesocycle_id,
+                date=start + timedelta(weeks=week, days=day),
+                week_number=week % 12 + 1,
+                user_id=user_id,
+                exercises_performed=[
+                    ExercisePerformed(exercise_id, SETS, [
+                        SetPerformed(40 + 10 * exercise_id + week * 0.25, rng.randint(4, 10), rng.randint(6, 10), 2)
+                        for _ in range(SETS)
+                    ])
+                    for exercise_id in range(1, EXERCISES + 1)
+                ],
+            )
+
+
+async def hydrated(repository, user_id, start, end, exercise_id):
+    """Baseline: load sessions and compute the same rows in Python"""
+    rows = defaultdict(lambda: [set(), 0.0, 0.0, 0, 0])
+    for session in await repository.find_by_user_and_date_range(user_id, start, end):
+        for exercise in session.exercises_performed:
+            if exercise_id is not None and exercise.exercise_id != exercise_id:
+                continue
+            for s in exercise.sets_performed:
+                row = rows[session.date]
+                row[0].add(session.id)
+                row[1] += s.calculate_volume()
+                row[2] = max(row[2], s.estimate_1rm())
+                row[3] += s.actual_rpe
+                row[4] += 1
+    return sorted(rows.items())
+
+
+async def timed(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    config = MongoDBConfig(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), DATABASE)
+    await config.connect()
+    db = config.database
+    await db.training_sessions.drop()
+    await db.daily_rollups.drop()
+    user_id = uuid4()
+    end = date.today()
+    try:
+        await apply_index_migrations(db)
+        sessions = TrainingSessionRepository(db)
+        rollups = WeeklyRollupRepository(db)
+        history_sessions = list(history(user_id, end))
+        await sessions.append_many(history_sessions)
+        for session in history_sessions:
+            # The week start only labels the rows; the daily read never uses it
+            await rollups.record(DailyRollup.from_session(session, session.date))
+        print(f"{len(history_sessions)} sessions, {len(history_sessions) * EXERCISES * SETS} sets over {YEARS} years, "
+              f"median of {ROUNDS}")
+        print(f"{'weeks':>6}{'exercise':>10}{'rollups ms':>13}{'hydrated ms':>14}")
+        for weeks in (12, 26, 52):
+            start = end - timedelta(weeks=weeks) + timedelta(days=1)
+            for exercise_id in (None, 1):
+                rollups_ms = await timed(lambda: rollups.find_daily_by_user(user_id, start, end, exercise_id))
+                hydrated_ms = await timed(lambda: hydrated(sessions, user_id, start, end, exercise_id))
+                label = "all" if exercise_id is None else str(exercise_id)
+                print(f"{weeks:>6}{label:>10}{rollups_ms:>13.2f}{hydrated_ms:>14.2f}")
+    finally:
+        await config.client.drop_database(DATABASE)
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
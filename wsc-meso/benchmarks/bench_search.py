@@ -0,0 +1,94 @@
+"""
+Benchmark: exercise search throughput
+
+Compares queries per second of the catalog's inverted index with the
+``$regex`` path it replaces. The regex path is replayed in process (one
+case-insensitive regex per field over every document, as MongoDB does for
+an unanchored ``$regex`` ``$or``), so it excludes the network round trip
+and BSON decoding and is a generous lower bound for the real query.
+
+No MongoDB server is needed.
+
+    PYTHONPATH=src:. python benchmarks/bench_search.py
+"""
+import random
+import re
+import time
+
+from domain.entities import Exercise, ExerciseType, MuscleGroup
+from infrastructure.catalog import CatalogSnapshot
+
+EXERCISES = 450
+SECONDS = 2.0
+
+MOVEMENTS = ["Press", "Curl", "Remo", "Jalón", "Sentadilla", "Extensión", "Elevación",
+             "Aperturas", "Zancadas", "Peso muerto", "Fondos", "Dominadas", "Crunch"]
+TARGETS = ["de bíceps", "de tríceps", "de hombros", "al pecho", "con barra", "con mancuernas",
+           "en polea", "en máquina", "inclinado", "declinado", "a una mano", "frontal", "lateral"]
+WORDS = ["tirar", "empujar", "barra", "codos", "rodillas", "espalda", "recta", "controlar",
+         "bajada", "subida", "respiración", "hombros", "escápulas", "agarre", "pronado", "supino"]
+QUERIES = ["press", "biceps", "jalon", "sentadillas", "remo barra", "extension triceps",
+           "elev", "mancuernas", "sentdilla", "hombros polea", "peso muerto", "dominadas"]
+
+
+def build_exercises(size: int):
+    rng = random.Random(11)
+    return [
+        Exercise(
+            id=i,
+            name=f"{rng.choice(MOVEMENTS)} {rng.choice(TARGETS)}",
+            number=str(i),
+            muscle_group=rng.choice(list(MuscleGroup)),
+            primary_muscles=["musculo principal"],
+            type=rng.choice(list(ExerciseType)),
+            execution=" ".join(rng.choice(WORDS) for _ in range(40)),
+            comments=" ".join(rng.choice(WORDS) for _ in range(12)),
+        )
+        for i in range(1, size + 1)
+    ]
+
+
+def regex_search(exercises, query: str, limit: int = 20):
+    """The former $or of unanchored case-insensitive $regex, replayed in Python"""
+    pattern = re.compile(query, re.IGNORECASE)
+    results = []
+    for exercise in exercises:
+        if any(pattern.search(text) for text in (exercise.name, exercise.execution, exercise.comments) if text):
+            results.append(exercise)
+            if len(results) == limit:
+                break
+    return results
+
+
+def qps(search) -> float:
+    done = 0
+    deadline = time.perf_counter() + SECONDS
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for query in QUERIES:
+            search(query)
+        done += len(QUERIES)
+    return done / (time.perf_counter() - start)
+
+
+def main() -> None:
+    exercises = build_exercises(EXERCISES)
+    start = time.perf_counter()
+    snapshot = CatalogSnapshot(exercises)
+    print(f"index build: {(time.perf_counter() - start) * 1e3:.1f} ms, "
+          f"{len(snapshot.search_index)} terms\n")
+
+    print(f"{'query':<20}{'regex hits':>12}{'index hits':>12}")
+    for query in QUERIES:
+        print(f"{query:<20}{len(regex_search(exercises, query)):>12}{len(snapshot.search(query)):>12}")
+
+    regex_qps = qps(lambda q: regex_search(exercises, q))
+    index_qps = qps(lambda q: snapshot.search(q))
+    print(f"\n{'path':<20}{'queries/s':>12}")
+    print(f"{'$regex (in process)':<20}{regex_qps:>12.0f}")
+    print(f"{'inverted index':<20}{index_qps:>12.0f}")
+    print(f"speed-up: {index_qps / regex_qps:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
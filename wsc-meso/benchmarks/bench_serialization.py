@@ -0,0 +1,197 @@
+"""
+Benchmark: list response serialization, generated models vs field maps
+
+Times the work between the repository result and the response body for a
+page of 100 items of each list endpoint. The baseline builds the generated
+models as the impls did (``from_dict`` or the constructor per item, then
+the envelope) and runs FastAPI's ``serialize_response`` and
+``JSONResponse`` for the route's ``response_model``; the fast path is
+``render``, which encodes the domain read models with orjson. Both bodies
+are checked to decode to the same JSON first.
+
+    PYTHONPATH=src:. python benchmarks/bench_serialization.py
+"""
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from domain.entities import ExerciseSummary, MesocycleSummary, MetricType, Progress, WorkoutSummary
+from domain.entities.exercise import ExerciseType, MuscleGroup
+from domain.entities.mesocycle import MesocycleStatus, PeriodizationModel, TrainingGoal
+from domain.entities.workout import TrainingSplit
+from openapi_server.models.exercise_summary import ExerciseSummary as ExerciseSummaryModel
+from openapi_server.models.list_exercises200_response import ListExercises200Response
+from openapi_server.models.list_mesocycles200_response import ListMesocycles200Response
+from openapi_server.models.list_progress200_response import ListProgress200Response
+from openapi_server.models.list_workouts200_response import ListWorkouts200Response
+from openapi_server.models.mesocycle import Mesocycle as MesocycleModel
+from openapi_server.models.progress import Progress as ProgressModel
+from openapi_server.models.workout import Workout as WorkoutModel
+from openapi_server.utils.serialization import render
+
+ITEMS = 100
+ROUNDS = 200
+START = datetime(2024, 1, 1)
+
+
+def exercises():
+    items = [
+        ExerciseSummary(i, f"Ejercicio {i}", MuscleGroup.PECTORALS, ["pectoral mayor", "deltoides anterior"], ExerciseType.FREE_WEIGHT)
+        for i in range(ITEMS)
+    ]
+
+    def models():
+        return ListExercises200Response(
+            exercises=[
+                ExerciseSummaryModel(
+                    id=ex.id,
+                    name=ex.name,
+                    muscle_group=ex.muscle_group.value,
+                    type=ex.type.value,
+                    primary_muscles=ex.primary_muscles,
+                )
+                for ex in items
+            ],
+            total_count=1000, page=1, total_pages=10,
+        )
+
+    return ListExercises200Response, models, dict(exercises=items, total_count=1000, page=1, total_pages=10)
+
+
+def mesocycles():
+    items = [
+        MesocycleSummary(
+            uuid4(), uuid4(), f"Bloque {i}", PeriodizationModel.BLOCK, TrainingGoal.STRENGTH, 8,
+            START + timedelta(weeks=8 * i), START + timedelta(weeks=8 * i + 8), MesocycleStatus.COMPLETED,
+            "intermediate", 4, START + timedelta(weeks=8 * i, hours=9),
+        )
+        for i in range(ITEMS)
+    ]
+
+    def models():
+        return ListMesocycles200Response(
+            items=[
+                MesocycleModel(
+                    id=str(m.id),
+                    user_id=str(m.user_id),
+                    name=m.name,
+                    description=m.description,
+                    periodization_model=m.periodization_model.value,
+                    goal=m.goal.value,
+                    duration_weeks=m.duration_weeks,
+                    start_date=m.start_date,
+                    end_date=m.end_date,
+                    status=m.status.value,
+                    training_level=m.training_level,
+                    weekly_frequency=m.weekly_frequency,
+                    deload_weeks=m.deload_weeks,
+                    created_at=m.created_at,
+                    updated_at=m.updated_at,
+                )
+                for m in items
+            ],
+            total=1000, page=1, total_pages=10,
+        )
+
+    return ListMesocycles200Response, models, dict(items=items, total=1000, page=1, total_pages=10)
+
+
+def workouts():
+    items = [
+        WorkoutSummary(
+            uuid4(), uuid4(), f"Sesión {i}", START + timedelta(days=i, hours=18), microcycle_id=i // 7 + 1,
+            completed=True, completed_at=START + timedelta(days=i, hours=19), duration_minutes=70, split=TrainingSplit.UPPER,
+        )
+        for i in range(ITEMS)
+    ]
+
+    def models():
+        return ListWorkouts200Response(
+            items=[
+                WorkoutModel(
+                    id=str(w.id),
+                    mesocycle_id=str(w.mesocycle_id),
+                    microcycle_id=w.microcycle_id,
+                    name=w.name,
+                    description=w.description,
+                    scheduled_date=w.scheduled_date,
+                    completed=w.completed,
+                    completed_at=w.completed_at,
+                    duration_minutes=w.duration_minutes,
+                    notes=w.notes,
+                    split=w.split.value if w.split else None,
+                    created_at=w.created_at,
+                    updated_at=w.updated_at,
+                )
+                for w in items
+            ],
+            total=1000, page=1, total_pages=10,
+        )
+
+    return ListWorkouts200Response, models, dict(items=items, total=1000, page=1, total_pages=10)
+
+
+def progress():
+    user_id = uuid4()
+    items = [
+        Progress(uuid4(), user_id, START + timedelta(days=i), MetricType.WEIGHT, 82.4 - i * 0.05, "kg", None, START + timedelta(days=i, hours=7))
+        for i in range(ITEMS)
+    ]
+
+    def models():
+        return ListProgress200Response(
+            items=[ProgressModel.from_dict({**p.__dict__, "id": str(p.id), "user_id": str(p.user_id)}) for p in items],
+            total=1000, page=1, total_pages=10,
+        )
+
+    return ListProgress200Response, models, dict(items=items, total=1000, page=1, total_pages=10)
+
+
+async def baseline(field, models) -> bytes:
+    """Impl builds the models, FastAPI validates and serializes them"""
+    content = await serialize_response(field=field, response_content=models())
+    return JSONResponse(content).body
+
+
+def fast(model, values) -> bytes:
+    return render(model, **values).body
+
+
+async def timed(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        result = fn()
+        if asyncio.iscoroutine(result):
+            await result
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    print(f"{ITEMS} items a page, median of {ROUNDS}")
+    print(f"{'endpoint':<16}{'models ms':>12}{'render ms':>12}{'speedup':>10}{'bytes':>9}")
+    for endpoint, case in (
+        ("GET /exercises", exercises),
+        ("GET /mesocycles", mesocycles),
+        ("GET /workouts", workouts),
+        ("GET /progress", progress),
+    ):
+        model, models, values = case()
+        field = create_model_field(name="Response_bench", type_=model, mode="serialization")
+        body = fast(model, values)
+        assert json.loads(body) == json.loads(await baseline(field, models)), endpoint
+        models_ms = await timed(lambda: baseline(field, models))
+        render_ms = await timed(lambda: fast(model, values))
+        print(f"{endpoint:<16}{models_ms:>12.3f}{render_ms:>12.3f}{models_ms / render_ms:>9.1f}x{len(body):>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark: set storage, per-set objects vs columnar arrays
+
+Builds 100k sets (10 per exercise entry) and compares, for a list of
+``SetPerformed`` and for ``SetColumns``: the memory held (tracemalloc), the
+throughput of total volume, mean RPE and best e1RM, and the BSON size of
+the stored exercise entries (one subdocument per set vs one packed binary).
+
+    PYTHONPATH=src:. python benchmarks/bench_set_storage.py
+"""
+import random
+import statistics
+import time
+import tracemalloc
+
+import bson
+
+from domain.entities.training_session import SetColumns, SetPerformed
+from infrastructure.persistence.models import encode_sets
+
+SETS = 100_000
+PER_EXERCISE = 10
+ROUNDS = 20
+
+
+def build_sets():
+    rng = random.Random(16)
+    return [
+        SetPerformed(rng.randint(80, 400) * 0.25, rng.randint(1, 12), rng.randint(6, 10), rng.randint(0, 4))
+        for _ in range(SETS)
+    ]
+
+
+def allocated(build) -> int:
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def per_set(sets):
+    volume = sum(s.calculate_volume() for s in sets)
+    rpe = sum(s.actual_rpe for s in sets) / len(sets)
+    return volume, rpe, max(s.estimate_1rm() for s in sets)
+
+
+def columnar(columns):
+    return columns.total_volume(), columns.average_rpe(), columns.max_1rm()
+
+
+def timed(fn, arg) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - began) * 1000)
+    return statistics.median(samples)
+
+
+def bson_size(entries) -> int:
+    return sum(len(bson.encode(entry)) for entry in entries)
+
+
+def main() -> None:
+    sets = build_sets()
+    columns = SetColumns.from_sets(sets)
+    chunks = [sets[i:i + PER_EXERCISE] for i in range(0, SETS, PER_EXERCISE)]
+
+    object_bytes = allocated(build_sets)
+    column_bytes = allocated(lambda: SetColumns.from_sets(sets))
+    documents = bson_size({"exercise_id": 1, "sets": [dict(vars(s)) for s in chunk]} for chunk in chunks)
+    binaries = bson_size({"exercise_id": 1, "sets": encode_sets(SetColumns.from_sets(chunk))} for chunk in chunks)
+
+    print(f"{SETS} sets, median of {ROUNDS}")
+    print(f"{'':>18}{'SetPerformed':>14}{'SetColumns':>14}")
+    print(f"{'memory MB':>18}{object_bytes / 2**20:>14.2f}{column_bytes / 2**20:>14.2f}")
+    print(f"{'BSON MB':>18}{documents / 2**20:>14.2f}{binaries / 2**20:>14.2f}")
+    print(f"{'metrics ms':>18}{timed(per_set, sets):>14.2f}{timed(columnar, columns):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: smart-log latency as history grows
+
+Logs sessions of five exercises for one user through ``smart_log_session``
+(session bucket append plus one ``find_one_and_update`` per exercise state)
+at four sessions a week, starting a new 16-week mesocycle when one ends, and
+reports median, p95 and p99 latency per block of sessions. Nothing in
+the path reads past sessions, so the numbers should stay flat from the
+first block to the last.
+
+Needs MongoDB at ``MONGODB_URL``; uses the ``mesocycle_planner_bench``
+database and drops it when done.
+
+    PYTHONPATH=src:. python benchmarks/bench_smart_log.py [sessions]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import date
+from uuid import uuid4
+
+from domain.entities.mesocycle import Mesocycle, PeriodizationModel, TrainingGoal
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.repositories import (
+    ExerciseStateRepository,
+    MesocycleRepository,
+    TrainingSessionRepository,
+)
+from openapi_server.impl.tracking_impl import TrackingApiImpl
+from openapi_server.models.smart_log_session_request import SmartLogSessionRequest
+
+DATABASE = "mesocycle_planner_bench"
+BLOCK = 500
+EXERCISES = 5
+WEEKS = 16
+PER_WEEK = 4
+
+
+def request(mesocycle_id, week_number: int, rng: random.Random) -> SmartLogSessionRequest:
+    return SmartLogSessionRequest.from_dict({
+        "mesocycle_id": str(mesocycle_id),
+        "week_number": week_number,
+        "performance_data": [
+            {"exercise_id": exercise_id, "sets_performed": [
+                {"weight_kg": 60 + 10 * exercise_id + rng.choice((-2.5, 0, 2.5)),
+                 "reps_achieved": rng.randint(4, 8), "actual_rpe": rng.randint(6, 10),
+                 "subjective_fatigue": rng.randint(3, 8)}
+                for _ in range(4)
+            ]}
+            for exercise_id in range(1, EXERCISES + 1)
+        ],
+    })
+
+
+async def main(sessions: int) -> None:
+    config = MongoDBConfig(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), DATABASE)
+    await config.connect()
+    db = config.database
+    rng = random.Random(7)
+    try:
+        await apply_index_migrations(db)
+        mesocycles = MesocycleRepository(db)
+        user_id = uuid4()
+        api = TrackingApiImpl(TrainingSessionRepository(db), mesocycles, ExerciseStateRepository(db))
+
+        async def new_mesocycle() -> Mesocycle:
+            return await mesocycles.save(Mesocycle.create(
+                user_id=user_id, name="Bench", periodization_model=PeriodizationModel.LINEAR,
+                goal=TrainingGoal.STRENGTH, duration_weeks=WEEKS, start_date=date(2025, 1, 6),
+                end_date=date(2025, 4, 27), training_level="intermediate", weekly_frequency=PER_WEEK,
+            ))
+
+        print(f"{EXERCISES} exercises per session, blocks of {BLOCK} sessions")
+        print(f"{'history':>10}{'median ms':>12}{'p95 ms':>10}{'p99 ms':>10}")
+        for start in range(0, sessions, BLOCK):
+            samples = []
+            for i in range(start, start + BLOCK):
+                week, day = divmod(i % (WEEKS * PER_WEEK), PER_WEEK)
+                if week == day == 0:
+                    mesocycle = await new_mesocycle()
+                body = request(mesocycle.id, week + 1, rng)
+                began = time.perf_counter()
+                await api.smart_log_session(body)
+                samples.append((time.perf_counter() - began) * 1000)
+            samples.sort()
+            median = samples[len(samples) // 2]
+            p95 = samples[int(len(samples) * 0.95)]
+            p99 = samples[int(len(samples) * 0.99)]
+            print(f"{start + BLOCK:>10}{median:>12.2f}{p95:>10.2f}{p99:>10.2f}")
+    finally:
+        await config.client.drop_database(DATABASE)
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
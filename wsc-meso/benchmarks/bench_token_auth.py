@@ -0,0 +1,101 @@
+"""
+Benchmark: bearer-auth overhead per request
+
+Times verifying one token with ``jwt.decode`` on every call (the old
+``verify_token``) against ``TokenVerifier`` hits, then the same through
+FastAPI: an endpoint with no auth, with a dependency that decodes the
+token each time and with ``get_token_bearerAuth``, called in-process over
+ASGI. The overhead column is the latency above the endpoint without auth.
+
+    PYTHONPATH=src:. python benchmarks/bench_token_auth.py
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, Security
+from fastapi.security import HTTPAuthorizationCredentials
+
+from api.dependencies import container
+from infrastructure.security import TokenVerifier
+from openapi_server.security_api import bearer_auth, get_token_bearerAuth
+from openapi_server.utils.auth import ALGORITHM, SECRET_KEY, create_access_token, verify_token
+
+CALLS = 20_000
+REQUESTS = 3_000
+ROUNDS = 5
+
+
+def per_call_us(fn, token: str) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        began = time.perf_counter()
+        for _ in range(CALLS):
+            fn(token)
+        samples.append((time.perf_counter() - began) / CALLS * 1e6)
+    return statistics.median(samples)
+
+
+async def decoded(credentials: HTTPAuthorizationCredentials = Depends(bearer_auth)) -> str:
+    """Baseline dependency: decode the token on every request"""
+    user_id = verify_token(credentials.credentials)
+    if not user_id:
+        raise HTTPException(status_code=401)
+    return user_id
+
+
+def build_app(verifier: TokenVerifier) -> FastAPI:
+    container.register(TokenVerifier, lambda c: verifier)
+    app = FastAPI()
+
+    @app.get("/open")
+    async def open_endpoint():
+        return {}
+
+    @app.get("/decoded")
+    async def decoded_endpoint(user_id: str = Depends(decoded)):
+        return {}
+
+    @app.get("/cached")
+    async def cached_endpoint(token=Security(get_token_bearerAuth)):
+        return {}
+
+    return app
+
+
+async def per_request_us(client: httpx.AsyncClient, paths, headers: dict) -> dict:
+    """Median latency per path; rounds interleave the paths so drift hits all alike"""
+    samples = {path: [] for path in paths}
+    for _ in range(ROUNDS):
+        for path in paths:
+            began = time.perf_counter()
+            for _ in range(REQUESTS):
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200
+            samples[path].append((time.perf_counter() - began) / REQUESTS * 1e6)
+    return {path: statistics.median(values) for path, values in samples.items()}
+
+
+async def main() -> None:
+    token = create_access_token({"user_id": "00000000-0000-0000-0000-000000000001"})
+    verifier = TokenVerifier(SECRET_KEY, ALGORITHM)
+    print(f"per call, median of {ROUNDS} x {CALLS}")
+    print(f"{'path':>22}{'us':>10}")
+    print(f"{'jwt.decode':>22}{per_call_us(verify_token, token):>10.2f}")
+    print(f"{'TokenVerifier hit':>22}{per_call_us(verifier.verify, token):>10.2f}")
+
+    transport = httpx.ASGITransport(app=build_app(verifier))
+    headers = {"Authorization": f"Bearer {token}"}
+    print(f"\nper request over ASGI, median of {ROUNDS} x {REQUESTS}")
+    print(f"{'endpoint':>22}{'us':>10}{'overhead us':>14}")
+    endpoints = (("no auth", "/open"), ("decode every request", "/decoded"), ("get_token_bearerAuth", "/cached"))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies = await per_request_us(client, [path for _, path in endpoints], headers)
+    for label, path in endpoints:
+        latency = latencies[path]
+        print(f"{label:>22}{latency:>10.1f}{latency - latencies['/open']:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
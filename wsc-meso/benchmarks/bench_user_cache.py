@@ -0,0 +1,104 @@
+"""
+Benchmark: user profile reads, MongoDB vs the per-worker cache
+
+Seeds 10,000 users and replays profile reads (``find_by_id``) with a Zipf
+popularity across four workers, each a ``CachedUserRepository`` on the
+same database; one request in a hundred updates the profile on a random
+worker. The cache clock advances 10 ms per request (100 requests/s per
+worker), so entries go through hits, version checks and reloads as in
+production. Reports latency and how each read was answered, against the
+plain repository.
+
+Needs MongoDB at ``MONGODB_URL``; uses the ``mesocycle_planner_bench``
+database and drops it when done.
+
+    PYTHONPATH=src:. python benchmarks/bench_user_cache.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import time
+
+from domain.entities.user import User
+from infrastructure.cache import CachedUserRepository
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.repositories import UserRepository
+
+DATABASE = "mesocycle_planner_bench"
+USERS = 10_000
+WORKERS = 4
+REQUESTS = 20_000
+UPDATE_SHARE = 0.01
+STEP_SECONDS = 0.01
+
+
+class VirtualClock:
+    """Request-paced clock for the caches"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def percentile(samples, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def replay(workers, ids, clock: VirtualClock) -> list:
+    """Latency in microseconds of each read"""
+    rng = random.Random(7)
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(len(ids))]
+    picks = rng.choices(ids, weights, k=REQUESTS)
+    latencies = []
+    for user_id in picks:
+        clock.now += STEP_SECONDS
+        worker = rng.choice(workers)
+        began = time.perf_counter()
+        user = await worker.find_by_id(user_id)
+        latencies.append((time.perf_counter() - began) * 1e6)
+        if rng.random() < UPDATE_SHARE:
+            user.full_name = f"Name {rng.random():.6f}"
+            await worker.update(user)
+    return latencies
+
+
+async def main() -> None:
+    config = MongoDBConfig(os.getenv("MONGODB_URL", "mongodb://localhost:27017"), DATABASE)
+    await config.connect()
+    db = config.database
+    await db.users.drop()
+    try:
+        await apply_index_migrations(db)
+        repository = UserRepository(db)
+        users = [
+            User.create(email=f"user{i}@example.com", username=f"user{i}", hashed_password="x")
+            for i in range(USERS)
+        ]
+        await repository.save_many(users)
+        ids = [user.id for user in users]
+        print(f"{USERS} users, {REQUESTS} reads over {WORKERS} workers, {UPDATE_SHARE:.0%} updates")
+        print(f"{'mode':>10}{'p50 us':>10}{'p99 us':>10}{'hit %':>8}{'version %':>11}{'miss %':>8}")
+
+        latencies = await replay([repository], ids, VirtualClock())
+        print(f"{'mongodb':>10}{statistics.median(latencies):>10.0f}{percentile(latencies, 0.99):>10.0f}"
+              f"{'':>8}{'':>11}{100:>8.1f}")
+
+        clock = VirtualClock()
+        workers = [CachedUserRepository(repository, clock=clock) for _ in range(WORKERS)]
+        latencies = await replay(workers, ids, clock)
+        lookups = sum(w.hits + w.revalidations + w.misses for w in workers)
+        shares = [100 * sum(getattr(w, name) for w in workers) / lookups for name in ("hits", "revalidations", "misses")]
+        print(f"{'cached':>10}{statistics.median(latencies):>10.0f}{percentile(latencies, 0.99):>10.0f}"
+              f"{shares[0]:>8.1f}{shares[1]:>11.1f}{shares[2]:>8.1f}")
+    finally:
+        await config.client.drop_database(DATABASE)
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,24 +1,31 @@
 """Domain entities package"""
 from .user import User, TrainingLevel
-from .exercise import Exercise, MuscleGroup, ExerciseType
-from .mesocycle import Mesocycle, MesocycleStatus
+from .exercise import Exercise, ExerciseSummary, MuscleGroup, ExerciseType
+from .mesocycle import Mesocycle, MesocycleStatus, MesocycleSummary
 from .microcycle import Microcycle, TrainingPhase
-from .workout import Workout
+from .workout import Workout, WorkoutSummary
 from .training_session import TrainingSession
-from .progress import Progress, MetricType
+from .weekly_rollup import DailyRollup, WeeklyRollup
+from .progress import Progress, MetricType, ProgressSeries
 
 __all__ = [
     "User",
     "TrainingLevel",
     "Exercise",
+    "ExerciseSummary",
     "MuscleGroup",
     "ExerciseType",
     "Mesocycle",
     "MesocycleStatus",
+    "MesocycleSummary",
     "Microcycle",
     "TrainingPhase",
     "Workout",
+    "WorkoutSummary",
     "TrainingSession",
+    "WeeklyRollup",
+    "DailyRollup",
     "Progress",
     "MetricType",
+    "ProgressSeries",
 ]
@@ -82,3 +82,23 @@ class Exercise:
     
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+class ExerciseSummary:
+    """Read model with the fields shown in exercise lists and search results"""
+    
+    __slots__ = ("id", "name", "muscle_group", "primary_muscles", "type")
+    
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        muscle_group: MuscleGroup,
+        primary_muscles: List[str],
+        type: ExerciseType,
+    ):
+        self.id = id
+        self.name = name
+        self.muscle_group = muscle_group
+        self.primary_muscles = primary_muscles
+        self.type = type
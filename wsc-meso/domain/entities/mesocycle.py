@@ -4,12 +4,17 @@ Domain Entity: Mesocycle
 Represents a training mesocycle with periodization model.
 This is an aggregate root that contains microcycles.
 """
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 from uuid import UUID, uuid4
 from enum import Enum
 
 
+def _as_date(value: date) -> date:
+    # Dates come back from MongoDB as midnight datetimes
+    return value.date() if isinstance(value, datetime) else value
+
+
 class MesocycleStatus(str, Enum):
     PLANNED = "planned"
     ACTIVE = "active"
@@ -147,6 +152,14 @@ class Mesocycle:
         """Check if given week is a deload week"""
         return week_number in self.deload_weeks
     
+    def week_of(self, day: date) -> int:
+        """Mesocycle week (1-based) a date falls in"""
+        return (_as_date(day) - _as_date(self.start_date)).days // 7 + 1
+    
+    def week_start(self, week_number: int) -> date:
+        """First day of a mesocycle week"""
+        return _as_date(self.start_date) + timedelta(weeks=week_number - 1)
+    
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Mesocycle):
             return False
@@ -154,3 +167,47 @@ class Mesocycle:
     
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+class MesocycleSummary:
+    """Read model with the fields shown in mesocycle lists (all but the plan)"""
+    
+    __slots__ = (
+        "id", "user_id", "name", "description", "periodization_model", "goal",
+        "duration_weeks", "start_date", "end_date", "status", "training_level",
+        "weekly_frequency", "deload_weeks", "created_at", "updated_at",
+    )
+    
+    def __init__(
+        self,
+        id: UUID,
+        user_id: UUID,
+        name: str,
+        periodization_model: PeriodizationModel,
+        goal: TrainingGoal,
+        duration_weeks: int,
+        start_date: date,
+        end_date: date,
+        status: MesocycleStatus,
+        training_level: str,
+        weekly_frequency: int,
+        created_at: Optional[datetime] = None,
+        description: Optional[str] = None,
+        deload_weeks: Optional[List[int]] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.name = name
+        self.description = description
+        self.periodization_model = periodization_model
+        self.goal = goal
+        self.duration_weeks = duration_weeks
+        self.start_date = start_date
+        self.end_date = end_date
+        self.status = status
+        self.training_level = training_level
+        self.weekly_frequency = weekly_frequency
+        self.deload_weeks = deload_weeks or []
+        self.created_at = created_at
+        self.updated_at = updated_at
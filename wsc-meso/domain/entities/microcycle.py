@@ -2,8 +2,10 @@
 Domain Entity: Microcycle
 
 Represents a training microcycle within a mesocycle.
+Microcycles and intensity ranges are immutable so derived ones can be
+shared between mesocycles and requests.
 """
-from typing import Optional
+from typing import Any, Optional
 from enum import Enum
 
 
@@ -15,29 +17,56 @@ class TrainingPhase(str, Enum):
     DELOAD = "deload"
 
 
+def _read_only(self: Any, name: str, value: Any) -> None:
+    raise AttributeError(f"{type(self).__name__} is immutable")
+
+
 class IntensityRange:
     """Value object for intensity range"""
     
+    __slots__ = ("min_pct", "max_pct")
+    
     def __init__(self, min_pct: float, max_pct: float):
         if not (0.0 <= min_pct <= 1.0) or not (0.0 <= max_pct <= 1.0):
             raise ValueError("Intensity percentages must be between 0 and 1")
         if min_pct > max_pct:
             raise ValueError("Min intensity cannot be greater than max intensity")
         
-        self.min_pct = min_pct
-        self.max_pct = max_pct
+        object.__setattr__(self, "min_pct", min_pct)
+        object.__setattr__(self, "max_pct", max_pct)
+    
+    __setattr__ = _read_only
+    __delattr__ = _read_only
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntensityRange):
+            return False
+        return (self.min_pct, self.max_pct) == (other.min_pct, other.max_pct)
+    
+    def __hash__(self) -> int:
+        return hash((self.min_pct, self.max_pct))
     
     def __repr__(self) -> str:
         return f"IntensityRange({self.min_pct:.1%}-{self.max_pct:.1%})"
 
 
 class Microcycle:
-    """Microcycle entity"""
+    """Microcycle entity.
+    
+    Microcycles derived from a periodization plan leave ``mesocycle_id``
+    empty: the same instance serves every mesocycle with that plan.
+    """
+    
+    __slots__ = (
+        "id", "mesocycle_id", "microcycle_number", "week_start", "week_end", "phase",
+        "intensity_range", "reps_range", "sets_range", "rir", "weekly_volume_multiplier",
+        "frequency_per_week",
+    )
     
     def __init__(
         self,
         id: int,
-        mesocycle_id: str,
+        mesocycle_id: Optional[str],
         microcycle_number: int,
         week_start: int,
         week_end: int,
@@ -49,24 +78,27 @@ class Microcycle:
         weekly_volume_multiplier: float,
         frequency_per_week: int,
     ):
-        self.id = id
-        self.mesocycle_id = mesocycle_id
-        self.microcycle_number = microcycle_number
-        self.week_start = week_start
-        self.week_end = week_end
-        self.phase = phase
-        self.intensity_range = intensity_range
-        self.reps_range = reps_range
-        self.sets_range = sets_range
-        self.rir = rir
-        self.weekly_volume_multiplier = weekly_volume_multiplier
-        self.frequency_per_week = frequency_per_week
-        
         # Validate
         if rir < 0 or rir > 5:
             raise ValueError("RIR must be between 0 and 5")
         if weekly_volume_multiplier < 0.5 or weekly_volume_multiplier > 2.0:
             raise ValueError("Volume multiplier must be between 0.5 and 2.0")
+        
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "mesocycle_id", mesocycle_id)
+        object.__setattr__(self, "microcycle_number", microcycle_number)
+        object.__setattr__(self, "week_start", week_start)
+        object.__setattr__(self, "week_end", week_end)
+        object.__setattr__(self, "phase", phase)
+        object.__setattr__(self, "intensity_range", intensity_range)
+        object.__setattr__(self, "reps_range", reps_range)
+        object.__setattr__(self, "sets_range", sets_range)
+        object.__setattr__(self, "rir", rir)
+        object.__setattr__(self, "weekly_volume_multiplier", weekly_volume_multiplier)
+        object.__setattr__(self, "frequency_per_week", frequency_per_week)
+    
+    __setattr__ = _read_only
+    __delattr__ = _read_only
     
     def get_duration_weeks(self) -> int:
         """Get the duration of this microcycle in weeks"""
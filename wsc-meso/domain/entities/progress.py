@@ -4,10 +4,12 @@ Domain Entity: Progress
 Represents progress tracking metrics.
 """
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 from uuid import UUID, uuid4
 from enum import Enum
 
+import numpy as np
+
 
 class MetricType(str, Enum):
     WEIGHT = "weight"
@@ -72,3 +74,32 @@ class Progress:
     
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+class ProgressSeries:
+    """Value object: one metric's values by day as parallel read-only arrays"""
+    
+    __slots__ = ("days", "values")
+    
+    def __init__(self, days: np.ndarray, values: np.ndarray):
+        # Days since 1970-01-01, ascending
+        self.days = np.asarray(days, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        if self.days.shape != self.values.shape:
+            raise ValueError("Series days and values differ in length")
+        self.days.flags.writeable = False
+        self.values.flags.writeable = False
+    
+    @classmethod
+    def from_points(cls, dates: Iterable[date], values: Iterable[float]) -> "ProgressSeries":
+        """Build a series from dates (or datetimes) and values in date order"""
+        days = np.array([d.date() if isinstance(d, datetime) else d for d in dates], dtype="datetime64[D]")
+        return cls(days.astype(np.int64), np.fromiter(values, dtype=np.float64, count=len(days)))
+    
+    def dates(self, indices: Optional[np.ndarray] = None) -> List[date]:
+        """Days of the series (or of the points at indices) as dates"""
+        days = self.days if indices is None else self.days[indices]
+        return days.astype("datetime64[D]").tolist()
+    
+    def __len__(self) -> int:
+        return len(self.days)
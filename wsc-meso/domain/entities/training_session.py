@@ -2,11 +2,17 @@
 Domain Entity: TrainingSession
 
 Represents a completed training session with performance data.
+
+An exercise's sets are held column-wise in ``SetColumns`` (one NumPy array
+per field), so volume, RPE and e1RM are vectorized; ``SetPerformed``
+remains the per-set value object at the API boundary.
 """
 from datetime import date
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
 from uuid import UUID
 
+import numpy as np
+
 
 class SetPerformed:
     """Value object for a performed set"""
@@ -43,6 +49,104 @@ class SetPerformed:
         return self.weight_kg * (1 + self.reps_achieved / 30.0)
 
 
+def _read_only(*arrays: np.ndarray) -> None:
+    for array in arrays:
+        array.flags.writeable = False
+
+
+class SetColumns:
+    """Value object: the sets of one exercise as parallel read-only arrays"""
+    
+    __slots__ = ("weight_kg", "reps_achieved", "actual_rpe", "reps_in_reserve")
+    
+    WEIGHT_DTYPE = np.dtype("<f8")
+    REPS_DTYPE = np.dtype("<u2")
+    SCALE_DTYPE = np.dtype("u1")  # RPE and RIR
+    
+    def __init__(
+        self,
+        weight_kg: Iterable[float] = (),
+        reps_achieved: Iterable[int] = (),
+        actual_rpe: Iterable[int] = (),
+        reps_in_reserve: Iterable[int] = (),
+    ):
+        weight = np.asarray(weight_kg, dtype=float)
+        reps = np.asarray(reps_achieved)
+        rpe = np.asarray(actual_rpe)
+        rir = np.asarray(reps_in_reserve)
+        if not weight.shape == reps.shape == rpe.shape == rir.shape or weight.ndim != 1:
+            raise ValueError("Set columns must be one-dimensional and of equal length")
+        if np.any(weight < 0):
+            raise ValueError("Weight cannot be negative")
+        if np.any(reps < 0):
+            raise ValueError("Reps cannot be negative")
+        # The integer columns would wrap silently past their dtype's range
+        if np.any(reps > np.iinfo(self.REPS_DTYPE).max):
+            raise ValueError(f"Reps cannot exceed {np.iinfo(self.REPS_DTYPE).max}")
+        if np.any((rpe < 1) | (rpe > 10)):
+            raise ValueError("RPE must be between 1 and 10")
+        if np.any(rir < 0):
+            raise ValueError("RIR cannot be negative")
+        if np.any(rir > np.iinfo(self.SCALE_DTYPE).max):
+            raise ValueError(f"RIR cannot exceed {np.iinfo(self.SCALE_DTYPE).max}")
+        
+        self.weight_kg = weight.astype(self.WEIGHT_DTYPE, copy=False)
+        self.reps_achieved = reps.astype(self.REPS_DTYPE, copy=False)
+        self.actual_rpe = rpe.astype(self.SCALE_DTYPE, copy=False)
+        self.reps_in_reserve = rir.astype(self.SCALE_DTYPE, copy=False)
+        _read_only(self.weight_kg, self.reps_achieved, self.actual_rpe, self.reps_in_reserve)
+    
+    @classmethod
+    def from_sets(cls, sets: Iterable[SetPerformed]) -> "SetColumns":
+        """Build the columns from per-set value objects"""
+        sets = list(sets)
+        return cls(
+            [s.weight_kg for s in sets],
+            [s.reps_achieved for s in sets],
+            [s.actual_rpe for s in sets],
+            [s.reps_in_reserve for s in sets],
+        )
+    
+    def __len__(self) -> int:
+        return len(self.weight_kg)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SetColumns):
+            return False
+        return all(np.array_equal(getattr(self, name), getattr(other, name)) for name in self.__slots__)
+    
+    def to_sets(self) -> List[SetPerformed]:
+        """Per-set value objects, in order"""
+        return [
+            SetPerformed(weight, reps, rpe, rir)
+            for weight, reps, rpe, rir in zip(
+                self.weight_kg.tolist(), self.reps_achieved.tolist(),
+                self.actual_rpe.tolist(), self.reps_in_reserve.tolist(),
+            )
+        ]
+    
+    def volumes(self) -> np.ndarray:
+        """Volume (weight × reps) of every set"""
+        return self.weight_kg * self.reps_achieved
+    
+    def estimate_1rm(self) -> np.ndarray:
+        """Epley 1RM estimate of every set (a single is its own 1RM)"""
+        return np.where(self.reps_achieved == 1, self.weight_kg, self.weight_kg * (1 + self.reps_achieved / 30.0))
+    
+    def total_volume(self) -> float:
+        return float(self.volumes().sum())
+    
+    def average_rpe(self) -> float:
+        if not len(self):
+            return 0.0
+        return float(self.actual_rpe.mean())
+    
+    def max_1rm(self) -> float:
+        if not len(self):
+            return 0.0
+        return float(self.estimate_1rm().max())
+
+
 class ExercisePerformed:
     """Value object for an exercise performed in a session"""
     
@@ -50,21 +154,26 @@ class ExercisePerformed:
         self,
         exercise_id: int,
         planned_sets: int,
-        sets_performed: List[SetPerformed],
+        sets_performed: Union[SetColumns, List[SetPerformed], None] = None,
     ):
         self.exercise_id = exercise_id
         self.planned_sets = planned_sets
-        self.sets_performed = sets_performed
+        if not isinstance(sets_performed, SetColumns):
+            sets_performed = SetColumns.from_sets(sets_performed or ())
+        self.sets = sets_performed
+    
+    @property
+    def sets_performed(self) -> List[SetPerformed]:
+        """The sets as per-set value objects (built on access)"""
+        return self.sets.to_sets()
     
     def get_total_volume(self) -> float:
         """Calculate total volume for this exercise"""
-        return sum(s.calculate_volume() for s in self.sets_performed)
+        return self.sets.total_volume()
     
     def get_average_rpe(self) -> float:
         """Calculate average RPE across all sets"""
-        if not self.sets_performed:
-            return 0.0
-        return sum(s.actual_rpe for s in self.sets_performed) / len(self.sets_performed)
+        return self.sets.average_rpe()
 
 
 class TrainingSession:
@@ -78,8 +187,10 @@ class TrainingSession:
         microcycle_id: Optional[int] = None,
         week_number: Optional[int] = None,
         exercises_performed: Optional[List[ExercisePerformed]] = None,
+        user_id: Optional[UUID] = None,
     ):
         self.id = id
+        self.user_id = user_id
         self.mesocycle_id = mesocycle_id
         self.microcycle_id = microcycle_id
         self.week_number = week_number
@@ -90,6 +201,10 @@ class TrainingSession:
         """Add an exercise to the session"""
         self.exercises_performed.append(exercise_performed)
     
+    def get_total_sets(self) -> int:
+        """Count the sets performed in the session"""
+        return sum(len(ex.sets) for ex in self.exercises_performed)
+    
     def get_total_session_volume(self) -> float:
         """Calculate total volume for the entire session"""
         return sum(ex.get_total_volume() for ex in self.exercises_performed)
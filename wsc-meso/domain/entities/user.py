@@ -30,6 +30,7 @@ class User:
         training_level: TrainingLevel = TrainingLevel.INTERMEDIATE,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        version: int = 0,
     ):
         self.id = id
         self.email = email
@@ -39,6 +40,7 @@ class User:
         self.training_level = training_level
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.version = version  # incremented by every stored update
     
     @classmethod
     def create(
@@ -0,0 +1,141 @@
+"""
+Domain Entity: WeeklyRollup
+
+Running training totals of one mesocycle week.
+
+A rollup covers one exercise, or the whole week when ``exercise_id`` is
+None. Every logged session and completed workout adds to the rollups of
+its week, so dashboards read one row per week instead of the sessions
+behind it. Sessions also add to the ``DailyRollup`` of their day, from
+which progress statistics chart one point per training day.
+"""
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities.training_session import TrainingSession
+
+
+class WeeklyRollup:
+    """Totals of one (user, mesocycle, week, exercise) key"""
+    
+    __slots__ = (
+        "user_id", "mesocycle_id", "week_number", "exercise_id", "week_start",
+        "sessions", "sets", "volume", "rpe_sum", "max_1rm", "workouts_completed",
+    )
+    
+    def __init__(
+        self,
+        user_id: UUID,
+        mesocycle_id: UUID,
+        week_number: int,
+        week_start: date,
+        exercise_id: Optional[int] = None,
+        sessions: int = 0,
+        sets: int = 0,
+        volume: float = 0.0,
+        rpe_sum: int = 0,
+        max_1rm: float = 0.0,
+        workouts_completed: int = 0,
+    ):
+        self.user_id = user_id
+        self.mesocycle_id = mesocycle_id
+        self.week_number = week_number
+        self.exercise_id = exercise_id
+        self.week_start = week_start
+        self.sessions = sessions
+        self.sets = sets
+        self.volume = volume
+        self.rpe_sum = rpe_sum
+        self.max_1rm = max_1rm
+        self.workouts_completed = workouts_completed
+    
+    @classmethod
+    def from_session(cls, session: TrainingSession, week_start: date) -> List["WeeklyRollup"]:
+        """Increments a session adds: one per exercise and one for the week"""
+        week = cls(session.user_id, session.mesocycle_id, session.week_number, week_start, sessions=1)
+        exercises: Dict[int, WeeklyRollup] = {}
+        for exercise in session.exercises_performed:
+            sets = exercise.sets
+            increment = cls(
+                session.user_id, session.mesocycle_id, session.week_number, week_start,
+                exercise_id=exercise.exercise_id,
+                sessions=1,
+                sets=len(sets),
+                volume=sets.total_volume(),
+                rpe_sum=int(sets.actual_rpe.sum()),
+                max_1rm=sets.max_1rm(),
+            )
+            if exercise.exercise_id in exercises:
+                # An exercise logged twice still counts as one session
+                increment.sessions = 0
+                exercises[exercise.exercise_id].add(increment)
+            else:
+                exercises[exercise.exercise_id] = increment
+            week.add(increment)
+        week.sessions = 1
+        return [week, *exercises.values()]
+    
+    @classmethod
+    def from_workout(cls, user_id: UUID, mesocycle_id: UUID, week_number: int, week_start: date) -> "WeeklyRollup":
+        """Increment a completed workout adds to its week"""
+        return cls(user_id, mesocycle_id, week_number, week_start, workouts_completed=1)
+    
+    @property
+    def key(self) -> Tuple[UUID, UUID, int, Optional[int]]:
+        return (self.user_id, self.mesocycle_id, self.week_number, self.exercise_id)
+    
+    @property
+    def avg_rpe(self) -> float:
+        return self.rpe_sum / self.sets if self.sets else 0.0
+    
+    @property
+    def days_trained(self) -> int:
+        """Training days counted for adherence: logged sessions or completed workouts"""
+        return max(self.sessions, self.workouts_completed)
+    
+    def add(self, other: "WeeklyRollup") -> None:
+        """Fold another increment of the same key into this one"""
+        self.sessions += other.sessions
+        self.sets += other.sets
+        self.volume += other.volume
+        self.rpe_sum += other.rpe_sum
+        self.max_1rm = max(self.max_1rm, other.max_1rm)
+        self.workouts_completed += other.workouts_completed
+    
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in WeeklyRollup.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(key={self.key!r}, sessions={self.sessions}, sets={self.sets})"
+
+
+class DailyRollup(WeeklyRollup):
+    """Totals of one (user, mesocycle, day, exercise) key
+    
+    Only sessions add to a day; completed workouts count towards the week.
+    """
+    
+    __slots__ = ("day",)
+    
+    def __init__(self, day: date, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.day = day
+    
+    @classmethod
+    def from_session(cls, session: TrainingSession, week_start: date) -> List["DailyRollup"]:
+        """Increments a session adds to its day: one per exercise and one for the day"""
+        day = session.date.date() if isinstance(session.date, datetime) else session.date
+        return [
+            cls(day, **{name: getattr(increment, name) for name in WeeklyRollup.__slots__})
+            for increment in WeeklyRollup.from_session(session, week_start)
+        ]
+    
+    @property
+    def key(self) -> Tuple[UUID, UUID, date, Optional[int]]:
+        return (self.user_id, self.mesocycle_id, self.day, self.exercise_id)
+    
+    def __eq__(self, other: object) -> bool:
+        return super().__eq__(other) and self.day == other.day
@@ -98,3 +98,43 @@ class Workout:
     
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+class WorkoutSummary:
+    """Read model with the fields shown in workout lists (all but the exercises)"""
+    
+    __slots__ = (
+        "id", "mesocycle_id", "microcycle_id", "name", "description", "scheduled_date",
+        "completed", "completed_at", "duration_minutes", "notes", "split",
+        "created_at", "updated_at",
+    )
+    
+    def __init__(
+        self,
+        id: UUID,
+        mesocycle_id: UUID,
+        name: str,
+        scheduled_date: datetime,
+        microcycle_id: Optional[int] = None,
+        completed: bool = False,
+        completed_at: Optional[datetime] = None,
+        duration_minutes: Optional[int] = None,
+        split: Optional[TrainingSplit] = None,
+        description: Optional[str] = None,
+        notes: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.mesocycle_id = mesocycle_id
+        self.microcycle_id = microcycle_id
+        self.name = name
+        self.description = description
+        self.scheduled_date = scheduled_date
+        self.completed = completed
+        self.completed_at = completed_at
+        self.duration_minutes = duration_minutes
+        self.notes = notes
+        self.split = split
+        self.created_at = created_at
+        self.updated_at = updated_at
@@ -1,9 +1,16 @@
 """Domain repositories package"""
-from .user_repository import IUserRepository
+from .user_repository import DuplicateUserError, IUserRepository
 from .exercise_repository import IExerciseRepository
 from .mesocycle_repository import IMesocycleRepository
 from .workout_repository import IWorkoutRepository
 from .progress_repository import IProgressRepository
+from .exercise_state_repository import IExerciseStateRepository
+from .training_session_repository import DuplicateSessionError, ITrainingSessionRepository
+from .weekly_rollup_repository import IWeeklyRollupRepository
+from .version_counter_repository import IVersionCounterRepository
+from .bulk import BulkItemError, BulkWriteResult
+from .page import Page
+from .read_profile import ReadProfile
 
 __all__ = [
     "IUserRepository",
@@ -11,4 +18,14 @@ __all__ = [
     "IMesocycleRepository",
     "IWorkoutRepository",
     "IProgressRepository",
+    "ITrainingSessionRepository",
+    "IExerciseStateRepository",
+    "IWeeklyRollupRepository",
+    "IVersionCounterRepository",
+    "DuplicateSessionError",
+    "DuplicateUserError",
+    "BulkItemError",
+    "BulkWriteResult",
+    "Page",
+    "ReadProfile",
 ]
@@ -0,0 +1,41 @@
+"""
+Repository Value Object: Bulk Write Result
+
+Outcome of a bulk save, update or delete, with failures reported per item.
+"""
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class BulkItemError:
+    """Why one item of a bulk write was not applied"""
+    
+    index: int
+    id: Any
+    message: str
+    code: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BulkWriteResult:
+    """Result of a bulk write.
+    
+    ``written`` counts the documents inserted, matched (updates) or deleted.
+    Items listed in ``errors`` (by their position in the input) were not
+    applied; every other item was. Deleting an id that does not exist is not
+    an error, it is simply not counted.
+    """
+    
+    written: int = 0
+    errors: Tuple[BulkItemError, ...] = ()
+    
+    @property
+    def ok(self) -> bool:
+        """Whether every item was applied"""
+        return not self.errors
+    
+    @property
+    def failed_indexes(self) -> FrozenSet[int]:
+        """Input positions of the items that were not applied"""
+        return frozenset(error.index for error in self.errors)
@@ -4,9 +4,11 @@ Repository Interface: Exercise Repository
 Defines the contract for exercise persistence operations.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from domain.entities.exercise import Exercise, MuscleGroup, ExerciseType
+from domain.entities.exercise import Exercise, ExerciseSummary, MuscleGroup, ExerciseType
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
 
 
 class IExerciseRepository(ABC):
@@ -24,12 +26,44 @@ class IExerciseRepository(ABC):
         exercise_type: Optional[ExerciseType] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Exercise]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
         """Find all exercises with optional filtering"""
         pass
     
     @abstractmethod
-    async def search(self, query: str, limit: int = 20) -> List[Exercise]:
+    async def find_page(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises by name, resuming after cursor"""
+        pass
+    
+    @abstractmethod
+    async def find_page_with_total(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises together with the total count"""
+        pass
+    
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
         """Search exercises by name or description"""
         pass
     
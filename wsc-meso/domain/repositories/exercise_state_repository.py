@@ -0,0 +1,24 @@
+"""
+Repository Interface: Exercise State Repository
+
+Defines the contract for the rolling per-(user, exercise) training state.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from domain.services.autoregulation import ExerciseObservation, ExerciseState
+
+
+class IExerciseStateRepository(ABC):
+    """Exercise state repository interface"""
+    
+    @abstractmethod
+    async def record(self, user_id: UUID, exercise_id: int, observation: ExerciseObservation) -> ExerciseState:
+        """Fold a session into the state atomically and return the new state"""
+        pass
+    
+    @abstractmethod
+    async def find(self, user_id: UUID, exercise_id: int) -> Optional[ExerciseState]:
+        """Find the state of one exercise for a user"""
+        pass
@@ -4,10 +4,13 @@ Repository Interface: Mesocycle Repository
 Defines the contract for mesocycle persistence operations.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 from uuid import UUID
 
-from domain.entities.mesocycle import Mesocycle, MesocycleStatus
+from domain.entities.mesocycle import Mesocycle, MesocycleSummary, MesocycleStatus
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
 
 
 class IMesocycleRepository(ABC):
@@ -30,10 +33,37 @@ class IMesocycleRepository(ABC):
         status: Optional[MesocycleStatus] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Mesocycle]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Mesocycle, MesocycleSummary]]:
         """Find mesocycles by user ID with optional status filter"""
         pass
     
+    @abstractmethod
+    async def find_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[MesocycleStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Mesocycle, MesocycleSummary]]:
+        """Find one page of a user's mesocycles, newest first, resuming after cursor"""
+        pass
+    
+    @abstractmethod
+    async def find_page_with_total(
+        self,
+        user_id: UUID,
+        status: Optional[MesocycleStatus] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Mesocycle, MesocycleSummary]]:
+        """Find one page of a user's mesocycles together with the total count"""
+        pass
+    
     @abstractmethod
     async def update(self, mesocycle: Mesocycle) -> Mesocycle:
         """Update a mesocycle"""
@@ -44,6 +74,21 @@ class IMesocycleRepository(ABC):
         """Delete a mesocycle"""
         pass
     
+    @abstractmethod
+    async def save_many(self, mesocycles: Sequence[Mesocycle]) -> BulkWriteResult:
+        """Insert mesocycles in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, mesocycles: Sequence[Mesocycle]) -> BulkWriteResult:
+        """Replace mesocycles in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, mesocycle_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete mesocycles in bulk, reporting failures per item"""
+        pass
+    
     @abstractmethod
     async def count_by_user_id(
         self,
@@ -0,0 +1,30 @@
+"""
+Repository Value Object: Page
+
+A slice of a listing plus the token needed to fetch the next slice.
+"""
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a repository listing.
+    
+    ``next_cursor`` is an opaque token for the following page and is
+    ``None`` on the last page. ``total`` is only filled in by the
+    ``find_page_with_total`` listings; with ``estimated=True`` it may be a
+    few seconds stale.
+    """
+    
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    
+    @property
+    def has_more(self) -> bool:
+        """Whether another page exists after this one"""
+        return self.next_cursor is not None
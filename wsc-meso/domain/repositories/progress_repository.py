@@ -5,10 +5,12 @@ Defines the contract for progress persistence operations.
 """
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
 
-from domain.entities.progress import Progress, MetricType
+from domain.entities.progress import Progress, MetricType, ProgressSeries
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
 
 
 class IProgressRepository(ABC):
@@ -37,6 +39,45 @@ class IProgressRepository(ABC):
         """Find progress entries by user ID with optional filters"""
         pass
     
+    @abstractmethod
+    async def find_page_by_user_id(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries, latest first, resuming after cursor"""
+        pass
+    
+    @abstractmethod
+    async def find_page_with_total(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries together with the total count"""
+        pass
+    
+    @abstractmethod
+    async def find_series(
+        self,
+        user_id: UUID,
+        metric_type: MetricType,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> ProgressSeries:
+        """A user's values of one metric in date order, as arrays"""
+        pass
+    
     @abstractmethod
     async def update(self, progress: Progress) -> Progress:
         """Update a progress entry"""
@@ -47,11 +88,28 @@ class IProgressRepository(ABC):
         """Delete a progress entry"""
         pass
     
+    @abstractmethod
+    async def save_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        """Insert progress entries in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        """Replace progress entries in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, progress_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete progress entries in bulk, reporting failures per item"""
+        pass
+    
     @abstractmethod
     async def count_by_user_id(
         self,
         user_id: UUID,
         metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> int:
         """Count progress entries for a user"""
         pass
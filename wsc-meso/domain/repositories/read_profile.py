@@ -0,0 +1,17 @@
+"""
+Repository Value Object: Read Profile
+
+Selects how much of a document a repository read loads.
+"""
+from enum import Enum
+
+
+class ReadProfile(str, Enum):
+    """Projection profile of a repository read.
+    
+    ``SUMMARY`` reads return the entity's summary read model and only fetch
+    the fields list views show; ``DETAIL`` reads return full entities.
+    """
+    
+    SUMMARY = "summary"
+    DETAIL = "detail"
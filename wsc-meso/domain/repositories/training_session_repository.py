@@ -0,0 +1,55 @@
+"""
+Repository Interface: Training Session Repository
+
+Defines the contract for training session persistence operations.
+"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Sequence
+from uuid import UUID
+
+from domain.entities.training_session import TrainingSession
+from domain.repositories.bulk import BulkWriteResult
+
+
+class DuplicateSessionError(ValueError):
+    """A session with the same id was already logged for that week"""
+
+
+class ITrainingSessionRepository(ABC):
+    """Training session repository interface.
+    
+    Sessions are append-only: logging a session whose id is already stored
+    for the same user and week raises DuplicateSessionError (or reports the
+    item as failed in bulk), so retried requests are safe.
+    """
+    
+    @abstractmethod
+    async def append(self, session: TrainingSession) -> TrainingSession:
+        """Store a session and its sets"""
+        pass
+    
+    @abstractmethod
+    async def append_many(self, sessions: Sequence[TrainingSession]) -> BulkWriteResult:
+        """Store many sessions in bulk, reporting failures per session"""
+        pass
+    
+    @abstractmethod
+    async def find_week(self, user_id: UUID, mesocycle_id: UUID, week_number: int) -> List[TrainingSession]:
+        """Find a user's sessions of one mesocycle week, in logging order"""
+        pass
+    
+    @abstractmethod
+    async def find_by_mesocycle_week(self, mesocycle_id: UUID, week_number: int) -> List[TrainingSession]:
+        """Find every session of one mesocycle week"""
+        pass
+    
+    @abstractmethod
+    async def find_by_user_and_date_range(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> List[TrainingSession]:
+        """Find a user's sessions between two dates (inclusive), oldest first"""
+        pass
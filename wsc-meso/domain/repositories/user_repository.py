@@ -5,10 +5,20 @@ Defines the contract for user persistence operations.
 This is a port in hexagonal architecture.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional, Sequence
 from uuid import UUID
 
-from domain.entities.user import User
+from domain.entities.user import TrainingLevel, User
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+
+
+class DuplicateUserError(ValueError):
+    """The email or username is already registered"""
+    
+    def __init__(self, field: str):
+        super().__init__(f"{field} already registered")
+        self.field = field
 
 
 class IUserRepository(ABC):
@@ -16,7 +26,7 @@ class IUserRepository(ABC):
     
     @abstractmethod
     async def save(self, user: User) -> User:
-        """Save a user"""
+        """Save a user; raises DuplicateUserError if the email or username is taken"""
         pass
     
     @abstractmethod
@@ -34,9 +44,14 @@ class IUserRepository(ABC):
         """Find user by username"""
         pass
     
+    @abstractmethod
+    async def find_version(self, user_id: UUID) -> Optional[int]:
+        """Version stamp of a user (None if there is no such user)"""
+        pass
+    
     @abstractmethod
     async def update(self, user: User) -> User:
-        """Update a user"""
+        """Update a user and increment its version"""
         pass
     
     @abstractmethod
@@ -44,6 +59,26 @@ class IUserRepository(ABC):
         """Delete a user"""
         pass
     
+    @abstractmethod
+    async def save_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Insert users in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Replace users in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, user_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete users in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    def usernames(self) -> AsyncIterator[str]:
+        """Every stored username"""
+        pass
+    
     @abstractmethod
     async def exists_by_email(self, email: str) -> bool:
         """Check if user exists by email"""
@@ -53,3 +88,14 @@ class IUserRepository(ABC):
     async def exists_by_username(self, username: str) -> bool:
         """Check if user exists by username"""
         pass
+    
+    @abstractmethod
+    async def find_page_with_total(
+        self,
+        training_level: Optional[TrainingLevel] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[User]:
+        """Find one page of users by username together with the total count"""
+        pass
@@ -0,0 +1,21 @@
+"""
+Repository Interface: Version Counter Repository
+
+Defines the contract for named counters that change whenever the data
+behind a cached value does.
+"""
+from abc import ABC, abstractmethod
+
+
+class IVersionCounterRepository(ABC):
+    """Version counter repository interface"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> int:
+        """Current version of a key (0 if it was never incremented)"""
+        pass
+    
+    @abstractmethod
+    async def increment(self, key: str) -> int:
+        """Atomically increment a key's version and return the new one"""
+        pass
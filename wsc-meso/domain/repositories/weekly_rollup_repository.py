@@ -0,0 +1,48 @@
+"""
+Repository Interface: Weekly Rollup Repository
+
+Defines the contract for the incrementally maintained weekly and daily
+rollups.
+"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+
+
+class IWeeklyRollupRepository(ABC):
+    """Weekly rollup repository interface"""
+    
+    @abstractmethod
+    async def record(self, increments: Sequence[WeeklyRollup]) -> None:
+        """Add weekly and daily increments to their rollups, creating missing ones"""
+        pass
+    
+    @abstractmethod
+    async def find_by_mesocycle(self, mesocycle_id: UUID) -> List[WeeklyRollup]:
+        """Every rollup of a mesocycle, by week and exercise"""
+        pass
+    
+    @abstractmethod
+    async def find_by_user(
+        self,
+        user_id: UUID,
+        start: date,
+        end: date,
+        exercise_id: Optional[int] = None,
+    ) -> List[WeeklyRollup]:
+        """A user's rollups of one exercise (None: week totals) for weeks starting in a range"""
+        pass
+    
+    @abstractmethod
+    async def find_daily_by_user(
+        self,
+        user_id: UUID,
+        start: date,
+        end: date,
+        exercise_id: Optional[int] = None,
+    ) -> List[DailyRollup]:
+        """A user's daily rollups of one exercise (None: day totals) between two dates (inclusive), oldest first"""
+        pass
@@ -5,10 +5,13 @@ Defines the contract for workout persistence operations.
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 from uuid import UUID
 
-from domain.entities.workout import Workout
+from domain.entities.workout import Workout, WorkoutSummary
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
 
 
 class IWorkoutRepository(ABC):
@@ -31,10 +34,37 @@ class IWorkoutRepository(ABC):
         completed: Optional[bool] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Workout]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Workout, WorkoutSummary]]:
         """Find workouts by mesocycle ID"""
         pass
     
+    @abstractmethod
+    async def find_page_by_mesocycle_id(
+        self,
+        mesocycle_id: UUID,
+        completed: Optional[bool] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Workout, WorkoutSummary]]:
+        """Find one page of a mesocycle's workouts, latest first, resuming after cursor"""
+        pass
+    
+    @abstractmethod
+    async def find_page_with_total(
+        self,
+        mesocycle_id: UUID,
+        completed: Optional[bool] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Workout, WorkoutSummary]]:
+        """Find one page of a mesocycle's workouts together with the total count"""
+        pass
+    
     @abstractmethod
     async def find_by_date_range(
         self,
@@ -55,6 +85,21 @@ class IWorkoutRepository(ABC):
         """Delete a workout"""
         pass
     
+    @abstractmethod
+    async def save_many(self, workouts: Sequence[Workout]) -> BulkWriteResult:
+        """Insert workouts in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, workouts: Sequence[Workout]) -> BulkWriteResult:
+        """Replace workouts in bulk, reporting failures per item"""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, workout_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete workouts in bulk, reporting failures per item"""
+        pass
+    
     @abstractmethod
     async def count_by_mesocycle_id(
         self,
@@ -0,0 +1,58 @@
+"""Domain services package"""
+from .analytics import (
+    SeriesAnalysis,
+    analyze_series,
+    classify_trend,
+    lttb,
+    moving_average,
+    robust_slope,
+)
+from .autoregulation import (
+    ExerciseObservation,
+    ExerciseState,
+    advance_state,
+    next_adjustment,
+    observe,
+    overtraining_risk,
+    recovery_recommendation,
+)
+from .periodization import (
+    ExercisePool,
+    MesocyclePlan,
+    PlannedDay,
+    PlannedWeek,
+    Prescription,
+    SPLIT_MUSCLE_GROUPS,
+    default_deload_weeks,
+    freeze_exercise_pool,
+    generate_plan,
+    materialize_plan,
+    weekly_splits,
+)
+
+__all__ = [
+    "SeriesAnalysis",
+    "analyze_series",
+    "classify_trend",
+    "lttb",
+    "moving_average",
+    "robust_slope",
+    "ExerciseObservation",
+    "ExerciseState",
+    "advance_state",
+    "next_adjustment",
+    "observe",
+    "overtraining_risk",
+    "recovery_recommendation",
+    "ExercisePool",
+    "MesocyclePlan",
+    "PlannedDay",
+    "PlannedWeek",
+    "Prescription",
+    "SPLIT_MUSCLE_GROUPS",
+    "default_deload_weeks",
+    "freeze_exercise_pool",
+    "generate_plan",
+    "materialize_plan",
+    "weekly_splits",
+]
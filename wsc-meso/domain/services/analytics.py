@@ -0,0 +1,156 @@
+"""
+Progress Analytics
+
+Summary statistics, robust trend and chart-ready downsampling of a
+``ProgressSeries``.
+
+Everything works on the series arrays: the statistics and the trend fit
+are vectorized over every point, the moving average is a prefix-sum
+difference over a window of days, and only the points chosen by LTTB
+(Largest-Triangle-Three-Buckets) are turned into response objects.
+"""
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from domain.entities.progress import ProgressSeries
+
+# Fitted change over the whole range, relative to the median value, below
+# which the trend is reported as stable
+STABLE_CHANGE = 0.01
+
+# Huber tuning constant (95% efficiency under normal noise) and the
+# iteratively reweighted least squares limits
+HUBER_K = 1.345
+IRLS_ITERATIONS = 20
+IRLS_TOLERANCE = 1e-6
+
+# LTTB buckets up to this size are scanned in plain Python, which beats
+# NumPy's per-call overhead on a handful of points
+_SMALL_BUCKET = 48
+
+
+class SeriesAnalysis(NamedTuple):
+    """Statistics of a series and the points to chart"""
+    
+    count: int
+    average: float
+    minimum: float
+    maximum: float
+    slope_per_day: float
+    trend: str  # increasing, decreasing or stable
+    indices: np.ndarray  # points kept for the chart
+    moving_average: Optional[np.ndarray]  # at the kept points
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of ``threshold`` points that keep the shape of (x, y).
+    
+    The first and last points are always kept; the rest of the series is
+    cut into ``threshold - 2`` buckets and from each one the point forming
+    the largest triangle with the previously kept point and the next
+    bucket's average is chosen.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.intp) + 1
+    counts = np.diff(edges)
+    # Average of each bucket, seen from the bucket before it; the last
+    # bucket looks at the last point
+    next_x = np.append(np.add.reduceat(x[:-1], edges[1:-1]) / counts[1:], x[-1])
+    next_y = np.append(np.add.reduceat(y[:-1], edges[1:-1]) / counts[1:], y[-1])
+    small = counts.max() <= _SMALL_BUCKET
+    xs, ys = (x.tolist(), y.tolist()) if small else (x, y)
+    bounds, next_x, next_y = edges.tolist(), next_x.tolist(), next_y.tolist()
+    
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        # Twice the triangle area, as a linear function of the candidate
+        ax, ay, cx, cy = xs[a], ys[a], next_x[i], next_y[i]
+        kx, ky, k = cy - ay, ax - cx, cx * ay - ax * cy
+        if small:
+            best, best_area = lo, -1.0
+            for j in range(lo, hi):
+                area = abs(xs[j] * kx + ys[j] * ky + k)
+                if area > best_area:
+                    best, best_area = j, area
+            a = best
+        else:
+            a = lo + int(np.abs(x[lo:hi] * kx + y[lo:hi] * ky + k).argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def robust_slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Slope of a Huber regression of y on x (IRLS, scale from the MAD)"""
+    if len(x) < 2 or np.ptp(x) == 0:
+        return 0.0
+    x = x - x.mean()
+    weights = np.ones_like(y)
+    slope = intercept = 0.0
+    for _ in range(IRLS_ITERATIONS):
+        total = weights.sum()
+        mean_x, mean_y = (weights @ x) / total, (weights @ y) / total
+        dx = x - mean_x
+        spread = weights @ (dx * dx)
+        if spread == 0:
+            break
+        new_slope = (weights @ (dx * (y - mean_y))) / spread
+        intercept = mean_y - new_slope * mean_x
+        converged = abs(new_slope - slope) <= IRLS_TOLERANCE * max(1.0, abs(new_slope))
+        slope = new_slope
+        if converged:
+            break
+        residuals = np.abs(y - intercept - slope * x)
+        scale = 1.4826 * np.median(residuals)
+        if scale == 0:
+            break
+        weights = np.minimum(1.0, HUBER_K * scale / np.maximum(residuals, 1e-300))
+    return float(slope)
+
+
+def moving_average(days: np.ndarray, values: np.ndarray, window_days: int) -> np.ndarray:
+    """Trailing mean of the values within ``window_days`` days of each point"""
+    sums = np.concatenate(([0.0], np.cumsum(values)))
+    end = np.arange(1, len(days) + 1)
+    start = np.searchsorted(days, days - window_days + 1, side="left")
+    return (sums[end] - sums[start]) / (end - start)
+
+
+def classify_trend(slope_per_day: float, span_days: float, level: float) -> str:
+    """Increasing, decreasing or stable, from the fitted change over the span"""
+    change = slope_per_day * span_days
+    if abs(change) <= STABLE_CHANGE * abs(level):
+        return "stable"
+    return "increasing" if change > 0 else "decreasing"
+
+
+def analyze_series(
+    series: ProgressSeries,
+    max_points: int,
+    moving_average_days: Optional[int] = None,
+) -> Optional[SeriesAnalysis]:
+    """Statistics, trend and chart points of a series (None if it is empty)"""
+    if not len(series):
+        return None
+    days = series.days.astype(np.float64)
+    values = series.values
+    slope = robust_slope(days, values)
+    indices = lttb(days, values, max_points)
+    averages = None
+    if moving_average_days:
+        averages = moving_average(series.days, values, moving_average_days)[indices]
+    return SeriesAnalysis(
+        count=len(values),
+        average=float(values.mean()),
+        minimum=float(values.min()),
+        maximum=float(values.max()),
+        slope_per_day=slope,
+        trend=classify_trend(slope, float(days[-1] - days[0]), float(np.median(values))),
+        indices=indices,
+        moving_average=averages,
+    )
@@ -0,0 +1,174 @@
+"""
+Autoregulation
+
+Per-exercise rolling state and the next-session adjustments derived from it.
+
+Each (user, exercise) pair keeps a constant-size ``ExerciseState``: the last
+top set, the best estimated 1RM, exponentially weighted averages of RPE and
+fatigue, and an exponentially weighted e1RM trend. ``advance_state`` folds
+one session into it, so recommendations never need the session history.
+"""
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Union
+
+from domain.entities.training_session import SetColumns, SetPerformed
+
+# Weight of the newest session in the RPE, fatigue and trend averages
+RPE_ALPHA = 0.3
+TREND_ALPHA = 0.3
+
+# Load change per RPE point between target and logged effort, and its cap
+LOAD_PER_RPE = 0.03
+MAX_LOAD_CHANGE = 0.10
+LOAD_INCREMENT_KG = 2.5
+
+# Effort above target (RPE points, averaged) that signals accumulated fatigue
+FATIGUE_MARGIN = 0.5
+OVERREACHING_MARGIN = 1.5
+HIGH_FATIGUE = 8.0
+
+
+class ExerciseObservation(NamedTuple):
+    """One session of one exercise, reduced to what the state needs"""
+    
+    weight_kg: float  # top set (highest e1RM)
+    reps: int
+    e1rm: float
+    rpe: float  # mean over sets
+    fatigue: Optional[float]
+    volume: float
+    sets: int
+
+
+class ExerciseState(NamedTuple):
+    """Rolling per-(user, exercise) training state"""
+    
+    exercise_id: int
+    sessions: int
+    last_weight_kg: float
+    last_reps: int
+    last_e1rm: float
+    best_e1rm: float
+    rpe_ewma: float
+    fatigue_ewma: Optional[float]
+    trend_slope: float  # kg of e1RM per session
+
+
+def observe(
+    sets: Union[SetColumns, Sequence[SetPerformed]],
+    fatigue: Iterable[int] = (),
+) -> ExerciseObservation:
+    """Summarize the sets of one exercise in one session"""
+    if not isinstance(sets, SetColumns):
+        sets = SetColumns.from_sets(sets)
+    if not len(sets):
+        raise ValueError("An exercise needs at least one set")
+    e1rms = sets.estimate_1rm()
+    top = int(e1rms.argmax())
+    ratings = list(fatigue)
+    return ExerciseObservation(
+        weight_kg=float(sets.weight_kg[top]),
+        reps=int(sets.reps_achieved[top]),
+        e1rm=round(float(e1rms[top]), 2),
+        rpe=sets.average_rpe(),
+        fatigue=sum(ratings) / len(ratings) if ratings else None,
+        volume=sets.total_volume(),
+        sets=len(sets),
+    )
+
+
+def _ewma(previous: Optional[float], value: float, alpha: float) -> float:
+    return value if previous is None else alpha * value + (1 - alpha) * previous
+
+
+def advance_state(
+    state: Optional[ExerciseState],
+    exercise_id: int,
+    observation: ExerciseObservation,
+) -> ExerciseState:
+    """Fold one session into the state (None for the exercise's first session).
+    
+    Mirrors the update pipeline the state repository runs in the database.
+    """
+    if state is None:
+        return ExerciseState(
+            exercise_id=exercise_id,
+            sessions=1,
+            last_weight_kg=observation.weight_kg,
+            last_reps=observation.reps,
+            last_e1rm=observation.e1rm,
+            best_e1rm=observation.e1rm,
+            rpe_ewma=observation.rpe,
+            fatigue_ewma=observation.fatigue,
+            trend_slope=0.0,
+        )
+    fatigue = state.fatigue_ewma
+    if observation.fatigue is not None:
+        fatigue = _ewma(fatigue, observation.fatigue, RPE_ALPHA)
+    return ExerciseState(
+        exercise_id=exercise_id,
+        sessions=state.sessions + 1,
+        last_weight_kg=observation.weight_kg,
+        last_reps=observation.reps,
+        last_e1rm=observation.e1rm,
+        best_e1rm=max(state.best_e1rm, observation.e1rm),
+        rpe_ewma=_ewma(state.rpe_ewma, observation.rpe, RPE_ALPHA),
+        fatigue_ewma=fatigue,
+        trend_slope=_ewma(state.trend_slope, observation.e1rm - state.last_e1rm, TREND_ALPHA),
+    )
+
+
+def _round_load(weight_kg: float) -> float:
+    return round(weight_kg / LOAD_INCREMENT_KG) * LOAD_INCREMENT_KG
+
+
+def next_adjustment(state: ExerciseState, last_rpe: float, target_rpe: float) -> Dict[str, object]:
+    """Load and reps for the exercise's next session.
+    
+    The last top set's weight moves ``LOAD_PER_RPE`` per RPE point the
+    session missed its target by, capped at ``MAX_LOAD_CHANGE``; a falling
+    trend while effort stays above target holds the load instead of adding.
+    """
+    gap = target_rpe - last_rpe
+    change = max(-MAX_LOAD_CHANGE, min(MAX_LOAD_CHANGE, gap * LOAD_PER_RPE))
+    if change > 0 and state.trend_slope < 0 and state.rpe_ewma > target_rpe:
+        change = 0.0
+    weight = _round_load(state.last_weight_kg * (1 + change))
+    if gap >= 1:
+        action = "increase"
+    elif gap <= -1:
+        action = "decrease"
+    else:
+        action = "maintain"
+    return {
+        "action": action,
+        "weight_kg": weight,
+        "reps": state.last_reps,
+        "target_rpe": target_rpe,
+        "load_change_pct": round((weight / state.last_weight_kg - 1) * 100, 1) if state.last_weight_kg else 0.0,
+        "best_e1rm_kg": state.best_e1rm,
+        "trend_kg_per_session": round(state.trend_slope, 2),
+    }
+
+
+def _overreaching(state: ExerciseState, target_rpe: float) -> bool:
+    fatigued = state.fatigue_ewma is not None and state.fatigue_ewma >= HIGH_FATIGUE
+    straining = state.rpe_ewma >= target_rpe + OVERREACHING_MARGIN
+    return state.sessions > 1 and (fatigued or straining) and state.trend_slope <= 0
+
+
+def overtraining_risk(states: Sequence[ExerciseState], target_rpe: float) -> bool:
+    """Whether effort or fatigue keeps rising while strength stalls on most exercises"""
+    if not states:
+        return False
+    flagged = sum(_overreaching(state, target_rpe) for state in states)
+    return flagged * 2 >= len(states) and flagged > 0
+
+
+def recovery_recommendation(states: Sequence[ExerciseState], target_rpe: float, risk: bool) -> str:
+    """Recovery advice for the days until the next session"""
+    if risk:
+        return ("Overreaching: deload next week (about half the sets, RPE 6-7) "
+                "and prioritize sleep before pushing load again")
+    if any(state.rpe_ewma >= target_rpe + FATIGUE_MARGIN for state in states):
+        return "Fatigue is building: allow 48-72 h before training these muscles again"
+    return "Recovery on track: continue with the planned progression"
@@ -0,0 +1,368 @@
+"""
+Periodization Engine
+
+Deterministic generation of a mesocycle's training plan: the week × day ×
+exercise prescription grid for each periodization model, computed with
+NumPy broadcasting, plus the microcycles and training days derived from it.
+"""
+from functools import lru_cache
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities.exercise import MuscleGroup
+from domain.entities.mesocycle import PeriodizationModel, TrainingGoal
+from domain.entities.microcycle import IntensityRange, Microcycle, TrainingPhase
+from domain.entities.workout import TrainingSplit
+
+
+class GoalProfile(NamedTuple):
+    """Loading parameters of a training goal"""
+    
+    intensity: Tuple[float, float]  # %1RM band the mesocycle moves through
+    reps: Tuple[int, int]
+    sets: float
+    rest_seconds: int
+    rir: int
+
+
+class LevelProfile(NamedTuple):
+    """Volume and exercise count adjustments of a training level"""
+    
+    volume: float
+    exercises_per_day: int
+    intensity_offset: float
+
+
+GOAL_PROFILES: Dict[TrainingGoal, GoalProfile] = {
+    TrainingGoal.STRENGTH: GoalProfile((0.75, 0.90), (2, 6), 4.0, 180, 2),
+    TrainingGoal.HYPERTROPHY: GoalProfile((0.65, 0.80), (6, 12), 4.0, 120, 2),
+    TrainingGoal.POWER: GoalProfile((0.70, 0.85), (2, 5), 5.0, 180, 3),
+    TrainingGoal.ENDURANCE: GoalProfile((0.50, 0.65), (12, 20), 3.0, 60, 2),
+    TrainingGoal.DEFINITION: GoalProfile((0.60, 0.75), (10, 15), 3.0, 75, 2),
+}
+
+LEVEL_PROFILES: Dict[str, LevelProfile] = {
+    "beginner": LevelProfile(0.8, 4, -0.05),
+    "intermediate": LevelProfile(1.0, 5, 0.0),
+    "advanced": LevelProfile(1.15, 6, 0.0),
+    "elite": LevelProfile(1.25, 6, 0.02),
+}
+
+# Training days (1=Monday) and splits by weekly frequency
+TRAINING_DAYS: Dict[int, Tuple[int, ...]] = {
+    3: (1, 3, 5),
+    4: (1, 2, 4, 5),
+    5: (1, 2, 3, 5, 6),
+    6: (1, 2, 3, 4, 5, 6),
+}
+WEEKLY_SPLITS: Dict[int, Tuple[TrainingSplit, ...]] = {
+    3: (TrainingSplit.FULLBODY,) * 3,
+    4: (TrainingSplit.UPPER, TrainingSplit.LOWER) * 2,
+    5: (TrainingSplit.PUSH, TrainingSplit.PULL, TrainingSplit.LEGS, TrainingSplit.UPPER, TrainingSplit.LOWER),
+    6: (TrainingSplit.PUSH, TrainingSplit.PULL, TrainingSplit.LEGS) * 2,
+}
+SPLIT_MUSCLE_GROUPS: Dict[TrainingSplit, Tuple[MuscleGroup, ...]] = {
+    TrainingSplit.PUSH: (MuscleGroup.PECTORALS, MuscleGroup.SHOULDERS, MuscleGroup.TRICEPS),
+    TrainingSplit.PULL: (MuscleGroup.BACK, MuscleGroup.BICEPS, MuscleGroup.FOREARMS),
+    TrainingSplit.LEGS: (MuscleGroup.LEGS, MuscleGroup.ABS),
+    TrainingSplit.UPPER: (
+        MuscleGroup.PECTORALS, MuscleGroup.BACK, MuscleGroup.SHOULDERS, MuscleGroup.BICEPS, MuscleGroup.TRICEPS,
+    ),
+    TrainingSplit.LOWER: (MuscleGroup.LEGS, MuscleGroup.ABS),
+    TrainingSplit.FULLBODY: (MuscleGroup.LEGS, MuscleGroup.PECTORALS, MuscleGroup.BACK, MuscleGroup.SHOULDERS),
+}
+
+# Accumulation, transmutation and realization start at these fractions of the mesocycle
+PHASE_STARTS = np.array([0.0, 0.4, 0.75])
+_PHASES = (TrainingPhase.ACCUMULATION, TrainingPhase.TRANSMUTATION, TrainingPhase.REALIZATION)
+# Relative load band of each block phase
+_BLOCK_LOAD = np.array([[0.0, 0.3], [0.45, 0.7], [0.85, 1.0]])
+# Heavy, moderate and light days of daily undulating periodization
+_DUP_OFFSETS = np.array([0.25, 0.0, -0.25])
+
+# The first two exercises of a day are the main lifts; the rest are accessories
+MAIN_LIFTS = 2
+ACCESSORY_INTENSITY_STEP = 0.04
+ACCESSORY_EXTRA_REPS = 3
+ACCESSORY_VOLUME = 0.75
+ACCESSORY_REST = 0.67
+DELOAD_INTENSITY = 0.9
+DELOAD_VOLUME = 0.6
+SECONDS_PER_SET = 40
+WARMUP_MINUTES = 10
+
+# Distinct (model, goal, level, weeks, frequency, deloads, pool) plans kept in memory
+PLAN_CACHE_SIZE = 256
+
+
+class Prescription(NamedTuple):
+    """One exercise of a training day"""
+    
+    exercise_id: Optional[int]
+    sets: int
+    reps: str
+    target_rpe: int
+    rest_seconds: int
+    weekly_progression_pct: float
+    intensity_pct: float
+
+
+class PlannedDay(NamedTuple):
+    """A training day of one week"""
+    
+    day_of_week: int
+    split: TrainingSplit
+    exercises: Tuple[Prescription, ...]
+    estimated_duration_minutes: int
+    warmup_sets: int
+
+
+class PlannedWeek(NamedTuple):
+    """A week of the plan with its microcycle-level targets"""
+    
+    week: int
+    phase: TrainingPhase
+    intensity_range: Tuple[float, float]
+    reps_range: str
+    sets_range: str
+    rir: int
+    volume_multiplier: float
+    days: Tuple[PlannedDay, ...]
+
+
+class PrescriptionGrid(NamedTuple):
+    """Read-only (weeks, days, exercises) arrays the plan is built from"""
+    
+    intensity: np.ndarray
+    sets: np.ndarray
+    reps_low: np.ndarray
+    reps_high: np.ndarray
+    rir: np.ndarray
+    rest_seconds: np.ndarray
+
+
+class MesocyclePlan(NamedTuple):
+    """Generated plan of a mesocycle"""
+    
+    periodization_model: PeriodizationModel
+    goal: TrainingGoal
+    training_level: str
+    deload_weeks: Tuple[int, ...]
+    weeks: Tuple[PlannedWeek, ...]
+    microcycles: Tuple[Microcycle, ...]
+    grid: PrescriptionGrid
+
+
+# Hashable form of an exercise pool: (split, exercise ids) pairs sorted by split
+ExercisePool = Tuple[Tuple[TrainingSplit, Tuple[int, ...]], ...]
+
+
+def default_deload_weeks(duration_weeks: int) -> List[int]:
+    """Deload every fourth week"""
+    return list(range(4, duration_weeks + 1, 4))
+
+
+def weekly_splits(weekly_frequency: int) -> Tuple[TrainingSplit, ...]:
+    """Split of each training day for a weekly frequency"""
+    try:
+        return WEEKLY_SPLITS[weekly_frequency]
+    except KeyError:
+        raise ValueError("Weekly frequency must be between 3 and 6") from None
+
+
+def _relative_load(model: PeriodizationModel, weeks: int, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Relative load in [0, 1] per (week, day) and the phase index of each week"""
+    position = np.arange(weeks) / weeks
+    phase = np.searchsorted(PHASE_STARTS, position, side="right") - 1
+    progress = np.linspace(0.0, 1.0, weeks)
+    
+    if model is PeriodizationModel.LINEAR:
+        load = np.broadcast_to(progress[:, None], (weeks, days))
+    elif model is PeriodizationModel.DAILY_UNDULATING:
+        load = (0.25 + 0.5 * progress)[:, None] + _DUP_OFFSETS[np.arange(days) % 3]
+    elif model is PeriodizationModel.BLOCK:
+        ends = np.append(PHASE_STARTS[1:], 1.0)
+        within = (position - PHASE_STARTS[phase]) / (ends[phase] - PHASE_STARTS[phase])
+        low, high = _BLOCK_LOAD[phase, 0], _BLOCK_LOAD[phase, 1]
+        load = np.broadcast_to((low + (high - low) * within)[:, None], (weeks, days))
+    elif model is PeriodizationModel.POLARIZED:
+        # One high-intensity day mid-week, every other day easy
+        hard = np.arange(days) == days // 2
+        load = np.where(hard, (0.85 + 0.15 * progress)[:, None], (0.1 + 0.2 * progress)[:, None])
+    else:
+        raise ValueError(f"Unsupported periodization model: {model}")
+    return np.clip(load, 0.0, 1.0), phase
+
+
+def _exercise_ids(
+    splits: Sequence[TrainingSplit],
+    exercises_per_day: int,
+    exercise_pool: Optional[Mapping[TrainingSplit, Sequence[int]]],
+) -> List[List[Optional[int]]]:
+    """Exercise of each (day, slot); repeated splits move on to the next exercises"""
+    ids: List[List[Optional[int]]] = []
+    seen: Dict[TrainingSplit, int] = {}
+    for split in splits:
+        pool = (exercise_pool or {}).get(split) or ()
+        repeat = seen.get(split, 0)
+        seen[split] = repeat + 1
+        if not pool:
+            ids.append([None] * exercises_per_day)
+            continue
+        start = repeat * exercises_per_day
+        ids.append([pool[(start + slot) % len(pool)] for slot in range(exercises_per_day)])
+    return ids
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def generate_plan(
+    periodization_model: PeriodizationModel,
+    goal: TrainingGoal,
+    training_level: str,
+    duration_weeks: int,
+    weekly_frequency: int,
+    deload_weeks: Optional[Sequence[int]] = None,
+    exercise_pool: Optional[Mapping[TrainingSplit, Sequence[int]]] = None,
+) -> MesocyclePlan:
+    """Build the full plan of a mesocycle.
+    
+    Every prescription is computed on (weeks, days, exercises) arrays:
+    the periodization model sets a relative load per (week, day), the
+    goal maps it onto an intensity band, and reps follow from intensity
+    (inverse Epley minus reps in reserve). Accessories are lighter, higher
+    rep and shorter rest than the main lifts, and deload weeks cut volume
+    and intensity. ``exercise_pool`` lists candidate exercise ids per split
+    in order of preference; without it exercise ids are left empty.
+    """
+    if not 4 <= duration_weeks <= 16:
+        raise ValueError("Duration must be between 4 and 16 weeks")
+    splits = weekly_splits(weekly_frequency)
+    profile = GOAL_PROFILES[goal]
+    level = LEVEL_PROFILES.get(training_level, LEVEL_PROFILES["intermediate"])
+    deloads = tuple(sorted(set(default_deload_weeks(duration_weeks) if deload_weeks is None else deload_weeks)))
+    weeks, days, slots = duration_weeks, weekly_frequency, level.exercises_per_day
+    
+    load, phase = _relative_load(periodization_model, weeks, days)
+    deload = np.isin(np.arange(1, weeks + 1), deloads)
+    deload_day = deload[:, None]
+    deload_cell = deload[:, None, None]
+    
+    slot = np.arange(slots)
+    accessory = slot >= MAIN_LIFTS
+    low, high = profile.intensity
+    high += level.intensity_offset
+    
+    intensity = (low + (high - low) * load)[:, :, None] * (1.0 - ACCESSORY_INTENSITY_STEP * slot)
+    intensity = np.where(deload_cell, intensity * DELOAD_INTENSITY, intensity)
+    
+    rir = np.clip(np.rint(profile.rir + 1 - 2 * load), 0, 4)
+    rir = np.where(deload_day, np.minimum(rir + 2, 5), rir).astype(np.int64)
+    
+    reps_cap = profile.reps[1] + np.where(accessory, ACCESSORY_EXTRA_REPS, 0)
+    reps = 30.0 * (1.0 / intensity - 1.0) - rir[:, :, None]
+    reps_low = np.clip(np.floor(reps), profile.reps[0], reps_cap - 2).astype(np.int64)
+    reps_high = reps_low + 2
+    
+    sets = profile.sets * level.volume * (1.2 - 0.4 * load)[:, :, None] * np.where(accessory, ACCESSORY_VOLUME, 1.0)
+    sets = np.where(deload_cell, sets * DELOAD_VOLUME, sets)
+    sets = np.clip(np.rint(sets), 1, 6).astype(np.int64)
+    
+    rest = profile.rest_seconds * (0.75 + 0.5 * load)[:, :, None] * np.where(accessory, ACCESSORY_REST, 1.0)
+    rest = (np.rint(rest / 15.0) * 15).astype(np.int64)
+    
+    progression = np.diff(intensity, axis=0, prepend=intensity[:1]) / intensity
+    duration = WARMUP_MINUTES + (sets * (rest + SECONDS_PER_SET)).sum(axis=2) // 60
+    warmup = np.where(intensity[:, :, 0] >= 0.75, 3, 2)
+    volume = np.clip(level.volume * (1.2 - 0.4 * load).mean(axis=1) * np.where(deload, DELOAD_VOLUME, 1.0), 0.5, 2.0)
+    
+    # Materialize from flat lists (one tolist() per array) to keep per-plan allocations low
+    ids = _exercise_ids(splits, slots, exercise_pool)
+    cells = weeks * days * slots
+    reps_labels = {low: f"{low}-{low + 2}" for low in range(profile.reps[0], int(reps_cap.max()) - 1)}
+    prescriptions = list(map(
+        Prescription,
+        [exercise_id for day_ids in ids for exercise_id in day_ids] * weeks,
+        sets.ravel().tolist(),
+        [reps_labels[low] for low in reps_low.ravel().tolist()],
+        np.repeat(10 - rir, slots).tolist(),
+        rest.ravel().tolist(),
+        np.round(progression, 4).ravel().tolist(),
+        np.round(intensity, 3).ravel().tolist(),
+    ))
+    planned_days = list(map(
+        PlannedDay,
+        TRAINING_DAYS[weekly_frequency] * weeks,
+        splits * weeks,
+        [tuple(prescriptions[i:i + slots]) for i in range(0, cells, slots)],
+        duration.ravel().tolist(),
+        warmup.ravel().tolist(),
+    ))
+    phases = [TrainingPhase.DELOAD if is_deload else _PHASES[p] for p, is_deload in zip(phase.tolist(), deload.tolist())]
+    planned_weeks = tuple(map(
+        PlannedWeek,
+        range(1, weeks + 1),
+        phases,
+        zip(np.round(intensity.min(axis=(1, 2)), 3).tolist(), np.round(intensity.max(axis=(1, 2)), 3).tolist()),
+        [f"{low}-{high}" for low, high in zip(reps_low.min(axis=(1, 2)).tolist(), reps_high.max(axis=(1, 2)).tolist())],
+        [f"{low}-{high}" for low, high in zip(sets.min(axis=(1, 2)).tolist(), sets.max(axis=(1, 2)).tolist())],
+        np.rint(rir.mean(axis=1)).astype(np.int64).tolist(),
+        np.round(volume, 2).tolist(),
+        [tuple(planned_days[i:i + days]) for i in range(0, weeks * days, days)],
+    ))
+    
+    grid = PrescriptionGrid(
+        _read_only(intensity), _read_only(sets), _read_only(reps_low),
+        _read_only(reps_high), _read_only(rir), _read_only(rest),
+    )
+    # One microcycle per week; they belong to the plan, not to a mesocycle
+    microcycles = tuple(
+        Microcycle(
+            id=week.week,
+            mesocycle_id=None,
+            microcycle_number=week.week,
+            week_start=week.week,
+            week_end=week.week,
+            phase=week.phase,
+            intensity_range=IntensityRange(*week.intensity_range),
+            reps_range=week.reps_range,
+            sets_range=week.sets_range,
+            rir=week.rir,
+            weekly_volume_multiplier=week.volume_multiplier,
+            frequency_per_week=days,
+        )
+        for week in planned_weeks
+    )
+    return MesocyclePlan(periodization_model, goal, training_level, deloads, planned_weeks, microcycles, grid)
+
+
+def freeze_exercise_pool(exercise_pool: Optional[Mapping[TrainingSplit, Sequence[int]]]) -> ExercisePool:
+    """Hashable copy of an exercise pool, usable as a cache key"""
+    return tuple(sorted((split, tuple(ids)) for split, ids in (exercise_pool or {}).items()))
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def materialize_plan(
+    periodization_model: PeriodizationModel,
+    goal: TrainingGoal,
+    training_level: str,
+    duration_weeks: int,
+    weekly_frequency: int,
+    deload_weeks: Tuple[int, ...],
+    exercise_pool: ExercisePool = (),
+) -> MesocyclePlan:
+    """Memoized generate_plan.
+    
+    Plans are fully immutable (tuples, frozen microcycles and read-only
+    arrays), so one instance is shared by every mesocycle with the same
+    parameters. Most users pick from a handful of configurations, so a
+    small LRU serves nearly every request.
+    """
+    return generate_plan(
+        periodization_model, goal, training_level, duration_weeks, weekly_frequency,
+        deload_weeks, dict(exercise_pool),
+    )
@@ -0,0 +1,14 @@
+"""Infrastructure cache package"""
+from .bloom_filter import BloomFilter
+from .ttl_cache import TTLCache
+from .user_cache import CachedUserRepository
+from .username_filter import UsernameFilter
+from .versioned_cache import VersionedCache
+
+__all__ = [
+    "BloomFilter",
+    "CachedUserRepository",
+    "TTLCache",
+    "UsernameFilter",
+    "VersionedCache",
+]
@@ -0,0 +1,50 @@
+"""
+Bloom Filter
+
+Fixed-size probabilistic set of strings.
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Set membership with no false negatives and a bounded false-positive rate.
+    
+    Sized for ``capacity`` items at ``error_rate``; adding more items keeps
+    working but raises the false-positive rate. Items cannot be removed.
+    Positions come from one BLAKE2b digest split into two 64-bit hashes
+    (Kirsch-Mitzenmacher double hashing).
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+    
+    def add(self, item: str) -> None:
+        """Add an item"""
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        """False if the item was never added; True if it probably was"""
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the bit array"""
+        return len(self._bits)
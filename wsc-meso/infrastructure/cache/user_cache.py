@@ -0,0 +1,140 @@
+"""
+User Cache
+
+Read-through cache of users by id in front of IUserRepository.
+
+Profiles are read on every screen of the apps and rarely change. A worker
+serves a cached user for ``version_ttl_seconds`` without a round trip;
+after that it reads only the user's ``version`` stamp (incremented by every
+update, on any worker) and keeps serving the cached copy while it matches.
+Updates through this worker write through, so its own changes show at
+once; other workers' show after at most ``version_ttl_seconds``.
+"""
+import copy
+import time
+from typing import AsyncIterator, Callable, Optional, Sequence
+from uuid import UUID
+
+from domain.entities.user import TrainingLevel, User
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.user_repository import IUserRepository
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+class CachedUserRepository(IUserRepository):
+    """User repository that caches ``find_by_id``.
+    
+    Entries are dropped after ``ttl_seconds`` without a read or once
+    ``max_entries`` is reached (least recently used first). Callers get
+    copies, so changing a returned user does not change the cache. Other
+    reads go straight to the wrapped repository.
+    """
+    
+    def __init__(
+        self,
+        repository: IUserRepository,
+        ttl_seconds: float = 300.0,
+        version_ttl_seconds: float = 5.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.repository = repository
+        self.version_ttl_seconds = version_ttl_seconds
+        self._clock = clock
+        # user id -> (user, when its version was last confirmed)
+        self._users = TTLCache(ttl_seconds, max_entries, clock)
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+    
+    def _remember(self, user: User) -> None:
+        self._users.set(user.id, (copy.copy(user), self._clock()))
+    
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        """Find user by ID"""
+        entry = self._users.get(user_id)
+        if entry is not None:
+            user, checked_at = entry
+            if self._clock() - checked_at < self.version_ttl_seconds:
+                self.hits += 1
+                return copy.copy(user)
+            if await self.repository.find_version(user_id) == user.version:
+                self.revalidations += 1
+                self._users.set(user_id, (user, self._clock()))
+                return copy.copy(user)
+            self._users.invalidate(user_id)
+        self.misses += 1
+        user = await self.repository.find_by_id(user_id)
+        if user is not None:
+            self._remember(user)
+        return user
+    
+    async def save(self, user: User) -> User:
+        """Save a user"""
+        user = await self.repository.save(user)
+        self._remember(user)
+        return user
+    
+    async def update(self, user: User) -> User:
+        """Update a user and cache the stored version"""
+        user = await self.repository.update(user)
+        self._remember(user)
+        return user
+    
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete a user"""
+        deleted = await self.repository.delete(user_id)
+        self._users.invalidate(user_id)
+        return deleted
+    
+    async def save_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Insert users in bulk, reporting failures per item"""
+        return await self.repository.save_many(users)
+    
+    async def update_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Replace users in bulk, reporting failures per item"""
+        result = await self.repository.update_many(users)
+        for user in users:
+            self._users.invalidate(user.id)
+        return result
+    
+    async def delete_many(self, user_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete users in bulk, reporting failures per item"""
+        result = await self.repository.delete_many(user_ids)
+        for user_id in user_ids:
+            self._users.invalidate(user_id)
+        return result
+    
+    async def find_version(self, user_id: UUID) -> Optional[int]:
+        return await self.repository.find_version(user_id)
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self.repository.find_by_email(email)
+    
+    async def find_by_username(self, username: str) -> Optional[User]:
+        return await self.repository.find_by_username(username)
+    
+    def usernames(self) -> AsyncIterator[str]:
+        return self.repository.usernames()
+    
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.repository.exists_by_email(email)
+    
+    async def exists_by_username(self, username: str) -> bool:
+        return await self.repository.exists_by_username(username)
+    
+    async def find_page_with_total(
+        self,
+        training_level: Optional[TrainingLevel] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[User]:
+        return await self.repository.find_page_with_total(training_level, limit, offset, estimated)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (with or without a version check)"""
+        lookups = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / lookups if lookups else 0.0
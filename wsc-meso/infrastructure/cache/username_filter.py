@@ -0,0 +1,77 @@
+"""
+Username Filter
+
+Username availability from a Bloom filter of the taken usernames.
+"""
+import asyncio
+from typing import AsyncIterator, Optional, Protocol
+
+from .bloom_filter import BloomFilter
+
+
+class UsernameSource(Protocol):
+    """Where taken usernames come from (the MongoDB user repository)"""
+    
+    def usernames(self) -> AsyncIterator[str]: ...
+    
+    async def exists_by_username(self, username: str) -> bool: ...
+
+
+class UsernameFilter:
+    """Answers "is this username free?" mostly without a database round trip.
+    
+    A username the filter has never seen is free; one it may have seen is
+    checked against the source, so answers are exact except for usernames
+    taken by another worker since this one's last ``rebuild``. ``watch``
+    rebuilds on an interval to bound that window; registration still relies
+    on the unique index. Until the first rebuild finishes every lookup goes
+    to the source.
+    """
+    
+    def __init__(self, source: UsernameSource, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.source = source
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter: Optional[BloomFilter] = None
+        self._building: Optional[BloomFilter] = None
+        self._rebuild_lock = asyncio.Lock()
+    
+    @property
+    def ready(self) -> bool:
+        """Whether a rebuild has completed"""
+        return self._filter is not None
+    
+    async def rebuild(self) -> int:
+        """Load every username into a new filter and swap it in; return the count"""
+        async with self._rebuild_lock:
+            # Usernames added while loading go into the new filter too
+            self._building = BloomFilter(self.capacity, self.error_rate)
+            try:
+                async for username in self.source.usernames():
+                    self._building.add(username)
+                self._filter = self._building
+            finally:
+                self._building = None
+            return self._filter.count
+    
+    async def watch(self, interval_seconds: float) -> None:
+        """Rebuild now and then every ``interval_seconds``, forever"""
+        while True:
+            try:
+                await self.rebuild()
+            except Exception as e:
+                # Keep answering from the previous filter until the source is back
+                print(f"Username filter rebuild failed: {e}")
+            await asyncio.sleep(interval_seconds)
+    
+    def add(self, username: str) -> None:
+        """Record a username that was just taken"""
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.add(username)
+    
+    async def is_available(self, username: str) -> bool:
+        """Whether no user has this username"""
+        if self._filter is not None and username not in self._filter:
+            return True
+        return not await self.source.exists_by_username(username)
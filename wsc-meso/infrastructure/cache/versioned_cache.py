@@ -0,0 +1,66 @@
+"""
+Versioned Cache
+
+In-process cache of values computed from data that changes through known
+write paths.
+
+Each key has a version counter kept in MongoDB, which writers increment;
+a value is cached together with the version it was computed at and is only
+served while that version is current. To answer without a round trip, a
+worker trusts the last version it read for ``version_ttl_seconds``; its own
+increments apply immediately and other workers' after at most that long.
+"""
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from domain.repositories.version_counter_repository import IVersionCounterRepository
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+class VersionedCache:
+    """Values cached per key and version, with versions shared across workers"""
+    
+    def __init__(
+        self,
+        counters: IVersionCounterRepository,
+        namespace: str,
+        version_ttl_seconds: float = 5.0,
+        max_entries: int = 10_000,
+        value_ttl_seconds: float = 24 * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.counters = counters
+        self.namespace = namespace
+        self._versions = TTLCache(version_ttl_seconds, max_entries, clock)
+        self._values = TTLCache(value_ttl_seconds, max_entries, clock)
+    
+    def _counter(self, key: Hashable) -> str:
+        return f"{self.namespace}:{key}"
+    
+    async def version(self, key: Hashable) -> int:
+        """Current version of key, read from MongoDB at most once per TTL"""
+        version = self._versions.get(key)
+        if version is None:
+            version = await self.counters.get(self._counter(key))
+            self._versions.set(key, version)
+        return version
+    
+    async def bump(self, key: Hashable) -> int:
+        """Record a write to the data behind key"""
+        version = await self.counters.increment(self._counter(key))
+        # Concurrent bumps may return out of order; keep the highest
+        if version > self._versions.get(key, 0):
+            self._versions.set(key, version)
+        self._values.invalidate(key)
+        return version
+    
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        """Value cached for key at version, if any"""
+        entry = self._values.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+    
+    def set(self, key: Hashable, version: int, value: Any) -> None:
+        """Cache the value computed for key at version"""
+        self._values.set(key, (version, value))
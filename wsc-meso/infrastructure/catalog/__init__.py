@@ -0,0 +1,13 @@
+"""Infrastructure catalog package"""
+from .exercise_catalog import CatalogSource, ExerciseCatalog
+from .recommendations import rank_recommendations
+from .search_index import SearchIndex
+from .snapshot import CatalogSnapshot
+
+__all__ = [
+    "CatalogSnapshot",
+    "CatalogSource",
+    "ExerciseCatalog",
+    "SearchIndex",
+    "rank_recommendations",
+]
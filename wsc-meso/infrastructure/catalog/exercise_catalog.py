@@ -0,0 +1,184 @@
+"""
+Exercise Catalog
+
+In-memory implementation of IExerciseRepository.
+"""
+import asyncio
+from bisect import bisect_right
+from typing import List, Optional, Protocol, Union
+
+from domain.entities.exercise import Exercise, ExerciseSummary, ExerciseType, MuscleGroup
+from domain.repositories.exercise_repository import IExerciseRepository
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
+from infrastructure.persistence.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+from .snapshot import CatalogSnapshot
+
+
+class CatalogSource(Protocol):
+    """Where the catalog loads exercises from (the MongoDB repository)"""
+    
+    async def load_all(self) -> List[Exercise]: ...
+    
+    async def fingerprint(self) -> str: ...
+
+
+class ExerciseCatalog(IExerciseRepository):
+    """Exercise repository served from an immutable in-memory snapshot.
+    
+    The exercise catalog is static reference data, so it is loaded once and
+    every read is answered from memory without a database round trip.
+    ``reload()`` builds a complete new snapshot and swaps it in with a
+    single assignment; each read takes one reference to the current snapshot
+    and works on it, so a request never sees a half-built catalog.
+    """
+    
+    def __init__(self, source: CatalogSource):
+        self.source = source
+        self._snapshot = CatalogSnapshot(())
+        self._reload_lock = asyncio.Lock()
+    
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """Snapshot currently being served"""
+        return self._snapshot
+    
+    @property
+    def version(self) -> str:
+        """Fingerprint of the loaded catalog ("" before the first load)"""
+        return self._snapshot.version
+    
+    async def reload(self) -> CatalogSnapshot:
+        """Load the catalog from the source and swap it in atomically"""
+        async with self._reload_lock:
+            # Fingerprint first: a change during the load triggers another refresh
+            version = await self.source.fingerprint()
+            exercises = await self.source.load_all()
+            self._snapshot = CatalogSnapshot(exercises, version)
+            return self._snapshot
+    
+    async def refresh(self) -> bool:
+        """Reload if the source fingerprint changed; return whether it did"""
+        if await self.source.fingerprint() == self._snapshot.version:
+            return False
+        await self.reload()
+        return True
+    
+    async def watch(self, interval_seconds: float) -> None:
+        """Poll the source fingerprint forever, reloading on change"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                if await self.refresh():
+                    print(f"Exercise catalog reloaded (version {self.version})")
+            except Exception as e:
+                # Keep serving the current snapshot until the source is back
+                print(f"Exercise catalog refresh failed: {e}")
+    
+    async def find_by_id(self, exercise_id: int) -> Optional[Exercise]:
+        """Find exercise by ID"""
+        return self._snapshot.by_id.get(exercise_id)
+    
+    async def find_all(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
+        """Find all exercises with optional filtering"""
+        snapshot = self._snapshot
+        items = snapshot.select(muscle_group, exercise_type)[offset:offset + limit]
+        if profile is ReadProfile.SUMMARY:
+            return [snapshot.summaries[e.id] for e in items]
+        return list(items)
+    
+    async def find_page(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises by name, resuming after cursor.
+        
+        Cursors are interchangeable with the MongoDB repository's.
+        """
+        snapshot = self._snapshot
+        start = offset
+        if cursor:
+            name, exercise_id = decode_cursor(cursor, "name")
+            if not isinstance(name, str) or not isinstance(exercise_id, int):
+                raise InvalidCursorError("Malformed pagination cursor")
+            start = bisect_right(snapshot.sort_keys(muscle_group, exercise_type), (name, exercise_id))
+        return self._slice(snapshot, muscle_group, exercise_type, start, limit, profile)
+    
+    async def find_page_with_total(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises together with the (always exact) total"""
+        return self._slice(self._snapshot, muscle_group, exercise_type, offset, limit, profile)
+    
+    def _slice(
+        self,
+        snapshot: CatalogSnapshot,
+        muscle_group: Optional[MuscleGroup],
+        exercise_type: Optional[ExerciseType],
+        start: int,
+        limit: int,
+        profile: ReadProfile,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Page of a precomputed listing starting at position start"""
+        listing = snapshot.select(muscle_group, exercise_type)
+        items = listing[start:start + limit]
+        next_cursor = None
+        if items and start + limit < len(listing):
+            last = items[-1]
+            next_cursor = encode_cursor("name", last.name, last.id)
+        if profile is ReadProfile.SUMMARY:
+            items = [snapshot.summaries[e.id] for e in items]
+        return Page(items=list(items), next_cursor=next_cursor, total=len(listing))
+    
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
+        """Search exercises by name or description, best match first"""
+        snapshot = self._snapshot
+        results = snapshot.search(query, limit)
+        if profile is ReadProfile.SUMMARY:
+            return [snapshot.summaries[e.id] for e in results]
+        return results
+    
+    async def find_recommended_by_muscle_group(
+        self,
+        muscle_group: MuscleGroup,
+        training_level: str,
+        limit: int = 8,
+    ) -> List[Exercise]:
+        """Find recommended exercises for a muscle group.
+        
+        Lists are ranked for every (muscle group, level) when the catalog
+        is loaded, so this is a lookup and a slice.
+        """
+        return list(self._snapshot.recommended(muscle_group, training_level)[:limit])
+    
+    async def count(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+    ) -> int:
+        """Count exercises with optional filtering"""
+        return len(self._snapshot.select(muscle_group, exercise_type))
@@ -0,0 +1,61 @@
+"""
+Exercise Recommendations
+
+Ranking of a muscle group's exercises for a training level.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from domain.entities.exercise import Exercise
+from domain.entities.user import TrainingLevel
+
+
+_LEVEL_RANK: Dict[str, int] = {level.value: rank for rank, level in enumerate(TrainingLevel)}
+
+# Score of an exercise's difficulty for a level, by (exercise - level) rank distance
+_FIT = {0: 2.0, -1: 1.0, 1: 0.5, -2: 0.25}
+_UNKNOWN_FIT = 0.75
+COMPOUND_BONUS = 0.75
+REPEATED_TYPE_PENALTY = 0.5
+
+
+def difficulty_fit(difficulty: Optional[str], training_level: str) -> float:
+    """How well an exercise's difficulty suits a level (2.0 is an exact match).
+    
+    Easier exercises score above harder ones at the same distance.
+    """
+    if difficulty not in _LEVEL_RANK or training_level not in _LEVEL_RANK:
+        return _UNKNOWN_FIT
+    return _FIT.get(_LEVEL_RANK[difficulty] - _LEVEL_RANK[training_level], 0.0)
+
+
+def rank_recommendations(exercises: Sequence[Exercise], training_level: str) -> Tuple[Exercise, ...]:
+    """Order a muscle group's exercises from most to least recommended.
+    
+    Each exercise scores its difficulty fit plus a bonus for compound
+    movements. Picks are greedy: every exercise of an equipment type that
+    was already picked loses a little, so the top of the list mixes free
+    weights, machines, cables, and so on. Ties keep the input order.
+    """
+    remaining: List[Tuple[float, int, Exercise]] = [
+        (
+            difficulty_fit(exercise.difficulty, training_level)
+            + (COMPOUND_BONUS if exercise.is_compound_exercise() else 0.0),
+            position,
+            exercise,
+        )
+        for position, exercise in enumerate(exercises)
+    ]
+    picked_types: Dict[object, int] = {}
+    ranked: List[Exercise] = []
+    while remaining:
+        best = max(
+            range(len(remaining)),
+            key=lambda i: (
+                remaining[i][0] - REPEATED_TYPE_PENALTY * picked_types.get(remaining[i][2].type, 0),
+                -remaining[i][1],
+            ),
+        )
+        _, _, exercise = remaining.pop(best)
+        ranked.append(exercise)
+        picked_types[exercise.type] = picked_types.get(exercise.type, 0) + 1
+    return tuple(ranked)
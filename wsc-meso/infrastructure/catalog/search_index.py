@@ -0,0 +1,201 @@
+"""
+Exercise Search Index
+
+Ranked full-text search over the in-memory exercise catalog.
+"""
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+from domain.entities.exercise import Exercise
+
+
+# Field weights: a hit in the name counts far more than one in the description
+FIELD_WEIGHTS: Mapping[str, float] = {
+    "name": 3.0,
+    "primary_muscles": 1.5,
+    "execution": 1.0,
+    "comments": 0.5,
+}
+
+# Score multipliers for inexact matches of a query word
+PREFIX_WEIGHT = 0.7
+TYPO_WEIGHT = 0.5
+
+MIN_PREFIX_LENGTH = 2
+MIN_TYPO_LENGTH = 4
+MAX_PREFIX_EXPANSIONS = 64
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = frozenset({
+    "a", "al", "con", "de", "del", "el", "en", "la", "las", "lo", "los", "o",
+    "para", "por", "se", "sin", "su", "un", "una", "y",
+})
+
+# Longest first; only stripped when at least three characters remain
+_SUFFIXES = (
+    "amientos", "imientos", "amiento", "imiento", "idades", "mente", "iones",
+    "ables", "ibles", "istas", "idad", "able", "ible", "ista", "ores", "ion",
+    "es", "os", "as", "or", "s", "a", "o", "e",
+)
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip diacritics ("Jalón" -> "jalon")"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=65_536)
+def stem(word: str) -> str:
+    """Light Spanish stemmer: drop plural, gender and common derivational endings"""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Folded, stemmed terms of a text, without stopwords"""
+    return [stem(word) for word in _WORD.findall(fold(text)) if word not in STOPWORDS]
+
+
+def _deletes(term: str) -> Set[str]:
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Whether a and b differ by at most one insertion, deletion, substitution or swap"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diff = [i for i in range(len(a)) if a[i] != b[i]]
+        if len(diff) == 1:
+            return True
+        return (
+            len(diff) == 2 and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+        )
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    for i in range(len(longer)):
+        if longer[:i] + longer[i + 1:] == shorter:
+            return True
+    return False
+
+
+def _field_texts(exercise: Exercise) -> Dict[str, str]:
+    return {
+        "name": exercise.name or "",
+        "primary_muscles": " ".join(exercise.primary_muscles or ()),
+        "execution": exercise.execution or "",
+        "comments": exercise.comments or "",
+    }
+
+
+class SearchIndex:
+    """Inverted index with BM25F ranking, prefix matching and typo tolerance.
+    
+    Documents are positions in the sequence given at build time. Each term's
+    posting list holds the precomputed BM25F score of every document that
+    contains it, so a query only sums a handful of dict lookups. A query
+    word matches its exact term; the last word (still being typed) and any
+    word without an exact match also match terms it is a prefix of, and a
+    word that still matches nothing falls back to terms one edit away.
+    Results that match more query words always rank first.
+    """
+    
+    def __init__(self, exercises: Sequence[Exercise]):
+        field_terms = [
+            {field: tokenize(text) for field, text in _field_texts(exercise).items()}
+            for exercise in exercises
+        ]
+        count = len(field_terms)
+        average_length = {
+            field: (sum(len(doc[field]) for doc in field_terms) / count if count else 0.0) or 1.0
+            for field in FIELD_WEIGHTS
+        }
+        
+        # BM25F: length-normalised, weighted term frequency summed over fields
+        weighted_tf: Dict[str, Dict[int, float]] = {}
+        for position, doc in enumerate(field_terms):
+            for field, terms in doc.items():
+                norm = 1 - BM25_B + BM25_B * len(terms) / average_length[field]
+                weight = FIELD_WEIGHTS[field] / norm
+                for term in terms:
+                    postings = weighted_tf.setdefault(term, {})
+                    postings[position] = postings.get(position, 0.0) + weight
+        
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for term, postings in weighted_tf.items():
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            self._postings[term] = {
+                position: idf * tf * (BM25_K1 + 1) / (tf + BM25_K1)
+                for position, tf in postings.items()
+            }
+        
+        self._vocabulary: Tuple[str, ...] = tuple(sorted(self._postings))
+        self._neighbours: Dict[str, Set[str]] = {}
+        for term in self._vocabulary:
+            if len(term) >= MIN_TYPO_LENGTH - 1:
+                for variant in _deletes(term) | {term}:
+                    self._neighbours.setdefault(variant, set()).add(term)
+    
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+    
+    def _prefixed(self, prefix: str) -> Iterable[str]:
+        start = bisect_left(self._vocabulary, prefix)
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            yield term
+    
+    def _near(self, word: str) -> Iterable[str]:
+        candidates: Set[str] = set()
+        for variant in _deletes(word) | {word}:
+            candidates |= self._neighbours.get(variant, set())
+        return (term for term in candidates if _within_one_edit(word, term))
+    
+    def _expand(self, word: str, is_last: bool) -> List[Tuple[str, float]]:
+        """Index terms a query word matches, with their score multiplier"""
+        matches: List[Tuple[str, float]] = []
+        if word in self._postings:
+            matches.append((word, 1.0))
+        if (is_last or not matches) and len(word) >= MIN_PREFIX_LENGTH:
+            matches.extend((term, PREFIX_WEIGHT) for term in self._prefixed(word) if term != word)
+        if not matches and len(word) >= MIN_TYPO_LENGTH:
+            matches.extend((term, TYPO_WEIGHT) for term in self._near(word))
+        return matches
+    
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        """Positions of the best matching documents, best first"""
+        words = list(dict.fromkeys(tokenize(query)))
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for index, word in enumerate(words):
+            best: Dict[int, float] = {}
+            for term, multiplier in self._expand(word, index == len(words) - 1):
+                for position, score in self._postings[term].items():
+                    score *= multiplier
+                    if score > best.get(position, 0.0):
+                        best[position] = score
+            for position, score in best.items():
+                scores[position] = scores.get(position, 0.0) + score
+                matched[position] = matched.get(position, 0) + 1
+        
+        # Position breaks ties, which keeps equal scores in name order
+        ranked = sorted(scores, key=lambda p: (-matched[p], -scores[p], p))
+        return ranked[:limit]
@@ -0,0 +1,112 @@
+"""
+Catalog Snapshot
+
+Immutable, fully indexed view of the exercise catalog.
+"""
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from domain.entities.exercise import Exercise, ExerciseSummary, ExerciseType, MuscleGroup
+from domain.entities.user import TrainingLevel
+
+from .recommendations import rank_recommendations
+from .search_index import SearchIndex
+
+
+FilterKey = Tuple[Optional[MuscleGroup], Optional[ExerciseType]]
+SortKey = Tuple[str, int]
+
+
+class CatalogSnapshot:
+    """Exercises indexed by id, filter and difficulty, all in name order.
+    
+    Every listing the API can request (no filter, muscle group, type or
+    both) is precomputed as a tuple sorted by ``(name, id)``, the same order
+    MongoDB uses, so listings are slices and cursors are bisections. A
+    snapshot is never mutated after construction; reloading builds a new one
+    (search index and recommendation lists included).
+    The exercise entities are shared between requests and must be treated as
+    read-only.
+    """
+    
+    __slots__ = ("version", "by_id", "summaries", "by_difficulty", "search_index", "recommendations", "_lists", "_keys")
+    
+    def __init__(self, exercises: Iterable[Exercise], version: str = ""):
+        ordered = sorted(exercises, key=lambda e: (e.name, e.id))
+        
+        lists: Dict[FilterKey, List[Exercise]] = {}
+        by_difficulty: Dict[str, List[Exercise]] = {}
+        for exercise in ordered:
+            group, kind = exercise.muscle_group, exercise.type
+            for key in ((None, None), (group, None), (None, kind), (group, kind)):
+                lists.setdefault(key, []).append(exercise)
+            if exercise.difficulty:
+                by_difficulty.setdefault(exercise.difficulty, []).append(exercise)
+        
+        self.version = version
+        self.by_id: Mapping[int, Exercise] = MappingProxyType({e.id: e for e in ordered})
+        self.summaries: Mapping[int, ExerciseSummary] = MappingProxyType({
+            e.id: ExerciseSummary(
+                id=e.id,
+                name=e.name,
+                muscle_group=e.muscle_group,
+                primary_muscles=e.primary_muscles,
+                type=e.type,
+            )
+            for e in ordered
+        })
+        self.by_difficulty: Mapping[str, Tuple[Exercise, ...]] = MappingProxyType(
+            {level: tuple(items) for level, items in by_difficulty.items()}
+        )
+        self.search_index = SearchIndex(ordered)
+        self.recommendations: Mapping[Tuple[MuscleGroup, str], Tuple[Exercise, ...]] = MappingProxyType({
+            (group, level.value): rank_recommendations(lists.get((group, None), ()), level.value)
+            for group in MuscleGroup
+            for level in TrainingLevel
+        })
+        self._lists: Mapping[FilterKey, Tuple[Exercise, ...]] = MappingProxyType(
+            {key: tuple(items) for key, items in lists.items()}
+        )
+        self._keys: Mapping[FilterKey, Tuple[SortKey, ...]] = MappingProxyType(
+            {key: tuple((e.name, e.id) for e in items) for key, items in lists.items()}
+        )
+    
+    def __len__(self) -> int:
+        return len(self.by_id)
+    
+    def select(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+    ) -> Tuple[Exercise, ...]:
+        """Exercises matching the filters, in name order"""
+        return self._lists.get((muscle_group, exercise_type), ())
+    
+    def sort_keys(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+    ) -> Tuple[SortKey, ...]:
+        """``(name, id)`` keys parallel to select(), for bisecting cursors"""
+        return self._keys.get((muscle_group, exercise_type), ())
+    
+    def search(self, query: str, limit: int = 20) -> List[Exercise]:
+        """Best matches for a free-text query, best first"""
+        everything = self._lists.get((None, None), ())
+        return [everything[position] for position in self.search_index.search(query, limit)]
+    
+    def recommended(self, muscle_group: MuscleGroup, training_level: str) -> Tuple[Exercise, ...]:
+        """Exercises of a muscle group ranked for a training level"""
+        ranked = self.recommendations.get((muscle_group, training_level))
+        if ranked is None:
+            # Unknown level: rank on demand rather than fail
+            ranked = rank_recommendations(self.by_muscle_group(muscle_group), training_level)
+        return ranked
+    
+    def by_muscle_group(self, muscle_group: MuscleGroup) -> Tuple[Exercise, ...]:
+        """Exercises of one muscle group, in name order"""
+        return self.select(muscle_group, None)
+    
+    def by_type(self, exercise_type: ExerciseType) -> Tuple[Exercise, ...]:
+        """Exercises of one equipment type, in name order"""
+        return self.select(None, exercise_type)
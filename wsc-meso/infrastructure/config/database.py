@@ -3,9 +3,14 @@ MongoDB Configuration
 
 Database connection and settings for MongoDB.
 """
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from typing import Optional
 
+from infrastructure.persistence.indexes import apply_index_migrations
+
+from .settings import Settings
+
 
 class MongoDBConfig:
     """MongoDB configuration and connection management"""
@@ -14,24 +19,78 @@ class MongoDBConfig:
         self,
         connection_string: str = "mongodb://localhost:27017",
         database_name: str = "mesocycle_planner",
+        min_pool_size: int = 0,
+        max_pool_size: int = 100,
+        max_idle_time_ms: Optional[int] = None,
+        wait_queue_timeout_ms: Optional[int] = None,
+        server_selection_timeout_ms: int = 30_000,
     ):
         self.connection_string = connection_string
         self.database_name = database_name
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self.max_idle_time_ms = max_idle_time_ms
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
+        self.server_selection_timeout_ms = server_selection_timeout_ms
         self._client: Optional[AsyncIOMotorClient] = None
         self._database: Optional[AsyncIOMotorDatabase] = None
     
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "MongoDBConfig":
+        """Build a configuration from application settings"""
+        return cls(
+            connection_string=settings.mongodb_url,
+            database_name=settings.mongodb_database,
+            min_pool_size=settings.mongodb_min_pool_size,
+            max_pool_size=settings.mongodb_max_pool_size,
+            max_idle_time_ms=settings.mongodb_max_idle_time_ms,
+            wait_queue_timeout_ms=settings.mongodb_wait_queue_timeout_ms,
+            server_selection_timeout_ms=settings.mongodb_server_selection_timeout_ms,
+        )
+    
     async def connect(self) -> None:
         """Connect to MongoDB"""
-        self._client = AsyncIOMotorClient(self.connection_string)
+        self._client = AsyncIOMotorClient(
+            self.connection_string,
+            minPoolSize=self.min_pool_size,
+            maxPoolSize=self.max_pool_size,
+            maxIdleTimeMS=self.max_idle_time_ms,
+            waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=self.server_selection_timeout_ms,
+            # Entities use uuid.UUID identifiers
+            uuidRepresentation="standard",
+        )
         self._database = self._client[self.database_name]
         print(f"Connected to MongoDB: {self.database_name}")
     
+    async def warm_pool(self) -> None:
+        """Open min_pool_size connections up front.
+        
+        Concurrent pings force the driver to check out (and therefore open)
+        one connection each, so the first requests after startup do not pay
+        the TCP/TLS/auth handshake.
+        """
+        size = max(self.min_pool_size, 1)
+        await asyncio.gather(
+            *(self.database.command("ping") for _ in range(size))
+        )
+        print(f"MongoDB connection pool warmed ({size} connections)")
+    
     async def disconnect(self) -> None:
         """Disconnect from MongoDB"""
         if self._client:
             self._client.close()
+            self._client = None
+            self._database = None
             print("Disconnected from MongoDB")
     
+    @property
+    def client(self) -> AsyncIOMotorClient:
+        """Get client instance"""
+        if self._client is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+        return self._client
+    
     @property
     def database(self) -> AsyncIOMotorDatabase:
         """Get database instance"""
@@ -40,32 +99,9 @@ class MongoDBConfig:
         return self._database
     
     async def create_indexes(self) -> None:
-        """Create database indexes for optimal performance"""
-        db = self.database
-        
-        # Users indexes
-        await db.users.create_index("email", unique=True)
-        await db.users.create_index("username", unique=True)
-        
-        # Exercises indexes
-        await db.exercises.create_index("muscle_group")
-        await db.exercises.create_index("type")
-        await db.exercises.create_index([("name", "text"), ("execution", "text")])
-        
-        # Mesocycles indexes
-        await db.mesocycles.create_index("user_id")
-        await db.mesocycles.create_index([("user_id", 1), ("status", 1)])
-        
-        # Workouts indexes
-        await db.workouts.create_index("mesocycle_id")
-        await db.workouts.create_index([("mesocycle_id", 1), ("completed", 1)])
-        await db.workouts.create_index("scheduled_date")
-        
-        # Progress indexes
-        await db.progress.create_index([("user_id", 1), ("metric_type", 1)])
-        await db.progress.create_index([("user_id", 1), ("date", -1)])
-        
-        print("Database indexes created")
+        """Apply pending index migrations from the index registry"""
+        version = await apply_index_migrations(self.database)
+        print(f"Database indexes at version {version}")
 
 
 # Global database instance
@@ -80,12 +116,18 @@ def get_database_config() -> MongoDBConfig:
     return _db_config
 
 
-async def init_database(connection_string: str = "mongodb://localhost:27017") -> None:
-    """Initialize database connection"""
+async def init_database(settings: Settings) -> MongoDBConfig:
+    """Initialize the process-wide database connection.
+    
+    Called once from the application lifespan, before any request is served.
+    """
     global _db_config
-    _db_config = MongoDBConfig(connection_string=connection_string)
+    _db_config = MongoDBConfig.from_settings(settings)
     await _db_config.connect()
-    await _db_config.create_indexes()
+    await _db_config.warm_pool()
+    if settings.mongodb_create_indexes_on_startup:
+        await _db_config.create_indexes()
+    return _db_config
 
 
 async def close_database() -> None:
@@ -4,7 +4,7 @@ Application Settings
 Configuration settings for the application.
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -19,10 +19,58 @@ class Settings(BaseSettings):
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database: str = "mesocycle_planner"
     
+    # Connection pool (per worker process)
+    mongodb_min_pool_size: int = 10
+    mongodb_max_pool_size: int = 100
+    mongodb_max_idle_time_ms: int = 60_000
+    mongodb_wait_queue_timeout_ms: int = 2_000
+    mongodb_server_selection_timeout_ms: int = 5_000
+    mongodb_create_indexes_on_startup: bool = True
+    
+    # List totals: estimated=True serves totals from a short-lived cache
+    list_estimated_totals: bool = False
+    count_cache_ttl_seconds: float = 30.0
+    count_cache_max_entries: int = 10_000
+    
+    # Progress storage: "collection" (progress), "timeseries" (progress_timeseries,
+    # MongoDB 7.0+) or "dual" while migrating (reads progress, writes both)
+    progress_backend: Literal["collection", "dual", "timeseries"] = "collection"
+    
+    # Mesocycle dashboards cached per worker; other workers' writes show up
+    # once the locally known version expires
+    dashboard_version_ttl_seconds: float = 5.0
+    dashboard_cache_max_entries: int = 10_000
+    
+    # Users by id cached per worker; other workers' updates show up once the
+    # cached version stamp is rechecked
+    user_cache_enabled: bool = True
+    user_cache_ttl_seconds: float = 300.0
+    user_cache_version_ttl_seconds: float = 5.0
+    user_cache_max_entries: int = 10_000
+    
+    # Username availability from a per-worker Bloom filter (capacity users at
+    # the error rate; about 1.2 MB for a million at 1 %), rebuilt so names
+    # taken on other workers show up
+    username_filter_capacity: int = 1_000_000
+    username_filter_error_rate: float = 0.01
+    username_filter_rebuild_seconds: float = 300.0
+    
+    # Exercise catalog served from memory; reloaded when the collection changes
+    exercise_catalog_enabled: bool = True
+    exercise_catalog_refresh_seconds: float = 60.0
+    
     # Security
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24  # 24 hours
+    admin_token: Optional[str] = None  # enables the /admin endpoints
+    token_cache_max_entries: int = 10_000  # verified JWTs kept per worker until they expire
+    
+    # Password hashing: bcrypt cost, and a thread pool per worker process that
+    # answers 503 once password_hash_max_pending calls are queued or running
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
     
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8080"]
@@ -0,0 +1,387 @@
+"""
+Index Registry
+
+Single source of truth for MongoDB indexes and the query shapes they serve.
+
+Indexes (and the few collections that need creation options, such as
+time-series collections) are applied as numbered migrations. The highest
+applied version is
+stored in the ``schema_migrations`` collection, so startup only runs new
+migrations, and every step is idempotent (creating an existing collection
+or index is a no-op, dropping a missing index is ignored) so concurrent
+workers can race safely.
+
+Repository methods declare the filters and sort they issue with
+``@query_shape``. ``uncovered_shapes()`` checks those declarations against
+the indexes the migrations produce, and the integration suite runs
+``explain()`` on each shape to catch collection scans and in-memory sorts.
+
+Apply pending migrations without starting the API::
+    
+    PYTHONPATH=src:. python -m infrastructure.persistence.indexes
+"""
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+
+Key = Tuple[str, Any]
+
+MIGRATIONS_COLLECTION = "schema_migrations"
+_INDEX_NOT_FOUND = 27
+_NAMESPACE_EXISTS = 48
+
+
+def index_name(keys: Sequence[Key]) -> str:
+    """Default MongoDB name for an index key pattern"""
+    return "_".join(f"{field_name}_{direction}" for field_name, direction in keys)
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One index on one collection"""
+    
+    collection: str
+    keys: Tuple[Key, ...]
+    unique: bool = False
+    
+    @property
+    def name(self) -> str:
+        return index_name(self.keys)
+    
+    def model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, unique=self.unique)
+
+
+@dataclass(frozen=True)
+class TimeSeriesSpec:
+    """A time-series collection, created before its indexes"""
+    
+    collection: str
+    time_field: str
+    meta_field: str
+    granularity: str = "hours"
+    
+    def options(self) -> Dict[str, Any]:
+        return {"timeField": self.time_field, "metaField": self.meta_field, "granularity": self.granularity}
+
+
+@dataclass(frozen=True)
+class IndexMigration:
+    """A versioned set of collection and index creations and index drops"""
+    
+    version: int
+    description: str
+    create: Tuple[IndexSpec, ...] = ()
+    drop: Tuple[Tuple[str, str], ...] = ()
+    collections: Tuple[TimeSeriesSpec, ...] = ()
+
+
+def _ix(collection: str, *keys: Key, unique: bool = False) -> IndexSpec:
+    return IndexSpec(collection, tuple(keys), unique)
+
+
+MIGRATIONS: Tuple[IndexMigration, ...] = (
+    IndexMigration(
+        version=1,
+        description="Baseline indexes (formerly in create_indexes and init-mongo.js)",
+        create=(
+            _ix("users", ("email", 1), unique=True),
+            _ix("users", ("username", 1), unique=True),
+            _ix("exercises", ("muscle_group", 1)),
+            _ix("exercises", ("type", 1)),
+            _ix("exercises", ("name", "text"), ("execution", "text")),
+            _ix("mesocycles", ("user_id", 1)),
+            _ix("mesocycles", ("user_id", 1), ("status", 1)),
+            _ix("workouts", ("mesocycle_id", 1)),
+            _ix("workouts", ("mesocycle_id", 1), ("completed", 1)),
+            _ix("workouts", ("scheduled_date", 1)),
+            _ix("progress", ("user_id", 1), ("metric_type", 1)),
+            _ix("progress", ("user_id", 1), ("date", -1)),
+        ),
+    ),
+    IndexMigration(
+        version=2,
+        description="Equality-sort compound indexes for listings; drop covered prefixes",
+        create=(
+            # UserRepository.find_page_with_total sorts on (username, _id), the
+            # pagination tiebreaker; the unique username_1 cannot serve that sort
+            _ix("users", ("username", 1), ("_id", 1)),
+            _ix("exercises", ("name", 1), ("_id", 1)),
+            _ix("exercises", ("muscle_group", 1), ("name", 1), ("_id", 1)),
+            _ix("exercises", ("type", 1), ("name", 1), ("_id", 1)),
+            _ix("mesocycles", ("user_id", 1), ("created_at", -1), ("_id", -1)),
+            _ix("mesocycles", ("user_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)),
+            _ix("workouts", ("mesocycle_id", 1), ("scheduled_date", -1), ("_id", -1)),
+            _ix("workouts", ("mesocycle_id", 1), ("completed", 1), ("scheduled_date", -1), ("_id", -1)),
+            _ix("progress", ("user_id", 1), ("date", -1), ("_id", -1)),
+            _ix("progress", ("user_id", 1), ("metric_type", 1), ("date", -1), ("_id", -1)),
+        ),
+        drop=(
+            ("exercises", "muscle_group_1"),
+            ("exercises", "type_1"),
+            ("mesocycles", "user_id_1"),
+            ("mesocycles", "user_id_1_status_1"),
+            ("workouts", "mesocycle_id_1"),
+            ("workouts", "mesocycle_id_1_completed_1"),
+            ("workouts", "scheduled_date_1"),
+            ("progress", "user_id_1_metric_type_1"),
+            ("progress", "user_id_1_date_-1"),
+        ),
+    ),
+    IndexMigration(
+        version=3,
+        description="Weekly training session buckets",
+        create=(
+            _ix("training_sessions", ("user_id", 1), ("date", -1)),
+            _ix("training_sessions", ("mesocycle_id", 1), ("week_number", 1)),
+        ),
+    ),
+    IndexMigration(
+        version=4,
+        description="Weekly rollups",
+        create=(
+            _ix("weekly_rollups", ("mesocycle_id", 1), ("week_number", 1), ("exercise_id", 1)),
+            _ix("weekly_rollups", ("user_id", 1), ("exercise_id", 1), ("week_start", 1)),
+        ),
+    ),
+    IndexMigration(
+        version=5,
+        description="Time-series progress backend",
+        collections=(TimeSeriesSpec("progress_timeseries", time_field="date", meta_field="meta"),),
+        create=(
+            # Time-series collections have no unique _id index of their own
+            _ix("progress_timeseries", ("_id", 1)),
+            _ix("progress_timeseries", ("meta.user_id", 1), ("date", -1), ("_id", -1)),
+            _ix("progress_timeseries", ("meta.user_id", 1), ("meta.metric_type", 1), ("date", -1), ("_id", -1)),
+        ),
+    ),
+    IndexMigration(
+        version=6,
+        description="Daily rollups",
+        create=(
+            _ix("daily_rollups", ("mesocycle_id", 1), ("day", 1)),
+            _ix("daily_rollups", ("user_id", 1), ("exercise_id", 1), ("day", 1)),
+        ),
+    ),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def target_indexes(migrations: Sequence[IndexMigration] = MIGRATIONS) -> Dict[str, List[IndexSpec]]:
+    """Indexes per collection once every migration has been applied"""
+    indexes: Dict[str, Dict[str, IndexSpec]] = {}
+    for migration in migrations:
+        for spec in migration.create:
+            indexes.setdefault(spec.collection, {})[spec.name] = spec
+        for collection, name in migration.drop:
+            indexes.get(collection, {}).pop(name, None)
+    return {collection: list(specs.values()) for collection, specs in indexes.items()}
+
+
+async def applied_version(database: AsyncIOMotorDatabase) -> int:
+    """Highest index migration recorded in the database"""
+    doc = await database[MIGRATIONS_COLLECTION].find_one({"_id": "indexes"})
+    return doc["version"] if doc else 0
+
+
+async def apply_index_migrations(
+    database: AsyncIOMotorDatabase,
+    migrations: Sequence[IndexMigration] = MIGRATIONS,
+) -> int:
+    """Apply pending index migrations in order; return the resulting version"""
+    current = await applied_version(database)
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+        
+        for spec in migration.collections:
+            try:
+                await database.create_collection(spec.collection, timeseries=spec.options())
+            except CollectionInvalid:
+                pass
+            except OperationFailure as e:
+                if e.code != _NAMESPACE_EXISTS:
+                    raise
+        
+        by_collection: Dict[str, List[IndexModel]] = {}
+        for spec in migration.create:
+            by_collection.setdefault(spec.collection, []).append(spec.model())
+        for collection, models in by_collection.items():
+            await database[collection].create_indexes(models)
+        
+        for collection, name in migration.drop:
+            try:
+                await database[collection].drop_index(name)
+            except OperationFailure as e:
+                if e.code != _INDEX_NOT_FOUND:
+                    raise
+        
+        await database[MIGRATIONS_COLLECTION].update_one(
+            {"_id": "indexes"},
+            {"$max": {"version": migration.version}, "$set": {"applied_at": datetime.utcnow()}},
+            upsert=True,
+        )
+        current = migration.version
+        print(f"Index migration {migration.version} applied: {migration.description}")
+    return current
+
+
+# Query shapes
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Filter and sort a repository method sends to MongoDB.
+    
+    ``equality`` fields are matched exactly, ``range`` fields with bounds and
+    ``residual`` fields are filtered after the index scan (acceptable when the
+    index prefix is already selective). ``collscan`` documents why a shape is
+    allowed to scan the collection.
+    """
+    
+    collection: str
+    equality: Tuple[str, ...] = ()
+    sort: Tuple[Key, ...] = ()
+    range: Tuple[str, ...] = ()
+    residual: Tuple[str, ...] = ()
+    collscan: Optional[str] = None
+    source: str = field(default="", compare=False)
+    
+    def example_filter(self) -> Dict[str, Any]:
+        """A filter with this shape, for explain()"""
+        query: Dict[str, Any] = {}
+        for name in self.equality + self.residual:
+            query[name] = None
+        for name in self.range:
+            query[name] = {"$gte": datetime(1970, 1, 1), "$lte": datetime(2100, 1, 1)}
+        return query
+
+
+QUERY_SHAPES: List[QueryShape] = []
+
+
+def query_shape(
+    collection: str,
+    equality: Sequence[str] = (),
+    sort: Sequence[Key] = (),
+    range: Sequence[str] = (),
+    residual: Sequence[str] = (),
+    collscan: Optional[str] = None,
+) -> Callable:
+    """Declare a query shape issued by the decorated repository method.
+    
+    Stack the decorator once per variant (e.g. with and without an optional
+    filter). The method itself is returned unchanged.
+    """
+    def decorator(method: Callable) -> Callable:
+        QUERY_SHAPES.append(QueryShape(
+            collection=collection,
+            equality=tuple(equality),
+            sort=tuple(sort),
+            range=tuple(range),
+            residual=tuple(residual),
+            collscan=collscan,
+            source=method.__qualname__,
+        ))
+        return method
+    return decorator
+
+
+def supports(index: IndexSpec, shape: QueryShape) -> bool:
+    """Whether an index serves a shape without a collection scan or sort.
+    
+    Follows the equality-sort-range rule: the key pattern must start with
+    exactly the equality fields (in any order), continue with the sort keys
+    (all in the declared direction or all reversed), and range fields must
+    come either as the first sort key or right after the sort keys.
+    """
+    keys = list(index.keys)
+    if any(direction not in (1, -1) for _, direction in keys):
+        return False
+    
+    equality = set(shape.equality)
+    prefix = [name for name, _ in keys[:len(equality)]]
+    if set(prefix) != equality:
+        return False
+    rest = keys[len(equality):]
+    
+    if shape.sort:
+        if len(rest) < len(shape.sort):
+            return False
+        head = rest[:len(shape.sort)]
+        if [name for name, _ in head] != [name for name, _ in shape.sort]:
+            return False
+        same = all(d == sd for (_, d), (_, sd) in zip(head, shape.sort))
+        reverse = all(d == -sd for (_, d), (_, sd) in zip(head, shape.sort))
+        if not (same or reverse):
+            return False
+        rest = rest[len(shape.sort):]
+        ranges = set(shape.range) - {shape.sort[0][0]}
+    else:
+        ranges = set(shape.range)
+    
+    following = [name for name, _ in rest[:len(ranges)]]
+    if set(following) != ranges:
+        return False
+    
+    # Some key must bound the scan (or provide the order)
+    return bool(equality or shape.range or shape.sort)
+
+
+def covering_index(shape: QueryShape, indexes: Sequence[IndexSpec]) -> Optional[IndexSpec]:
+    """First index that serves shape, if any"""
+    if shape.equality == ("_id",) and not shape.sort:
+        return IndexSpec(shape.collection, (("_id", 1),))
+    for index in indexes:
+        if supports(index, shape):
+            return index
+    return None
+
+
+def uncovered_shapes(shapes: Sequence[QueryShape] = None) -> List[QueryShape]:
+    """Declared shapes that no registered index serves"""
+    indexes = target_indexes()
+    return [
+        shape for shape in (QUERY_SHAPES if shapes is None else shapes)
+        if shape.collscan is None
+        and covering_index(shape, indexes.get(shape.collection, [])) is None
+    ]
+
+
+def plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Stage names of an explain() query plan, outermost first"""
+    stages = []
+    pending = [plan]
+    while pending:
+        node = pending.pop()
+        if "stage" in node:
+            stages.append(node["stage"])
+        if "queryPlan" in node:
+            pending.append(node["queryPlan"])
+        if "inputStage" in node:
+            pending.append(node["inputStage"])
+        pending.extend(node.get("inputStages", []))
+    return stages
+
+
+async def main() -> None:
+    from infrastructure.config.database import MongoDBConfig
+    from infrastructure.config.settings import get_settings
+    
+    config = MongoDBConfig.from_settings(get_settings())
+    await config.connect()
+    try:
+        version = await apply_index_migrations(config.database)
+        print(f"Indexes at version {version}")
+    finally:
+        await config.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,7 @@ from .exercise_model import ExerciseModel
 from .mesocycle_model import MesocycleModel
 from .workout_model import WorkoutModel
 from .progress_model import ProgressModel
+from .training_session_model import SessionEntryModel, SessionExerciseModel, decode_sets, encode_sets
 
 __all__ = [
     "UserModel",
@@ -11,4 +12,8 @@ __all__ = [
     "MesocycleModel",
     "WorkoutModel",
     "ProgressModel",
+    "SessionEntryModel",
+    "SessionExerciseModel",
+    "encode_sets",
+    "decode_sets",
 ]
@@ -1,9 +1,10 @@
 """
 MongoDB Model: Progress
 
-MongoDB document model for Progress entity.
+MongoDB document model for Progress entity. BSON has no date type, so
+the day is stored as midnight UTC.
 """
-from datetime import date, datetime
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
 from uuid import UUID
@@ -14,7 +15,7 @@ class ProgressModel(BaseModel):
     
     id: UUID = Field(alias="_id")
     user_id: UUID
-    date: date
+    date: datetime
     metric_type: str
     value: float
     unit: Optional[str] = None
@@ -0,0 +1,70 @@
+"""
+MongoDB Model: Training Session
+
+Elements of the weekly training session bucket documents.
+
+A bucket (``_id`` = ``"{user_id}:{mesocycle_id}:{week_number}"``) holds
+one user's sessions of one mesocycle week in its ``sessions`` array, so a
+new session is a single ``$push``. Each exercise entry stores its sets as
+one BSON binary of concatenated little-endian columns (weights as float64,
+reps as uint16, RPE and RIR as uint8: 12 bytes a set) next to the volume,
+best e1RM and RPE sum the aggregations read.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from domain.entities.training_session import SetColumns
+
+_COLUMN_DTYPES = (
+    SetColumns.WEIGHT_DTYPE,
+    SetColumns.REPS_DTYPE,
+    SetColumns.SCALE_DTYPE,
+    SetColumns.SCALE_DTYPE,
+)
+SET_RECORD_BYTES = sum(dtype.itemsize for dtype in _COLUMN_DTYPES)
+
+
+def encode_sets(sets: SetColumns) -> bytes:
+    """Pack set columns into one buffer, column after column"""
+    return b"".join((
+        sets.weight_kg.tobytes(),
+        sets.reps_achieved.tobytes(),
+        sets.actual_rpe.tobytes(),
+        sets.reps_in_reserve.tobytes(),
+    ))
+
+
+def decode_sets(data: bytes) -> SetColumns:
+    """Unpack a buffer written by ``encode_sets`` (the arrays view it, no copy)"""
+    count, remainder = divmod(len(data), SET_RECORD_BYTES)
+    if remainder:
+        raise ValueError("Set buffer length is not a whole number of sets")
+    columns, offset = [], 0
+    for dtype in _COLUMN_DTYPES:
+        columns.append(np.frombuffer(data, dtype=dtype, count=count, offset=offset))
+        offset += dtype.itemsize * count
+    return SetColumns(*columns)
+
+
+class SessionExerciseModel(BaseModel):
+    """Exercise entry of a session header"""
+    
+    exercise_id: int
+    planned_sets: int
+    set_count: int
+    volume: float
+    max_1rm: float
+    rpe_sum: int
+    sets: bytes
+
+
+class SessionEntryModel(BaseModel):
+    """Session header stored in a bucket's ``sessions`` array"""
+    
+    id: int
+    date: datetime
+    microcycle_id: Optional[int] = None
+    exercises: List[SessionExerciseModel] = []
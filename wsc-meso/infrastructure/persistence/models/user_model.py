@@ -20,6 +20,7 @@ class UserModel(BaseModel):
     training_level: str = "intermediate"
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    version: int = 0
     
     class Config:
         populate_by_name = True
@@ -0,0 +1,209 @@
+"""
+Keyset Pagination
+
+Cursor encoding and query building for seek-based listings.
+
+Offset pagination makes MongoDB walk and discard every skipped document, so
+page N costs O(N * limit). A keyset cursor instead remembers the sort key of
+the last document returned and resumes with a range predicate the index can
+seek to directly, making every page cost the same.
+
+Listings that also need a total use a single ``$facet`` aggregation instead
+of a find followed by ``count_documents``.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+ASCENDING = 1
+DESCENDING = -1
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def _with_sort_field(projection: Optional[Dict[str, Any]], sort_field: str) -> Optional[Dict[str, Any]]:
+    """Projection extended with the sort field, or None for whole documents"""
+    if projection is None or projection.get(sort_field):
+        return projection
+    return {**projection, sort_field: 1}
+
+
+def _dump_value(value: Any) -> List[Any]:
+    """Tag a sort key value so it round-trips through JSON"""
+    if value is None:
+        return ["n", None]
+    if isinstance(value, bool):
+        return ["b", value]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        # BSON has no date type; values read back from MongoDB are datetimes
+        return ["dt", datetime.combine(value, time()).isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, int):
+        return ["i", value]
+    if isinstance(value, float):
+        return ["f", value]
+    if isinstance(value, str):
+        return ["s", value]
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+_LOADERS = {
+    "n": lambda raw: None,
+    "b": bool,
+    "dt": datetime.fromisoformat,
+    "u": UUID,
+    "i": int,
+    "f": float,
+    "s": str,
+}
+
+
+def _load_value(tagged: Any) -> Any:
+    """Inverse of _dump_value"""
+    tag, raw = tagged
+    return _LOADERS[tag](raw)
+
+
+def encode_cursor(sort_field: str, value: Any, doc_id: Any) -> str:
+    """Encode the sort key of the last returned document as an opaque token"""
+    payload = {"f": sort_field, "k": [_dump_value(value), _dump_value(doc_id)]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str, sort_field: str) -> Tuple[Any, Any]:
+    """Decode a token produced by encode_cursor into (value, _id)"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["f"] != sort_field:
+            raise InvalidCursorError("Cursor belongs to a different listing")
+        value, doc_id = (_load_value(item) for item in payload["k"])
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, KeyError, TypeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+    return value, doc_id
+
+
+def keyset_filter(sort_field: str, direction: int, value: Any, doc_id: Any) -> Dict[str, Any]:
+    """Predicate matching documents strictly after (value, _id) in sort order.
+    
+    MongoDB sorts a null or missing sort field before every value, and
+    ``$gt``/``$lt`` never match null. Ascending, a null key is followed by
+    the rest of the null run and then every non-null document; descending,
+    the null run comes after every value.
+    """
+    op = "$lt" if direction == DESCENDING else "$gt"
+    same_value = {sort_field: value, "_id": {op: doc_id}}
+    if value is None:
+        if direction == DESCENDING:
+            return same_value
+        return {"$or": [same_value, {sort_field: {"$ne": None}}]}
+    branches = [{sort_field: {op: value}}, same_value]
+    if direction == DESCENDING:
+        branches.append({sort_field: None})
+    return {"$or": branches}
+
+
+async def fetch_page(
+    collection: AsyncIOMotorCollection,
+    query: Dict[str, Any],
+    sort_field: str,
+    direction: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    projection: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """Fetch one page of documents and the cursor for the next one.
+    
+    With a cursor the page starts right after the encoded key and ``offset``
+    is ignored. Without one the page starts at ``offset`` (classic paging).
+    ``_id`` breaks ties so documents sharing a sort value are never skipped
+    or repeated. One extra document is read to learn whether a next page
+    exists without a count. A ``projection`` always keeps the sort field,
+    which the next cursor is built from.
+    """
+    if cursor:
+        value, doc_id = decode_cursor(cursor, sort_field)
+        query = {"$and": [query, keyset_filter(sort_field, direction, value, doc_id)]}
+        offset = 0
+    
+    find = collection.find(query, _with_sort_field(projection, sort_field)).sort([(sort_field, direction), ("_id", direction)])
+    if offset:
+        find = find.skip(offset)
+    docs = await find.limit(limit + 1).to_list(length=limit + 1)
+    
+    if len(docs) <= limit:
+        return docs, None
+    docs = docs[:limit]
+    last = docs[-1]
+    return docs, encode_cursor(sort_field, last.get(sort_field), last["_id"])
+
+
+def page_with_total_pipeline(
+    query: Dict[str, Any],
+    sort_field: str,
+    direction: int,
+    limit: int,
+    offset: int = 0,
+    projection: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Aggregation returning one page and the filter total in one document.
+    
+    ``$match`` and ``$sort`` stay ahead of ``$facet`` because stages inside a
+    facet cannot use indexes; this way the index serves both and the facet
+    only slices the sorted stream and counts it.
+    """
+    items: List[Dict[str, Any]] = []
+    if offset:
+        items.append({"$skip": offset})
+    items.append({"$limit": limit + 1})
+    pipeline = [
+        {"$match": query},
+        {"$sort": {sort_field: direction, "_id": direction}},
+    ]
+    if projection is not None:
+        pipeline.append({"$project": _with_sort_field(projection, sort_field)})
+    pipeline.append({"$facet": {"items": items, "total": [{"$count": "n"}]}})
+    return pipeline
+
+
+async def fetch_page_with_total(
+    collection: AsyncIOMotorCollection,
+    query: Dict[str, Any],
+    sort_field: str,
+    direction: int,
+    limit: int,
+    offset: int = 0,
+    projection: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[dict], Optional[str], int]:
+    """Fetch one page, the cursor for the next one and the total in one round trip"""
+    pipeline = page_with_total_pipeline(query, sort_field, direction, limit, offset, projection)
+    result = await collection.aggregate(pipeline).to_list(length=1)
+    facet = result[0] if result else {"items": [], "total": []}
+    total = facet["total"][0]["n"] if facet["total"] else 0
+    
+    docs = facet["items"]
+    if len(docs) <= limit:
+        return docs, None, total
+    docs = docs[:limit]
+    last = docs[-1]
+    return docs, encode_cursor(sort_field, last.get(sort_field), last["_id"]), total
+
+
+def filter_key(collection_name: str, query: Dict[str, Any]) -> str:
+    """Stable cache key for a collection filter"""
+    return collection_name + ":" + json.dumps(query, sort_keys=True, default=str)
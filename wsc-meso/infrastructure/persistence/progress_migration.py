@@ -0,0 +1,115 @@
+"""
+Progress Time-Series Migration
+
+Copies ``progress`` into the ``progress_timeseries`` collection while the
+API keeps serving.
+
+Run the API with ``PROGRESS_BACKEND=dual`` (reads from ``progress``, every
+write mirrored), then run this module until ``--check`` reports no drift,
+then switch to ``PROGRESS_BACKEND=timeseries``. Each pass walks ``progress``
+by ``_id`` in batches and compares every entry with its copy: missing,
+stale or duplicated copies are rewritten, and copies of entries deleted
+meanwhile are removed, so rerunning it is always safe::
+    
+    PYTHONPATH=src:. python -m infrastructure.persistence.progress_migration --check
+    PYTHONPATH=src:. python -m infrastructure.persistence.progress_migration [--batch-size N]
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from infrastructure.persistence.indexes import apply_index_migrations, query_shape
+from infrastructure.persistence.repositories.progress_repository_impl import ProgressRepository
+from infrastructure.persistence.repositories.progress_timeseries_repository_impl import TimeSeriesProgressRepository
+
+BATCH_SIZE = 1000
+
+
+class MigrationReport(NamedTuple):
+    """Outcome of a migration pass or check"""
+    
+    entries: int
+    drifted: List[UUID]  # entries whose copy was missing, stale or duplicated
+    extra: List[UUID]  # copies of entries no longer in ``progress``
+    written: bool
+
+
+@query_shape("progress", collscan="Migration walks every progress entry by _id")
+@query_shape("progress_timeseries", equality=("_id",))
+@query_shape("progress_timeseries", collscan="Migration looks for copies of deleted entries")
+async def migrate_progress(
+    database: AsyncIOMotorDatabase,
+    batch_size: int = BATCH_SIZE,
+    check: bool = False,
+) -> MigrationReport:
+    """Bring the time-series copy in line with ``progress``; only report if ``check``"""
+    source = ProgressRepository(database)
+    target = TimeSeriesProgressRepository(database)
+    entries, drifted, extra = 0, [], []
+    
+    last_id = None
+    while True:
+        query = {} if last_id is None else {"_id": {"$gt": last_id}}
+        docs = await source.collection.find(query).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]["_id"]
+        entries += len(docs)
+        expected = {doc["_id"]: target._to_document(source._to_entity(doc)) for doc in docs}
+        copies: Dict[Any, List[dict]] = defaultdict(list)
+        async for copy in target.collection.find({"_id": {"$in": list(expected)}}):
+            copies[copy["_id"]].append(copy)
+        stale = [entry_id for entry_id, doc in expected.items() if copies.get(entry_id) != [doc]]
+        drifted.extend(stale)
+        if stale and not check:
+            # Rewriting from the source also collapses duplicate copies
+            await target.collection.delete_many({"_id": {"$in": stale}})
+            await target.collection.insert_many([expected[entry_id] for entry_id in stale], ordered=False)
+    
+    async def remove_extra(batch: List[Any]) -> None:
+        present = {doc["_id"] async for doc in source.collection.find({"_id": {"$in": batch}}, {"_id": 1})}
+        missing = [entry_id for entry_id in batch if entry_id not in present]
+        extra.extend(missing)
+        if missing and not check:
+            await target.collection.delete_many({"_id": {"$in": missing}})
+    
+    batch = []
+    async for copy in target.collection.find({}, {"_id": 1}).batch_size(batch_size):
+        batch.append(copy["_id"])
+        if len(batch) == batch_size:
+            await remove_extra(batch)
+            batch = []
+    if batch:
+        await remove_extra(batch)
+    
+    extra = sorted(set(extra), key=str)
+    return MigrationReport(entries, drifted, extra, written=not check and bool(drifted or extra))
+
+
+async def main() -> None:
+    from infrastructure.config.database import MongoDBConfig
+    from infrastructure.config.settings import get_settings
+    
+    parser = argparse.ArgumentParser(description="Copy progress into the time-series collection")
+    parser.add_argument("--check", action="store_true", help="report drift without writing")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+    
+    config = MongoDBConfig.from_settings(get_settings())
+    await config.connect()
+    try:
+        # The time-series collection must exist with its options
+        await apply_index_migrations(config.database)
+        report = await migrate_progress(config.database, args.batch_size, check=args.check)
+    finally:
+        await config.disconnect()
+    action = "rewritten" if report.written else "unchanged"
+    print(f"{report.entries} entries, {len(report.drifted)} drifted, {len(report.extra)} extra copies, {action}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
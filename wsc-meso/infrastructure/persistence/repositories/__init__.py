@@ -4,6 +4,11 @@ from .mesocycle_repository_impl import MesocycleRepository
 from .exercise_repository_impl import ExerciseRepository
 from .workout_repository_impl import WorkoutRepository
 from .progress_repository_impl import ProgressRepository
+from .progress_timeseries_repository_impl import MirroredProgressRepository, TimeSeriesProgressRepository
+from .training_session_repository_impl import TrainingSessionRepository
+from .exercise_state_repository_impl import ExerciseStateRepository
+from .weekly_rollup_repository_impl import WeeklyRollupRepository
+from .version_counter_repository_impl import VersionCounterRepository
 
 __all__ = [
     "UserRepository",
@@ -11,4 +16,10 @@ __all__ = [
     "ExerciseRepository",
     "WorkoutRepository",
     "ProgressRepository",
+    "TimeSeriesProgressRepository",
+    "MirroredProgressRepository",
+    "TrainingSessionRepository",
+    "ExerciseStateRepository",
+    "WeeklyRollupRepository",
+    "VersionCounterRepository",
 ]
@@ -0,0 +1,155 @@
+"""
+Base MongoDB Repository
+
+Listing and bulk write helpers shared by the MongoDB repository implementations.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pymongo import DeleteOne, InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from domain.repositories.bulk import BulkItemError, BulkWriteResult
+from domain.repositories.read_profile import ReadProfile
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.pagination import (
+    fetch_page,
+    fetch_page_with_total,
+    filter_key,
+)
+
+
+class MongoRepository:
+    """Mixin for repositories backed by ``self.collection``.
+    
+    ``count_cache`` holds recent listing totals keyed by collection and
+    filter. Every exact count refreshes it; ``estimated`` listings read from
+    it and, on a hit, run a plain find instead of the ``$facet`` count.
+    
+    ``summary_projection`` lists the fields ``_to_summary`` reads; summary
+    profile reads fetch only those.
+    
+    Bulk writes are sent as unordered ``bulk_write`` batches of at most
+    ``bulk_chunk_size`` operations, so one failing item does not stop the
+    others and each failure is reported with its input position.
+    """
+    
+    collection: Any
+    count_cache: Optional[TTLCache] = None
+    summary_projection: Optional[Dict[str, int]] = None
+    bulk_chunk_size: int = 1000
+    
+    def _projection(self, profile: ReadProfile) -> Optional[Dict[str, int]]:
+        """MongoDB projection for a read profile (None = whole document)"""
+        if profile is ReadProfile.SUMMARY:
+            return self.summary_projection
+        return None
+    
+    def _decode(self, doc: dict, profile: ReadProfile) -> Any:
+        """Build the entity or summary read model for a read profile"""
+        if profile is ReadProfile.SUMMARY:
+            return self._to_summary(doc)
+        return self._to_entity(doc)
+    
+    async def _find_page_with_total(
+        self,
+        query: Dict[str, Any],
+        sort_field: str,
+        direction: int,
+        limit: int,
+        offset: int = 0,
+        estimated: bool = False,
+        projection: Optional[Dict[str, int]] = None,
+    ) -> Tuple[List[dict], Optional[str], int]:
+        """Fetch a page and its total, possibly reusing a cached total"""
+        key = None
+        if self.count_cache is not None:
+            key = filter_key(self.collection.name, query)
+            if estimated:
+                total = self.count_cache.get(key)
+                if total is not None:
+                    docs, next_cursor = await fetch_page(
+                        self.collection, query, sort_field, direction, limit,
+                        offset=offset, projection=projection,
+                    )
+                    return docs, next_cursor, total
+        
+        docs, next_cursor, total = await fetch_page_with_total(
+            self.collection, query, sort_field, direction, limit,
+            offset=offset, projection=projection,
+        )
+        if key is not None:
+            self.count_cache.set(key, total)
+        return docs, next_cursor, total
+    
+    async def _bulk_write(
+        self,
+        requests: Sequence[Any],
+        ids: Sequence[Any],
+        counter: str,
+    ) -> BulkWriteResult:
+        """Run write requests in unordered chunks and collect per-item errors.
+        
+        ``counter`` names the field of the server's bulk result that
+        ``written`` adds up (``nInserted``, ``nMatched`` or ``nRemoved``).
+        """
+        written = 0
+        errors: List[BulkItemError] = []
+        for start in range(0, len(requests), self.bulk_chunk_size):
+            chunk = requests[start:start + self.bulk_chunk_size]
+            try:
+                result = await self.collection.bulk_write(chunk, ordered=False)
+                details = result.bulk_api_result
+            except BulkWriteError as e:
+                details = e.details
+                for error in details.get("writeErrors", []):
+                    index = start + error["index"]
+                    errors.append(BulkItemError(
+                        index=index,
+                        id=ids[index],
+                        message=error.get("errmsg", "Write failed"),
+                        code=error.get("code"),
+                    ))
+            written += details.get(counter, 0)
+        return BulkWriteResult(written=written, errors=tuple(errors))
+    
+    async def _insert_many(self, documents: Sequence[dict]) -> BulkWriteResult:
+        """Insert documents in bulk"""
+        return await self._bulk_write(
+            [InsertOne(doc) for doc in documents],
+            [doc["_id"] for doc in documents],
+            "nInserted",
+        )
+    
+    async def _replace_many(self, documents: Sequence[dict]) -> BulkWriteResult:
+        """Replace documents by _id in bulk; missing documents are reported as errors"""
+        ids = [doc["_id"] for doc in documents]
+        result = await self._bulk_write(
+            [ReplaceOne({"_id": doc["_id"]}, doc) for doc in documents],
+            ids,
+            "nMatched",
+        )
+        if result.written + len(result.errors) >= len(documents):
+            return result
+        
+        # Some replacements matched nothing: one lookup tells which
+        failed = result.failed_indexes
+        pending = [doc_id for index, doc_id in enumerate(ids) if index not in failed]
+        existing = {
+            doc["_id"]
+            async for doc in self.collection.find({"_id": {"$in": pending}}, {"_id": 1})
+        }
+        missing = [
+            BulkItemError(index=index, id=doc_id, message="Not found")
+            for index, doc_id in enumerate(ids)
+            if index not in failed and doc_id not in existing
+        ]
+        errors = tuple(sorted(result.errors + tuple(missing), key=lambda error: error.index))
+        return BulkWriteResult(written=result.written, errors=errors)
+    
+    async def _delete_many(self, ids: Sequence[Any]) -> BulkWriteResult:
+        """Delete documents by _id in bulk"""
+        return await self._bulk_write(
+            [DeleteOne({"_id": doc_id}) for doc_id in ids],
+            ids,
+            "nRemoved",
+        )
@@ -3,20 +3,30 @@ Exercise Repository Implementation
 
 MongoDB implementation of IExerciseRepository.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from domain.entities.exercise import Exercise, MuscleGroup, ExerciseType
+from domain.entities.exercise import Exercise, ExerciseSummary, MuscleGroup, ExerciseType
 from domain.repositories.exercise_repository import IExerciseRepository
-from infrastructure.persistence.models.exercise_model import ExerciseModel
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
+from infrastructure.cache import TTLCache
+from infrastructure.catalog.recommendations import rank_recommendations
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.pagination import ASCENDING, fetch_page
+from infrastructure.persistence.repositories.base_repository import MongoRepository
 
 
-class ExerciseRepository(IExerciseRepository):
+class ExerciseRepository(MongoRepository, IExerciseRepository):
     """MongoDB implementation of Exercise repository"""
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    summary_projection = {"name": 1, "muscle_group": 1, "primary_muscles": 1, "type": 1}
+    
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
         self.collection = database.exercises
+        self.count_cache = count_cache
     
+    @query_shape("exercises", equality=("_id",))
     async def find_by_id(self, exercise_id: int) -> Optional[Exercise]:
         """Find exercise by ID"""
         doc = await self.collection.find_one({"_id": exercise_id})
@@ -24,25 +34,86 @@ class ExerciseRepository(IExerciseRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("exercises", sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("type",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)), residual=("type",))
     async def find_all(
         self,
         muscle_group: Optional[MuscleGroup] = None,
         exercise_type: Optional[ExerciseType] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Exercise]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
         """Find all exercises with optional filtering"""
-        query = {}
-        if muscle_group:
-            query["muscle_group"] = muscle_group.value
-        if exercise_type:
-            query["type"] = exercise_type.value
-        
-        cursor = self.collection.find(query).skip(offset).limit(limit).sort("name", 1)
+        query = self._filter_query(muscle_group, exercise_type)
+        cursor = self.collection.find(query, self._projection(profile)).skip(offset).limit(limit).sort([("name", 1), ("_id", 1)])
         docs = await cursor.to_list(length=limit)
-        return [self._to_entity(doc) for doc in docs]
+        return [self._decode(doc, profile) for doc in docs]
+    
+    @query_shape("exercises", sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("type",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)), residual=("type",))
+    async def find_page(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises ordered by name"""
+        docs, next_cursor = await fetch_page(
+            self.collection,
+            self._filter_query(muscle_group, exercise_type),
+            "name",
+            ASCENDING,
+            limit,
+            cursor=cursor,
+            offset=offset,
+            projection=self._projection(profile),
+        )
+        return Page(items=[self._decode(doc, profile) for doc in docs], next_cursor=next_cursor)
+    
+    @query_shape("exercises", sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("type",), sort=(("name", 1), ("_id", 1)))
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)), residual=("type",))
+    async def find_page_with_total(
+        self,
+        muscle_group: Optional[MuscleGroup] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Exercise, ExerciseSummary]]:
+        """Find one page of exercises and the total in one round trip"""
+        docs, next_cursor, total = await self._find_page_with_total(
+            self._filter_query(muscle_group, exercise_type),
+            "name",
+            ASCENDING,
+            limit,
+            offset=offset,
+            estimated=estimated,
+            projection=self._projection(profile),
+        )
+        return Page(
+            items=[self._decode(doc, profile) for doc in docs],
+            next_cursor=next_cursor,
+            total=total,
+        )
     
-    async def search(self, query: str, limit: int = 20) -> List[Exercise]:
+    @query_shape("exercises", residual=("name", "execution", "comments"), collscan="Unanchored case-insensitive regex over a small static catalog")
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Exercise, ExerciseSummary]]:
         """Search exercises by name or description"""
         search_query = {
             "$or": [
@@ -52,48 +123,84 @@ class ExerciseRepository(IExerciseRepository):
             ]
         }
         
-        cursor = self.collection.find(search_query).limit(limit)
+        cursor = self.collection.find(search_query, self._projection(profile)).limit(limit)
         docs = await cursor.to_list(length=limit)
-        return [self._to_entity(doc) for doc in docs]
+        return [self._decode(doc, profile) for doc in docs]
     
+    @query_shape("exercises", equality=("muscle_group",), sort=(("name", 1), ("_id", 1)))
     async def find_recommended_by_muscle_group(
         self,
         muscle_group: MuscleGroup,
         training_level: str,
         limit: int = 8,
     ) -> List[Exercise]:
-        """Find recommended exercises for a muscle group"""
-        query = {
-            "muscle_group": muscle_group.value,
-            "difficulty": training_level
-        }
-        
-        cursor = self.collection.find(query).limit(limit)
-        docs = await cursor.to_list(length=limit)
-        
-        # If not enough exercises with exact difficulty, get any from muscle group
-        if len(docs) < limit:
-            remaining = limit - len(docs)
-            query = {"muscle_group": muscle_group.value}
-            cursor = self.collection.find(query).limit(remaining)
-            additional_docs = await cursor.to_list(length=remaining)
-            docs.extend(additional_docs)
+        """Find recommended exercises for a muscle group.
         
-        return [self._to_entity(doc) for doc in docs]
+        Loads the group once and ranks it like the in-memory catalog does.
+        """
+        cursor = self.collection.find({"muscle_group": muscle_group.value}).sort([("name", 1), ("_id", 1)])
+        docs = await cursor.to_list(length=None)
+        ranked = rank_recommendations([self._to_entity(doc) for doc in docs], training_level)
+        return list(ranked[:limit])
     
+    @query_shape("exercises", equality=("muscle_group",))
+    @query_shape("exercises", equality=("type",))
+    @query_shape("exercises", equality=("muscle_group",), residual=("type",))
     async def count(
         self,
         muscle_group: Optional[MuscleGroup] = None,
         exercise_type: Optional[ExerciseType] = None,
     ) -> int:
         """Count exercises with optional filtering"""
+        return await self.collection.count_documents(
+            self._filter_query(muscle_group, exercise_type)
+        )
+    
+    @query_shape("exercises", collscan="Whole catalog load for the in-memory exercise catalog")
+    async def load_all(self) -> List[Exercise]:
+        """Load every exercise (source of the in-memory catalog)"""
+        docs = await self.collection.find({}).to_list(length=None)
+        return [self._to_entity(doc) for doc in docs]
+    
+    @query_shape("exercises", collscan="Catalog fingerprint over a small static collection")
+    async def fingerprint(self) -> str:
+        """Cheap version stamp of the collection: count, max _id and last update"""
+        result = await self.collection.aggregate([
+            {"$group": {
+                "_id": None,
+                "count": {"$sum": 1},
+                "max_id": {"$max": "$_id"},
+                "updated_at": {"$max": "$updated_at"},
+            }}
+        ]).to_list(length=1)
+        if not result:
+            return "0"
+        stats = result[0]
+        updated_at = stats["updated_at"].isoformat() if stats.get("updated_at") else ""
+        return f"{stats['count']}:{stats['max_id']}:{updated_at}"
+    
+    def _filter_query(
+        self,
+        muscle_group: Optional[MuscleGroup],
+        exercise_type: Optional[ExerciseType],
+    ) -> dict:
+        """Build the filter shared by the listing and count"""
         query = {}
         if muscle_group:
             query["muscle_group"] = muscle_group.value
         if exercise_type:
             query["type"] = exercise_type.value
-        
-        return await self.collection.count_documents(query)
+        return query
+    
+    def _to_summary(self, doc: dict) -> ExerciseSummary:
+        """Convert a summary projection to an ExerciseSummary"""
+        return ExerciseSummary(
+            id=doc["_id"],
+            name=doc["name"],
+            muscle_group=MuscleGroup(doc["muscle_group"]),
+            primary_muscles=doc["primary_muscles"],
+            type=ExerciseType(doc["type"]),
+        )
     
     def _to_entity(self, doc: dict) -> Exercise:
         """Convert MongoDB document to Exercise entity"""
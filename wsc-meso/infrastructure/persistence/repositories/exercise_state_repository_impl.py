@@ -0,0 +1,110 @@
+"""
+Exercise State Repository Implementation
+
+MongoDB implementation of IExerciseStateRepository.
+
+One small document per user and exercise (``_id`` =
+``"{user_id}:{exercise_id}"``). ``record`` is a single upserting
+``find_one_and_update`` whose aggregation-pipeline update computes the new
+averages from the stored ones, so concurrent sessions never lose an update
+and the cost does not depend on how many sessions came before.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from domain.repositories.exercise_state_repository import IExerciseStateRepository
+from domain.services.autoregulation import (
+    RPE_ALPHA,
+    TREND_ALPHA,
+    ExerciseObservation,
+    ExerciseState,
+)
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.repositories.base_repository import MongoRepository
+
+
+def state_key(user_id: UUID, exercise_id: int) -> str:
+    """_id of a user's state document for one exercise"""
+    return f"{user_id}:{exercise_id}"
+
+
+def _ewma(field: str, value: Any, alpha: float) -> dict:
+    """alpha * value + (1 - alpha) * $field, seeded with value when unset"""
+    return {"$add": [
+        {"$multiply": [alpha, value]},
+        {"$multiply": [1 - alpha, {"$ifNull": [f"${field}", value]}]},
+    ]}
+
+
+def update_pipeline(
+    user_id: UUID,
+    exercise_id: int,
+    observation: ExerciseObservation,
+    now: datetime,
+) -> List[Dict[str, Any]]:
+    """Update pipeline equivalent to ``advance_state``.
+    
+    Every expression in the ``$set`` stage reads the stored (previous) values.
+    """
+    changes: Dict[str, Any] = {
+        "user_id": user_id,
+        "exercise_id": exercise_id,
+        "sessions": {"$add": [{"$ifNull": ["$sessions", 0]}, 1]},
+        "last_weight_kg": observation.weight_kg,
+        "last_reps": observation.reps,
+        "last_e1rm": observation.e1rm,
+        "best_e1rm": {"$max": ["$best_e1rm", observation.e1rm]},
+        "rpe_ewma": _ewma("rpe_ewma", observation.rpe, RPE_ALPHA),
+        "trend_slope": {"$cond": [
+            {"$eq": [{"$type": "$last_e1rm"}, "missing"]},
+            0.0,
+            _ewma("trend_slope", {"$subtract": [observation.e1rm, "$last_e1rm"]}, TREND_ALPHA),
+        ]},
+        "updated_at": now,
+    }
+    if observation.fatigue is not None:
+        changes["fatigue_ewma"] = _ewma("fatigue_ewma", observation.fatigue, RPE_ALPHA)
+    return [{"$set": changes}]
+
+
+class ExerciseStateRepository(MongoRepository, IExerciseStateRepository):
+    """MongoDB implementation of ExerciseState repository"""
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.exercise_states
+    
+    @query_shape("exercise_states", equality=("_id",))
+    async def record(self, user_id: UUID, exercise_id: int, observation: ExerciseObservation) -> ExerciseState:
+        """Fold a session into the state with one atomic round trip"""
+        doc = await self.collection.find_one_and_update(
+            {"_id": state_key(user_id, exercise_id)},
+            update_pipeline(user_id, exercise_id, observation, datetime.utcnow()),
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._to_entity(doc)
+    
+    @query_shape("exercise_states", equality=("_id",))
+    async def find(self, user_id: UUID, exercise_id: int) -> Optional[ExerciseState]:
+        """Find the state of one exercise for a user"""
+        doc = await self.collection.find_one({"_id": state_key(user_id, exercise_id)})
+        if not doc:
+            return None
+        return self._to_entity(doc)
+    
+    def _to_entity(self, doc: dict) -> ExerciseState:
+        """Convert a MongoDB document to an ExerciseState"""
+        return ExerciseState(
+            exercise_id=doc["exercise_id"],
+            sessions=doc["sessions"],
+            last_weight_kg=doc["last_weight_kg"],
+            last_reps=doc["last_reps"],
+            last_e1rm=doc["last_e1rm"],
+            best_e1rm=doc["best_e1rm"],
+            rpe_ewma=doc["rpe_ewma"],
+            fatigue_ewma=doc.get("fatigue_ewma"),
+            trend_slope=doc["trend_slope"],
+        )
@@ -3,44 +3,43 @@ Mesocycle Repository Implementation
 
 MongoDB implementation of IMesocycleRepository.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from domain.entities.mesocycle import Mesocycle, MesocycleStatus, TrainingGoal, PeriodizationModel
+from domain.entities.mesocycle import Mesocycle, MesocycleSummary, MesocycleStatus, TrainingGoal, PeriodizationModel
 from domain.repositories.mesocycle_repository import IMesocycleRepository
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.indexes import query_shape
 from infrastructure.persistence.models.mesocycle_model import MesocycleModel
+from infrastructure.persistence.pagination import DESCENDING, fetch_page
+from infrastructure.persistence.repositories.base_repository import MongoRepository
 
 
-class MesocycleRepository(IMesocycleRepository):
+class MesocycleRepository(MongoRepository, IMesocycleRepository):
     """MongoDB implementation of Mesocycle repository"""
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    # Every field of the list schema that is stored with the mesocycle
+    summary_projection = {
+        "user_id": 1, "name": 1, "description": 1, "periodization_model": 1, "goal": 1,
+        "duration_weeks": 1, "start_date": 1, "end_date": 1, "status": 1,
+        "training_level": 1, "weekly_frequency": 1, "deload_weeks": 1,
+        "created_at": 1, "updated_at": 1,
+    }
+    
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
         self.collection = database.mesocycles
+        self.count_cache = count_cache
     
     async def save(self, mesocycle: Mesocycle) -> Mesocycle:
         """Save a mesocycle"""
-        mesocycle_model = MesocycleModel(
-            _id=mesocycle.id,
-            user_id=mesocycle.user_id,
-            name=mesocycle.name,
-            description=mesocycle.description,
-            periodization_model=mesocycle.periodization_model.value,
-            goal=mesocycle.goal.value,
-            duration_weeks=mesocycle.duration_weeks,
-            start_date=mesocycle.start_date,
-            end_date=mesocycle.end_date,
-            status=mesocycle.status.value,
-            training_level=mesocycle.training_level,
-            weekly_frequency=mesocycle.weekly_frequency,
-            deload_weeks=mesocycle.deload_weeks,
-            created_at=mesocycle.created_at,
-            updated_at=mesocycle.updated_at,
-        )
-        
-        await self.collection.insert_one(mesocycle_model.model_dump(by_alias=True))
+        await self.collection.insert_one(self._to_document(mesocycle))
         return mesocycle
     
+    @query_shape("mesocycles", equality=("_id",))
     async def find_by_id(self, mesocycle_id: UUID) -> Optional[Mesocycle]:
         """Find mesocycle by ID"""
         doc = await self.collection.find_one({"_id": mesocycle_id})
@@ -48,46 +47,76 @@ class MesocycleRepository(IMesocycleRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("mesocycles", equality=("user_id",), sort=(("created_at", -1), ("_id", -1)))
+    @query_shape("mesocycles", equality=("user_id", "status"), sort=(("created_at", -1), ("_id", -1)))
     async def find_by_user_id(
         self,
         user_id: UUID,
         status: Optional[MesocycleStatus] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Mesocycle]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Mesocycle, MesocycleSummary]]:
         """Find mesocycles by user ID"""
-        query = {"user_id": user_id}
-        if status:
-            query["status"] = status.value
-        
-        cursor = self.collection.find(query).skip(offset).limit(limit).sort("created_at", -1)
+        query = self._user_query(user_id, status)
+        cursor = self.collection.find(query, self._projection(profile)).skip(offset).limit(limit).sort([("created_at", -1), ("_id", -1)])
         docs = await cursor.to_list(length=limit)
-        return [self._to_entity(doc) for doc in docs]
+        return [self._decode(doc, profile) for doc in docs]
     
-    async def update(self, mesocycle: Mesocycle) -> Mesocycle:
-        """Update a mesocycle"""
-        mesocycle_model = MesocycleModel(
-            _id=mesocycle.id,
-            user_id=mesocycle.user_id,
-            name=mesocycle.name,
-            description=mesocycle.description,
-            periodization_model=mesocycle.periodization_model.value,
-            goal=mesocycle.goal.value,
-            duration_weeks=mesocycle.duration_weeks,
-            start_date=mesocycle.start_date,
-            end_date=mesocycle.end_date,
-            status=mesocycle.status.value,
-            training_level=mesocycle.training_level,
-            weekly_frequency=mesocycle.weekly_frequency,
-            deload_weeks=mesocycle.deload_weeks,
-            created_at=mesocycle.created_at,
-            updated_at=mesocycle.updated_at,
+    @query_shape("mesocycles", equality=("user_id",), sort=(("created_at", -1), ("_id", -1)))
+    @query_shape("mesocycles", equality=("user_id", "status"), sort=(("created_at", -1), ("_id", -1)))
+    async def find_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[MesocycleStatus] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Mesocycle, MesocycleSummary]]:
+        """Find one page of a user's mesocycles, newest first"""
+        docs, next_cursor = await fetch_page(
+            self.collection,
+            self._user_query(user_id, status),
+            "created_at",
+            DESCENDING,
+            limit,
+            cursor=cursor,
+            offset=offset,
+            projection=self._projection(profile),
         )
-        
-        await self.collection.replace_one(
-            {"_id": mesocycle.id},
-            mesocycle_model.model_dump(by_alias=True)
+        return Page(items=[self._decode(doc, profile) for doc in docs], next_cursor=next_cursor)
+    
+    @query_shape("mesocycles", equality=("user_id",), sort=(("created_at", -1), ("_id", -1)))
+    @query_shape("mesocycles", equality=("user_id", "status"), sort=(("created_at", -1), ("_id", -1)))
+    async def find_page_with_total(
+        self,
+        user_id: UUID,
+        status: Optional[MesocycleStatus] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Mesocycle, MesocycleSummary]]:
+        """Find one page of a user's mesocycles and the total in one round trip"""
+        docs, next_cursor, total = await self._find_page_with_total(
+            self._user_query(user_id, status),
+            "created_at",
+            DESCENDING,
+            limit,
+            offset=offset,
+            estimated=estimated,
+            projection=self._projection(profile),
         )
+        return Page(
+            items=[self._decode(doc, profile) for doc in docs],
+            next_cursor=next_cursor,
+            total=total,
+        )
+    
+    async def update(self, mesocycle: Mesocycle) -> Mesocycle:
+        """Update a mesocycle"""
+        await self.collection.replace_one({"_id": mesocycle.id}, self._to_document(mesocycle))
         return mesocycle
     
     async def delete(self, mesocycle_id: UUID) -> bool:
@@ -95,17 +124,29 @@ class MesocycleRepository(IMesocycleRepository):
         result = await self.collection.delete_one({"_id": mesocycle_id})
         return result.deleted_count > 0
     
+    async def save_many(self, mesocycles: Sequence[Mesocycle]) -> BulkWriteResult:
+        """Insert mesocycles in bulk, reporting failures per item"""
+        return await self._insert_many([self._to_document(mesocycle) for mesocycle in mesocycles])
+    
+    async def update_many(self, mesocycles: Sequence[Mesocycle]) -> BulkWriteResult:
+        """Replace mesocycles in bulk, reporting failures per item"""
+        return await self._replace_many([self._to_document(mesocycle) for mesocycle in mesocycles])
+    
+    async def delete_many(self, mesocycle_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete mesocycles in bulk, reporting failures per item"""
+        return await self._delete_many(mesocycle_ids)
+    
+    @query_shape("mesocycles", equality=("user_id",))
+    @query_shape("mesocycles", equality=("user_id", "status"))
     async def count_by_user_id(
         self,
         user_id: UUID,
         status: Optional[MesocycleStatus] = None,
     ) -> int:
         """Count mesocycles for a user"""
-        query = {"user_id": user_id}
-        if status:
-            query["status"] = status.value
-        return await self.collection.count_documents(query)
+        return await self.collection.count_documents(self._user_query(user_id, status))
     
+    @query_shape("mesocycles", equality=("user_id", "status"))
     async def find_active_by_user_id(self, user_id: UUID) -> Optional[Mesocycle]:
         """Find active mesocycle for a user"""
         doc = await self.collection.find_one({"user_id": user_id, "status": "active"})
@@ -113,6 +154,53 @@ class MesocycleRepository(IMesocycleRepository):
             return None
         return self._to_entity(doc)
     
+    def _user_query(self, user_id: UUID, status: Optional[MesocycleStatus]) -> dict:
+        """Build the filter shared by the per-user listing and count"""
+        query = {"user_id": user_id}
+        if status:
+            query["status"] = status.value
+        return query
+    
+    def _to_summary(self, doc: dict) -> MesocycleSummary:
+        """Convert a summary projection to a MesocycleSummary"""
+        return MesocycleSummary(
+            id=doc["_id"],
+            user_id=doc["user_id"],
+            name=doc["name"],
+            periodization_model=PeriodizationModel(doc["periodization_model"]),
+            goal=TrainingGoal(doc["goal"]),
+            duration_weeks=doc["duration_weeks"],
+            start_date=doc["start_date"],
+            end_date=doc["end_date"],
+            status=MesocycleStatus(doc["status"]),
+            training_level=doc["training_level"],
+            weekly_frequency=doc["weekly_frequency"],
+            created_at=doc.get("created_at"),
+            description=doc.get("description"),
+            deload_weeks=doc.get("deload_weeks", []),
+            updated_at=doc.get("updated_at"),
+        )
+    
+    def _to_document(self, mesocycle: Mesocycle) -> dict:
+        """Convert Mesocycle entity to a MongoDB document"""
+        return MesocycleModel(
+            _id=mesocycle.id,
+            user_id=mesocycle.user_id,
+            name=mesocycle.name,
+            description=mesocycle.description,
+            periodization_model=mesocycle.periodization_model.value,
+            goal=mesocycle.goal.value,
+            duration_weeks=mesocycle.duration_weeks,
+            start_date=mesocycle.start_date,
+            end_date=mesocycle.end_date,
+            status=mesocycle.status.value,
+            training_level=mesocycle.training_level,
+            weekly_frequency=mesocycle.weekly_frequency,
+            deload_weeks=mesocycle.deload_weeks,
+            created_at=mesocycle.created_at,
+            updated_at=mesocycle.updated_at,
+        ).model_dump(by_alias=True)
+    
     def _to_entity(self, doc: dict) -> Mesocycle:
         """Convert MongoDB document to Mesocycle entity"""
         return Mesocycle(
@@ -3,38 +3,46 @@ Progress Repository Implementation
 
 MongoDB implementation of IProgressRepository.
 """
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime, time
+from typing import List, Optional, Sequence
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from domain.entities.progress import Progress, MetricType
+from domain.entities.progress import Progress, MetricType, ProgressSeries
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
 from domain.repositories.progress_repository import IProgressRepository
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.indexes import query_shape
 from infrastructure.persistence.models.progress_model import ProgressModel
+from infrastructure.persistence.pagination import DESCENDING, fetch_page
+from infrastructure.persistence.repositories.base_repository import MongoRepository
 
 
-class ProgressRepository(IProgressRepository):
+def _as_datetime(day: date) -> datetime:
+    """BSON has no date type; days are stored at midnight"""
+    if isinstance(day, datetime):
+        return day
+    return datetime.combine(day, time())
+
+
+class ProgressRepository(MongoRepository, IProgressRepository):
     """MongoDB implementation of Progress repository"""
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    # Filter fields of the per-user queries
+    user_field = "user_id"
+    metric_field = "metric_type"
+    
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
         self.collection = database.progress
+        self.count_cache = count_cache
     
     async def save(self, progress: Progress) -> Progress:
         """Save a progress entry"""
-        progress_model = ProgressModel(
-            _id=progress.id,
-            user_id=progress.user_id,
-            date=progress.date,
-            metric_type=progress.metric_type.value,
-            value=progress.value,
-            unit=progress.unit,
-            notes=progress.notes,
-            created_at=progress.created_at,
-        )
-        
-        await self.collection.insert_one(progress_model.model_dump(by_alias=True))
+        await self.collection.insert_one(self._to_document(progress))
         return progress
     
+    @query_shape("progress", equality=("_id",))
     async def find_by_id(self, progress_id: UUID) -> Optional[Progress]:
         """Find progress entry by ID"""
         doc = await self.collection.find_one({"_id": progress_id})
@@ -42,6 +50,8 @@ class ProgressRepository(IProgressRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("progress", equality=("user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape("progress", equality=("user_id", "metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
     async def find_by_user_id(
         self,
         user_id: UUID,
@@ -52,40 +62,79 @@ class ProgressRepository(IProgressRepository):
         offset: int = 0,
     ) -> List[Progress]:
         """Find progress entries by user ID with optional filters"""
-        query = {"user_id": user_id}
-        
-        if metric_type:
-            query["metric_type"] = metric_type.value
-        
-        if start_date or end_date:
-            date_query = {}
-            if start_date:
-                date_query["$gte"] = start_date
-            if end_date:
-                date_query["$lte"] = end_date
-            query["date"] = date_query
-        
-        cursor = self.collection.find(query).skip(offset).limit(limit).sort("date", -1)
+        query = self._user_query(user_id, metric_type, start_date, end_date)
+        cursor = self.collection.find(query).skip(offset).limit(limit).sort([("date", -1), ("_id", -1)])
         docs = await cursor.to_list(length=limit)
         return [self._to_entity(doc) for doc in docs]
     
-    async def update(self, progress: Progress) -> Progress:
-        """Update a progress entry"""
-        progress_model = ProgressModel(
-            _id=progress.id,
-            user_id=progress.user_id,
-            date=progress.date,
-            metric_type=progress.metric_type.value,
-            value=progress.value,
-            unit=progress.unit,
-            notes=progress.notes,
-            created_at=progress.created_at,
+    @query_shape("progress", equality=("user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape("progress", equality=("user_id", "metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
+    async def find_page_by_user_id(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries, latest first"""
+        docs, next_cursor = await fetch_page(
+            self.collection,
+            self._user_query(user_id, metric_type, start_date, end_date),
+            "date",
+            DESCENDING,
+            limit,
+            cursor=cursor,
+            offset=offset,
         )
-        
-        await self.collection.replace_one(
-            {"_id": progress.id},
-            progress_model.model_dump(by_alias=True)
+        return Page(items=[self._to_entity(doc) for doc in docs], next_cursor=next_cursor)
+    
+    @query_shape("progress", equality=("user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape("progress", equality=("user_id", "metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
+    async def find_page_with_total(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries and the total in one round trip"""
+        docs, next_cursor, total = await self._find_page_with_total(
+            self._user_query(user_id, metric_type, start_date, end_date),
+            "date",
+            DESCENDING,
+            limit,
+            offset=offset,
+            estimated=estimated,
+        )
+        return Page(
+            items=[self._to_entity(doc) for doc in docs],
+            next_cursor=next_cursor,
+            total=total,
         )
+    
+    @query_shape("progress", equality=("user_id", "metric_type"), sort=(("date", 1),), range=("date",))
+    async def find_series(
+        self,
+        user_id: UUID,
+        metric_type: MetricType,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> ProgressSeries:
+        """A user's values of one metric in date order, as arrays"""
+        query = self._user_query(user_id, metric_type, start_date, end_date)
+        cursor = self.collection.find(query, {"_id": 0, "date": 1, "value": 1}).sort("date", 1)
+        docs = await cursor.to_list(length=None)
+        return ProgressSeries.from_points((doc["date"] for doc in docs), (doc["value"] for doc in docs))
+    
+    async def update(self, progress: Progress) -> Progress:
+        """Update a progress entry"""
+        await self.collection.replace_one({"_id": progress.id}, self._to_document(progress))
         return progress
     
     async def delete(self, progress_id: UUID) -> bool:
@@ -93,23 +142,76 @@ class ProgressRepository(IProgressRepository):
         result = await self.collection.delete_one({"_id": progress_id})
         return result.deleted_count > 0
     
+    async def save_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        """Insert progress entries in bulk, reporting failures per item"""
+        return await self._insert_many([self._to_document(progress) for progress in entries])
+    
+    async def update_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        """Replace progress entries in bulk, reporting failures per item"""
+        return await self._replace_many([self._to_document(progress) for progress in entries])
+    
+    async def delete_many(self, progress_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete progress entries in bulk, reporting failures per item"""
+        return await self._delete_many(progress_ids)
+    
+    @query_shape("progress", equality=("user_id",))
+    @query_shape("progress", equality=("user_id", "metric_type"))
+    @query_shape("progress", equality=("user_id",), range=("date",))
+    @query_shape("progress", equality=("user_id", "metric_type"), range=("date",))
     async def count_by_user_id(
         self,
         user_id: UUID,
         metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> int:
         """Count progress entries for a user"""
-        query = {"user_id": user_id}
+        return await self.collection.count_documents(
+            self._user_query(user_id, metric_type, start_date, end_date)
+        )
+    
+    def _user_query(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> dict:
+        """Build the filter shared by the per-user listing and count"""
+        query = {self.user_field: user_id}
+        
         if metric_type:
-            query["metric_type"] = metric_type.value
-        return await self.collection.count_documents(query)
+            query[self.metric_field] = metric_type.value
+        
+        if start_date or end_date:
+            date_query = {}
+            if start_date:
+                date_query["$gte"] = _as_datetime(start_date)
+            if end_date:
+                date_query["$lte"] = _as_datetime(end_date)
+            query["date"] = date_query
+        
+        return query
+    
+    def _to_document(self, progress: Progress) -> dict:
+        """Convert Progress entity to a MongoDB document"""
+        return ProgressModel(
+            _id=progress.id,
+            user_id=progress.user_id,
+            date=_as_datetime(progress.date),
+            metric_type=progress.metric_type.value,
+            value=progress.value,
+            unit=progress.unit,
+            notes=progress.notes,
+            created_at=progress.created_at,
+        ).model_dump(by_alias=True)
     
     def _to_entity(self, doc: dict) -> Progress:
         """Convert MongoDB document to Progress entity"""
         return Progress(
             id=doc["_id"],
             user_id=doc["user_id"],
-            date=doc["date"],
+            date=doc["date"].date(),
             metric_type=MetricType(doc["metric_type"]),
             value=doc["value"],
             unit=doc.get("unit"),
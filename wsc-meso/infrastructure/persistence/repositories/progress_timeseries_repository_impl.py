@@ -0,0 +1,256 @@
+"""
+Time-Series Progress Repository Implementation
+
+MongoDB implementation of IProgressRepository on a native time-series
+collection, and the mirror used while migrating to it.
+
+``progress_timeseries`` has ``date`` as timeField and ``meta`` =
+``{user_id, metric_type}`` as metaField, so MongoDB packs one user's
+entries of a metric into compressed buckets and range scans read a few
+buckets instead of one index entry and document per day. Time-series
+collections cannot replace a document in place and do not enforce unique
+``_id``s: updates delete and re-insert the entry, and deletes match every
+copy. Requires MongoDB 7.0 (deletes filtered on measurement fields).
+
+``infrastructure.persistence.progress_migration`` copies ``progress`` into
+it while ``MirroredProgressRepository`` keeps both in step.
+"""
+import logging
+from datetime import date
+from typing import List, Optional, Sequence
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DeleteMany
+
+from domain.entities.progress import Progress, MetricType, ProgressSeries
+from domain.repositories.bulk import BulkItemError, BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.progress_repository import IProgressRepository
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.repositories.progress_repository_impl import ProgressRepository, _as_datetime
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "progress_timeseries"
+
+
+class TimeSeriesProgressRepository(ProgressRepository):
+    """MongoDB time-series implementation of Progress repository"""
+    
+    user_field = "meta.user_id"
+    metric_field = "meta.metric_type"
+    
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
+        self.collection = database[COLLECTION]
+        self.count_cache = count_cache
+    
+    @query_shape(COLLECTION, equality=("_id",))
+    async def find_by_id(self, progress_id: UUID) -> Optional[Progress]:
+        """Find progress entry by ID"""
+        return await super().find_by_id(progress_id)
+    
+    @query_shape(COLLECTION, equality=("meta.user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
+    async def find_by_user_id(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Progress]:
+        """Find progress entries by user ID with optional filters"""
+        return await super().find_by_user_id(user_id, metric_type, start_date, end_date, limit, offset)
+    
+    @query_shape(COLLECTION, equality=("meta.user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
+    async def find_page_by_user_id(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries, latest first"""
+        return await super().find_page_by_user_id(user_id, metric_type, start_date, end_date, limit, cursor, offset)
+    
+    @query_shape(COLLECTION, equality=("meta.user_id",), sort=(("date", -1), ("_id", -1)), range=("date",))
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"), sort=(("date", -1), ("_id", -1)), range=("date",))
+    async def find_page_with_total(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 50,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[Progress]:
+        """Find one page of a user's progress entries and the total in one round trip"""
+        return await super().find_page_with_total(user_id, metric_type, start_date, end_date, limit, offset, estimated)
+    
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"), sort=(("date", 1),), range=("date",))
+    async def find_series(
+        self,
+        user_id: UUID,
+        metric_type: MetricType,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> ProgressSeries:
+        """A user's values of one metric in date order, as arrays"""
+        return await super().find_series(user_id, metric_type, start_date, end_date)
+    
+    @query_shape(COLLECTION, equality=("_id",))
+    async def update(self, progress: Progress) -> Progress:
+        """Update a progress entry (delete and re-insert; not atomic)"""
+        await self.collection.delete_many({"_id": progress.id})
+        await self.collection.insert_one(self._to_document(progress))
+        return progress
+    
+    @query_shape(COLLECTION, equality=("_id",))
+    async def delete(self, progress_id: UUID) -> bool:
+        """Delete a progress entry"""
+        result = await self.collection.delete_many({"_id": progress_id})
+        return result.deleted_count > 0
+    
+    @query_shape(COLLECTION, equality=("_id",))
+    async def update_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        """Replace progress entries in bulk (delete and re-insert), reporting failures per item"""
+        ids = [progress.id for progress in entries]
+        existing = {doc["_id"] async for doc in self.collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+        missing = [
+            BulkItemError(index=index, id=progress_id, message="Not found")
+            for index, progress_id in enumerate(ids)
+            if progress_id not in existing
+        ]
+        found = [(index, progress) for index, progress in enumerate(entries) if progress.id in existing]
+        await self.collection.delete_many({"_id": {"$in": [progress.id for _, progress in found]}})
+        inserted = await self._insert_many([self._to_document(progress) for _, progress in found])
+        errors = missing + [
+            BulkItemError(index=found[error.index][0], id=error.id, message=error.message, code=error.code)
+            for error in inserted.errors
+        ]
+        return BulkWriteResult(written=inserted.written, errors=tuple(sorted(errors, key=lambda error: error.index)))
+    
+    @query_shape(COLLECTION, equality=("_id",))
+    async def delete_many(self, progress_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete progress entries in bulk, reporting failures per item"""
+        return await self._bulk_write(
+            [DeleteMany({"_id": progress_id}) for progress_id in progress_ids],
+            progress_ids,
+            "nRemoved",
+        )
+    
+    @query_shape(COLLECTION, equality=("meta.user_id",))
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"))
+    @query_shape(COLLECTION, equality=("meta.user_id",), range=("date",))
+    @query_shape(COLLECTION, equality=("meta.user_id", "meta.metric_type"), range=("date",))
+    async def count_by_user_id(
+        self,
+        user_id: UUID,
+        metric_type: Optional[MetricType] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """Count progress entries for a user"""
+        return await super().count_by_user_id(user_id, metric_type, start_date, end_date)
+    
+    def _to_document(self, progress: Progress) -> dict:
+        """Convert Progress entity to a time-series measurement"""
+        return {
+            "_id": progress.id,
+            "date": _as_datetime(progress.date),
+            "meta": {"user_id": progress.user_id, "metric_type": progress.metric_type.value},
+            "value": float(progress.value),
+            "unit": progress.unit,
+            "notes": progress.notes,
+            "created_at": progress.created_at,
+        }
+    
+    def _to_entity(self, doc: dict) -> Progress:
+        """Convert a time-series measurement to Progress entity"""
+        return Progress(
+            id=doc["_id"],
+            user_id=doc["meta"]["user_id"],
+            date=doc["date"].date(),
+            metric_type=MetricType(doc["meta"]["metric_type"]),
+            value=doc["value"],
+            unit=doc.get("unit"),
+            notes=doc.get("notes"),
+            created_at=doc.get("created_at"),
+        )
+
+
+class MirroredProgressRepository(IProgressRepository):
+    """Reads from a primary repository and applies every write to a mirror too.
+    
+    Used while ``progress`` is copied to the time-series collection: the
+    primary stays the source of truth. A failed mirror write is logged and
+    not raised, since the primary write already happened; the drift it
+    leaves is found and repaired by ``progress_migration --check``.
+    """
+    
+    def __init__(self, primary: IProgressRepository, mirror: IProgressRepository):
+        self.primary = primary
+        self.mirror = mirror
+    
+    async def _mirror(self, operation: str, *args) -> None:
+        try:
+            await getattr(self.mirror, operation)(*args)
+        except Exception:
+            logger.exception("Progress mirror %s failed; run progress_migration --check", operation)
+    
+    async def save(self, progress: Progress) -> Progress:
+        saved = await self.primary.save(progress)
+        await self._mirror("save", progress)
+        return saved
+    
+    async def find_by_id(self, progress_id: UUID) -> Optional[Progress]:
+        return await self.primary.find_by_id(progress_id)
+    
+    async def find_by_user_id(self, *args, **kwargs) -> List[Progress]:
+        return await self.primary.find_by_user_id(*args, **kwargs)
+    
+    async def find_page_by_user_id(self, *args, **kwargs) -> Page[Progress]:
+        return await self.primary.find_page_by_user_id(*args, **kwargs)
+    
+    async def find_page_with_total(self, *args, **kwargs) -> Page[Progress]:
+        return await self.primary.find_page_with_total(*args, **kwargs)
+    
+    async def find_series(self, *args, **kwargs) -> ProgressSeries:
+        return await self.primary.find_series(*args, **kwargs)
+    
+    async def update(self, progress: Progress) -> Progress:
+        updated = await self.primary.update(progress)
+        await self._mirror("update", progress)
+        return updated
+    
+    async def delete(self, progress_id: UUID) -> bool:
+        deleted = await self.primary.delete(progress_id)
+        await self._mirror("delete", progress_id)
+        return deleted
+    
+    async def save_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        result = await self.primary.save_many(entries)
+        failed = result.failed_indexes
+        await self._mirror("save_many", [progress for index, progress in enumerate(entries) if index not in failed])
+        return result
+    
+    async def update_many(self, entries: Sequence[Progress]) -> BulkWriteResult:
+        result = await self.primary.update_many(entries)
+        failed = result.failed_indexes
+        await self._mirror("update_many", [progress for index, progress in enumerate(entries) if index not in failed])
+        return result
+    
+    async def delete_many(self, progress_ids: Sequence[UUID]) -> BulkWriteResult:
+        result = await self.primary.delete_many(progress_ids)
+        await self._mirror("delete_many", progress_ids)
+        return result
+    
+    async def count_by_user_id(self, *args, **kwargs) -> int:
+        return await self.primary.count_by_user_id(*args, **kwargs)
@@ -0,0 +1,216 @@
+"""
+Training Session Repository Implementation
+
+MongoDB implementation of ITrainingSessionRepository.
+
+Sessions are stored in bucket documents, one per user per mesocycle week
+(see ``training_session_model``). Appending a session is one upserting
+``update_one`` that pushes its header (sets packed per exercise) and bumps the counters; the
+filter excludes buckets that already hold the session id, so a retried
+append hits the unique ``_id`` and is reported as a duplicate instead of
+being stored twice.
+"""
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Dict, List, Sequence
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from domain.entities.training_session import ExercisePerformed, TrainingSession
+from domain.repositories.bulk import BulkItemError, BulkWriteResult
+from domain.repositories.training_session_repository import (
+    DuplicateSessionError,
+    ITrainingSessionRepository,
+)
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.models.training_session_model import (
+    SessionEntryModel,
+    SessionExerciseModel,
+    decode_sets,
+    encode_sets,
+)
+from infrastructure.persistence.repositories.base_repository import MongoRepository
+
+_DUPLICATE_KEY = 11000
+
+
+def bucket_key(user_id: UUID, mesocycle_id: UUID, week_number: int) -> str:
+    """_id of the bucket holding a user's sessions of one mesocycle week"""
+    return f"{user_id}:{mesocycle_id}:{week_number}"
+
+
+def _as_datetime(day: date) -> datetime:
+    """BSON has no date type; sessions are stored at midnight"""
+    if isinstance(day, datetime):
+        return day
+    return datetime.combine(day, time())
+
+
+class TrainingSessionRepository(MongoRepository, ITrainingSessionRepository):
+    """MongoDB implementation of TrainingSession repository"""
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.training_sessions
+    
+    async def append(self, session: TrainingSession) -> TrainingSession:
+        """Store a session in its weekly bucket"""
+        query = {"_id": self._bucket_key(session), "sessions.id": {"$ne": session.id}}
+        update = self._to_update(session, [session])
+        try:
+            await self.collection.update_one(query, update, upsert=True)
+        except DuplicateKeyError:
+            # Either another append created the bucket first, or the session
+            # is already stored; only the latter fails a second time
+            try:
+                await self.collection.update_one(query, update, upsert=True)
+            except DuplicateKeyError:
+                raise DuplicateSessionError(f"Session {session.id} already logged")
+        return session
+    
+    async def append_many(self, sessions: Sequence[TrainingSession]) -> BulkWriteResult:
+        """Store sessions with one bucket update per user and week.
+        
+        A bucket update that fails fails every session in it, so each of
+        those sessions is reported with its own input position.
+        """
+        errors: List[BulkItemError] = []
+        groups: Dict[str, List[int]] = defaultdict(list)
+        seen = set()
+        for index, session in enumerate(sessions):
+            key = self._bucket_key(session)
+            if (key, session.id) in seen:
+                errors.append(BulkItemError(index=index, id=session.id, message="Duplicate session in batch"))
+                continue
+            seen.add((key, session.id))
+            groups[key].append(index)
+        
+        pending = list(groups.items())
+        for attempt in range(2):
+            requests = [
+                UpdateOne(
+                    {"_id": key, "sessions.id": {"$nin": [sessions[i].id for i in members]}},
+                    self._to_update(sessions[members[0]], [sessions[i] for i in members]),
+                    upsert=True,
+                )
+                for key, members in pending
+            ]
+            result = await self._bulk_write(requests, [key for key, _ in pending], "nUpserted")
+            # Duplicate keys are retried once (bucket creation race), then reported
+            retry = []
+            for error in result.errors:
+                key, members = pending[error.index]
+                if error.code == _DUPLICATE_KEY and not attempt:
+                    retry.append((key, members))
+                    continue
+                message = "Session already logged" if error.code == _DUPLICATE_KEY else error.message
+                errors.extend(
+                    BulkItemError(index=i, id=sessions[i].id, message=message, code=error.code)
+                    for i in members
+                )
+            if not retry:
+                break
+            pending = retry
+        
+        errors.sort(key=lambda error: error.index)
+        return BulkWriteResult(written=len(sessions) - len(errors), errors=tuple(errors))
+    
+    @query_shape("training_sessions", equality=("_id",))
+    async def find_week(self, user_id: UUID, mesocycle_id: UUID, week_number: int) -> List[TrainingSession]:
+        """Find a user's sessions of one mesocycle week"""
+        doc = await self.collection.find_one({"_id": bucket_key(user_id, mesocycle_id, week_number)})
+        if not doc:
+            return []
+        return self._to_entities(doc)
+    
+    @query_shape("training_sessions", equality=("mesocycle_id", "week_number"))
+    async def find_by_mesocycle_week(self, mesocycle_id: UUID, week_number: int) -> List[TrainingSession]:
+        """Find every session of one mesocycle week"""
+        cursor = self.collection.find({"mesocycle_id": mesocycle_id, "week_number": week_number})
+        return [session async for doc in cursor for session in self._to_entities(doc)]
+    
+    @query_shape("training_sessions", equality=("user_id",), range=("date",), residual=("last_date",))
+    async def find_by_user_and_date_range(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> List[TrainingSession]:
+        """Find a user's sessions between two dates, oldest first"""
+        start, end = _as_datetime(start_date), _as_datetime(end_date)
+        # Buckets overlapping the range; their sessions are then trimmed to it
+        query = {"user_id": user_id, "date": {"$lte": end}, "last_date": {"$gte": start}}
+        cursor = self.collection.find(query)
+        sessions = [
+            session
+            async for doc in cursor
+            for session in self._to_entities(doc)
+            if start <= _as_datetime(session.date) <= end
+        ]
+        sessions.sort(key=lambda session: session.date)
+        return sessions
+    
+    @staticmethod
+    def _bucket_key(session: TrainingSession) -> str:
+        if session.user_id is None or session.week_number is None:
+            raise ValueError("Session needs a user_id and week_number to be stored")
+        return bucket_key(session.user_id, session.mesocycle_id, session.week_number)
+    
+    def _to_update(self, bucket: TrainingSession, sessions: Sequence[TrainingSession]) -> dict:
+        """Update document appending sessions to ``bucket``'s week"""
+        entries = []
+        set_count = 0
+        for session in sessions:
+            entries.append(SessionEntryModel(
+                id=session.id,
+                date=_as_datetime(session.date),
+                microcycle_id=session.microcycle_id,
+                exercises=[
+                    SessionExerciseModel(
+                        exercise_id=exercise.exercise_id,
+                        planned_sets=exercise.planned_sets,
+                        set_count=len(exercise.sets),
+                        volume=exercise.sets.total_volume(),
+                        max_1rm=exercise.sets.max_1rm(),
+                        rpe_sum=int(exercise.sets.actual_rpe.sum()),
+                        sets=encode_sets(exercise.sets),
+                    )
+                    for exercise in session.exercises_performed
+                ],
+            ).model_dump())
+            set_count += session.get_total_sets()
+        dates = [entry["date"] for entry in entries]
+        return {
+            "$setOnInsert": {
+                "user_id": bucket.user_id,
+                "mesocycle_id": bucket.mesocycle_id,
+                "week_number": bucket.week_number,
+            },
+            "$min": {"date": min(dates)},
+            "$max": {"last_date": max(dates)},
+            "$push": {"sessions": {"$each": entries}},
+            "$inc": {"session_count": len(entries), "set_count": set_count},
+        }
+    
+    def _to_entities(self, doc: dict) -> List[TrainingSession]:
+        """Convert a bucket document to its TrainingSession entities"""
+        return [
+            TrainingSession(
+                id=entry["id"],
+                mesocycle_id=doc["mesocycle_id"],
+                date=entry["date"].date(),
+                microcycle_id=entry.get("microcycle_id"),
+                week_number=doc["week_number"],
+                exercises_performed=[
+                    ExercisePerformed(
+                        exercise_id=exercise["exercise_id"],
+                        planned_sets=exercise["planned_sets"],
+                        sets_performed=decode_sets(exercise["sets"]),
+                    )
+                    for exercise in entry.get("exercises", [])
+                ],
+                user_id=doc["user_id"],
+            )
+            for entry in doc.get("sessions", [])
+        ]
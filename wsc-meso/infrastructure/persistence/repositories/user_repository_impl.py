@@ -3,37 +3,50 @@ User Repository Implementation
 
 MongoDB implementation of IUserRepository.
 """
-from typing import Optional
+from typing import AsyncIterator, Optional, Sequence
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from domain.entities.user import User, TrainingLevel
-from domain.repositories.user_repository import IUserRepository
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.user_repository import DuplicateUserError, IUserRepository
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.indexes import query_shape
 from infrastructure.persistence.models.user_model import UserModel
+from infrastructure.persistence.pagination import ASCENDING
+from infrastructure.persistence.repositories.base_repository import MongoRepository
 
 
-class UserRepository(IUserRepository):
+def _duplicate_field(error: DuplicateKeyError) -> str:
+    """Field of the unique index a duplicate-key error comes from"""
+    details = error.details or {}
+    fields = list(details.get("keyPattern") or details.get("keyValue") or ())
+    if fields:
+        return fields[0]
+    # Servers before 4.4 only name the index in the message
+    message = str(error)
+    return "username" if "username_1" in message else "email" if "email_1" in message else "_id"
+
+
+class UserRepository(MongoRepository, IUserRepository):
     """MongoDB implementation of User repository"""
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
         self.collection = database.users
+        self.count_cache = count_cache
     
     async def save(self, user: User) -> User:
-        """Save a user"""
-        user_model = UserModel(
-            _id=user.id,
-            email=user.email,
-            username=user.username,
-            hashed_password=user.hashed_password,
-            full_name=user.full_name,
-            training_level=user.training_level.value,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-        
-        await self.collection.insert_one(user_model.model_dump(by_alias=True))
+        """Save a user; the unique indexes on email and username reject duplicates"""
+        try:
+            await self.collection.insert_one(self._to_document(user))
+        except DuplicateKeyError as e:
+            raise DuplicateUserError(_duplicate_field(e)) from e
         return user
     
+    @query_shape("users", equality=("_id",))
     async def find_by_id(self, user_id: UUID) -> Optional[User]:
         """Find user by ID"""
         doc = await self.collection.find_one({"_id": user_id})
@@ -41,6 +54,7 @@ class UserRepository(IUserRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("users", equality=("email",))
     async def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email"""
         doc = await self.collection.find_one({"email": email})
@@ -48,6 +62,7 @@ class UserRepository(IUserRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("users", equality=("username",))
     async def find_by_username(self, username: str) -> Optional[User]:
         """Find user by username"""
         doc = await self.collection.find_one({"username": username})
@@ -55,23 +70,28 @@ class UserRepository(IUserRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("users", equality=("_id",))
+    async def find_version(self, user_id: UUID) -> Optional[int]:
+        """Version stamp of a user (None if there is no such user)"""
+        doc = await self.collection.find_one({"_id": user_id}, {"version": 1})
+        if not doc:
+            return None
+        return doc.get("version", 0)
+    
+    @query_shape("users", equality=("_id",))
     async def update(self, user: User) -> User:
-        """Update a user"""
-        user_model = UserModel(
-            _id=user.id,
-            email=user.email,
-            username=user.username,
-            hashed_password=user.hashed_password,
-            full_name=user.full_name,
-            training_level=user.training_level.value,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-        
-        await self.collection.replace_one(
+        """Update a user and increment its version"""
+        fields = self._to_document(user)
+        del fields["_id"], fields["version"]
+        # $inc gives concurrent updates distinct versions
+        doc = await self.collection.find_one_and_update(
             {"_id": user.id},
-            user_model.model_dump(by_alias=True)
+            {"$set": fields, "$inc": {"version": 1}},
+            projection={"version": 1},
+            return_document=ReturnDocument.AFTER,
         )
+        if doc:
+            user.version = doc["version"]
         return user
     
     async def delete(self, user_id: UUID) -> bool:
@@ -79,16 +99,81 @@ class UserRepository(IUserRepository):
         result = await self.collection.delete_one({"_id": user_id})
         return result.deleted_count > 0
     
+    async def save_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Insert users in bulk, reporting failures per item"""
+        return await self._insert_many([self._to_document(user) for user in users])
+    
+    async def update_many(self, users: Sequence[User]) -> BulkWriteResult:
+        """Replace users in bulk, reporting failures per item"""
+        documents = [self._to_document(user) for user in users]
+        for document in documents:
+            document["version"] += 1
+        return await self._replace_many(documents)
+    
+    async def delete_many(self, user_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete users in bulk, reporting failures per item"""
+        return await self._delete_many(user_ids)
+    
+    @query_shape("users", sort=(("username", 1),))
+    async def usernames(self) -> AsyncIterator[str]:
+        """Every stored username, read from the username index"""
+        cursor = self.collection.find({}, {"username": 1, "_id": 0}).sort("username", 1)
+        async for doc in cursor:
+            yield doc["username"]
+    
+    @query_shape("users", equality=("email",))
     async def exists_by_email(self, email: str) -> bool:
         """Check if user exists by email"""
         count = await self.collection.count_documents({"email": email})
         return count > 0
     
+    @query_shape("users", equality=("username",))
     async def exists_by_username(self, username: str) -> bool:
         """Check if user exists by username"""
         count = await self.collection.count_documents({"username": username})
         return count > 0
     
+    @query_shape("users", sort=(("username", 1), ("_id", 1)))
+    @query_shape("users", sort=(("username", 1), ("_id", 1)), residual=("training_level",))
+    async def find_page_with_total(
+        self,
+        training_level: Optional[TrainingLevel] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+    ) -> Page[User]:
+        """Find one page of users by username and the total in one round trip"""
+        query = {}
+        if training_level:
+            query["training_level"] = training_level.value
+        docs, next_cursor, total = await self._find_page_with_total(
+            query,
+            "username",
+            ASCENDING,
+            limit,
+            offset=offset,
+            estimated=estimated,
+        )
+        return Page(
+            items=[self._to_entity(doc) for doc in docs],
+            next_cursor=next_cursor,
+            total=total,
+        )
+    
+    def _to_document(self, user: User) -> dict:
+        """Convert User entity to a MongoDB document"""
+        return UserModel(
+            _id=user.id,
+            email=user.email,
+            username=user.username,
+            hashed_password=user.hashed_password,
+            full_name=user.full_name,
+            training_level=user.training_level.value,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            version=user.version,
+        ).model_dump(by_alias=True)
+    
     def _to_entity(self, doc: dict) -> User:
         """Convert MongoDB document to User entity"""
         return User(
@@ -100,4 +185,5 @@ class UserRepository(IUserRepository):
             training_level=TrainingLevel(doc.get("training_level", "intermediate")),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at"),
+            version=doc.get("version", 0),
         )
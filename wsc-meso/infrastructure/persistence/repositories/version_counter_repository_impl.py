@@ -0,0 +1,39 @@
+"""
+Version Counter Repository Implementation
+
+MongoDB implementation of IVersionCounterRepository.
+
+One tiny document per key in ``version_counters`` (``_id`` = key), so
+every worker process sees the same versions.
+"""
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from domain.repositories.version_counter_repository import IVersionCounterRepository
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.repositories.base_repository import MongoRepository
+
+
+class VersionCounterRepository(MongoRepository, IVersionCounterRepository):
+    """MongoDB implementation of the version counters"""
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.version_counters
+    
+    @query_shape("version_counters", equality=("_id",))
+    async def get(self, key: str) -> int:
+        """Current version of a key (0 if it was never incremented)"""
+        doc = await self.collection.find_one({"_id": key}, {"version": 1})
+        return doc["version"] if doc else 0
+    
+    @query_shape("version_counters", equality=("_id",))
+    async def increment(self, key: str) -> int:
+        """Atomically increment a key's version and return the new one"""
+        doc = await self.collection.find_one_and_update(
+            {"_id": key},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            projection={"version": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        return doc["version"]
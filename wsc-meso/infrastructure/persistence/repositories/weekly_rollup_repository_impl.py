@@ -0,0 +1,176 @@
+"""
+Weekly Rollup Repository Implementation
+
+MongoDB implementation of IWeeklyRollupRepository.
+
+One document per (user, mesocycle, week, exercise) in ``weekly_rollups``
+(``_id`` = ``"{user_id}:{mesocycle_id}:{week_number}:{exercise_id}"``, with
+``all`` for the week totals). Logging a session or completing a workout
+sends one unordered ``bulk_write`` of upserts that ``$inc`` the counters
+and ``$max`` the best e1RM, so concurrent writers never lose an increment.
+Daily rollups live in ``daily_rollups`` and are written the same way, with
+the ISO day in place of the week number in ``_id``.
+``infrastructure.persistence.rollups`` recomputes the rollups from the raw
+collections to check or repair them.
+"""
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+from domain.repositories.weekly_rollup_repository import IWeeklyRollupRepository
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.repositories.base_repository import MongoRepository
+
+_DUPLICATE_KEY = 11000
+_COUNTERS = ("sessions", "sets", "volume", "rpe_sum", "workouts_completed")
+
+
+def rollup_key(
+    user_id: UUID,
+    mesocycle_id: UUID,
+    period: Union[int, date],
+    exercise_id: Optional[int] = None,
+) -> str:
+    """_id of a rollup document; ``period`` is the week number or the day"""
+    exercise = "all" if exercise_id is None else exercise_id
+    return f"{user_id}:{mesocycle_id}:{period}:{exercise}"
+
+
+def _as_datetime(day: date) -> datetime:
+    """BSON has no date type; week starts are stored at midnight"""
+    if isinstance(day, datetime):
+        return day
+    return datetime.combine(day, time())
+
+
+def _identity(rollup: WeeklyRollup) -> Dict[str, Any]:
+    """Fields of a rollup document that never change"""
+    fields = {
+        "user_id": rollup.user_id,
+        "mesocycle_id": rollup.mesocycle_id,
+        "week_number": rollup.week_number,
+        "exercise_id": rollup.exercise_id,
+        "week_start": _as_datetime(rollup.week_start),
+    }
+    if isinstance(rollup, DailyRollup):
+        fields["day"] = _as_datetime(rollup.day)
+    return fields
+
+
+def rollup_update(increment: WeeklyRollup) -> Dict[str, Any]:
+    """Upserting update that adds an increment to its rollup"""
+    return {
+        "$setOnInsert": _identity(increment),
+        "$inc": {name: getattr(increment, name) for name in _COUNTERS},
+        "$max": {"max_1rm": increment.max_1rm},
+    }
+
+
+class WeeklyRollupRepository(MongoRepository, IWeeklyRollupRepository):
+    """MongoDB implementation of WeeklyRollup repository"""
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.collection = database.weekly_rollups
+        self.daily = database.daily_rollups
+    
+    @query_shape("weekly_rollups", equality=("_id",))
+    @query_shape("daily_rollups", equality=("_id",))
+    async def record(self, increments: Sequence[WeeklyRollup]) -> None:
+        """Add increments to their rollups with one unordered bulk write per collection"""
+        weekly = [increment for increment in increments if not isinstance(increment, DailyRollup)]
+        daily = [increment for increment in increments if isinstance(increment, DailyRollup)]
+        await asyncio.gather(self._record(self.collection, weekly), self._record(self.daily, daily))
+    
+    @staticmethod
+    async def _record(collection: AsyncIOMotorCollection, increments: List[WeeklyRollup]) -> None:
+        pending = increments
+        for attempt in range(2):
+            if not pending:
+                return
+            requests = [
+                UpdateOne({"_id": rollup_key(*increment.key)}, rollup_update(increment), upsert=True)
+                for increment in pending
+            ]
+            try:
+                await collection.bulk_write(requests, ordered=False)
+                return
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                # Two first writes to a new rollup race on the upsert; the
+                # loser's increment is applied again to the existing document
+                if attempt or any(error.get("code") != _DUPLICATE_KEY for error in errors):
+                    raise
+                pending = [pending[error["index"]] for error in errors]
+    
+    @query_shape("weekly_rollups", equality=("mesocycle_id",), sort=(("week_number", 1), ("exercise_id", 1)))
+    async def find_by_mesocycle(self, mesocycle_id: UUID) -> List[WeeklyRollup]:
+        """Every rollup of a mesocycle, by week and exercise"""
+        cursor = self.collection.find({"mesocycle_id": mesocycle_id}).sort([("week_number", 1), ("exercise_id", 1)])
+        return [self._to_entity(doc) async for doc in cursor]
+    
+    @query_shape("weekly_rollups", equality=("user_id", "exercise_id"), range=("week_start",), sort=(("week_start", 1),))
+    async def find_by_user(
+        self,
+        user_id: UUID,
+        start: date,
+        end: date,
+        exercise_id: Optional[int] = None,
+    ) -> List[WeeklyRollup]:
+        """A user's rollups of one exercise (None: week totals) for weeks overlapping a range"""
+        query = {
+            "user_id": user_id,
+            "exercise_id": exercise_id,
+            "week_start": {"$gt": _as_datetime(start - timedelta(weeks=1)), "$lte": _as_datetime(end)},
+        }
+        cursor = self.collection.find(query).sort("week_start", 1)
+        return [self._to_entity(doc) async for doc in cursor]
+    
+    @query_shape("daily_rollups", equality=("user_id", "exercise_id"), range=("day",), sort=(("day", 1),))
+    async def find_daily_by_user(
+        self,
+        user_id: UUID,
+        start: date,
+        end: date,
+        exercise_id: Optional[int] = None,
+    ) -> List[DailyRollup]:
+        """A user's daily rollups of one exercise (None: day totals) between two dates, oldest first"""
+        query = {
+            "user_id": user_id,
+            "exercise_id": exercise_id,
+            "day": {"$gte": _as_datetime(start), "$lte": _as_datetime(end)},
+        }
+        cursor = self.daily.find(query).sort("day", 1)
+        return [self._to_entity(doc) async for doc in cursor]
+    
+    def _to_document(self, rollup: WeeklyRollup) -> dict:
+        """Convert a WeeklyRollup or DailyRollup to a MongoDB document"""
+        return {
+            "_id": rollup_key(*rollup.key),
+            **_identity(rollup),
+            "max_1rm": rollup.max_1rm,
+            **{name: getattr(rollup, name) for name in _COUNTERS},
+        }
+    
+    def _to_entity(self, doc: dict) -> WeeklyRollup:
+        """Convert a MongoDB document to a WeeklyRollup, or a DailyRollup if it has a day"""
+        fields = dict(
+            user_id=doc["user_id"],
+            mesocycle_id=doc["mesocycle_id"],
+            week_number=doc["week_number"],
+            week_start=doc["week_start"].date(),
+            exercise_id=doc.get("exercise_id"),
+            sessions=doc.get("sessions", 0),
+            sets=doc.get("sets", 0),
+            volume=doc.get("volume", 0.0),
+            rpe_sum=doc.get("rpe_sum", 0),
+            max_1rm=doc.get("max_1rm", 0.0),
+            workouts_completed=doc.get("workouts_completed", 0),
+        )
+        if "day" in doc:
+            return DailyRollup(doc["day"].date(), **fields)
+        return WeeklyRollup(**fields)
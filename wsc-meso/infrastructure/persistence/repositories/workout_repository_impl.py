@@ -4,42 +4,42 @@ Workout Repository Implementation
 MongoDB implementation of IWorkoutRepository.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from domain.entities.workout import Workout, TrainingSplit
+from domain.entities.workout import Workout, WorkoutSummary, TrainingSplit
+from domain.repositories.bulk import BulkWriteResult
+from domain.repositories.page import Page
+from domain.repositories.read_profile import ReadProfile
 from domain.repositories.workout_repository import IWorkoutRepository
+from infrastructure.cache import TTLCache
+from infrastructure.persistence.indexes import query_shape
 from infrastructure.persistence.models.workout_model import WorkoutModel
+from infrastructure.persistence.pagination import DESCENDING, fetch_page
+from infrastructure.persistence.repositories.base_repository import MongoRepository
 
 
-class WorkoutRepository(IWorkoutRepository):
+class WorkoutRepository(MongoRepository, IWorkoutRepository):
     """MongoDB implementation of Workout repository"""
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    # Every field of the list schema; only the exercises are left out
+    summary_projection = {
+        "mesocycle_id": 1, "microcycle_id": 1, "name": 1, "description": 1,
+        "scheduled_date": 1, "completed": 1, "completed_at": 1, "duration_minutes": 1,
+        "notes": 1, "split": 1, "created_at": 1, "updated_at": 1,
+    }
+    
+    def __init__(self, database: AsyncIOMotorDatabase, count_cache: Optional[TTLCache] = None):
         self.collection = database.workouts
+        self.count_cache = count_cache
     
     async def save(self, workout: Workout) -> Workout:
         """Save a workout"""
-        workout_model = WorkoutModel(
-            _id=workout.id,
-            mesocycle_id=workout.mesocycle_id,
-            microcycle_id=workout.microcycle_id,
-            name=workout.name,
-            description=workout.description,
-            scheduled_date=workout.scheduled_date,
-            completed=workout.completed,
-            completed_at=workout.completed_at,
-            duration_minutes=workout.duration_minutes,
-            notes=workout.notes,
-            split=workout.split.value if workout.split else None,
-            created_at=workout.created_at,
-            updated_at=workout.updated_at,
-        )
-        
-        await self.collection.insert_one(workout_model.model_dump(by_alias=True))
+        await self.collection.insert_one(self._to_document(workout))
         return workout
     
+    @query_shape("workouts", equality=("_id",))
     async def find_by_id(self, workout_id: UUID) -> Optional[Workout]:
         """Find workout by ID"""
         doc = await self.collection.find_one({"_id": workout_id})
@@ -47,22 +47,74 @@ class WorkoutRepository(IWorkoutRepository):
             return None
         return self._to_entity(doc)
     
+    @query_shape("workouts", equality=("mesocycle_id",), sort=(("scheduled_date", -1), ("_id", -1)))
+    @query_shape("workouts", equality=("mesocycle_id", "completed"), sort=(("scheduled_date", -1), ("_id", -1)))
     async def find_by_mesocycle_id(
         self,
         mesocycle_id: UUID,
         completed: Optional[bool] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> List[Workout]:
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> List[Union[Workout, WorkoutSummary]]:
         """Find workouts by mesocycle ID"""
-        query = {"mesocycle_id": mesocycle_id}
-        if completed is not None:
-            query["completed"] = completed
-        
-        cursor = self.collection.find(query).skip(offset).limit(limit).sort("scheduled_date", -1)
+        query = self._mesocycle_query(mesocycle_id, completed)
+        cursor = self.collection.find(query, self._projection(profile)).skip(offset).limit(limit).sort([("scheduled_date", -1), ("_id", -1)])
         docs = await cursor.to_list(length=limit)
-        return [self._to_entity(doc) for doc in docs]
+        return [self._decode(doc, profile) for doc in docs]
     
+    @query_shape("workouts", equality=("mesocycle_id",), sort=(("scheduled_date", -1), ("_id", -1)))
+    @query_shape("workouts", equality=("mesocycle_id", "completed"), sort=(("scheduled_date", -1), ("_id", -1)))
+    async def find_page_by_mesocycle_id(
+        self,
+        mesocycle_id: UUID,
+        completed: Optional[bool] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Workout, WorkoutSummary]]:
+        """Find one page of a mesocycle's workouts, latest first"""
+        docs, next_cursor = await fetch_page(
+            self.collection,
+            self._mesocycle_query(mesocycle_id, completed),
+            "scheduled_date",
+            DESCENDING,
+            limit,
+            cursor=cursor,
+            offset=offset,
+            projection=self._projection(profile),
+        )
+        return Page(items=[self._decode(doc, profile) for doc in docs], next_cursor=next_cursor)
+    
+    @query_shape("workouts", equality=("mesocycle_id",), sort=(("scheduled_date", -1), ("_id", -1)))
+    @query_shape("workouts", equality=("mesocycle_id", "completed"), sort=(("scheduled_date", -1), ("_id", -1)))
+    async def find_page_with_total(
+        self,
+        mesocycle_id: UUID,
+        completed: Optional[bool] = None,
+        limit: int = 20,
+        offset: int = 0,
+        estimated: bool = False,
+        profile: ReadProfile = ReadProfile.DETAIL,
+    ) -> Page[Union[Workout, WorkoutSummary]]:
+        """Find one page of a mesocycle's workouts and the total in one round trip"""
+        docs, next_cursor, total = await self._find_page_with_total(
+            self._mesocycle_query(mesocycle_id, completed),
+            "scheduled_date",
+            DESCENDING,
+            limit,
+            offset=offset,
+            estimated=estimated,
+            projection=self._projection(profile),
+        )
+        return Page(
+            items=[self._decode(doc, profile) for doc in docs],
+            next_cursor=next_cursor,
+            total=total,
+        )
+    
+    @query_shape("workouts", equality=("mesocycle_id",), sort=(("scheduled_date", 1),), range=("scheduled_date",))
     async def find_by_date_range(
         self,
         mesocycle_id: UUID,
@@ -84,26 +136,7 @@ class WorkoutRepository(IWorkoutRepository):
     
     async def update(self, workout: Workout) -> Workout:
         """Update a workout"""
-        workout_model = WorkoutModel(
-            _id=workout.id,
-            mesocycle_id=workout.mesocycle_id,
-            microcycle_id=workout.microcycle_id,
-            name=workout.name,
-            description=workout.description,
-            scheduled_date=workout.scheduled_date,
-            completed=workout.completed,
-            completed_at=workout.completed_at,
-            duration_minutes=workout.duration_minutes,
-            notes=workout.notes,
-            split=workout.split.value if workout.split else None,
-            created_at=workout.created_at,
-            updated_at=workout.updated_at,
-        )
-        
-        await self.collection.replace_one(
-            {"_id": workout.id},
-            workout_model.model_dump(by_alias=True)
-        )
+        await self.collection.replace_one({"_id": workout.id}, self._to_document(workout))
         return workout
     
     async def delete(self, workout_id: UUID) -> bool:
@@ -111,16 +144,72 @@ class WorkoutRepository(IWorkoutRepository):
         result = await self.collection.delete_one({"_id": workout_id})
         return result.deleted_count > 0
     
+    async def save_many(self, workouts: Sequence[Workout]) -> BulkWriteResult:
+        """Insert workouts in bulk, reporting failures per item"""
+        return await self._insert_many([self._to_document(workout) for workout in workouts])
+    
+    async def update_many(self, workouts: Sequence[Workout]) -> BulkWriteResult:
+        """Replace workouts in bulk, reporting failures per item"""
+        return await self._replace_many([self._to_document(workout) for workout in workouts])
+    
+    async def delete_many(self, workout_ids: Sequence[UUID]) -> BulkWriteResult:
+        """Delete workouts in bulk, reporting failures per item"""
+        return await self._delete_many(workout_ids)
+    
+    @query_shape("workouts", equality=("mesocycle_id",))
+    @query_shape("workouts", equality=("mesocycle_id", "completed"))
     async def count_by_mesocycle_id(
         self,
         mesocycle_id: UUID,
         completed: Optional[bool] = None,
     ) -> int:
         """Count workouts for a mesocycle"""
+        return await self.collection.count_documents(
+            self._mesocycle_query(mesocycle_id, completed)
+        )
+    
+    def _mesocycle_query(self, mesocycle_id: UUID, completed: Optional[bool]) -> dict:
+        """Build the filter shared by the per-mesocycle listing and count"""
         query = {"mesocycle_id": mesocycle_id}
         if completed is not None:
             query["completed"] = completed
-        return await self.collection.count_documents(query)
+        return query
+    
+    def _to_summary(self, doc: dict) -> WorkoutSummary:
+        """Convert a summary projection to a WorkoutSummary"""
+        return WorkoutSummary(
+            id=doc["_id"],
+            mesocycle_id=doc["mesocycle_id"],
+            microcycle_id=doc.get("microcycle_id"),
+            name=doc["name"],
+            scheduled_date=doc["scheduled_date"],
+            completed=doc.get("completed", False),
+            completed_at=doc.get("completed_at"),
+            duration_minutes=doc.get("duration_minutes"),
+            split=TrainingSplit(doc["split"]) if doc.get("split") else None,
+            description=doc.get("description"),
+            notes=doc.get("notes"),
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+        )
+    
+    def _to_document(self, workout: Workout) -> dict:
+        """Convert Workout entity to a MongoDB document"""
+        return WorkoutModel(
+            _id=workout.id,
+            mesocycle_id=workout.mesocycle_id,
+            microcycle_id=workout.microcycle_id,
+            name=workout.name,
+            description=workout.description,
+            scheduled_date=workout.scheduled_date,
+            completed=workout.completed,
+            completed_at=workout.completed_at,
+            duration_minutes=workout.duration_minutes,
+            notes=workout.notes,
+            split=workout.split.value if workout.split else None,
+            created_at=workout.created_at,
+            updated_at=workout.updated_at,
+        ).model_dump(by_alias=True)
     
     def _to_entity(self, doc: dict) -> Workout:
         """Convert MongoDB document to Workout entity"""
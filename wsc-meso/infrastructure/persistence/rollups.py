@@ -0,0 +1,220 @@
+"""
+Weekly Rollup Rebuild
+
+Recomputes ``weekly_rollups`` and ``daily_rollups`` from the raw
+collections.
+
+Session totals are grouped server-side from the training session buckets
+(per exercise, and per week or day), completed workouts are counted per
+mesocycle and day, and both are mapped to weeks with the mesocycle start
+dates. The result can be compared with the stored rollups (``--check``) or
+replace them.
+
+Check or rebuild every rollup, or only some mesocycles'::
+    
+    PYTHONPATH=src:. python -m infrastructure.persistence.rollups --check
+    PYTHONPATH=src:. python -m infrastructure.persistence.rollups <mesocycle_id> ...
+"""
+import argparse
+import asyncio
+import itertools
+import math
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from domain.entities.mesocycle import Mesocycle
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+from infrastructure.persistence.indexes import query_shape
+from infrastructure.persistence.repositories.mesocycle_repository_impl import MesocycleRepository
+from infrastructure.persistence.repositories.weekly_rollup_repository_impl import WeeklyRollupRepository
+
+RollupKey = Tuple[UUID, UUID, Union[int, date], Optional[int]]
+_FIELDS = ("sessions", "sets", "volume", "rpe_sum", "max_1rm", "workouts_completed")
+
+
+class RebuildReport(NamedTuple):
+    """Outcome of a rebuild or check"""
+    
+    rollups: int
+    drifted: List[RollupKey]  # keys whose stored rollup differs, is missing or is extra
+    written: bool
+
+
+def _scope(mesocycle_ids: Optional[Sequence[UUID]], field: str = "mesocycle_id") -> Dict[str, Any]:
+    return {} if mesocycle_ids is None else {field: {"$in": list(mesocycle_ids)}}
+
+
+def session_pipeline(
+    mesocycle_ids: Optional[Sequence[UUID]],
+    per_exercise: bool,
+    per_day: bool = False,
+) -> List[Dict[str, Any]]:
+    """Session totals per week (or day), or per week (or day) and exercise"""
+    group_id = {"user_id": "$user_id", "mesocycle_id": "$mesocycle_id", "week_number": "$week_number"}
+    if per_day:
+        group_id["day"] = "$sessions.date"
+    if per_exercise:
+        group_id["exercise_id"] = "$sessions.exercises.exercise_id"
+    return [
+        {"$match": _scope(mesocycle_ids)},
+        {"$unwind": "$sessions"},
+        # Sessions without exercises still count towards the week
+        {"$unwind": {"path": "$sessions.exercises", "preserveNullAndEmptyArrays": not per_exercise}},
+        {"$group": {
+            "_id": group_id,
+            "session_ids": {"$addToSet": "$sessions.id"},
+            "sets": {"$sum": "$sessions.exercises.set_count"},
+            "volume": {"$sum": "$sessions.exercises.volume"},
+            "rpe_sum": {"$sum": "$sessions.exercises.rpe_sum"},
+            "max_1rm": {"$max": "$sessions.exercises.max_1rm"},
+        }},
+        {"$set": {"sessions": {"$size": "$session_ids"}}},
+        {"$unset": "session_ids"},
+    ]
+
+
+def workout_pipeline(mesocycle_ids: Optional[Sequence[UUID]]) -> List[Dict[str, Any]]:
+    """Completed workouts per mesocycle and scheduled day"""
+    return [
+        {"$match": {**_scope(mesocycle_ids), "completed": True}},
+        {"$group": {
+            "_id": {
+                "mesocycle_id": "$mesocycle_id",
+                "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$scheduled_date"}},
+            },
+            "workouts_completed": {"$sum": 1},
+        }},
+    ]
+
+
+@query_shape("mesocycles", equality=("_id",))
+@query_shape("mesocycles", collscan="Full rollup rebuild maps every mesocycle's weeks to dates")
+async def _mesocycles(database: AsyncIOMotorDatabase, mesocycle_ids: Optional[Sequence[UUID]]) -> Dict[UUID, Mesocycle]:
+    """Mesocycles in scope, by id"""
+    repository = MesocycleRepository(database)
+    return {
+        doc["_id"]: repository._to_entity(doc)
+        async for doc in repository.collection.find(_scope(mesocycle_ids, "_id"))
+    }
+
+
+@query_shape("training_sessions", equality=("mesocycle_id",))
+@query_shape("training_sessions", collscan="Full rollup rebuild groups every session bucket")
+@query_shape("workouts", equality=("mesocycle_id", "completed"))
+@query_shape("workouts", residual=("completed",), collscan="Full rollup rebuild counts every completed workout")
+async def recompute_rollups(
+    database: AsyncIOMotorDatabase,
+    mesocycle_ids: Optional[Sequence[UUID]] = None,
+) -> Dict[RollupKey, WeeklyRollup]:
+    """Rollups as they follow from the sessions and workouts in scope"""
+    mesocycles = await _mesocycles(database, mesocycle_ids)
+    rollups: Dict[RollupKey, WeeklyRollup] = {}
+    
+    def add(increment: WeeklyRollup) -> None:
+        if increment.key in rollups:
+            rollups[increment.key].add(increment)
+        else:
+            rollups[increment.key] = increment
+    
+    for per_day, per_exercise in itertools.product((False, True), repeat=2):
+        pipeline = session_pipeline(mesocycle_ids, per_exercise, per_day)
+        async for row in database.training_sessions.aggregate(pipeline):
+            key = row["_id"]
+            mesocycle = mesocycles.get(key["mesocycle_id"])
+            if mesocycle is None:
+                continue
+            fields = dict(
+                user_id=key["user_id"],
+                mesocycle_id=key["mesocycle_id"],
+                week_number=key["week_number"],
+                week_start=mesocycle.week_start(key["week_number"]),
+                exercise_id=key.get("exercise_id"),
+                sessions=row["sessions"],
+                sets=row["sets"],
+                volume=row["volume"],
+                rpe_sum=row["rpe_sum"],
+                max_1rm=row["max_1rm"] or 0.0,
+            )
+            add(DailyRollup(key["day"].date(), **fields) if per_day else WeeklyRollup(**fields))
+    async for row in database.workouts.aggregate(workout_pipeline(mesocycle_ids)):
+        mesocycle = mesocycles.get(row["_id"]["mesocycle_id"])
+        if mesocycle is None:
+            continue
+        week = mesocycle.week_of(date.fromisoformat(row["_id"]["day"]))
+        increment = WeeklyRollup.from_workout(mesocycle.user_id, mesocycle.id, week, mesocycle.week_start(week))
+        increment.workouts_completed = row["workouts_completed"]
+        add(increment)
+    return rollups
+
+
+def _same(stored: WeeklyRollup, expected: WeeklyRollup) -> bool:
+    return type(stored) is type(expected) and stored.week_start == expected.week_start and all(
+        math.isclose(getattr(stored, name), getattr(expected, name), rel_tol=1e-9, abs_tol=1e-6)
+        for name in _FIELDS
+    )
+
+
+@query_shape("weekly_rollups", equality=("mesocycle_id",))
+@query_shape("weekly_rollups", collscan="Full rollup rebuild compares or replaces every rollup")
+@query_shape("daily_rollups", equality=("mesocycle_id",))
+@query_shape("daily_rollups", collscan="Full rollup rebuild compares or replaces every daily rollup")
+async def rebuild_rollups(
+    database: AsyncIOMotorDatabase,
+    mesocycle_ids: Optional[Sequence[UUID]] = None,
+    check: bool = False,
+) -> RebuildReport:
+    """Compare the stored rollups with recomputed ones; replace them unless ``check``.
+    
+    Replacing is not atomic with concurrent logging: rebuild while writes
+    to the affected mesocycles are paused, or check again afterwards.
+    """
+    repository = WeeklyRollupRepository(database)
+    collections = (repository.collection, repository.daily)
+    expected = await recompute_rollups(database, mesocycle_ids)
+    stored = {}
+    for collection in collections:
+        async for doc in collection.find(_scope(mesocycle_ids)):
+            rollup = repository._to_entity(doc)
+            stored[rollup.key] = rollup
+    drifted = sorted(
+        (key for key in expected.keys() | stored.keys()
+         if key not in expected or key not in stored or not _same(stored[key], expected[key])),
+        key=str,
+    )
+    if check or not drifted:
+        return RebuildReport(len(expected), drifted, written=False)
+    
+    for collection, daily in zip(collections, (False, True)):
+        await collection.delete_many(_scope(mesocycle_ids))
+        documents = [repository._to_document(r) for r in expected.values() if isinstance(r, DailyRollup) == daily]
+        if documents:
+            await collection.insert_many(documents, ordered=False)
+    return RebuildReport(len(expected), drifted, written=True)
+
+
+async def main() -> None:
+    from infrastructure.config.database import MongoDBConfig
+    from infrastructure.config.settings import get_settings
+    
+    parser = argparse.ArgumentParser(description="Recompute weekly_rollups and daily_rollups from sessions and workouts")
+    parser.add_argument("mesocycle_ids", nargs="*", type=UUID, help="limit to these mesocycles")
+    parser.add_argument("--check", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+    
+    config = MongoDBConfig.from_settings(get_settings())
+    await config.connect()
+    try:
+        report = await rebuild_rollups(config.database, args.mesocycle_ids or None, check=args.check)
+    finally:
+        await config.disconnect()
+    for key in report.drifted:
+        print("drift:", ":".join("all" if part is None else str(part) for part in key))
+    action = "rewritten" if report.written else "unchanged"
+    print(f"{report.rollups} rollups, {len(report.drifted)} drifted, {action}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,21 +10,11 @@ db.createCollection('mesocycles');
 db.createCollection('workouts');
 db.createCollection('progress');
 
-// Create indexes
-db.users.createIndex({ "email": 1 }, { unique: true });
-db.users.createIndex({ "username": 1 }, { unique: true });
-db.exercises.createIndex({ "muscle_group": 1 });
-db.exercises.createIndex({ "type": 1 });
-db.exercises.createIndex({ "name": "text", "execution": "text" });
-db.mesocycles.createIndex({ "user_id": 1 });
-db.mesocycles.createIndex({ "user_id": 1, "status": 1 });
-db.workouts.createIndex({ "mesocycle_id": 1 });
-db.workouts.createIndex({ "mesocycle_id": 1, "completed": 1 });
-db.workouts.createIndex({ "scheduled_date": 1 });
-db.progress.createIndex({ "user_id": 1, "metric_type": 1 });
-db.progress.createIndex({ "user_id": 1, "date": -1 });
+// Indexes are not created here: the API applies the versioned migrations in
+// infrastructure/persistence/indexes.py at startup (or run
+// `PYTHONPATH=src:. python -m infrastructure.persistence.indexes`).
 
-print('✅ Database and indexes created successfully');
+print('✅ Database created successfully');
 
 // Insert exercises - PECTORALS
 let exerciseId = 1;
@@ -0,0 +1,11 @@
+"""Infrastructure security package"""
+from .password_hasher import HasherBusyError, PasswordHasher, hash_password, verify_password
+from .token_verifier import TokenVerifier
+
+__all__ = [
+    "HasherBusyError",
+    "PasswordHasher",
+    "TokenVerifier",
+    "hash_password",
+    "verify_password",
+]
@@ -0,0 +1,107 @@
+"""
+Password Hasher
+
+bcrypt hashing and checking off the event loop.
+
+A bcrypt call takes tens to hundreds of milliseconds of CPU (doubling with
+each cost round). bcrypt releases the GIL while it works, so the calls run
+in a small dedicated thread pool and the event loop keeps serving other
+requests. The pool's backlog is bounded: once ``max_pending`` calls are
+queued or running, further ones fail at once with ``HasherBusyError``
+instead of waiting behind work that would outlast the client's timeout.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+DEFAULT_ROUNDS = 12
+
+
+def hash_password(password: str, rounds: int = DEFAULT_ROUNDS) -> str:
+    """Hash a password with bcrypt at the given cost"""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash"""
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except (ValueError, TypeError):
+        return False
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Cost of a ``$2b$<rounds>$...`` hash, or None if it is not one"""
+    parts = hashed_password.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class HasherBusyError(Exception):
+    """Raised when the hasher's backlog is full"""
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt.
+    
+    ``workers`` threads run the calls; at most ``max_pending`` calls are
+    queued or running at a time. The pool is created on first use and
+    ``close`` shuts it down. The backlog counter is shared by every event
+    loop that uses the hasher.
+    """
+    
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, workers: int = 2, max_pending: int = 16):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        if workers < 1 or max_pending < workers:
+            raise ValueError("Need at least one worker and max_pending >= workers")
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pending(self) -> int:
+        """Calls queued or running"""
+        return self._pending
+    
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+    
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HasherBusyError(f"{self._pending} password hashes pending")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="bcrypt")
+            future = self._executor.submit(fn, *args)
+            self._pending += 1
+        # Counted until the thread is done, even if the caller stopped waiting
+        future.add_done_callback(self._release)
+        return future
+    
+    async def hash(self, password: str) -> str:
+        """Hash a password at the configured cost"""
+        return await asyncio.wrap_future(self._submit(hash_password, password, self.rounds))
+    
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash"""
+        return await asyncio.wrap_future(self._submit(verify_password, plain_password, hashed_password))
+    
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a hash was made at a different cost than the configured one"""
+        return hash_rounds(hashed_password) != self.rounds
+    
+    def close(self) -> None:
+        """Shut the pool down; queued calls are cancelled"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,63 @@
+"""
+Token Verifier
+
+JWT verification with a cache of verified claims.
+
+Decoding a token means base64, JSON and an HMAC over it on every request.
+The claims of a verified token are kept in a bounded LRU keyed by the
+SHA-256 of the token (the token itself is not kept), and each entry
+expires at the token's ``exp``, so a cached token is never accepted past
+the point where ``jwt.decode`` would reject it. Tokens without ``exp``
+are verified every time.
+"""
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from jose import JWTError, jwt
+
+from infrastructure.cache import TTLCache
+
+
+class TokenVerifier:
+    """Verifies each JWT once and serves its claims from memory until it expires.
+    
+    Like ``TTLCache``, it is meant to be used from the event loop thread.
+    """
+    
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self._clock = clock
+        # exp is a Unix timestamp, so entries expire on the wall clock
+        self._claims = TTLCache(0, max_entries, clock)
+    
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """Claims of a valid token, or None"""
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        claims = self._claims.get(key)
+        if claims is not None:
+            return claims
+        try:
+            claims = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except JWTError:
+            return None
+        expires_at = claims.get("exp")
+        if isinstance(expires_at, (int, float)):
+            ttl = expires_at - self._clock()
+            if ttl > 0:
+                self._claims.set(key, claims, ttl)
+        return claims
+    
+    def clear(self) -> None:
+        """Forget every verified token (e.g. after rotating the key)"""
+        self._claims.clear()
+    
+    def __len__(self) -> int:
+        return len(self._claims)
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.authentication_api_base import BaseAuthenticationApi
 import openapi_server.impl
+from api.dependencies import get_authentication_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -23,6 +24,9 @@ from fastapi import (  # noqa: F401
 )
 
 from openapi_server.models.extra_models import TokenModel  # noqa: F401
+from pydantic import Field
+from typing_extensions import Annotated
+from openapi_server.models.check_username_availability200_response import CheckUsernameAvailability200Response
 from openapi_server.models.error import Error
 from openapi_server.models.token import Token
 from openapi_server.models.user import User
@@ -37,11 +41,29 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
     importlib.import_module(name)
 
 
+@router.get(
+    "/auth/username-available",
+    responses={
+        200: {"model": CheckUsernameAvailability200Response, "description": "Availability of the username"},
+    },
+    tags=["Authentication"],
+    summary="Check whether a username is available",
+    response_model_by_alias=True,
+)
+async def check_username_availability(
+    username: Annotated[str, Field(min_length=3, strict=True)] = Query(None, description="", alias="username", min_length=3),
+    api: BaseAuthenticationApi = Depends(get_authentication_api),
+) -> CheckUsernameAvailability200Response:
+    """Answered from an in-memory Bloom filter of taken usernames; only possible matches are confirmed against the database. Registration still checks uniqueness itself. """
+    return await api.check_username_availability(username)
+
+
 @router.post(
     "/auth/login",
     responses={
         200: {"model": Token, "description": "Login successful"},
         401: {"model": Error, "description": "Invalid credentials"},
+        503: {"model": Error, "description": "Too many password checks in progress; retry later"},
     },
     tags=["Authentication"],
     summary="Login user",
@@ -49,10 +71,9 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
 )
 async def login_user(
     user_login: UserLogin = Body(None, description=""),
+    api: BaseAuthenticationApi = Depends(get_authentication_api),
 ) -> Token:
-    if not BaseAuthenticationApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAuthenticationApi.subclasses[0]().login_user(user_login)
+    return await api.login_user(user_login)
 
 
 @router.post(
@@ -61,6 +82,7 @@ async def login_user(
         201: {"model": User, "description": "User created successfully"},
         400: {"model": Error, "description": "Invalid input"},
         409: {"model": Error, "description": "User already exists"},
+        503: {"model": Error, "description": "Too many password checks in progress; retry later"},
     },
     tags=["Authentication"],
     summary="Register a new user",
@@ -68,7 +90,6 @@ async def login_user(
 )
 async def register_user(
     user_create: UserCreate = Body(None, description=""),
+    api: BaseAuthenticationApi = Depends(get_authentication_api),
 ) -> User:
-    if not BaseAuthenticationApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseAuthenticationApi.subclasses[0]().register_user(user_create)
+    return await api.register_user(user_create)
@@ -2,6 +2,9 @@
 
 from typing import ClassVar, Dict, List, Tuple  # noqa: F401
 
+from pydantic import Field
+from typing_extensions import Annotated
+from openapi_server.models.check_username_availability200_response import CheckUsernameAvailability200Response
 from openapi_server.models.error import Error
 from openapi_server.models.token import Token
 from openapi_server.models.user import User
@@ -15,6 +18,14 @@ class BaseAuthenticationApi:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         BaseAuthenticationApi.subclasses = BaseAuthenticationApi.subclasses + (cls,)
+    async def check_username_availability(
+        self,
+        username: Annotated[str, Field(min_length=3, strict=True)],
+    ) -> CheckUsernameAvailability200Response:
+        """Answered from an in-memory Bloom filter of taken usernames; only possible matches are confirmed against the database. Registration still checks uniqueness itself. """
+        ...
+
+
     async def login_user(
         self,
         user_login: UserLogin,
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.exercises_api_base import BaseExercisesApi
 import openapi_server.impl
+from api.dependencies import get_exercises_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -54,10 +55,9 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
 )
 async def get_exercise(
     exercise_id: StrictInt = Path(..., description=""),
+    api: BaseExercisesApi = Depends(get_exercises_api),
 ) -> Exercise:
-    if not BaseExercisesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseExercisesApi.subclasses[0]().get_exercise(exercise_id)
+    return await api.get_exercise(exercise_id)
 
 
 @router.get(
@@ -72,10 +72,9 @@ async def get_exercise(
 async def get_recommended_exercises(
     group: MuscleGroup = Path(..., description=""),
     level: Optional[TrainingLevel] = Query(None, description="", alias="level"),
+    api: BaseExercisesApi = Depends(get_exercises_api),
 ) -> List[Exercise]:
-    if not BaseExercisesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseExercisesApi.subclasses[0]().get_recommended_exercises(group, level)
+    return await api.get_recommended_exercises(group, level)
 
 
 @router.get(
@@ -92,10 +91,10 @@ async def list_exercises(
     type: Optional[ExerciseType] = Query(None, description="", alias="type"),
     page: Optional[Annotated[int, Field(strict=True, ge=1)]] = Query(1, description="", alias="page", ge=1),
     limit: Optional[Annotated[int, Field(le=100, strict=True)]] = Query(20, description="", alias="limit", le=100),
+    cursor: Optional[StrictStr] = Query(None, description="", alias="cursor"),
+    api: BaseExercisesApi = Depends(get_exercises_api),
 ) -> ListExercises200Response:
-    if not BaseExercisesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseExercisesApi.subclasses[0]().list_exercises(group, type, page, limit)
+    return await api.list_exercises(group, type, page, limit, cursor)
 
 
 @router.get(
@@ -110,7 +109,6 @@ async def list_exercises(
 async def search_exercises(
     q: StrictStr = Query(None, description="", alias="q"),
     limit: Optional[Annotated[int, Field(le=100, strict=True)]] = Query(20, description="", alias="limit", le=100),
+    api: BaseExercisesApi = Depends(get_exercises_api),
 ) -> List[ExerciseSummary]:
-    if not BaseExercisesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseExercisesApi.subclasses[0]().search_exercises(q, limit)
+    return await api.search_exercises(q, limit)
@@ -41,6 +41,7 @@ class BaseExercisesApi:
         type: Optional[ExerciseType],
         page: Optional[Annotated[int, Field(strict=True, ge=1)]],
         limit: Optional[Annotated[int, Field(le=100, strict=True)]],
+        cursor: Optional[StrictStr],
     ) -> ListExercises200Response:
         ...
 
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.mesocycles_api_base import BaseMesocyclesApi
 import openapi_server.impl
+from api.dependencies import get_mesocycles_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -60,10 +61,9 @@ async def create_mesocycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> Mesocycle:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().create_mesocycle(mesocycle_create)
+    return await api.create_mesocycle(mesocycle_create)
 
 
 @router.delete(
@@ -82,10 +82,9 @@ async def delete_mesocycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> None:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().delete_mesocycle(mesocycle_id)
+    return await api.delete_mesocycle(mesocycle_id)
 
 
 @router.post(
@@ -104,10 +103,9 @@ async def generate_ai_mesocycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> Mesocycle:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().generate_ai_mesocycle(generate_ai_mesocycle_request)
+    return await api.generate_ai_mesocycle(generate_ai_mesocycle_request)
 
 
 @router.get(
@@ -126,16 +124,16 @@ async def get_mesocycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> Mesocycle:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().get_mesocycle(mesocycle_id)
+    return await api.get_mesocycle(mesocycle_id)
 
 
 @router.get(
     "/mesocycles/{mesocycle_id}/dashboard",
     responses={
         200: {"model": GetMesocycleDashboard200Response, "description": "Dashboard data with analytics"},
+        304: {"description": "Dashboard unchanged since the ETag in If-None-Match"},
         404: {"model": Error, "description": "Mesocycle not found"},
         401: {"model": Error, "description": "Unauthorized"},
     },
@@ -145,13 +143,13 @@ async def get_mesocycle(
 )
 async def get_mesocycle_dashboard(
     mesocycle_id: StrictStr = Path(..., description=""),
+    if_none_match: Optional[StrictStr] = Header(None, description="ETag of a previously returned dashboard"),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> GetMesocycleDashboard200Response:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().get_mesocycle_dashboard(mesocycle_id)
+    return await api.get_mesocycle_dashboard(mesocycle_id, if_none_match)
 
 
 @router.get(
@@ -171,10 +169,9 @@ async def get_mesocycle_progression(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> GetMesocycleProgression200Response:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().get_mesocycle_progression(mesocycle_id, week)
+    return await api.get_mesocycle_progression(mesocycle_id, week)
 
 
 @router.get(
@@ -195,10 +192,9 @@ async def get_microcycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> GetMicrocycle200Response:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().get_microcycle(mesocycle_id, microcycle_number, week)
+    return await api.get_microcycle(mesocycle_id, microcycle_number, week)
 
 
 @router.get(
@@ -215,13 +211,13 @@ async def list_mesocycles(
     status: Optional[MesocycleStatus] = Query(None, description="", alias="status"),
     page: Optional[Annotated[int, Field(strict=True, ge=1)]] = Query(1, description="", alias="page", ge=1),
     limit: Optional[Annotated[int, Field(le=100, strict=True)]] = Query(20, description="", alias="limit", le=100),
+    cursor: Optional[StrictStr] = Query(None, description="", alias="cursor"),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> ListMesocycles200Response:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().list_mesocycles(status, page, limit)
+    return await api.list_mesocycles(status, page, limit, cursor)
 
 
 @router.put(
@@ -241,7 +237,6 @@ async def update_mesocycle(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseMesocyclesApi = Depends(get_mesocycles_api),
 ) -> Mesocycle:
-    if not BaseMesocyclesApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseMesocyclesApi.subclasses[0]().update_mesocycle(mesocycle_id, mesocycle_create)
+    return await api.update_mesocycle(mesocycle_id, mesocycle_create)
@@ -53,6 +53,7 @@ class BaseMesocyclesApi:
     async def get_mesocycle_dashboard(
         self,
         mesocycle_id: StrictStr,
+        if_none_match: Optional[StrictStr],
     ) -> GetMesocycleDashboard200Response:
         ...
 
@@ -79,6 +80,7 @@ class BaseMesocyclesApi:
         status: Optional[MesocycleStatus],
         page: Optional[Annotated[int, Field(strict=True, ge=1)]],
         limit: Optional[Annotated[int, Field(le=100, strict=True)]],
+        cursor: Optional[StrictStr],
     ) -> ListMesocycles200Response:
         ...
 
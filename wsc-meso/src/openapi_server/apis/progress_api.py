@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.progress_api_base import BaseProgressApi
 import openapi_server.impl
+from api.dependencies import get_progress_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -57,10 +58,9 @@ async def create_progress(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseProgressApi = Depends(get_progress_api),
 ) -> Progress:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().create_progress(progress_create)
+    return await api.create_progress(progress_create)
 
 
 @router.delete(
@@ -79,55 +79,54 @@ async def delete_progress(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseProgressApi = Depends(get_progress_api),
 ) -> None:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().delete_progress(progress_id)
+    return await api.delete_progress(progress_id)
 
 
 @router.get(
-    "/progress/{progress_id}",
+    "/progress/analytics",
     responses={
-        200: {"model": Progress, "description": "Progress entry details"},
-        404: {"model": Error, "description": "Progress entry not found"},
+        200: {"model": GetProgressAnalytics200Response, "description": "Progress analytics"},
         401: {"model": Error, "description": "Unauthorized"},
     },
     tags=["Progress"],
-    summary="Get progress entry by ID",
+    summary="Get progress analytics",
     response_model_by_alias=True,
 )
-async def get_progress(
-    progress_id: StrictStr = Path(..., description=""),
+async def get_progress_analytics(
+    metric_type: StrictStr = Query(None, description="", alias="metric_type"),
+    start_date: Optional[date] = Query(None, description="", alias="start_date"),
+    end_date: Optional[date] = Query(None, description="", alias="end_date"),
+    max_points: Optional[Annotated[int, Field(le=5000, strict=True, ge=3)]] = Query(500, description="Most data points to return; longer series are downsampled with Largest-Triangle-Three-Buckets, keeping the first and last point. ", alias="max_points", ge=3, le=5000),
+    moving_average_days: Optional[Annotated[int, Field(le=365, strict=True, ge=2)]] = Query(None, description="Trailing window, in days, of the moving average added to each data point", alias="moving_average_days", ge=2, le=365),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
-) -> Progress:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().get_progress(progress_id)
+    api: BaseProgressApi = Depends(get_progress_api),
+) -> GetProgressAnalytics200Response:
+    return await api.get_progress_analytics(metric_type, start_date, end_date, max_points, moving_average_days)
 
 
 @router.get(
-    "/progress/analytics",
+    "/progress/{progress_id}",
     responses={
-        200: {"model": GetProgressAnalytics200Response, "description": "Progress analytics"},
+        200: {"model": Progress, "description": "Progress entry details"},
+        404: {"model": Error, "description": "Progress entry not found"},
         401: {"model": Error, "description": "Unauthorized"},
     },
     tags=["Progress"],
-    summary="Get progress analytics",
+    summary="Get progress entry by ID",
     response_model_by_alias=True,
 )
-async def get_progress_analytics(
-    metric_type: StrictStr = Query(None, description="", alias="metric_type"),
-    start_date: Optional[date] = Query(None, description="", alias="start_date"),
-    end_date: Optional[date] = Query(None, description="", alias="end_date"),
+async def get_progress(
+    progress_id: StrictStr = Path(..., description=""),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
-) -> GetProgressAnalytics200Response:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().get_progress_analytics(metric_type, start_date, end_date)
+    api: BaseProgressApi = Depends(get_progress_api),
+) -> Progress:
+    return await api.get_progress(progress_id)
 
 
 @router.get(
@@ -146,13 +145,13 @@ async def list_progress(
     end_date: Optional[date] = Query(None, description="", alias="end_date"),
     page: Optional[Annotated[int, Field(strict=True, ge=1)]] = Query(1, description="", alias="page", ge=1),
     limit: Optional[Annotated[int, Field(le=100, strict=True)]] = Query(20, description="", alias="limit", le=100),
+    cursor: Optional[StrictStr] = Query(None, description="", alias="cursor"),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseProgressApi = Depends(get_progress_api),
 ) -> ListProgress200Response:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().list_progress(metric_type, start_date, end_date, page, limit)
+    return await api.list_progress(metric_type, start_date, end_date, page, limit, cursor)
 
 
 @router.put(
@@ -172,7 +171,6 @@ async def update_progress(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseProgressApi = Depends(get_progress_api),
 ) -> Progress:
-    if not BaseProgressApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressApi.subclasses[0]().update_progress(progress_id, progress_create)
+    return await api.update_progress(progress_id, progress_create)
@@ -45,6 +45,8 @@ class BaseProgressApi:
         metric_type: StrictStr,
         start_date: Optional[date],
         end_date: Optional[date],
+        max_points: Optional[Annotated[int, Field(le=5000, strict=True, ge=3)]],
+        moving_average_days: Optional[Annotated[int, Field(le=365, strict=True, ge=2)]],
     ) -> GetProgressAnalytics200Response:
         ...
 
@@ -56,6 +58,7 @@ class BaseProgressApi:
         end_date: Optional[date],
         page: Optional[Annotated[int, Field(strict=True, ge=1)]],
         limit: Optional[Annotated[int, Field(le=100, strict=True)]],
+        cursor: Optional[StrictStr],
     ) -> ListProgress200Response:
         ...
 
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.progression_api_base import BaseProgressionApi
 import openapi_server.impl
+from api.dependencies import get_progression_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -47,7 +48,6 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
 )
 async def get_progression_table(
     goal: TrainingGoal = Path(..., description=""),
+    api: BaseProgressionApi = Depends(get_progression_api),
 ) -> ProgressionTable:
-    if not BaseProgressionApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseProgressionApi.subclasses[0]().get_progression_table(goal)
+    return await api.get_progression_table(goal)
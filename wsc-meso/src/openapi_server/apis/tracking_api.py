@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.tracking_api_base import BaseTrackingApi
 import openapi_server.impl
+from api.dependencies import get_tracking_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -54,14 +55,13 @@ for _, name, _ in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + "."):
 async def get_user_progress_stats(
     user_id: StrictStr = Path(..., description=""),
     exercise_id: Optional[StrictInt] = Query(None, description="", alias="exercise_id"),
-    weeks_back: Optional[Annotated[int, Field(le=52, strict=True)]] = Query(12, description="", alias="weeks_back", le=52),
+    weeks_back: Optional[Annotated[int, Field(le=52, ge=1)]] = Query(12, description="", alias="weeks_back", ge=1, le=52),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseTrackingApi = Depends(get_tracking_api),
 ) -> GetUserProgressStats200Response:
-    if not BaseTrackingApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseTrackingApi.subclasses[0]().get_user_progress_stats(user_id, exercise_id, weeks_back)
+    return await api.get_user_progress_stats(user_id, exercise_id, weeks_back)
 
 
 @router.post(
@@ -80,10 +80,9 @@ async def log_session(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseTrackingApi = Depends(get_tracking_api),
 ) -> TrainingSession:
-    if not BaseTrackingApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseTrackingApi.subclasses[0]().log_session(training_session)
+    return await api.log_session(training_session)
 
 
 @router.post(
@@ -102,7 +101,6 @@ async def smart_log_session(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseTrackingApi = Depends(get_tracking_api),
 ) -> SmartLogSession200Response:
-    if not BaseTrackingApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseTrackingApi.subclasses[0]().smart_log_session(smart_log_session_request)
+    return await api.smart_log_session(smart_log_session_request)
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.users_api_base import BaseUsersApi
 import openapi_server.impl
+from api.dependencies import get_users_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -49,10 +50,9 @@ async def get_current_user(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseUsersApi = Depends(get_users_api),
 ) -> User:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().get_current_user()
+    return await api.get_current_user()
 
 
 @router.put(
@@ -71,7 +71,6 @@ async def update_current_user(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseUsersApi = Depends(get_users_api),
 ) -> User:
-    if not BaseUsersApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseUsersApi.subclasses[0]().update_current_user(update_current_user_request)
+    return await api.update_current_user(update_current_user_request)
@@ -6,6 +6,7 @@ import pkgutil
 
 from openapi_server.apis.workouts_api_base import BaseWorkoutsApi
 import openapi_server.impl
+from api.dependencies import get_workouts_api
 
 from fastapi import (  # noqa: F401
     APIRouter,
@@ -30,6 +31,8 @@ from openapi_server.models.complete_workout_request import CompleteWorkoutReques
 from openapi_server.models.error import Error
 from openapi_server.models.list_workouts200_response import ListWorkouts200Response
 from openapi_server.models.workout import Workout
+from openapi_server.models.workout_batch_create import WorkoutBatchCreate
+from openapi_server.models.workout_batch_result import WorkoutBatchResult
 from openapi_server.models.workout_create import WorkoutCreate
 from openapi_server.security_api import get_token_bearerAuth
 
@@ -57,10 +60,9 @@ async def complete_workout(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> Workout:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().complete_workout(workout_id, complete_workout_request)
+    return await api.complete_workout(workout_id, complete_workout_request)
 
 
 @router.post(
@@ -79,10 +81,31 @@ async def create_workout(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> Workout:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().create_workout(workout_create)
+    return await api.create_workout(workout_create)
+
+
+@router.post(
+    "/workouts/batch",
+    responses={
+        201: {"model": WorkoutBatchResult, "description": "Workouts created (failed items listed in errors)"},
+        400: {"model": Error, "description": "Invalid input"},
+        401: {"model": Error, "description": "Unauthorized"},
+    },
+    tags=["Workouts"],
+    summary="Create several workouts in one request",
+    response_model_by_alias=True,
+)
+async def create_workouts_batch(
+    workout_batch_create: WorkoutBatchCreate = Body(None, description=""),
+    token_bearerAuth: TokenModel = Security(
+        get_token_bearerAuth
+    ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
+) -> WorkoutBatchResult:
+    """Workouts are written with a single unordered bulk write. Items that fail (invalid ids, duplicate keys) are reported in &#x60;errors&#x60; by their position in the request; the others are created. """
+    return await api.create_workouts_batch(workout_batch_create)
 
 
 @router.delete(
@@ -101,10 +124,9 @@ async def delete_workout(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> None:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().delete_workout(workout_id)
+    return await api.delete_workout(workout_id)
 
 
 @router.get(
@@ -123,10 +145,9 @@ async def get_workout(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> Workout:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().get_workout(workout_id)
+    return await api.get_workout(workout_id)
 
 
 @router.get(
@@ -144,13 +165,13 @@ async def list_workouts(
     completed: Optional[StrictBool] = Query(None, description="", alias="completed"),
     page: Optional[Annotated[int, Field(strict=True, ge=1)]] = Query(1, description="", alias="page", ge=1),
     limit: Optional[Annotated[int, Field(le=100, strict=True)]] = Query(20, description="", alias="limit", le=100),
+    cursor: Optional[StrictStr] = Query(None, description="", alias="cursor"),
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> ListWorkouts200Response:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().list_workouts(mesocycle_id, completed, page, limit)
+    return await api.list_workouts(mesocycle_id, completed, page, limit, cursor)
 
 
 @router.put(
@@ -170,7 +191,6 @@ async def update_workout(
     token_bearerAuth: TokenModel = Security(
         get_token_bearerAuth
     ),
+    api: BaseWorkoutsApi = Depends(get_workouts_api),
 ) -> Workout:
-    if not BaseWorkoutsApi.subclasses:
-        raise HTTPException(status_code=500, detail="Not implemented")
-    return await BaseWorkoutsApi.subclasses[0]().update_workout(workout_id, workout_create)
+    return await api.update_workout(workout_id, workout_create)
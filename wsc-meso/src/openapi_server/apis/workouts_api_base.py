@@ -9,6 +9,8 @@ from openapi_server.models.complete_workout_request import CompleteWorkoutReques
 from openapi_server.models.error import Error
 from openapi_server.models.list_workouts200_response import ListWorkouts200Response
 from openapi_server.models.workout import Workout
+from openapi_server.models.workout_batch_create import WorkoutBatchCreate
+from openapi_server.models.workout_batch_result import WorkoutBatchResult
 from openapi_server.models.workout_create import WorkoutCreate
 from openapi_server.security_api import get_token_bearerAuth
 
@@ -33,6 +35,14 @@ class BaseWorkoutsApi:
         ...
 
 
+    async def create_workouts_batch(
+        self,
+        workout_batch_create: WorkoutBatchCreate,
+    ) -> WorkoutBatchResult:
+        """Workouts are written with a single unordered bulk write. Items that fail (invalid ids, duplicate keys) are reported in &#x60;errors&#x60; by their position in the request; the others are created. """
+        ...
+
+
     async def delete_workout(
         self,
         workout_id: StrictStr,
@@ -53,6 +63,7 @@ class BaseWorkoutsApi:
         completed: Optional[StrictBool],
         page: Optional[Annotated[int, Field(strict=True, ge=1)]],
         limit: Optional[Annotated[int, Field(le=100, strict=True)]],
+        cursor: Optional[StrictStr],
     ) -> ListWorkouts200Response:
         ...
 
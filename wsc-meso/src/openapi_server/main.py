@@ -13,6 +13,9 @@
 """  # noqa: E501
 
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from openapi_server.apis.authentication_api import router as AuthenticationApiRouter
@@ -24,10 +27,46 @@ from openapi_server.apis.tracking_api import router as TrackingApiRouter
 from openapi_server.apis.users_api import router as UsersApiRouter
 from openapi_server.apis.workouts_api import router as WorkoutsApiRouter
 
+from api.controllers import admin_router
+from api.dependencies import container
+from infrastructure.cache import UsernameFilter
+from infrastructure.catalog import ExerciseCatalog
+from infrastructure.config.database import close_database, init_database
+from infrastructure.config.settings import get_settings
+from infrastructure.security import PasswordHasher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared MongoDB client before serving and close it on shutdown."""
+    settings = get_settings()
+    await init_database(settings)
+    # Lookups fall back to MongoDB until the username filter is loaded
+    usernames = asyncio.create_task(
+        container.resolve(UsernameFilter).watch(settings.username_filter_rebuild_seconds)
+    )
+    watcher = None
+    if settings.exercise_catalog_enabled:
+        catalog = container.resolve(ExerciseCatalog)
+        await catalog.reload()
+        watcher = asyncio.create_task(catalog.watch(settings.exercise_catalog_refresh_seconds))
+    try:
+        yield
+    finally:
+        usernames.cancel()
+        if watcher:
+            watcher.cancel()
+        await close_database()
+        container.resolve(PasswordHasher).close()
+        # Repositories hold collections of the closed client
+        container.reset()
+
+
 app = FastAPI(
     title="Mesocycle Planner API - Advanced Periodization",
     description="Complete API for fitness training app with advanced periodization support. Features: 440+ exercises database, Linear/DUP/Block/Polarized periodization models, microcycle management, auto-progression, session logging, and AI-generated training plans.  Supports user authentication, mesocycle planning, workout tracking, and progress analytics. ",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(AuthenticationApiRouter)
@@ -38,3 +77,4 @@ app.include_router(ProgressionApiRouter)
 app.include_router(TrackingApiRouter)
 app.include_router(UsersApiRouter)
 app.include_router(WorkoutsApiRouter)
+app.include_router(admin_router)
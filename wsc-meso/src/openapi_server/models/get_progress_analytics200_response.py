@@ -21,7 +21,7 @@ import json
 
 
 
-from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr, field_validator
 from typing import Any, ClassVar, Dict, List, Optional, Union
 from openapi_server.models.get_progress_analytics200_response_data_points_inner import GetProgressAnalytics200ResponseDataPointsInner
 try:
@@ -38,8 +38,10 @@ class GetProgressAnalytics200Response(BaseModel):
     min: Optional[Union[StrictFloat, StrictInt]] = None
     max: Optional[Union[StrictFloat, StrictInt]] = None
     trend: Optional[StrictStr] = None
+    slope_per_week: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, description="Robust (Huber) linear fit of the values, in units per week")
+    count: Optional[StrictInt] = Field(default=None, description="Entries in the range before downsampling")
     data_points: Optional[List[GetProgressAnalytics200ResponseDataPointsInner]] = None
-    __properties: ClassVar[List[str]] = ["metric_type", "average", "min", "max", "trend", "data_points"]
+    __properties: ClassVar[List[str]] = ["metric_type", "average", "min", "max", "trend", "slope_per_week", "count", "data_points"]
 
     @field_validator('trend')
     def trend_validate_enum(cls, value):
@@ -112,6 +114,8 @@ class GetProgressAnalytics200Response(BaseModel):
             "min": obj.get("min"),
             "max": obj.get("max"),
             "trend": obj.get("trend"),
+            "slope_per_week": obj.get("slope_per_week"),
+            "count": obj.get("count"),
             "data_points": [GetProgressAnalytics200ResponseDataPointsInner.from_dict(_item) for _item in obj.get("data_points")] if obj.get("data_points") is not None else None
         })
         return _obj
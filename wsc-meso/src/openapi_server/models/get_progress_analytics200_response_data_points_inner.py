@@ -35,7 +35,8 @@ class GetProgressAnalytics200ResponseDataPointsInner(BaseModel):
     """ # noqa: E501
     var_date: Optional[date] = Field(default=None, alias="date")
     value: Optional[Union[StrictFloat, StrictInt]] = None
-    __properties: ClassVar[List[str]] = ["date", "value"]
+    moving_average: Optional[Union[StrictFloat, StrictInt]] = None
+    __properties: ClassVar[List[str]] = ["date", "value", "moving_average"]
 
     model_config = {
         "populate_by_name": True,
@@ -87,7 +88,8 @@ class GetProgressAnalytics200ResponseDataPointsInner(BaseModel):
 
         _obj = cls.model_validate({
             "date": obj.get("date"),
-            "value": obj.get("value")
+            "value": obj.get("value"),
+            "moving_average": obj.get("moving_average")
         })
         return _obj
 
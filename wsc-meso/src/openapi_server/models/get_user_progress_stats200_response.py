@@ -35,9 +35,11 @@ class GetUserProgressStats200Response(BaseModel):
     GetUserProgressStats200Response
     """ # noqa: E501
     exercise: Optional[ExerciseSummary] = None
+    total_sessions: Optional[StrictInt] = None
+    total_volume: Optional[Union[StrictFloat, StrictInt]] = None
     progression_data: Optional[List[GetUserProgressStats200ResponseProgressionDataInner]] = None
     strength_velocity: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, description="%/week")
-    __properties: ClassVar[List[str]] = ["exercise", "progression_data", "strength_velocity"]
+    __properties: ClassVar[List[str]] = ["exercise", "total_sessions", "total_volume", "progression_data", "strength_velocity"]
 
     model_config = {
         "populate_by_name": True,
@@ -99,6 +101,8 @@ class GetUserProgressStats200Response(BaseModel):
 
         _obj = cls.model_validate({
             "exercise": ExerciseSummary.from_dict(obj.get("exercise")) if obj.get("exercise") is not None else None,
+            "total_sessions": obj.get("total_sessions"),
+            "total_volume": obj.get("total_volume"),
             "progression_data": [GetUserProgressStats200ResponseProgressionDataInner.from_dict(_item) for _item in obj.get("progression_data")] if obj.get("progression_data") is not None else None,
             "strength_velocity": obj.get("strength_velocity")
         })
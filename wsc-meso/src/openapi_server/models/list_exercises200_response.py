@@ -21,7 +21,7 @@ import json
 
 
 
-from pydantic import BaseModel, ConfigDict, StrictInt
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
 from openapi_server.models.exercise_summary import ExerciseSummary
 try:
@@ -37,7 +37,8 @@ class ListExercises200Response(BaseModel):
     total_count: Optional[StrictInt] = None
     page: Optional[StrictInt] = None
     total_pages: Optional[StrictInt] = None
-    __properties: ClassVar[List[str]] = ["exercises", "total_count", "page", "total_pages"]
+    next_cursor: Optional[StrictStr] = Field(default=None, description="Token for the next page; absent on the last page")
+    __properties: ClassVar[List[str]] = ["exercises", "total_count", "page", "total_pages", "next_cursor"]
 
     model_config = {
         "populate_by_name": True,
@@ -83,6 +84,11 @@ class ListExercises200Response(BaseModel):
                 if _item:
                     _items.append(_item.to_dict())
             _dict['exercises'] = _items
+        # set to None if next_cursor (nullable) is None
+        # and model_fields_set contains the field
+        if self.next_cursor is None and "next_cursor" in self.model_fields_set:
+            _dict['next_cursor'] = None
+
         return _dict
 
     @classmethod
@@ -98,7 +104,8 @@ class ListExercises200Response(BaseModel):
             "exercises": [ExerciseSummary.from_dict(_item) for _item in obj.get("exercises")] if obj.get("exercises") is not None else None,
             "total_count": obj.get("total_count"),
             "page": obj.get("page"),
-            "total_pages": obj.get("total_pages")
+            "total_pages": obj.get("total_pages"),
+            "next_cursor": obj.get("next_cursor")
         })
         return _obj
 
@@ -35,7 +35,7 @@ class Microcycle(BaseModel):
     Microcycle
     """ # noqa: E501
     id: StrictInt
-    mesocycle_id: StrictInt
+    mesocycle_id: StrictStr
     microcycle_number: StrictInt
     week_start: Optional[StrictInt] = None
     week_end: Optional[StrictInt] = None
@@ -2,7 +2,7 @@
 
 from typing import List
 
-from fastapi import Depends, Security  # noqa: F401
+from fastapi import Depends, HTTPException, Security  # noqa: F401
 from fastapi.openapi.models import OAuthFlowImplicit, OAuthFlows  # noqa: F401
 from fastapi.security import (  # noqa: F401
     HTTPAuthorizationCredentials,
@@ -16,21 +16,32 @@ from fastapi.security import (  # noqa: F401
 )
 from fastapi.security.api_key import APIKeyCookie, APIKeyHeader, APIKeyQuery  # noqa: F401
 
+from infrastructure.security import TokenVerifier
 from openapi_server.models.extra_models import TokenModel
+from openapi_server.utils.auth import set_current_user_id
 
 
 bearer_auth = HTTPBearer()
 
 
-def get_token_bearerAuth(credentials: HTTPAuthorizationCredentials = Depends(bearer_auth)) -> TokenModel:
+async def get_token_bearerAuth(credentials: HTTPAuthorizationCredentials = Depends(bearer_auth)) -> TokenModel:
     """
     Check and retrieve authentication information from custom bearer token.
 
+    A coroutine, so the user id it stores is visible to the endpoint.
+
     :param credentials Credentials provided by Authorization header
     :type credentials: HTTPAuthorizationCredentials
-    :return: Decoded token information or None if token is invalid
-    :rtype: TokenModel | None
+    :return: Decoded token information
+    :rtype: TokenModel
     """
 
-    ...
+    # Imported here: the container imports the API bases, which import this module
+    from api.dependencies import container
 
+    claims = container.resolve(TokenVerifier).verify(credentials.credentials)
+    user_id = claims.get("user_id") if claims else None
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token", headers={"WWW-Authenticate": "Bearer"})
+    set_current_user_id(user_id)
+    return TokenModel(sub=user_id)
@@ -3,14 +3,15 @@
 """
 Authentication utilities
 
-JWT token generation and password hashing utilities.
+JWT token generation and the authenticated user of the current request.
+Password hashing lives in infrastructure.security.
 """
 
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from typing import Optional
-import bcrypt
-from datetime import datetime, timedelta
-from typing import Optional
+from uuid import UUID
+from fastapi import HTTPException
 from jose import JWTError, jwt
 
 # JWT Configuration
@@ -18,23 +19,8 @@ SECRET_KEY = "mesocycle-planner-secret-key-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
-    pwd_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(pwd_bytes, salt)
-    return hashed.decode('utf-8')
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    try:
-        pwd_bytes = plain_password.encode('utf-8')
-        hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(pwd_bytes, hashed_bytes)
-    except (ValueError, TypeError):
-        return False
+# User id resolved by the bearer-auth dependency for the current request
+_current_user_id: ContextVar[Optional[str]] = ContextVar("current_user_id", default=None)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -73,3 +59,21 @@ def get_current_user_id(authorization: Optional[str]) -> Optional[str]:
     
     token = parts[1]
     return verify_token(token)
+
+
+def set_current_user_id(user_id: Optional[str]) -> None:
+    """Remember the authenticated user for the rest of the request"""
+    _current_user_id.set(user_id)
+
+
+def current_user_id() -> Optional[str]:
+    """User id the bearer-auth dependency resolved for this request"""
+    return _current_user_id.get()
+
+
+def current_user_uuid() -> UUID:
+    """Authenticated user of this request; 401 when there is none"""
+    try:
+        return UUID(current_user_id())
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
@@ -0,0 +1,113 @@
+# coding: utf-8
+
+"""
+Response serialization
+
+JSON bodies written straight from domain entities, without building the
+generated models.
+
+``render`` emits a generated model's fields with the names, order and
+nulls FastAPI gives them for ``response_model``, from a field map built
+once per model, and encodes with orjson. Nothing is validated: the values
+must already have the schema's types, as entities read from the
+repositories do. Day fields also take the midnight datetimes MongoDB
+returns.
+"""
+
+import typing
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+# pydantic writes UTC offsets as Z
+_OPTIONS = orjson.OPT_UTC_Z
+
+Converter = Callable[[Any], Any]
+
+
+def _day(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _unwrap(annotation):
+    """Strip Optional and Annotated from a field annotation"""
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is typing.Annotated:
+            annotation = typing.get_args(annotation)[0]
+        elif origin is typing.Union:
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                return annotation
+            annotation = args[0]
+        else:
+            return annotation
+
+
+def _converter(annotation) -> Optional[Converter]:
+    """Conversion of a non-null value before encoding; None when orjson takes it as is"""
+    annotation = _unwrap(annotation)
+    if typing.get_origin(annotation) is list:
+        item = _converter(typing.get_args(annotation)[0])
+        if item is None:
+            return None
+        return lambda values: [None if value is None else item(value) for value in values]
+    if annotation is date:
+        return _day
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return field_map(annotation).from_object
+    # UUIDs, datetimes and enums are encoded by orjson as pydantic does
+    return None
+
+
+class FieldMap:
+    """JSON name, attribute and converter of each field of a generated model"""
+    
+    __slots__ = ("fields",)
+    
+    def __init__(self, model: Type[BaseModel]):
+        self.fields: Tuple[Tuple[str, str, Optional[Converter]], ...] = tuple(
+            (field.alias or name, name, _converter(field.annotation))
+            for name, field in model.model_fields.items()
+        )
+    
+    def from_object(self, obj: Any) -> Dict[str, Any]:
+        """Body of an entity whose attributes are named like the JSON fields"""
+        body = {}
+        for key, _, convert in self.fields:
+            value = getattr(obj, key, None)
+            if value is not None and convert is not None:
+                value = convert(value)
+            body[key] = value
+        return body
+    
+    def from_values(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Body of the keyword arguments the model's constructor would take"""
+        body = {}
+        for key, name, convert in self.fields:
+            value = values.get(name)
+            if value is not None and convert is not None:
+                value = convert(value)
+            body[key] = value
+        return body
+
+
+@lru_cache(maxsize=None)
+def field_map(model: Type[BaseModel]) -> FieldMap:
+    """Field map of a generated model, built on first use"""
+    return FieldMap(model)
+
+
+def dumps(model: Type[BaseModel], **values: Any) -> bytes:
+    """JSON of ``model(**values)``, without building the model"""
+    return orjson.dumps(field_map(model).from_values(values), option=_OPTIONS)
+
+
+def render(model: Type[BaseModel], **values: Any) -> Response:
+    """``dumps`` as a JSON response, which FastAPI sends without validating"""
+    return Response(dumps(model, **values), media_type="application/json")
+
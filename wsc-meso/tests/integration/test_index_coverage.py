@@ -0,0 +1,59 @@
+"""
+Integration Tests for Index Coverage
+
+Runs explain() for every declared query shape against a local mongod with
+the registered indexes applied, and fails on collection scans or in-memory
+sorts.
+"""
+import pytest
+import pytest_asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+
+import infrastructure.persistence.repositories  # noqa: F401  (registers query shapes)
+from infrastructure.persistence.indexes import (
+    LATEST_VERSION,
+    QUERY_SHAPES,
+    applied_version,
+    apply_index_migrations,
+    plan_stages,
+)
+
+
+@pytest_asyncio.fixture
+async def indexed_database():
+    """Test database with every index migration applied"""
+    client = AsyncIOMotorClient("mongodb://localhost:27017", uuidRepresentation="standard")
+    db = client.mesocycle_planner_index_test
+    await apply_index_migrations(db)
+    yield db
+    await client.drop_database("mesocycle_planner_index_test")
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_migrations_are_idempotent(indexed_database):
+    """Test re-running migrations is a no-op"""
+    before = await indexed_database.progress.index_information()
+    
+    assert await apply_index_migrations(indexed_database) == LATEST_VERSION
+    assert await applied_version(indexed_database) == LATEST_VERSION
+    assert await indexed_database.progress.index_information() == before
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "shape",
+    [s for s in QUERY_SHAPES if s.collscan is None],
+    ids=lambda s: s.source,
+)
+async def test_shape_uses_index(indexed_database, shape):
+    """Test the winning plan has no COLLSCAN or SORT stage"""
+    cursor = indexed_database[shape.collection].find(shape.example_filter())
+    if shape.sort:
+        cursor = cursor.sort(list(shape.sort))
+    explain = await cursor.explain()
+    
+    stages = plan_stages(explain["queryPlanner"]["winningPlan"])
+    
+    assert "COLLSCAN" not in stages, f"{shape.source} scans {shape.collection}: {stages}"
+    assert "SORT" not in stages, f"{shape.source} sorts in memory: {stages}"
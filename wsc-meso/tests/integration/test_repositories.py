@@ -6,19 +6,35 @@ Tests for repository implementations with MongoDB.
 import pytest
 import pytest_asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
-from datetime import date
+from datetime import date, datetime
 from uuid import uuid4
 
 from domain.entities.user import User, TrainingLevel
 from domain.entities.mesocycle import Mesocycle, MesocycleStatus, TrainingGoal, PeriodizationModel
+from domain.entities.progress import MetricType, Progress
+from domain.entities.training_session import ExercisePerformed, SetPerformed, TrainingSession
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+from domain.entities.workout import Workout
+from domain.repositories.training_session_repository import DuplicateSessionError
+from domain.repositories.user_repository import DuplicateUserError
+from domain.services.autoregulation import advance_state, observe
 from infrastructure.persistence.repositories.user_repository_impl import UserRepository
 from infrastructure.persistence.repositories.mesocycle_repository_impl import MesocycleRepository
+from infrastructure.persistence.repositories.workout_repository_impl import WorkoutRepository
+from infrastructure.persistence.repositories.training_session_repository_impl import TrainingSessionRepository
+from infrastructure.persistence.repositories.exercise_state_repository_impl import ExerciseStateRepository
+from infrastructure.persistence.repositories.weekly_rollup_repository_impl import WeeklyRollupRepository
+from infrastructure.persistence.repositories.progress_repository_impl import ProgressRepository
+from infrastructure.persistence.repositories.progress_timeseries_repository_impl import TimeSeriesProgressRepository
+from infrastructure.persistence.indexes import apply_index_migrations
+from infrastructure.persistence.progress_migration import migrate_progress
+from infrastructure.persistence.rollups import rebuild_rollups
 
 
 @pytest_asyncio.fixture
 async def mongodb_client():
     """Create MongoDB test client"""
-    client = AsyncIOMotorClient("mongodb://localhost:27017")
+    client = AsyncIOMotorClient("mongodb://localhost:27017", uuidRepresentation="standard")
     yield client
     client.close()
 
@@ -44,6 +60,38 @@ async def mesocycle_repository(test_database):
     return MesocycleRepository(test_database)
 
 
+@pytest_asyncio.fixture
+async def workout_repository(test_database):
+    """Create workout repository with small bulk chunks"""
+    repository = WorkoutRepository(test_database)
+    repository.bulk_chunk_size = 2
+    return repository
+
+
+@pytest_asyncio.fixture
+async def training_session_repository(test_database):
+    """Create training session repository"""
+    return TrainingSessionRepository(test_database)
+
+
+@pytest_asyncio.fixture
+async def exercise_state_repository(test_database):
+    """Create exercise state repository"""
+    return ExerciseStateRepository(test_database)
+
+
+@pytest_asyncio.fixture
+async def weekly_rollup_repository(test_database):
+    """Create weekly rollup repository"""
+    return WeeklyRollupRepository(test_database)
+
+
+@pytest_asyncio.fixture
+async def progress_repository(test_database):
+    """Create progress repository"""
+    return ProgressRepository(test_database)
+
+
 class TestUserRepository:
     """Test User Repository"""
     
@@ -98,6 +146,9 @@ class TestUserRepository:
         
         found = await user_repository.find_by_id(user.id)
         assert found.full_name == "Updated Name"
+        assert found.version == 1
+        assert await user_repository.find_version(user.id) == 1
+        assert await user_repository.find_version(uuid4()) is None
     
     @pytest.mark.asyncio
     async def test_exists_by_email(self, user_repository):
@@ -115,6 +166,22 @@ class TestUserRepository:
         
         not_exists = await user_repository.exists_by_email("notexists@test.com")
         assert not_exists is False
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_user(self, test_database, user_repository):
+        """Test the unique indexes reject a taken email or username"""
+        await apply_index_migrations(test_database)
+        await user_repository.save(User.create(email="dup@test.com", username="dupuser", hashed_password="pwd"))
+        
+        with pytest.raises(DuplicateUserError) as e:
+            await user_repository.save(User.create(email="other@test.com", username="dupuser", hashed_password="pwd"))
+        assert e.value.field == "username"
+        
+        with pytest.raises(DuplicateUserError) as e:
+            await user_repository.save(User.create(email="dup@test.com", username="other", hashed_password="pwd"))
+        assert e.value.field == "email"
+        
+        assert [name async for name in user_repository.usernames()] == ["dupuser"]
 
 
 class TestMesocycleRepository:
@@ -247,3 +314,243 @@ class TestMesocycleRepository:
         # Verify
         found = await mesocycle_repository.find_by_id(mesocycle.id)
         assert found is None
+
+
+class TestWorkoutBulkWrites:
+    """Test bulk writes of the Workout Repository"""
+    
+    @staticmethod
+    def make_workouts(count):
+        mesocycle_id = uuid4()
+        return [
+            Workout.create(mesocycle_id=mesocycle_id, name=f"Day {i}", scheduled_date=datetime(2025, 1, i + 1))
+            for i in range(count)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_save_many_reports_duplicates(self, workout_repository):
+        """Test a duplicate id fails alone and keeps its input position"""
+        workouts = self.make_workouts(4)
+        await workout_repository.save(workouts[2])
+        
+        result = await workout_repository.save_many(workouts)
+        
+        assert result.written == 3
+        assert [(e.index, e.id, e.code) for e in result.errors] == [(2, workouts[2].id, 11000)]
+        assert await workout_repository.count_by_mesocycle_id(workouts[0].mesocycle_id) == 4
+    
+    @pytest.mark.asyncio
+    async def test_update_many_reports_missing(self, workout_repository):
+        """Test replacing a workout that does not exist is reported"""
+        workouts = self.make_workouts(3)
+        await workout_repository.save_many(workouts[:2])
+        for workout in workouts:
+            workout.name = "Renamed"
+        
+        result = await workout_repository.update_many(workouts)
+        
+        assert result.written == 2
+        assert [(e.index, e.message) for e in result.errors] == [(2, "Not found")]
+        assert (await workout_repository.find_by_id(workouts[1].id)).name == "Renamed"
+    
+    @pytest.mark.asyncio
+    async def test_delete_many(self, workout_repository):
+        """Test deleting in bulk counts only existing documents"""
+        workouts = self.make_workouts(3)
+        await workout_repository.save_many(workouts)
+        
+        result = await workout_repository.delete_many([w.id for w in workouts] + [uuid4()])
+        
+        assert result.ok
+        assert result.written == 3
+
+
+class TestTrainingSessionRepository:
+    """Test the weekly bucketed Training Session Repository"""
+    
+    @staticmethod
+    def make_session(session_id, user_id, mesocycle_id, day, week_number):
+        return TrainingSession(
+            id=session_id,
+            mesocycle_id=mesocycle_id,
+            date=day,
+            week_number=week_number,
+            user_id=user_id,
+            exercises_performed=[
+                ExercisePerformed(exercise_id=1, planned_sets=2, sets_performed=[
+                    SetPerformed(100.0, 5, 8, 2), SetPerformed(100.0, 5, 9, 1),
+                ]),
+            ],
+        )
+    
+    @pytest.mark.asyncio
+    async def test_append_and_date_range(self, training_session_repository):
+        """Test sessions land in weekly buckets and read back by date range"""
+        user_id, mesocycle_id = uuid4(), uuid4()
+        days = [date(2025, 1, 6), date(2025, 1, 9), date(2025, 1, 13), date(2025, 1, 20)]
+        sessions = [
+            self.make_session(i, user_id, mesocycle_id, day, week_number=i // 2 + 1)
+            for i, day in enumerate(days)
+        ]
+        
+        result = await training_session_repository.append_many(sessions)
+        found = await training_session_repository.find_by_user_and_date_range(
+            user_id, date(2025, 1, 8), date(2025, 1, 13),
+        )
+        
+        assert result.written == 4
+        assert await training_session_repository.collection.count_documents({}) == 2
+        assert [s.id for s in found] == [1, 2]
+        assert found[0].get_total_sets() == 2
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_session(self, training_session_repository):
+        """Test appending a logged session again is rejected"""
+        session = self.make_session(1, uuid4(), uuid4(), date(2025, 1, 6), week_number=1)
+        await training_session_repository.append(session)
+        
+        with pytest.raises(DuplicateSessionError):
+            await training_session_repository.append(session)
+        
+        week = await training_session_repository.find_by_mesocycle_week(session.mesocycle_id, 1)
+        assert [s.id for s in week] == [1]
+
+
+class TestExerciseStateRepository:
+    """Test the atomic exercise state updates"""
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_matches_advance_state(self, exercise_state_repository):
+        """Test the server-side update computes the same state as the domain"""
+        user_id = uuid4()
+        expected = None
+        for weight, reps, rpe, fatigue in [(100.0, 5, 7, [5]), (105.0, 5, 8, []), (100.0, 4, 9, [8])]:
+            observation = observe([SetPerformed(weight, reps, rpe, 10 - rpe)], fatigue)
+            expected = advance_state(expected, 3, observation)
+            
+            state = await exercise_state_repository.record(user_id, 3, observation)
+        
+        assert state._replace(rpe_ewma=0, fatigue_ewma=0, trend_slope=0) == expected._replace(
+            rpe_ewma=0, fatigue_ewma=0, trend_slope=0,
+        )
+        assert state.rpe_ewma == pytest.approx(expected.rpe_ewma)
+        assert state.fatigue_ewma == pytest.approx(expected.fatigue_ewma)
+        assert state.trend_slope == pytest.approx(expected.trend_slope)
+        assert await exercise_state_repository.find(user_id, 3) == state
+
+
+class TestWeeklyRollups:
+    """Test the incremental weekly rollups against a rebuild"""
+    
+    @pytest.mark.asyncio
+    async def test_increments_match_rebuild(self, test_database, weekly_rollup_repository):
+        """Test online increments agree with the rollups recomputed from raw data"""
+        mesocycle = Mesocycle.create(
+            user_id=uuid4(),
+            name="Rollups",
+            periodization_model=PeriodizationModel.LINEAR,
+            goal=TrainingGoal.STRENGTH,
+            duration_weeks=4,
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 2, 2),
+        )
+        doc = MesocycleRepository(test_database)._to_document(mesocycle)
+        doc["start_date"], doc["end_date"] = datetime(2025, 1, 6), datetime(2025, 2, 2)
+        await test_database.mesocycles.insert_one(doc)
+        sessions = TrainingSessionRepository(test_database)
+        workouts = WorkoutRepository(test_database)
+        for session in [
+            TestTrainingSessionRepository.make_session(1, mesocycle.user_id, mesocycle.id, date(2025, 1, 6), 1),
+            TestTrainingSessionRepository.make_session(2, mesocycle.user_id, mesocycle.id, date(2025, 1, 8), 1),
+            TestTrainingSessionRepository.make_session(3, mesocycle.user_id, mesocycle.id, date(2025, 1, 14), 2),
+        ]:
+            await sessions.append(session)
+            week_start = mesocycle.week_start(session.week_number)
+            await weekly_rollup_repository.record([
+                *WeeklyRollup.from_session(session, week_start),
+                *DailyRollup.from_session(session, week_start),
+            ])
+        workout = Workout.create(mesocycle_id=mesocycle.id, name="Day 1", scheduled_date=datetime(2025, 1, 15))
+        workout.mark_completed()
+        await workouts.save(workout)
+        await weekly_rollup_repository.record([WeeklyRollup.from_workout(mesocycle.user_id, mesocycle.id, 2, mesocycle.week_start(2))])
+        
+        rollups = await weekly_rollup_repository.find_by_mesocycle(mesocycle.id)
+        clean = await rebuild_rollups(test_database, [mesocycle.id], check=True)
+        await weekly_rollup_repository.collection.update_one({"exercise_id": None, "week_number": 1}, {"$inc": {"sets": 1}})
+        drifted = await rebuild_rollups(test_database, [mesocycle.id])
+        
+        assert [(r.week_number, r.exercise_id, r.sessions, r.sets) for r in rollups] == [
+            (1, None, 2, 4), (1, 1, 2, 4), (2, None, 1, 2), (2, 1, 1, 2),
+        ]
+        assert rollups[2].workouts_completed == 1
+        assert clean.drifted == [] and clean.rollups == 10
+        assert drifted.drifted == [(mesocycle.user_id, mesocycle.id, 1, None)] and drifted.written
+        assert await weekly_rollup_repository.find_by_mesocycle(mesocycle.id) == rollups
+        assert [r.week_start for r in await weekly_rollup_repository.find_by_user(
+            mesocycle.user_id, date(2025, 1, 10), date(2025, 1, 31),
+        )] == [date(2025, 1, 6), date(2025, 1, 13)]
+        assert [(r.day, r.sets) for r in await weekly_rollup_repository.find_daily_by_user(
+            mesocycle.user_id, date(2025, 1, 8), date(2025, 1, 31), 1,
+        )] == [(date(2025, 1, 8), 2), (date(2025, 1, 14), 2)]
+
+
+class TestProgressRepository:
+    """Test progress entries and their series"""
+    
+    @pytest.mark.asyncio
+    async def test_find_series(self, progress_repository):
+        """Test one metric's values come back as arrays in date order, by day"""
+        user_id = uuid4()
+        for day, metric, value in [
+            (date(2025, 1, 3), MetricType.WEIGHT, 81.0),
+            (date(2025, 1, 1), MetricType.WEIGHT, 82.0),
+            (date(2025, 1, 2), MetricType.BODY_FAT, 15.0),
+            (date(2025, 1, 9), MetricType.WEIGHT, 80.5),
+        ]:
+            await progress_repository.save(Progress.create(user_id, day, metric, value))
+        
+        series = await progress_repository.find_series(user_id, MetricType.WEIGHT, date(2025, 1, 1), date(2025, 1, 3))
+        
+        assert series.dates() == [date(2025, 1, 1), date(2025, 1, 3)]
+        assert series.values.tolist() == [82.0, 81.0]
+        assert len(await progress_repository.find_series(uuid4(), MetricType.WEIGHT)) == 0
+
+
+class TestProgressTimeSeries:
+    """Test the time-series backend and the migration to it (MongoDB 7.0+)"""
+    
+    @pytest.mark.asyncio
+    async def test_migration_and_reads(self, test_database, progress_repository):
+        """Test a pass copies every entry, repairs drift and the copies read the same"""
+        await apply_index_migrations(test_database)
+        timeseries = TimeSeriesProgressRepository(test_database)
+        user_id = uuid4()
+        entries = [
+            Progress.create(user_id, date(2025, 1, day), MetricType.WEIGHT, 80.0 + day / 10, unit="kg")
+            for day in range(1, 11)
+        ]
+        await progress_repository.save_many(entries)
+        
+        first = await migrate_progress(test_database, batch_size=3)
+        clean = await migrate_progress(test_database, check=True)
+        await progress_repository.delete(entries[0].id)
+        await timeseries.collection.insert_one(timeseries._to_document(entries[1]))  # duplicate copy
+        repaired = await migrate_progress(test_database, batch_size=3)
+        
+        assert (first.entries, len(first.drifted), first.written) == (10, 10, True)
+        assert clean.drifted == [] and clean.extra == [] and not clean.written
+        assert repaired.drifted == [entries[1].id] and repaired.extra == [entries[0].id]
+        start, end = date(2025, 1, 1), date(2025, 1, 31)
+        expected = await progress_repository.find_series(user_id, MetricType.WEIGHT, start, end)
+        series = await timeseries.find_series(user_id, MetricType.WEIGHT, start, end)
+        assert series.dates() == expected.dates() and series.values.tolist() == expected.values.tolist()
+        page = await timeseries.find_page_with_total(user_id, MetricType.WEIGHT, limit=4)
+        assert page.total == 9 and [p.date for p in page.items] == [date(2025, 1, d) for d in (10, 9, 8, 7)]
+        
+        updated = entries[2]
+        updated.value = 79.0
+        await timeseries.update(updated)
+        assert (await timeseries.find_by_id(updated.id)).value == 79.0
+        assert await timeseries.delete(updated.id)
+        assert await timeseries.find_by_id(updated.id) is None
@@ -3,6 +3,7 @@
 from fastapi.testclient import TestClient
 
 
+from openapi_server.models.check_username_availability200_response import CheckUsernameAvailability200Response  # noqa: F401
 from openapi_server.models.error import Error  # noqa: F401
 from openapi_server.models.token import Token  # noqa: F401
 from openapi_server.models.user import User  # noqa: F401
@@ -10,6 +11,26 @@ from openapi_server.models.user_create import UserCreate  # noqa: F401
 from openapi_server.models.user_login import UserLogin  # noqa: F401
 
 
+def test_check_username_availability(client: TestClient):
+    """Test case for check_username_availability
+
+    Check whether a username is available
+    """
+    params = [("username", 'lifter42')]
+    headers = {
+    }
+    # uncomment below to make a request
+    #response = client.request(
+    #    "GET",
+    #    "/auth/username-available",
+    #    headers=headers,
+    #    params=params,
+    #)
+
+    # uncomment below to assert the status code of the HTTP response
+    #assert response.status_code == 200
+
+
 def test_login_user(client: TestClient):
     """Test case for login_user
 
@@ -108,6 +108,7 @@ def test_get_mesocycle_dashboard(client: TestClient):
     """
 
     headers = {
+        "if_none_match": 'if_none_match_example',
         "Authorization": "Bearer special-key",
     }
     # uncomment below to make a request
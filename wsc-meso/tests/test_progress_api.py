@@ -81,7 +81,7 @@ def test_get_progress_analytics(client: TestClient):
 
     Get progress analytics
     """
-    params = [("metric_type", 'metric_type_example'),     ("start_date", '2013-10-20'),     ("end_date", '2013-10-20')]
+    params = [("metric_type", 'metric_type_example'),     ("start_date", '2013-10-20'),     ("end_date", '2013-10-20'),     ("max_points", 500),     ("moving_average_days", 56)]
     headers = {
         "Authorization": "Bearer special-key",
     }
@@ -0,0 +1,223 @@
+"""
+Unit Tests for Autoregulation
+
+Tests for the rolling exercise state, the adjustments derived from it and
+the smart log endpoint implementation.
+"""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from domain.entities.mesocycle import Mesocycle, PeriodizationModel, TrainingGoal
+from domain.entities.training_session import SetPerformed
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+from domain.services import (
+    advance_state,
+    next_adjustment,
+    observe,
+    overtraining_risk,
+    recovery_recommendation,
+)
+from openapi_server.impl.tracking_impl import TrackingApiImpl
+from openapi_server.models.smart_log_session_request import SmartLogSessionRequest
+from openapi_server.utils.auth import set_current_user_id
+
+
+def run(sessions):
+    """State after logging each (weight, reps, rpe) session in turn"""
+    state = None
+    for weight, reps, rpe in sessions:
+        state = advance_state(state, 1, observe([SetPerformed(weight, reps, rpe, 10 - rpe)]))
+    return state
+
+
+class FakeStateRepository:
+    """State store applying advance_state in memory"""
+    
+    def __init__(self):
+        self.states = {}
+    
+    async def record(self, user_id, exercise_id, observation):
+        key = (user_id, exercise_id)
+        self.states[key] = advance_state(self.states.get(key), exercise_id, observation)
+        return self.states[key]
+    
+    async def find(self, user_id, exercise_id):
+        return self.states.get((user_id, exercise_id))
+
+
+class FakeSessionRepository:
+    """Session store keeping appended sessions in a list"""
+    
+    def __init__(self):
+        self.sessions = []
+    
+    async def append(self, session):
+        self.sessions.append(session)
+        return session
+
+
+class FakeRollupRepository:
+    """Rollup store keeping recorded increments in a list"""
+    
+    def __init__(self):
+        self.increments = []
+    
+    async def record(self, increments):
+        self.increments.extend(increments)
+
+
+class FakeMesocycleRepository:
+    """Repository stand-in holding a single mesocycle"""
+    
+    def __init__(self, mesocycle):
+        self.mesocycle = mesocycle
+    
+    async def find_by_id(self, mesocycle_id):
+        return self.mesocycle if mesocycle_id == self.mesocycle.id else None
+
+
+class TestExerciseState:
+    """Test observe and advance_state"""
+    
+    def test_observe_uses_top_set(self):
+        """Test the top set is the one with the highest e1RM"""
+        observation = observe(
+            [SetPerformed(100.0, 5, 8, 2), SetPerformed(110.0, 3, 9, 1), SetPerformed(90.0, 8, 9, 1)],
+            fatigue=[6, 8],
+        )
+        
+        assert (observation.weight_kg, observation.reps) == (110.0, 3)
+        assert observation.e1rm == 121.0
+        assert observation.rpe == pytest.approx(26 / 3)
+        assert observation.fatigue == 7
+        assert observation.sets == 3
+    
+    def test_first_session_seeds_state(self):
+        """Test the first session sets the averages and a flat trend"""
+        state = run([(100.0, 5, 8)])
+        
+        assert state.sessions == 1
+        assert state.rpe_ewma == 8
+        assert state.trend_slope == 0.0
+        assert state.fatigue_ewma is None
+    
+    def test_averages_and_trend(self):
+        """Test EWMAs follow the latest sessions and best e1RM never drops"""
+        state = run([(100.0, 5, 7), (105.0, 5, 8), (95.0, 5, 9)])
+        
+        assert state.sessions == 3
+        assert state.rpe_ewma == pytest.approx(0.3 * 9 + 0.7 * (0.3 * 8 + 0.7 * 7))
+        assert state.best_e1rm == pytest.approx(122.5)
+        assert state.trend_slope < 0
+        assert (state.last_weight_kg, state.last_reps) == (95.0, 5)
+
+
+class TestAdjustments:
+    """Test next_adjustment, overtraining_risk and recovery_recommendation"""
+    
+    def test_easy_session_adds_load(self):
+        """Test a session below target RPE raises the next load"""
+        state = run([(100.0, 5, 6)])
+        
+        adjustment = next_adjustment(state, last_rpe=6, target_rpe=8)
+        
+        assert adjustment["action"] == "increase"
+        assert adjustment["weight_kg"] == 105.0
+        assert adjustment["reps"] == 5
+    
+    def test_hard_session_cuts_load_within_cap(self):
+        """Test overshooting the target lowers the load by at most the cap"""
+        state = run([(100.0, 5, 10)])
+        
+        adjustment = next_adjustment(state, last_rpe=10, target_rpe=6)
+        
+        assert adjustment["action"] == "decrease"
+        assert adjustment["weight_kg"] == 90.0
+    
+    def test_stalling_under_high_effort_is_overreaching(self):
+        """Test rising effort with falling e1RM flags risk and a deload"""
+        stalling = run([(100.0, 5, 9), (100.0, 4, 10), (100.0, 3, 10), (97.5, 3, 10)])
+        progressing = run([(100.0, 5, 7), (102.5, 5, 7), (105.0, 5, 8)])
+        
+        assert overtraining_risk([stalling], target_rpe=8)
+        assert not overtraining_risk([progressing], target_rpe=8)
+        assert recovery_recommendation([stalling], 8, True).startswith("Overreaching")
+        assert recovery_recommendation([progressing], 8, False).startswith("Recovery on track")
+
+
+class TestSmartLogSession:
+    """Test TrackingApiImpl.smart_log_session"""
+    
+    @staticmethod
+    def make_api():
+        user_id = uuid4()
+        set_current_user_id(str(user_id))
+        mesocycle = Mesocycle.create(
+            user_id=user_id,
+            name="Block",
+            goal=TrainingGoal.STRENGTH,
+            periodization_model=PeriodizationModel.LINEAR,
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 3, 30),
+            duration_weeks=12,
+            training_level="intermediate",
+            weekly_frequency=4,
+        )
+        api = TrackingApiImpl(
+            FakeSessionRepository(), FakeMesocycleRepository(mesocycle), FakeStateRepository(),
+            rollups=FakeRollupRepository(),
+        )
+        return api, mesocycle
+    
+    @staticmethod
+    def make_request(mesocycle_id, week_number=1, rpe=6):
+        return SmartLogSessionRequest.from_dict({
+            "mesocycle_id": str(mesocycle_id),
+            "week_number": week_number,
+            "performance_data": [{"exercise_id": 3, "sets_performed": [
+                {"weight_kg": 100, "reps_achieved": 5, "actual_rpe": rpe, "subjective_fatigue": 4},
+                {"weight_kg": 100, "reps_achieved": 5, "actual_rpe": rpe},
+            ]}],
+        })
+    
+    @pytest.mark.asyncio
+    async def test_logs_session_and_recommends(self):
+        """Test the session is stored and the state drives the adjustments"""
+        api, mesocycle = self.make_api()
+        
+        result = await api.smart_log_session(self.make_request(mesocycle.id))
+        
+        assert api.sessions.sessions[0].get_total_sets() == 2
+        assert result.session.week_number == 1
+        assert result.next_session_adjustments["3"]["action"] == "increase"
+        assert result.overtraining_risk is False
+        assert (await api.states.find(mesocycle.user_id, 3)).sessions == 1
+        assert [(type(r), r.exercise_id, r.sets) for r in api.rollups.increments] == [
+            (WeeklyRollup, None, 2), (WeeklyRollup, 3, 2), (DailyRollup, None, 2), (DailyRollup, 3, 2),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_week_outside_mesocycle(self):
+        """Test a week past the mesocycle's end is rejected"""
+        api, mesocycle = self.make_api()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await api.smart_log_session(self.make_request(mesocycle.id, week_number=13))
+        assert exc_info.value.status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_failed_append_leaves_state_alone(self):
+        """Test nothing is aggregated for a session that was not stored"""
+        api, mesocycle = self.make_api()
+        
+        async def append(session):
+            raise ConnectionError("primary down")
+        api.sessions.append = append
+        
+        with pytest.raises(ConnectionError):
+            await api.smart_log_session(self.make_request(mesocycle.id))
+        assert await api.states.find(mesocycle.user_id, 3) is None
+        assert api.rollups.increments == []
@@ -0,0 +1,121 @@
+"""
+Unit Tests for Bulk Writes
+
+Tests for chunked bulk writes and the batch workout endpoint implementation
+(no MongoDB server required).
+"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from domain.repositories import BulkItemError, BulkWriteResult
+from infrastructure.persistence.repositories.base_repository import MongoRepository
+from openapi_server.impl.workouts_impl import WorkoutsApiImpl
+from openapi_server.models.workout_batch_create import WorkoutBatchCreate
+
+
+class FakeCollection:
+    """Collection whose bulk_write rejects a given set of _ids"""
+    
+    name = "things"
+    
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.batches = []
+    
+    async def bulk_write(self, requests, ordered=True):
+        assert ordered is False
+        self.batches.append(len(requests))
+        ids = [request._doc["_id"] for request in requests]
+        write_errors = [
+            {"index": i, "code": 11000, "errmsg": "E11000 duplicate key error"}
+            for i, doc_id in enumerate(ids) if doc_id in self.rejected
+        ]
+        details = {"nInserted": len(ids) - len(write_errors), "writeErrors": write_errors}
+        if write_errors:
+            raise BulkWriteError(details)
+        return SimpleNamespace(bulk_api_result=details)
+
+
+class ThingRepository(MongoRepository):
+    """Minimal repository over a fake collection"""
+    
+    bulk_chunk_size = 3
+    
+    def __init__(self, collection):
+        self.collection = collection
+
+
+class FakeWorkoutRepository:
+    """Repository stand-in that fails the given positions"""
+    
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.saved = []
+    
+    async def save_many(self, workouts):
+        self.saved = list(workouts)
+        return BulkWriteResult(
+            written=len(workouts) - len(self.failing),
+            errors=tuple(
+                BulkItemError(index=i, id=workouts[i].id, message="duplicate key", code=11000)
+                for i in sorted(self.failing)
+            ),
+        )
+
+
+class TestBulkWrite:
+    """Test MongoRepository bulk helpers"""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_and_global_error_positions(self):
+        """Test errors keep their position in the input across chunks"""
+        collection = FakeCollection(rejected={"d", "g"})
+        repository = ThingRepository(collection)
+        documents = [{"_id": doc_id} for doc_id in "abcdefg"]
+        
+        result = await repository._insert_many(documents)
+        
+        assert collection.batches == [3, 3, 1]
+        assert result.written == 5
+        assert [(e.index, e.id, e.code) for e in result.errors] == [(3, "d", 11000), (6, "g", 11000)]
+        assert result.failed_indexes == {3, 6}
+        assert not result.ok
+    
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        """Test nothing is sent for an empty batch"""
+        collection = FakeCollection()
+        
+        result = await ThingRepository(collection)._insert_many([])
+        
+        assert result == BulkWriteResult()
+        assert collection.batches == []
+
+
+class TestCreateWorkoutsBatch:
+    """Test WorkoutsApiImpl.create_workouts_batch"""
+    
+    @staticmethod
+    def request(*mesocycle_ids):
+        return WorkoutBatchCreate.from_dict({"workouts": [
+            {"mesocycle_id": mesocycle_id, "name": f"Day {i}", "scheduled_date": "2025-01-06T08:00:00"}
+            for i, mesocycle_id in enumerate(mesocycle_ids)
+        ]})
+    
+    @pytest.mark.asyncio
+    async def test_errors_map_to_request_positions(self):
+        """Test invalid and rejected items are reported by request index"""
+        mesocycle_id = str(uuid4())
+        # Position 1 never reaches the repository; repository position 1 is request item 2
+        repository = FakeWorkoutRepository(failing={1})
+        api = WorkoutsApiImpl(repository)
+        
+        result = await api.create_workouts_batch(self.request(mesocycle_id, "not-a-uuid", mesocycle_id, mesocycle_id))
+        
+        assert len(repository.saved) == 3
+        assert [(e.index, e.message) for e in result.errors] == [(1, "Invalid mesocycle_id"), (2, "duplicate key")]
+        assert [w.name for w in result.created] == ["Day 0", "Day 3"]
+        assert result.created[0].mesocycle_id == mesocycle_id
@@ -0,0 +1,83 @@
+"""
+Unit Tests for the Dependency Container
+
+Tests for singleton resolution of repositories and API implementations.
+"""
+import pytest
+from fastapi import HTTPException
+
+from api.dependencies import build_container, Container
+from infrastructure.catalog import ExerciseCatalog
+from infrastructure.persistence.repositories import (
+    ExerciseRepository,
+    MesocycleRepository,
+    VersionCounterRepository,
+    WeeklyRollupRepository,
+)
+from openapi_server.apis.exercises_api_base import BaseExercisesApi
+from openapi_server.apis.mesocycles_api_base import BaseMesocyclesApi
+from openapi_server.apis.progression_api_base import BaseProgressionApi
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+
+
+class FakeMesocycleRepository:
+    """Stand-in repository that needs no database"""
+
+
+class TestContainer:
+    """Test Container"""
+    
+    def test_provider_runs_once(self):
+        """Test a provider is only invoked on first resolve"""
+        calls = []
+        container = Container()
+        container.register("thing", lambda c: calls.append(1) or object())
+        
+        first = container.resolve("thing")
+        second = container.resolve("thing")
+        
+        assert first is second
+        assert len(calls) == 1
+    
+    def test_reset_rebuilds(self):
+        """Test reset drops built instances"""
+        container = Container()
+        container.register("thing", lambda c: object())
+        
+        before = container.resolve("thing")
+        container.reset()
+        
+        assert container.resolve("thing") is not before
+    
+    def test_api_impl_is_singleton_with_injected_repository(self):
+        """Test the impl is built once and receives the shared repository"""
+        container = build_container()
+        repository = FakeMesocycleRepository()
+        container.register(MesocycleRepository, lambda c: repository)
+        container.register(ExerciseRepository, lambda c: FakeMesocycleRepository())
+        container.register(WeeklyRollupRepository, lambda c: FakeMesocycleRepository())
+        container.register(VersionCounterRepository, lambda c: FakeMesocycleRepository())
+        
+        api = container.resolve(BaseMesocyclesApi)
+        
+        assert isinstance(api, MesocyclesApiImpl)
+        assert api.repository is repository
+        assert container.resolve(BaseMesocyclesApi) is api
+    
+    def test_exercises_api_reads_from_catalog(self):
+        """Test the exercises impl is wired to the in-memory catalog"""
+        container = build_container()
+        container.register(ExerciseRepository, lambda c: FakeMesocycleRepository())
+        
+        api = container.resolve(BaseExercisesApi)
+        
+        assert api.repository is container.resolve(ExerciseCatalog)
+    
+    def test_missing_implementation(self, monkeypatch):
+        """Test a Base*Api without implementation maps to HTTP 500"""
+        monkeypatch.setattr(BaseProgressionApi, "subclasses", ())
+        container = build_container()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            container.resolve(BaseProgressionApi)
+        assert exc_info.value.status_code == 500
@@ -0,0 +1,167 @@
+"""
+Unit Tests for the Dashboard Cache
+
+Tests for versioned caching, ETags and invalidation by logged sessions.
+"""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from domain.entities.mesocycle import Mesocycle, PeriodizationModel, TrainingGoal
+from domain.entities.weekly_rollup import WeeklyRollup
+from infrastructure.cache import VersionedCache
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.utils.auth import set_current_user_id
+
+
+def make_mesocycle():
+    """A mesocycle of the authenticated user"""
+    user_id = uuid4()
+    set_current_user_id(str(user_id))
+    return Mesocycle.create(
+        user_id=user_id,
+        name="Block",
+        goal=TrainingGoal.STRENGTH,
+        periodization_model=PeriodizationModel.LINEAR,
+        start_date=date(2025, 1, 6),
+        end_date=date(2025, 3, 30),
+        duration_weeks=12,
+        training_level="intermediate",
+        weekly_frequency=4,
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCounters:
+    """Version counter stand-in shared by several caches, counting reads"""
+    
+    def __init__(self):
+        self.versions = {}
+        self.reads = 0
+    
+    async def get(self, key):
+        self.reads += 1
+        return self.versions.get(key, 0)
+    
+    async def increment(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return self.versions[key]
+
+
+class CountingRepository:
+    """Mesocycle and rollup repository stand-in counting reads"""
+    
+    def __init__(self, mesocycle):
+        self.mesocycle = mesocycle
+        self.rollups = []
+        self.reads = 0
+    
+    async def find_by_id(self, mesocycle_id):
+        self.reads += 1
+        return self.mesocycle if mesocycle_id == self.mesocycle.id else None
+    
+    async def find_by_mesocycle(self, mesocycle_id):
+        self.reads += 1
+        return list(self.rollups)
+
+
+class TestVersionedCache:
+    """Test VersionedCache"""
+    
+    @pytest.mark.asyncio
+    async def test_value_is_served_at_its_version(self):
+        """Test a value is returned only for the version it was stored at"""
+        cache = VersionedCache(FakeCounters(), "dashboard")
+        version = await cache.version("m")
+        cache.set("m", version, "body")
+        
+        assert cache.get("m", version) == "body"
+        assert cache.get("m", version + 1) is None
+    
+    @pytest.mark.asyncio
+    async def test_own_bump_applies_immediately(self):
+        """Test a worker sees its own writes without waiting for the TTL"""
+        cache = VersionedCache(FakeCounters(), "dashboard", version_ttl_seconds=60)
+        cache.set("m", await cache.version("m"), "body")
+        
+        await cache.bump("m")
+        
+        assert cache.get("m", await cache.version("m")) is None
+    
+    @pytest.mark.asyncio
+    async def test_other_workers_bump_after_version_ttl(self):
+        """Test another worker's write is seen once the known version expires"""
+        counters, clock = FakeCounters(), FakeClock()
+        reader = VersionedCache(counters, "dashboard", version_ttl_seconds=5, clock=clock)
+        writer = VersionedCache(counters, "dashboard", version_ttl_seconds=5, clock=clock)
+        assert await reader.version("m") == 0
+        
+        await writer.bump("m")
+        
+        assert await reader.version("m") == 0
+        assert counters.reads == 1
+        clock.now = 5.0
+        assert await reader.version("m") == 1
+
+
+class TestDashboardETag:
+    """Test the cached dashboard responses"""
+    
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304_without_reads(self):
+        """Test a revalidation is answered from the cache alone"""
+        mesocycle = make_mesocycle()
+        repository = CountingRepository(mesocycle)
+        api = MesocyclesApiImpl(repository, rollups=repository, dashboard_cache=VersionedCache(FakeCounters(), "dashboard"))
+        
+        first = await api.get_mesocycle_dashboard(str(mesocycle.id))
+        reads = repository.reads
+        again = await api.get_mesocycle_dashboard(str(mesocycle.id), first.headers["etag"])
+        weak = await api.get_mesocycle_dashboard(str(mesocycle.id), 'W/"other", W/' + first.headers["etag"])
+        
+        assert first.status_code == 200
+        assert first.headers["etag"].startswith('"')
+        assert (again.status_code, weak.status_code) == (304, 304)
+        assert again.body == b""
+        assert again.headers["etag"] == first.headers["etag"]
+        assert repository.reads == reads
+    
+    @pytest.mark.asyncio
+    async def test_bump_changes_etag(self):
+        """Test a logged session invalidates the cached dashboard"""
+        mesocycle = make_mesocycle()
+        repository = CountingRepository(mesocycle)
+        cache = VersionedCache(FakeCounters(), "dashboard")
+        api = MesocyclesApiImpl(repository, rollups=repository, dashboard_cache=cache)
+        first = await api.get_mesocycle_dashboard(str(mesocycle.id))
+        
+        repository.rollups.append(
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 1, date(2025, 1, 6), sessions=1, sets=4, volume=1000.0, rpe_sum=32),
+        )
+        await cache.bump(mesocycle.id)
+        second = await api.get_mesocycle_dashboard(str(mesocycle.id), first.headers["etag"])
+        
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
+    
+    @pytest.mark.asyncio
+    async def test_unknown_mesocycle_is_not_cached(self):
+        """Test a missing mesocycle is a 404 each time"""
+        repository = CountingRepository(make_mesocycle())
+        api = MesocyclesApiImpl(repository, rollups=repository, dashboard_cache=VersionedCache(FakeCounters(), "dashboard"))
+        
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await api.get_mesocycle_dashboard(str(uuid4()))
+            assert exc_info.value.status_code == 404
@@ -0,0 +1,52 @@
+"""
+Unit Tests for Database Configuration
+
+Tests for connection pool settings (no MongoDB server required).
+"""
+import pytest
+
+from infrastructure.config.database import MongoDBConfig
+from infrastructure.config.settings import Settings
+
+
+class TestMongoDBConfig:
+    """Test MongoDBConfig"""
+    
+    def test_from_settings(self):
+        """Test pool options are taken from settings"""
+        settings = Settings(
+            mongodb_url="mongodb://db.example:27017",
+            mongodb_database="meso_test",
+            mongodb_min_pool_size=5,
+            mongodb_max_pool_size=50,
+            mongodb_wait_queue_timeout_ms=1500,
+            mongodb_server_selection_timeout_ms=3000,
+        )
+        
+        config = MongoDBConfig.from_settings(settings)
+        
+        assert config.connection_string == "mongodb://db.example:27017"
+        assert config.database_name == "meso_test"
+        assert config.min_pool_size == 5
+        assert config.max_pool_size == 50
+        assert config.wait_queue_timeout_ms == 1500
+        assert config.server_selection_timeout_ms == 3000
+    
+    @pytest.mark.asyncio
+    async def test_connect_applies_pool_options(self):
+        """Test the Motor client is built with the configured pool"""
+        config = MongoDBConfig(min_pool_size=2, max_pool_size=8, wait_queue_timeout_ms=250)
+        
+        await config.connect()
+        try:
+            options = config.client.options.pool_options
+            assert options.min_pool_size == 2
+            assert options.max_pool_size == 8
+            assert options.wait_queue_timeout == 0.25
+        finally:
+            await config.disconnect()
+    
+    def test_database_requires_connect(self):
+        """Test accessing the database before connect fails loudly"""
+        with pytest.raises(RuntimeError, match="Database not connected"):
+            MongoDBConfig().database
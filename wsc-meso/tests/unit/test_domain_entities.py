@@ -11,6 +11,7 @@ from domain.entities.user import User, TrainingLevel
 from domain.entities.mesocycle import Mesocycle, MesocycleStatus, TrainingGoal, PeriodizationModel
 from domain.entities.workout import Workout, TrainingSplit
 from domain.entities.progress import Progress, MetricType
+from domain.entities.training_session import ExercisePerformed, SetColumns, SetPerformed
 
 
 class TestUser:
@@ -203,3 +204,41 @@ class TestProgress:
                 value=-10,  # Invalid
                 unit="kg"
             )
+
+
+class TestSetColumns:
+    """Test SetColumns value object"""
+    
+    def test_vectorized_metrics_match_per_set(self):
+        """Test column math agrees with SetPerformed"""
+        sets = [SetPerformed(100.0, 5, 8, 2), SetPerformed(110.0, 1, 10, 0), SetPerformed(92.5, 8, 7, 3)]
+        columns = SetColumns.from_sets(sets)
+        
+        assert len(columns) == 3
+        assert columns.total_volume() == sum(s.calculate_volume() for s in sets)
+        assert columns.estimate_1rm().tolist() == pytest.approx([s.estimate_1rm() for s in sets])
+        assert columns.max_1rm() == pytest.approx(max(s.estimate_1rm() for s in sets))
+        assert columns.average_rpe() == pytest.approx(25 / 3)
+        assert [vars(s) for s in columns.to_sets()] == [vars(s) for s in sets]
+    
+    def test_set_columns_validation(self):
+        """Test invalid values and read-only arrays"""
+        with pytest.raises(ValueError, match="RPE"):
+            SetColumns([100.0], [5], [11], [0])
+        with pytest.raises(ValueError, match="equal length"):
+            SetColumns([100.0, 90.0], [5], [8], [2])
+        with pytest.raises(ValueError, match="Reps cannot exceed 65535"):
+            SetColumns([100.0], [65536], [8], [2])
+        with pytest.raises(ValueError, match="RIR cannot exceed 255"):
+            SetColumns([100.0], [5], [8], [256])
+        assert SetColumns([100.0], [65535], [8], [255]).reps_in_reserve.tolist() == [255]
+        with pytest.raises(ValueError):
+            SetColumns([100.0], [5], [8], [2]).weight_kg[0] = 0
+    
+    def test_exercise_performed_empty(self):
+        """Test an exercise without sets"""
+        exercise = ExercisePerformed(exercise_id=1, planned_sets=3)
+        
+        assert exercise.get_total_volume() == 0
+        assert exercise.get_average_rpe() == 0.0
+        assert exercise.sets_performed == []
@@ -0,0 +1,203 @@
+"""
+Unit Tests for the Exercise Catalog
+
+Tests for the in-memory exercise repository (no MongoDB server required).
+"""
+import pytest
+
+from domain.entities import Exercise, ExerciseSummary, ExerciseType, MuscleGroup
+from domain.repositories import ReadProfile
+from infrastructure.catalog import CatalogSnapshot, ExerciseCatalog, rank_recommendations
+from infrastructure.persistence.pagination import InvalidCursorError, encode_cursor
+
+
+def make_exercise(exercise_id, name, muscle_group=MuscleGroup.PECTORALS,
+                  exercise_type=ExerciseType.FREE_WEIGHT, difficulty="intermediate", **kwargs):
+    return Exercise(
+        id=exercise_id,
+        name=name,
+        number=str(exercise_id),
+        muscle_group=muscle_group,
+        primary_muscles=["pectoral mayor"],
+        type=exercise_type,
+        difficulty=difficulty,
+        **kwargs,
+    )
+
+
+class FakeSource:
+    """Catalog source backed by a list"""
+    
+    def __init__(self, exercises, version="v1"):
+        self.exercises = exercises
+        self.version = version
+        self.loads = 0
+    
+    async def load_all(self):
+        self.loads += 1
+        return list(self.exercises)
+    
+    async def fingerprint(self):
+        return self.version
+
+
+@pytest.fixture
+def exercises():
+    return [
+        make_exercise(3, "Press de banca"),
+        make_exercise(1, "Aperturas con mancuernas", difficulty="beginner"),
+        make_exercise(2, "Cruce de poleas", exercise_type=ExerciseType.CABLE),
+        make_exercise(4, "Dominadas", MuscleGroup.BACK, ExerciseType.BODYWEIGHT, "advanced",
+                      execution="Tirar hasta pasar la barbilla"),
+        make_exercise(5, "Remo con barra", MuscleGroup.BACK, difficulty="advanced"),
+    ]
+
+
+@pytest.fixture
+async def catalog(exercises):
+    catalog = ExerciseCatalog(FakeSource(exercises))
+    await catalog.reload()
+    return catalog
+
+
+class TestCatalogSnapshot:
+    """Test CatalogSnapshot"""
+    
+    def test_listings_are_in_name_order(self, exercises):
+        """Test every precomputed listing is sorted by (name, id)"""
+        snapshot = CatalogSnapshot(exercises)
+        
+        assert [e.id for e in snapshot.select()] == [1, 2, 4, 3, 5]
+        assert [e.id for e in snapshot.by_muscle_group(MuscleGroup.BACK)] == [4, 5]
+        assert [e.id for e in snapshot.by_type(ExerciseType.CABLE)] == [2]
+        assert [e.id for e in snapshot.select(MuscleGroup.PECTORALS, ExerciseType.FREE_WEIGHT)] == [1, 3]
+        assert [e.id for e in snapshot.by_difficulty["advanced"]] == [4, 5]
+        assert snapshot.select(MuscleGroup.LEGS) == ()
+    
+    def test_is_read_only(self, exercises):
+        """Test the indexes cannot be modified in place"""
+        snapshot = CatalogSnapshot(exercises)
+        
+        with pytest.raises(TypeError):
+            snapshot.by_id[99] = exercises[0]
+        with pytest.raises(AttributeError):
+            snapshot.extra = 1
+
+
+class TestRecommendations:
+    """Test recommendation ranking"""
+    
+    def test_difficulty_fit_then_compound(self):
+        """Test exact difficulty wins and compound movements break ties"""
+        isolation = make_exercise(1, "Aperturas", difficulty="intermediate")
+        compound = make_exercise(2, "Press de banca", difficulty="intermediate",
+                                 secondary_muscles=["tríceps"])
+        too_hard = make_exercise(3, "Fondos lastrados", difficulty="elite",
+                                 secondary_muscles=["tríceps"])
+        
+        ranked = rank_recommendations([isolation, too_hard, compound], "intermediate")
+        
+        assert [e.id for e in ranked] == [2, 1, 3]
+    
+    def test_type_diversity(self):
+        """Test a second exercise of the same type yields to another type"""
+        exercises = [
+            make_exercise(1, "Press con barra"),
+            make_exercise(2, "Press con mancuernas"),
+            make_exercise(3, "Contractora", exercise_type=ExerciseType.MACHINE),
+        ]
+        
+        ranked = rank_recommendations(exercises, "intermediate")
+        
+        assert [e.id for e in ranked] == [1, 3, 2]
+    
+    def test_precomputed_for_every_group_and_level(self, exercises):
+        """Test lists exist for each (group, level) and cover the whole group"""
+        snapshot = CatalogSnapshot(exercises)
+        
+        assert len(snapshot.recommendations) == len(MuscleGroup) * 4
+        assert [e.id for e in snapshot.recommended(MuscleGroup.BACK, "advanced")] == [4, 5]
+        assert snapshot.recommended(MuscleGroup.LEGS, "beginner") == ()
+
+
+class TestExerciseCatalog:
+    """Test ExerciseCatalog"""
+    
+    @pytest.mark.asyncio
+    async def test_find_by_id(self, catalog):
+        """Test lookups by id"""
+        assert (await catalog.find_by_id(4)).name == "Dominadas"
+        assert await catalog.find_by_id(99) is None
+    
+    @pytest.mark.asyncio
+    async def test_page_with_total_and_summary_profile(self, catalog):
+        """Test offset pages carry the exact total and summaries"""
+        page = await catalog.find_page_with_total(
+            muscle_group=MuscleGroup.PECTORALS, limit=2, offset=0, profile=ReadProfile.SUMMARY
+        )
+        
+        assert page.total == 3
+        assert [e.id for e in page.items] == [1, 2]
+        assert all(isinstance(e, ExerciseSummary) for e in page.items)
+        assert page.has_more
+    
+    @pytest.mark.asyncio
+    async def test_cursor_walks_listing(self, catalog):
+        """Test following cursors visits each exercise exactly once"""
+        seen, cursor = [], None
+        while True:
+            page = await catalog.find_page(limit=2, cursor=cursor)
+            seen.extend(e.id for e in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert seen == [1, 2, 4, 3, 5]
+    
+    @pytest.mark.asyncio
+    async def test_cursor_compatible_with_mongo_encoding(self, catalog):
+        """Test a cursor built like the MongoDB repository's resumes correctly"""
+        page = await catalog.find_page(limit=10, cursor=encode_cursor("name", "Cruce de poleas", 2))
+        
+        assert [e.id for e in page.items] == [4, 3, 5]
+        assert page.next_cursor is None
+    
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, catalog):
+        """Test cursors of another listing are rejected"""
+        with pytest.raises(InvalidCursorError):
+            await catalog.find_page(cursor=encode_cursor("created_at", "x", 1))
+    
+    @pytest.mark.asyncio
+    async def test_search(self, catalog):
+        """Test case-insensitive search over name and execution"""
+        names = [e.name for e in await catalog.search("BARBILLA")]
+        
+        assert names == ["Dominadas"]
+    
+    @pytest.mark.asyncio
+    async def test_recommended_has_no_duplicates(self, catalog):
+        """Test the closest difficulty comes first and nothing repeats"""
+        recommended = await catalog.find_recommended_by_muscle_group(MuscleGroup.PECTORALS, "beginner")
+        
+        assert [e.id for e in recommended] == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_refresh_swaps_snapshot_on_version_change(self, exercises):
+        """Test a new fingerprint triggers a reload and an atomic swap"""
+        source = FakeSource(exercises)
+        catalog = ExerciseCatalog(source)
+        await catalog.reload()
+        before = catalog.snapshot
+        
+        assert await catalog.refresh() is False
+        
+        source.exercises = exercises + [make_exercise(6, "Fondos en paralelas", MuscleGroup.TRICEPS)]
+        source.version = "v2"
+        assert await catalog.refresh() is True
+        
+        assert source.loads == 2
+        assert catalog.version == "v2"
+        assert await catalog.count() == 6
+        # Readers holding the old snapshot keep a consistent view
+        assert len(before) == 5
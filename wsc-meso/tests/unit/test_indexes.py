@@ -0,0 +1,120 @@
+"""
+Unit Tests for the Index Registry
+
+Tests that every declared query shape is served by a registered index.
+"""
+import pytest
+
+import infrastructure.persistence.repositories  # noqa: F401  (registers query shapes)
+from infrastructure.persistence.indexes import (
+    MIGRATIONS,
+    QUERY_SHAPES,
+    IndexSpec,
+    QueryShape,
+    covering_index,
+    plan_stages,
+    supports,
+    target_indexes,
+    uncovered_shapes,
+)
+
+
+class TestRegistry:
+    """Test migrations and declared shapes"""
+    
+    def test_versions_increase(self):
+        """Test migrations are numbered strictly increasing from 1"""
+        versions = [m.version for m in MIGRATIONS]
+        
+        assert versions == list(range(1, len(versions) + 1))
+    
+    def test_drops_reference_existing_indexes(self):
+        """Test every drop names an index created by an earlier migration"""
+        created = set()
+        for migration in MIGRATIONS:
+            for collection, name in migration.drop:
+                assert (collection, name) in created
+            created |= {(spec.collection, spec.name) for spec in migration.create}
+    
+    def test_every_repository_collection_declares_shapes(self):
+        """Test each repository registered its query shapes"""
+        collections = {shape.collection for shape in QUERY_SHAPES}
+        
+        assert collections == {
+            "users", "exercises", "mesocycles", "workouts", "progress", "training_sessions", "exercise_states",
+            "weekly_rollups", "daily_rollups", "version_counters", "progress_timeseries",
+        }
+    
+    def test_all_shapes_covered(self):
+        """Test no declared shape needs a collection scan or in-memory sort"""
+        missing = [f"{s.source}: {s}" for s in uncovered_shapes()]
+        
+        assert missing == []
+    
+    def test_unindexed_shape_is_reported(self):
+        """Test the check notices a shape without a matching index"""
+        shape = QueryShape("workouts", equality=("name",), sort=(("scheduled_date", -1),))
+        
+        assert uncovered_shapes([shape]) == [shape]
+    
+    def test_target_excludes_dropped(self):
+        """Test dropped indexes are not part of the final state"""
+        names = {spec.name for spec in target_indexes()["workouts"]}
+        
+        assert "mesocycle_id_1" not in names
+        assert "mesocycle_id_1_scheduled_date_-1__id_-1" in names
+    
+    def test_user_listing_needs_username_id_index(self):
+        """Test the unique username index alone leaves the user listing sort uncovered"""
+        shape = QueryShape("users", sort=(("username", 1), ("_id", 1)))
+        unique_only = [spec for spec in target_indexes()["users"] if spec.name != "username_1__id_1"]
+        
+        assert covering_index(shape, unique_only) is None
+        assert covering_index(shape, target_indexes()["users"]).name == "username_1__id_1"
+
+
+class TestSupports:
+    """Test the equality-sort-range rule"""
+    
+    INDEX = IndexSpec("progress", (("user_id", 1), ("date", -1), ("_id", -1)))
+    
+    @pytest.mark.parametrize("shape", [
+        QueryShape("progress", equality=("user_id",)),
+        QueryShape("progress", equality=("user_id",), sort=(("date", -1), ("_id", -1))),
+        QueryShape("progress", equality=("user_id",), sort=(("date", 1), ("_id", 1))),
+        QueryShape("progress", equality=("user_id",), sort=(("date", -1),), range=("date",)),
+        QueryShape("progress", equality=("user_id",), range=("date",)),
+        QueryShape("progress", equality=("user_id",), sort=(("date", -1),), residual=("unit",)),
+    ])
+    def test_supported(self, shape):
+        """Test shapes the index serves"""
+        assert supports(self.INDEX, shape)
+    
+    @pytest.mark.parametrize("shape", [
+        QueryShape("progress", equality=("metric_type",)),
+        QueryShape("progress", sort=(("date", -1),)),
+        QueryShape("progress", equality=("user_id",), sort=(("date", -1), ("_id", 1))),
+        QueryShape("progress", equality=("user_id",), sort=(("created_at", -1),)),
+        QueryShape("progress", equality=("user_id", "metric_type"), sort=(("date", -1),)),
+    ])
+    def test_unsupported(self, shape):
+        """Test shapes that would scan or sort in memory"""
+        assert not supports(self.INDEX, shape)
+
+
+def test_plan_stages_walks_nested_plans():
+    """Test explain() plans are flattened, including classic and SBE layouts"""
+    plan = {
+        "queryPlan": {
+            "stage": "LIMIT",
+            "inputStage": {
+                "stage": "SORT",
+                "inputStage": {"stage": "OR", "inputStages": [
+                    {"stage": "IXSCAN"},
+                    {"stage": "COLLSCAN"},
+                ]},
+            },
+        },
+    }
+    
+    assert sorted(plan_stages(plan)) == ["COLLSCAN", "IXSCAN", "LIMIT", "OR", "SORT"]
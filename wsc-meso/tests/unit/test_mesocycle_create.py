@@ -0,0 +1,67 @@
+"""
+Unit Tests for Mesocycle Creation
+
+Tests that create_mesocycle derives the duration from the dates and turns
+invalid spans into 400s.
+"""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.models.mesocycle_create import MesocycleCreate
+from openapi_server.utils.auth import set_current_user_id
+
+
+class FakeMesocycleRepository:
+    """Repository stand-in keeping saved mesocycles"""
+    
+    def __init__(self):
+        self.saved = []
+    
+    async def save(self, mesocycle):
+        self.saved.append(mesocycle)
+        return mesocycle
+
+
+def make_api() -> MesocyclesApiImpl:
+    set_current_user_id(str(uuid4()))
+    return MesocyclesApiImpl(FakeMesocycleRepository())
+
+
+def request(start_date, end_date) -> MesocycleCreate:
+    return MesocycleCreate(name="Block", goal="strength", start_date=start_date, end_date=end_date, weekly_frequency=4)
+
+
+class TestCreateMesocycle:
+    """Test MesocyclesApiImpl.create_mesocycle"""
+    
+    @pytest.mark.asyncio
+    async def test_duration_from_dates(self):
+        """Test a partial last week counts as a week"""
+        api = make_api()
+        
+        result = await api.create_mesocycle(request(date(2025, 1, 6), date(2025, 3, 5)))
+        
+        assert result.duration_weeks == 9
+        assert api.repository.saved[0].duration_weeks == 9
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("end_date, detail", [
+        (date(2025, 1, 26), "spans 3 weeks"),
+        (date(2025, 5, 5), "spans 18 weeks"),
+        (date(2025, 1, 6), "end_date must be after start_date"),
+        (date(2024, 12, 30), "end_date must be after start_date"),
+    ])
+    async def test_invalid_span_is_400(self, end_date, detail):
+        """Test too short, too long and reversed spans are rejected before saving"""
+        api = make_api()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await api.create_mesocycle(request(date(2025, 1, 6), end_date))
+        
+        assert exc_info.value.status_code == 400
+        assert detail in exc_info.value.detail
+        assert api.repository.saved == []
@@ -0,0 +1,187 @@
+"""
+Unit Tests for Keyset Pagination
+
+Tests for cursor encoding, the keyset predicate and the $facet pipeline.
+"""
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+
+from domain.repositories import Page
+from infrastructure.persistence.pagination import (
+    ASCENDING,
+    DESCENDING,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    filter_key,
+    keyset_filter,
+    page_with_total_pipeline,
+)
+
+
+class TestCursor:
+    """Test cursor encoding"""
+    
+    @pytest.mark.parametrize("value", [
+        datetime(2024, 5, 1, 12, 30, 15, 123000),
+        "Press banca",
+        42,
+        1.5,
+        None,
+    ])
+    def test_round_trip(self, value):
+        """Test sort key and _id survive encoding"""
+        doc_id = uuid4()
+        token = encode_cursor("created_at", value, doc_id)
+        
+        assert decode_cursor(token, "created_at") == (value, doc_id)
+    
+    def test_date_decodes_as_datetime(self):
+        """Test date values come back the way BSON stores them"""
+        token = encode_cursor("date", date(2024, 5, 1), 7)
+        
+        assert decode_cursor(token, "date") == (datetime(2024, 5, 1), 7)
+    
+    def test_token_is_url_safe(self):
+        """Test tokens can be passed as query parameters unescaped"""
+        token = encode_cursor("name", "Sentadilla ¿?&=", uuid4())
+        
+        assert set(token) <= set(
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+        )
+    
+    @pytest.mark.parametrize("token", ["", "not-base64!", "e30", "bm9wZQ"])
+    def test_malformed(self, token):
+        """Test garbage tokens are rejected"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "name")
+    
+    def test_other_listing(self):
+        """Test a cursor from another listing is rejected"""
+        token = encode_cursor("scheduled_date", datetime(2024, 1, 1), uuid4())
+        
+        with pytest.raises(InvalidCursorError, match="different listing"):
+            decode_cursor(token, "created_at")
+
+
+class TestKeysetFilter:
+    """Test keyset predicate"""
+    
+    def test_descending(self):
+        """Test descending order resumes below the last key"""
+        when = datetime(2024, 1, 1)
+        
+        assert keyset_filter("created_at", DESCENDING, when, 5) == {
+            "$or": [
+                {"created_at": {"$lt": when}},
+                {"created_at": when, "_id": {"$lt": 5}},
+                {"created_at": None},
+            ]
+        }
+    
+    def test_ascending(self):
+        """Test ascending order resumes above the last key"""
+        assert keyset_filter("name", ASCENDING, "Curl", 3) == {
+            "$or": [
+                {"name": {"$gt": "Curl"}},
+                {"name": "Curl", "_id": {"$gt": 3}},
+            ]
+        }
+    
+    def test_missing_sort_value(self):
+        """Test a null key resumes within the null run, then past it when ascending"""
+        assert keyset_filter("name", ASCENDING, None, 3) == {
+            "$or": [
+                {"name": None, "_id": {"$gt": 3}},
+                {"name": {"$ne": None}},
+            ]
+        }
+        assert keyset_filter("name", DESCENDING, None, 3) == {"name": None, "_id": {"$lt": 3}}
+    
+    @pytest.mark.parametrize("direction", [ASCENDING, DESCENDING])
+    def test_pages_through_null_keys(self, direction):
+        """Test paging two at a time visits every document once with nulls sorted first"""
+        docs = [{"_id": 1, "name": "Press"}, {"_id": 2}, {"_id": 3, "name": "Curl"}, {"_id": 4, "name": None},
+                {"_id": 5, "name": "Curl"}, {"_id": 6}, {"_id": 7, "name": "Remo"}]
+        ordered = sorted(docs, key=lambda doc: (doc.get("name") is not None, doc.get("name") or "", doc["_id"]),
+                         reverse=direction == DESCENDING)
+        
+        seen, query = [], {}
+        while True:
+            page = [doc for doc in ordered if matches(doc, query)][:2]
+            if not page:
+                break
+            seen += [doc["_id"] for doc in page]
+            query = keyset_filter("name", direction, page[-1].get("name"), page[-1]["_id"])
+        
+        assert seen == [doc["_id"] for doc in ordered]
+
+
+def matches(doc, query):
+    """Evaluate the subset of the query language keyset_filter emits"""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(doc, branch) for branch in condition):
+                return False
+            continue
+        value = doc.get(field)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        for op, operand in condition.items():
+            if op == "$ne":
+                ok = value != operand
+            else:
+                # Comparisons never match null
+                ok = value is not None and (value > operand if op == "$gt" else value < operand)
+            if not ok:
+                return False
+    return True
+
+
+def test_page_has_more():
+    """Test Page reports a following page only when a cursor is present"""
+    assert Page(items=[1], next_cursor="abc").has_more
+    assert not Page(items=[1]).has_more
+
+
+class TestPageWithTotalPipeline:
+    """Test the $facet listing pipeline"""
+    
+    def test_match_and_sort_precede_facet(self):
+        """Test index-usable stages run before $facet"""
+        pipeline = page_with_total_pipeline({"user_id": 1}, "date", DESCENDING, 20, offset=40)
+        
+        assert pipeline == [
+            {"$match": {"user_id": 1}},
+            {"$sort": {"date": -1, "_id": -1}},
+            {"$facet": {
+                "items": [{"$skip": 40}, {"$limit": 21}],
+                "total": [{"$count": "n"}],
+            }},
+        ]
+    
+    def test_first_page_has_no_skip(self):
+        """Test offset 0 adds no $skip stage"""
+        pipeline = page_with_total_pipeline({}, "name", ASCENDING, 10)
+        
+        assert pipeline[-1]["$facet"]["items"] == [{"$limit": 11}]
+    
+    def test_filter_key_is_order_independent(self):
+        """Test equal filters share a cache key regardless of key order"""
+        user_id = uuid4()
+        
+        assert filter_key("progress", {"user_id": user_id, "metric_type": "weight"}) == \
+            filter_key("progress", {"metric_type": "weight", "user_id": user_id})
+        assert filter_key("progress", {"user_id": user_id}) != \
+            filter_key("workouts", {"user_id": user_id})
+    
+    def test_projection_keeps_sort_field(self):
+        """Test a projected listing still returns the cursor's sort key"""
+        pipeline = page_with_total_pipeline({}, "name", ASCENDING, 10, projection={"type": 1})
+        
+        assert pipeline[2] == {"$project": {"type": 1, "name": 1}}
+        assert "$facet" in pipeline[3]
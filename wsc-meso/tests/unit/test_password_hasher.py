@@ -0,0 +1,122 @@
+"""
+Unit Tests for the Password Hasher
+
+Tests for the bounded bcrypt pool and its use by the authentication API.
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from domain.entities.user import User
+from infrastructure.security import HasherBusyError, PasswordHasher, hash_password
+from infrastructure.security import password_hasher
+from openapi_server.impl.authentication_impl import AuthenticationApiImpl
+from openapi_server.models.user_login import UserLogin
+
+
+class FakeUserRepository:
+    """In-memory user repository"""
+    
+    def __init__(self, user: User):
+        self.user = user
+        self.updated = []
+    
+    async def find_by_email(self, email: str):
+        return self.user if email == self.user.email else None
+    
+    async def update(self, user: User) -> User:
+        self.updated.append(user.hashed_password)
+        return user
+
+
+@pytest.fixture
+def blocked(monkeypatch):
+    """Make password checks wait until the returned event is set"""
+    release = threading.Event()
+    
+    def verify(plain_password, hashed_password):
+        release.wait(5)
+        return True
+    
+    monkeypatch.setattr(password_hasher, "verify_password", verify)
+    yield release
+    release.set()
+
+
+class TestPasswordHasher:
+    """Test PasswordHasher"""
+    
+    @pytest.mark.asyncio
+    async def test_hash_uses_configured_rounds(self):
+        """Test hashes carry the configured cost and verify"""
+        hasher = PasswordHasher(rounds=5)
+        hashed = await hasher.hash("s3cret")
+        
+        assert hashed.startswith("$2b$05$")
+        assert await hasher.verify("s3cret", hashed)
+        assert not await hasher.verify("wrong", hashed)
+        assert not hasher.needs_rehash(hashed)
+        assert hasher.needs_rehash(hash_password("s3cret", rounds=4))
+        hasher.close()
+    
+    @pytest.mark.asyncio
+    async def test_rejects_beyond_max_pending(self, blocked):
+        """Test a full backlog fails at once and frees up when work finishes"""
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=2)
+        first = asyncio.ensure_future(hasher.verify("a", "hash"))
+        second = asyncio.ensure_future(hasher.verify("b", "hash"))
+        await asyncio.sleep(0)
+        
+        assert hasher.pending == 2
+        with pytest.raises(HasherBusyError):
+            await hasher.verify("c", "hash")
+        
+        blocked.set()
+        assert await asyncio.gather(first, second) == [True, True]
+        assert hasher.pending == 0
+        hasher.close()
+    
+    def test_rejects_invalid_rounds(self):
+        """Test bcrypt's cost bounds are enforced"""
+        with pytest.raises(ValueError):
+            PasswordHasher(rounds=3)
+
+
+class TestLogin:
+    """Test the authentication API with the hasher"""
+    
+    @staticmethod
+    def _user(rounds: int) -> User:
+        return User.create(email="a@example.com", username="a", hashed_password=hash_password("s3cret", rounds))
+    
+    @pytest.mark.asyncio
+    async def test_busy_hasher_returns_503(self, blocked):
+        """Test logins beyond the backlog get 503 with Retry-After"""
+        hasher = PasswordHasher(rounds=4, workers=1, max_pending=1)
+        api = AuthenticationApiImpl(FakeUserRepository(self._user(4)), hasher)
+        pending = asyncio.ensure_future(hasher.verify("a", "hash"))
+        await asyncio.sleep(0)
+        
+        with pytest.raises(HTTPException) as e:
+            await api.login_user(UserLogin(email="a@example.com", password="s3cret"))
+        
+        assert e.value.status_code == 503
+        assert e.value.headers["Retry-After"] == "1"
+        blocked.set()
+        await pending
+        hasher.close()
+    
+    @pytest.mark.asyncio
+    async def test_login_upgrades_hash_cost(self):
+        """Test a hash made at another cost is replaced after a good login"""
+        repository = FakeUserRepository(self._user(4))
+        api = AuthenticationApiImpl(repository, PasswordHasher(rounds=5))
+        
+        token = await api.login_user(UserLogin(email="a@example.com", password="s3cret"))
+        
+        assert token.access_token
+        assert len(repository.updated) == 1
+        assert repository.updated[0].startswith("$2b$05$")
+        api.hasher.close()
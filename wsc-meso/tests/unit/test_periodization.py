@@ -0,0 +1,222 @@
+"""
+Unit Tests for the Periodization Engine
+
+Tests for plan generation per periodization model and the generate endpoint.
+"""
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from domain.entities import Exercise, ExerciseType, MuscleGroup, TrainingPhase
+from domain.entities.mesocycle import PeriodizationModel, TrainingGoal
+from domain.entities.workout import TrainingSplit
+from domain.services import default_deload_weeks, freeze_exercise_pool, generate_plan, materialize_plan
+from infrastructure.catalog import ExerciseCatalog
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.models.generate_ai_mesocycle_request import GenerateAIMesocycleRequest
+from openapi_server.utils.auth import set_current_user_id
+
+
+def plan(model=PeriodizationModel.LINEAR, goal=TrainingGoal.STRENGTH, level="intermediate", weeks=12, days=4, **kwargs):
+    return generate_plan(model, goal, level, weeks, days, **kwargs)
+
+
+class FakeMesocycleRepository:
+    """Repository stand-in that keeps saved mesocycles in a dict"""
+    
+    def __init__(self):
+        self.mesocycles = {}
+    
+    async def save(self, mesocycle):
+        self.mesocycles[mesocycle.id] = mesocycle
+        return mesocycle
+    
+    async def find_by_id(self, mesocycle_id):
+        return self.mesocycles.get(mesocycle_id)
+
+
+class FakeSource:
+    """Catalog source with a few exercises per muscle group"""
+    
+    def __init__(self):
+        self.exercises = [
+            Exercise(id=10 * i + j, name=f"{group.value} {j}", number=str(10 * i + j), muscle_group=group,
+                     primary_muscles=[group.value], type=ExerciseType.FREE_WEIGHT)
+            for i, group in enumerate(MuscleGroup, start=1) for j in range(3)
+        ]
+    
+    async def load_all(self):
+        return self.exercises
+    
+    async def fingerprint(self):
+        return "v1"
+
+
+class TestGeneratePlan:
+    """Test generate_plan"""
+    
+    def test_shape(self):
+        """Test one week per microcycle and one day per training session"""
+        result = plan(weeks=16, days=6, level="advanced")
+        
+        assert len(result.weeks) == 16
+        assert all(len(week.days) == 6 for week in result.weeks)
+        assert result.grid.intensity.shape == (16, 6, 6)
+        assert [day.day_of_week for day in result.weeks[0].days] == [1, 2, 3, 4, 5, 6]
+        assert [day.split for day in result.weeks[0].days][:3] == [
+            TrainingSplit.PUSH, TrainingSplit.PULL, TrainingSplit.LEGS,
+        ]
+    
+    def test_linear_intensity_rises_and_volume_falls(self):
+        """Test linear plans load up week over week outside deloads"""
+        result = plan(deload_weeks=[])
+        main_lift = result.grid.intensity[:, 0, 0]
+        
+        assert np.all(np.diff(main_lift) > 0)
+        assert result.grid.sets[0].sum() > result.grid.sets[-1].sum()
+        assert result.weeks[0].phase is TrainingPhase.ACCUMULATION
+        assert result.weeks[-1].phase is TrainingPhase.REALIZATION
+    
+    def test_daily_undulating_varies_within_week(self):
+        """Test DUP alternates heavy, moderate and light days"""
+        result = plan(PeriodizationModel.DAILY_UNDULATING, days=3)
+        heavy, moderate, light = result.grid.intensity[0, :, 0]
+        
+        assert heavy > moderate > light
+    
+    def test_block_phases_are_contiguous(self):
+        """Test block periodization steps up between phases"""
+        result = plan(PeriodizationModel.BLOCK, deload_weeks=[])
+        phases = [week.phase for week in result.weeks]
+        main_lift = result.grid.intensity[:, 0, 0]
+        
+        assert phases == sorted(phases, key=[
+            TrainingPhase.ACCUMULATION, TrainingPhase.TRANSMUTATION, TrainingPhase.REALIZATION,
+        ].index)
+        assert np.all(np.diff(main_lift) > 0)
+    
+    def test_polarized_has_one_hard_day(self):
+        """Test polarized weeks are mostly easy with a single hard day"""
+        result = plan(PeriodizationModel.POLARIZED, days=5)
+        week = result.grid.intensity[0, :, 0]
+        
+        assert np.sum(week == week.max()) == 1
+        assert week.max() - np.median(week) > 0.1
+    
+    def test_deload_weeks(self):
+        """Test deload weeks cut sets and intensity and raise RIR"""
+        result = plan(deload_weeks=[4])
+        
+        assert result.weeks[3].phase is TrainingPhase.DELOAD
+        assert result.grid.sets[3].sum() < result.grid.sets[2].sum()
+        assert result.grid.intensity[3, 0, 0] < result.grid.intensity[2, 0, 0]
+        assert result.weeks[3].rir > result.weeks[2].rir
+        assert default_deload_weeks(12) == [4, 8, 12]
+    
+    def test_prescriptions_within_goal(self):
+        """Test reps stay in the goal's range and the grid is read-only"""
+        result = plan(goal=TrainingGoal.HYPERTROPHY)
+        
+        for week in result.weeks:
+            for day in week.days:
+                main = day.exercises[0]
+                low, high = map(int, main.reps.split("-"))
+                assert 6 <= low < high <= 12
+                assert 1 <= main.sets <= 6
+        assert not result.grid.sets.flags.writeable
+    
+    def test_exercise_pool_rotation(self):
+        """Test repeated splits take the next exercises of the pool"""
+        pool = {split: list(range(100 * i, 100 * i + 20)) for i, split in enumerate(TrainingSplit)}
+        result = plan(days=6, level="intermediate", exercise_pool=pool)
+        first_push, second_push = result.weeks[0].days[0], result.weeks[0].days[3]
+        
+        assert [p.exercise_id for p in first_push.exercises] == pool[TrainingSplit.PUSH][:5]
+        assert [p.exercise_id for p in second_push.exercises] == pool[TrainingSplit.PUSH][5:10]
+    
+    def test_deterministic(self):
+        """Test the same inputs give the same plan"""
+        assert plan().weeks == plan().weeks
+    
+    def test_invalid_frequency(self):
+        """Test frequencies outside 3-6 are rejected"""
+        with pytest.raises(ValueError):
+            plan(days=7)
+
+
+class TestMaterializePlan:
+    """Test the memoized plan and its immutable microcycles"""
+    
+    def test_same_parameters_share_one_plan(self):
+        """Test equal parameters return the cached instance"""
+        pool = freeze_exercise_pool({TrainingSplit.UPPER: [1, 2], TrainingSplit.LOWER: [3]})
+        args = (PeriodizationModel.BLOCK, TrainingGoal.POWER, "advanced", 10, 4, (4, 8), pool)
+        
+        first = materialize_plan(*args)
+        hits = materialize_plan.cache_info().hits
+        
+        assert materialize_plan(*args) is first
+        assert materialize_plan.cache_info().hits == hits + 1
+        assert materialize_plan(*args[:-1]) is not first
+    
+    def test_microcycles_are_immutable(self):
+        """Test shared microcycles and intensity ranges cannot be modified"""
+        microcycle = materialize_plan(
+            PeriodizationModel.LINEAR, TrainingGoal.STRENGTH, "intermediate", 8, 3, (4, 8),
+        ).microcycles[0]
+        
+        with pytest.raises(AttributeError):
+            microcycle.rir = 0
+        with pytest.raises(AttributeError):
+            microcycle.intensity_range.max_pct = 1.0
+        assert microcycle.mesocycle_id is None
+
+
+class TestGenerateAIMesocycle:
+    """Test MesocyclesApiImpl.generate_ai_mesocycle"""
+    
+    @pytest.mark.asyncio
+    async def test_uses_request_parameters(self):
+        """Test goal, model and frequency drive the generated mesocycle"""
+        set_current_user_id(str(uuid4()))
+        catalog = ExerciseCatalog(FakeSource())
+        await catalog.reload()
+        api = MesocyclesApiImpl(FakeMesocycleRepository(), exercises=catalog)
+        request = GenerateAIMesocycleRequest.from_dict({
+            "goal": "hypertrophy", "duration_weeks": 8, "periodization_model": "block", "weekly_frequency": 3,
+        })
+        
+        result = await api.generate_ai_mesocycle(request)
+        
+        assert result.goal.value == "hypertrophy"
+        assert result.periodization_model.value == "block"
+        assert result.weekly_frequency == 3
+        assert result.deload_weeks == [4, 8]
+        assert len(result.microcycles) == 8
+        assert result.microcycles[0].mesocycle_id == result.id
+        assert [day.split.value for day in result.weekly_structure] == ["fullbody"] * 3
+        # Fullbody days interleave legs, pectorals, back and shoulders
+        exercise_ids = [e.exercise_id for e in result.weekly_structure[0].exercises]
+        assert [exercise_id // 10 for exercise_id in exercise_ids] == [7, 1, 2, 3, 7]
+    
+    @pytest.mark.asyncio
+    async def test_get_microcycle(self):
+        """Test a generated mesocycle's microcycle comes with its training days"""
+        set_current_user_id(str(uuid4()))
+        repository = FakeMesocycleRepository()
+        api = MesocyclesApiImpl(repository)
+        created = await api.generate_ai_mesocycle(GenerateAIMesocycleRequest.from_dict({
+            "goal": "strength", "duration_weeks": 12, "periodization_model": "linear", "weekly_frequency": 4,
+        }))
+        
+        result = await api.get_microcycle(created.id, 4, None)
+        
+        assert result.microcycle.phase.value == "deload"
+        assert result.microcycle.mesocycle_id == created.id
+        assert [day.day_of_week for day in result.training_days] == [1, 2, 4, 5]
+        assert result.intensity_guidelines.endswith(f"RIR {result.microcycle.rir}")
+        with pytest.raises(HTTPException) as exc_info:
+            await api.get_microcycle(created.id, 13, None)
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,185 @@
+"""
+Unit Tests for Progress Analytics
+
+Tests for LTTB downsampling, the robust trend, moving averages and the
+analytics endpoint.
+"""
+from datetime import date, datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from api.dependencies import get_progress_api
+from domain.entities.progress import ProgressSeries
+from domain.services.analytics import analyze_series, classify_trend, lttb, moving_average, robust_slope
+from openapi_server.impl.progress_impl import ProgressApiImpl
+from openapi_server.utils.auth import create_access_token, set_current_user_id
+
+
+def daily_series(values, first=date(2025, 1, 1)):
+    start = np.datetime64(first, "D").astype(np.int64)
+    return ProgressSeries(np.arange(start, start + len(values)), values)
+
+
+class FakeProgressRepository:
+    """Progress repository stand-in holding one user's series"""
+    
+    def __init__(self, series, user_id=None):
+        self.series = series
+        self.user_id = user_id or uuid4()
+        self.calls = []
+        set_current_user_id(str(self.user_id))
+    
+    async def find_series(self, user_id, metric_type, start_date=None, end_date=None):
+        self.calls.append((metric_type, start_date, end_date))
+        if user_id != self.user_id:
+            return daily_series(np.array([]))
+        return self.series
+
+
+class TestProgressSeries:
+    """Test ProgressSeries"""
+    
+    def test_from_points_round_trips_dates(self):
+        """Test dates and datetimes map to days and back"""
+        series = ProgressSeries.from_points([date(2025, 1, 1), datetime(2025, 1, 3)], [80.0, 79.5])
+        
+        assert series.dates() == [date(2025, 1, 1), date(2025, 1, 3)]
+        assert series.dates(np.array([1])) == [date(2025, 1, 3)]
+        assert not series.values.flags.writeable
+
+
+class TestLTTB:
+    """Test Largest-Triangle-Three-Buckets downsampling"""
+    
+    def test_short_series_is_kept(self):
+        """Test a series within the budget is returned whole"""
+        x = np.arange(10.0)
+        
+        assert lttb(x, x, 10).tolist() == list(range(10))
+        assert lttb(x, x, 50).tolist() == list(range(10))
+    
+    def test_budget_endpoints_and_spikes(self):
+        """Test the budget is met, the endpoints kept and an isolated spike survives"""
+        x = np.arange(1000.0)
+        y = np.zeros(1000)
+        y[437] = 50.0
+        
+        indices = lttb(x, y, 20)
+        
+        assert len(indices) == 20
+        assert indices[0] == 0 and indices[-1] == 999
+        assert 437 in indices
+        assert np.all(np.diff(indices) > 0)
+    
+    def test_large_buckets_match_small_bucket_path(self):
+        """Test the NumPy and plain Python bucket scans pick the same points"""
+        rng = np.random.default_rng(0)
+        x = np.arange(20_000.0)
+        y = np.cumsum(rng.normal(size=20_000))
+        
+        coarse = lttb(x, y, 100)  # about 200 points a bucket
+        fine = lttb(x[:2000], y[:2000], 100)  # about 20
+        
+        assert len(coarse) == len(fine) == 100
+        assert np.all(np.diff(coarse) > 0)
+
+
+class TestTrend:
+    """Test the robust fit and trend classification"""
+    
+    def test_slope_ignores_outliers(self):
+        """Test a few gross errors barely move the Huber fit"""
+        rng = np.random.default_rng(1)
+        x = np.arange(365.0)
+        y = 80 - 0.01 * x + rng.normal(0, 0.3, 365)
+        y[-40::4] += 400  # mistyped entries near the end
+        
+        assert robust_slope(x, y) == pytest.approx(-0.01, abs=0.002)
+        assert np.polyfit(x, y, 1)[0] > 0  # least squares is dragged upwards
+    
+    def test_degenerate_series(self):
+        """Test one point or a single day has no slope"""
+        assert robust_slope(np.array([1.0]), np.array([80.0])) == 0.0
+        assert robust_slope(np.array([5.0, 5.0]), np.array([80.0, 81.0])) == 0.0
+    
+    def test_classify(self):
+        """Test changes within 1% of the level are stable"""
+        assert classify_trend(0.001, 300, 80.0) == "stable"
+        assert classify_trend(0.01, 300, 80.0) == "increasing"
+        assert classify_trend(-0.01, 300, 80.0) == "decreasing"
+
+
+class TestMovingAverage:
+    """Test the trailing moving average"""
+    
+    def test_window_is_in_days(self):
+        """Test points outside the window are left out even with gaps"""
+        days = np.array([0, 1, 2, 10, 11])
+        values = np.array([1.0, 2.0, 3.0, 10.0, 20.0])
+        
+        assert moving_average(days, values, 3).tolist() == [1.0, 1.5, 2.0, 10.0, 15.0]
+
+
+class TestProgressAnalyticsApi:
+    """Test get_progress_analytics"""
+    
+    @pytest.mark.asyncio
+    async def test_statistics_cover_all_points(self):
+        """Test stats use every entry while data points are downsampled"""
+        values = np.linspace(90.0, 80.0, 3650)
+        api = ProgressApiImpl(FakeProgressRepository(daily_series(values)))
+        
+        result = await api.get_progress_analytics("weight", None, None, 100, 7)
+        
+        assert result.count == 3650
+        assert len(result.data_points) == 100
+        assert (result.min, result.max, result.average) == (80.0, 90.0, 85.0)
+        assert result.trend == "decreasing"
+        assert result.slope_per_week == pytest.approx(-10 / 3649 * 7, abs=1e-4)
+        assert result.data_points[0].var_date == date(2025, 1, 1)
+        assert result.data_points[0].moving_average == 90.0
+        assert result.data_points[-1].value == 80.0
+    
+    @pytest.mark.asyncio
+    async def test_empty_series(self):
+        """Test a range without entries has no statistics"""
+        api = ProgressApiImpl(FakeProgressRepository(daily_series(np.array([]))))
+        
+        result = await api.get_progress_analytics("body_fat", date(2025, 1, 1), date(2025, 2, 1))
+        
+        assert (result.count, result.data_points, result.trend) == (0, [], None)
+        assert result.average is None
+    
+    @pytest.mark.asyncio
+    async def test_invalid_metric(self):
+        """Test an unknown metric_type is a 400"""
+        api = ProgressApiImpl(FakeProgressRepository(daily_series(np.array([80.0]))))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await api.get_progress_analytics("mood", None, None)
+        
+        assert exc_info.value.status_code == 400
+    
+    def test_series_of_the_authenticated_user(self, app, client):
+        """Test the endpoint charts the bearer's own entries and no one else's"""
+        user_id = uuid4()
+        repository = FakeProgressRepository(ProgressSeries.from_points(
+            [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)], [80.0, 79.5, 79.0],
+        ), user_id)
+        app.dependency_overrides[get_progress_api] = lambda: ProgressApiImpl(repository)
+        
+        def analytics(user):
+            token = create_access_token({"user_id": str(user)})
+            return client.get(
+                "/progress/analytics", params={"metric_type": "weight"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        
+        response = analytics(user_id)
+        
+        assert response.status_code == 200
+        assert [p["value"] for p in response.json()["data_points"]] == [80.0, 79.5, 79.0]
+        assert analytics(uuid4()).json()["data_points"] == []
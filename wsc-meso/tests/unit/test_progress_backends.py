@@ -0,0 +1,174 @@
+"""
+Unit Tests for the Progress Backends
+
+Tests for the time-series document mapping, the mirrored writes used while
+migrating and the backend selection.
+"""
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+
+from api.dependencies import build_container
+from domain.entities.progress import MetricType, Progress
+from domain.repositories.bulk import BulkItemError, BulkWriteResult
+from infrastructure.config.settings import get_settings
+from infrastructure.persistence.indexes import MIGRATIONS, target_indexes
+from infrastructure.persistence.repositories import (
+    MirroredProgressRepository,
+    ProgressRepository,
+    TimeSeriesProgressRepository,
+)
+from openapi_server.apis.progress_api_base import BaseProgressApi
+
+
+class FakeDatabase(dict):
+    """Database stand-in handing out named placeholders for collections"""
+    
+    def __getattr__(self, name):
+        return self[name]
+    
+    def __missing__(self, name):
+        return name
+
+
+class RecordingRepository:
+    """Progress repository stand-in recording calls, failing some items"""
+    
+    def __init__(self, failed=()):
+        self.calls = []
+        self.failed = failed
+    
+    async def save(self, progress):
+        self.calls.append(("save", progress.id))
+        return progress
+    
+    async def find_by_id(self, progress_id):
+        self.calls.append(("find_by_id", progress_id))
+        return None
+    
+    async def save_many(self, entries):
+        self.calls.append(("save_many", [progress.id for progress in entries]))
+        errors = tuple(BulkItemError(index=i, id=entries[i].id, message="dup") for i in self.failed)
+        return BulkWriteResult(written=len(entries) - len(errors), errors=errors)
+    
+    async def delete(self, progress_id):
+        self.calls.append(("delete", progress_id))
+        return True
+
+
+def make_progress(day=date(2025, 3, 1)):
+    return Progress.create(uuid4(), day, MetricType.WEIGHT, 81.5, unit="kg")
+
+
+class TestTimeSeriesProgressRepository:
+    """Test the time-series document mapping"""
+    
+    def test_document_round_trip(self):
+        """Test user and metric go to the metaField and the day to the timeField"""
+        repository = TimeSeriesProgressRepository(FakeDatabase())
+        progress = make_progress()
+        
+        doc = repository._to_document(progress)
+        
+        assert repository.collection == "progress_timeseries"
+        assert doc["meta"] == {"user_id": progress.user_id, "metric_type": "weight"}
+        assert doc["date"] == datetime(2025, 3, 1)
+        entity = repository._to_entity(doc)
+        assert (entity.id, entity.user_id, entity.date, entity.metric_type, entity.value) == (
+            progress.id, progress.user_id, date(2025, 3, 1), MetricType.WEIGHT, 81.5,
+        )
+    
+    def test_user_query_filters_on_meta(self):
+        """Test range queries filter the metaField subfields and datetime bounds"""
+        repository = TimeSeriesProgressRepository(FakeDatabase())
+        user_id = uuid4()
+        
+        query = repository._user_query(user_id, MetricType.BODY_FAT, date(2025, 1, 1), date(2025, 2, 1))
+        
+        assert query == {
+            "meta.user_id": user_id,
+            "meta.metric_type": "body_fat",
+            "date": {"$gte": datetime(2025, 1, 1), "$lte": datetime(2025, 2, 1)},
+        }
+        assert ProgressRepository(FakeDatabase())._user_query(user_id, None, None, None) == {"user_id": user_id}
+    
+    def test_collection_created_as_time_series(self):
+        """Test a migration creates the collection with its time-series options before its indexes"""
+        (spec,) = [spec for migration in MIGRATIONS for spec in migration.collections]
+        
+        assert spec.collection == "progress_timeseries"
+        assert spec.options() == {"timeField": "date", "metaField": "meta", "granularity": "hours"}
+        assert {index.name for index in target_indexes()["progress_timeseries"]} >= {
+            "_id_1", "meta.user_id_1_meta.metric_type_1_date_-1__id_-1",
+        }
+
+
+class TestMirroredProgressRepository:
+    """Test the dual-write repository used during the migration"""
+    
+    @pytest.mark.asyncio
+    async def test_reads_primary_and_writes_both(self):
+        """Test reads never touch the mirror and writes reach both"""
+        primary, mirror = RecordingRepository(), RecordingRepository()
+        repository = MirroredProgressRepository(primary, mirror)
+        progress = make_progress()
+        
+        await repository.save(progress)
+        await repository.find_by_id(progress.id)
+        await repository.delete(progress.id)
+        
+        assert primary.calls == [("save", progress.id), ("find_by_id", progress.id), ("delete", progress.id)]
+        assert mirror.calls == [("save", progress.id), ("delete", progress.id)]
+    
+    @pytest.mark.asyncio
+    async def test_bulk_failures_are_not_mirrored(self):
+        """Test entries the primary rejected are left out of the mirror"""
+        primary, mirror = RecordingRepository(failed=(1,)), RecordingRepository()
+        entries = [make_progress(), make_progress(), make_progress()]
+        
+        result = await MirroredProgressRepository(primary, mirror).save_many(entries)
+        
+        assert result.failed_indexes == {1}
+        assert mirror.calls == [("save_many", [entries[0].id, entries[2].id])]
+    
+    @pytest.mark.asyncio
+    async def test_mirror_failures_are_logged(self, caplog):
+        """Test a failing mirror neither fails the write nor hides the primary's result"""
+        class BrokenMirror:
+            async def save(self, progress):
+                raise ConnectionError("mirror down")
+            
+            delete = save
+        
+        primary = RecordingRepository()
+        repository = MirroredProgressRepository(primary, BrokenMirror())
+        progress = make_progress()
+        
+        assert await repository.save(progress) is progress
+        assert await repository.delete(progress.id) is True
+        assert primary.calls == [("save", progress.id), ("delete", progress.id)]
+        assert [r.getMessage() for r in caplog.records] == [
+            "Progress mirror save failed; run progress_migration --check",
+            "Progress mirror delete failed; run progress_migration --check",
+        ]
+
+
+class TestBackendSelection:
+    """Test the progress_backend setting"""
+    
+    @pytest.mark.parametrize("backend, expected", [
+        ("collection", ProgressRepository),
+        ("dual", MirroredProgressRepository),
+        ("timeseries", TimeSeriesProgressRepository),
+    ])
+    def test_progress_api_repository(self, monkeypatch, backend, expected):
+        """Test the progress impl receives the configured repository"""
+        monkeypatch.setattr(get_settings(), "progress_backend", backend)
+        container = build_container()
+        container.register(ProgressRepository, lambda c: ProgressRepository(FakeDatabase()))
+        container.register(TimeSeriesProgressRepository, lambda c: TimeSeriesProgressRepository(FakeDatabase()))
+        
+        api = container.resolve(BaseProgressApi)
+        
+        assert type(api.repository) is expected
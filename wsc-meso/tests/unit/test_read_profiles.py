@@ -0,0 +1,158 @@
+"""
+Unit Tests for Read Profiles
+
+Tests that summary reads project and decode only the list-view fields.
+"""
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from api.dependencies import get_mesocycles_api, get_workouts_api
+from domain.entities import (
+    Exercise,
+    ExerciseSummary,
+    Mesocycle,
+    Workout,
+    WorkoutSummary,
+)
+from domain.entities.mesocycle import PeriodizationModel, TrainingGoal
+from domain.entities.workout import TrainingSplit
+from domain.repositories import ReadProfile
+from infrastructure.persistence.repositories import (
+    ExerciseRepository,
+    MesocycleRepository,
+    WorkoutRepository,
+)
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.impl.workouts_impl import WorkoutsApiImpl
+from openapi_server.utils.auth import create_access_token
+
+
+@pytest.fixture
+def database():
+    """Database handle of a client that never connects"""
+    client = AsyncIOMotorClient("mongodb://localhost:27017", connect=False)
+    yield client.mesocycle_planner_test
+    client.close()
+
+
+class StoredDocuments:
+    """Repository mixin serving pages from stored documents, applying the projection"""
+    
+    def store(self, entity):
+        self.docs = getattr(self, "docs", []) + [self._to_document(entity)]
+    
+    async def _find_page_with_total(self, query, sort_field, direction, limit, offset=0, estimated=False, projection=None):
+        docs = [doc for doc in getattr(self, "docs", []) if all(doc.get(k) == v for k, v in query.items())]
+        if projection is not None:
+            docs = [{k: v for k, v in doc.items() if k == "_id" or k in projection} for doc in docs]
+        return docs[offset:offset + limit], None, len(docs)
+
+
+class StoredWorkouts(StoredDocuments, WorkoutRepository):
+    pass
+
+
+class StoredMesocycles(StoredDocuments, MesocycleRepository):
+    pass
+
+
+class TestReadProfiles:
+    """Test summary and detail profiles"""
+    
+    def test_detail_reads_whole_document(self, database):
+        """Test the detail profile does not project"""
+        assert ExerciseRepository(database)._projection(ReadProfile.DETAIL) is None
+    
+    def test_exercise_summary(self, database):
+        """Test exercise summaries skip the long text fields"""
+        repository = ExerciseRepository(database)
+        projection = repository._projection(ReadProfile.SUMMARY)
+        doc = {
+            "_id": 12,
+            "name": "Press de banca",
+            "muscle_group": "pectorals",
+            "primary_muscles": ["pectoral mayor"],
+            "type": "free_weight",
+        }
+        
+        summary = repository._decode(doc, ReadProfile.SUMMARY)
+        
+        assert not {"execution", "comments", "common_mistakes", "variants"} & set(projection)
+        assert isinstance(summary, ExerciseSummary)
+        assert not isinstance(summary, Exercise)
+        assert summary.name == "Press de banca"
+        assert not hasattr(summary, "execution")
+    
+    def test_workout_summary(self, database):
+        """Test workout summaries decode documents missing the optional fields"""
+        repository = WorkoutRepository(database)
+        doc = {
+            "_id": uuid4(),
+            "mesocycle_id": uuid4(),
+            "name": "Push A",
+            "scheduled_date": datetime(2024, 5, 1),
+            "split": "push",
+        }
+        
+        summary = repository._decode(doc, ReadProfile.SUMMARY)
+        
+        assert isinstance(summary, WorkoutSummary)
+        assert summary.completed is False
+        assert summary.split.value == "push"
+        assert (summary.notes, summary.description) == (None, None)
+        assert "exercises" not in repository._projection(ReadProfile.SUMMARY)
+    
+    def test_mesocycle_summary_keeps_sort_key(self, database):
+        """Test the listing sort key is projected so cursors can be built"""
+        repository = MesocycleRepository(database)
+        
+        assert "created_at" in repository._projection(ReadProfile.SUMMARY)
+
+
+class TestListResponses:
+    """Test list endpoints return every field the list schema has"""
+    
+    @staticmethod
+    def bearer(user_id):
+        return {"Authorization": "Bearer " + create_access_token({"user_id": str(user_id)})}
+    
+    def test_workout_list_keeps_notes_and_description(self, app, client, database):
+        """Test summary reads do not blank fields stored with the workout"""
+        repository = StoredWorkouts(database)
+        workout = Workout.create(
+            uuid4(), "Push A", datetime(2025, 1, 6, 18), microcycle_id=1,
+            description="Heavy pressing", split=TrainingSplit.PUSH, notes="Shoulder felt fine",
+        )
+        repository.store(workout)
+        app.dependency_overrides[get_workouts_api] = lambda: WorkoutsApiImpl(repository)
+        
+        response = client.get(
+            "/workouts", params={"mesocycle_id": str(workout.mesocycle_id)}, headers=self.bearer(uuid4()),
+        )
+        item = response.json()["items"][0]
+        
+        assert response.status_code == 200
+        assert (item["description"], item["notes"]) == ("Heavy pressing", "Shoulder felt fine")
+        assert item["created_at"] is not None and item["updated_at"] is not None
+    
+    def test_mesocycle_list_keeps_stored_fields(self, app, client, database):
+        """Test description, deload weeks and updated_at survive the summary read"""
+        user_id = uuid4()
+        repository = StoredMesocycles(database)
+        repository.store(Mesocycle.create(
+            user_id=user_id, name="Block", periodization_model=PeriodizationModel.LINEAR,
+            goal=TrainingGoal.STRENGTH, duration_weeks=8, start_date=date(2025, 1, 6),
+            end_date=date(2025, 3, 2), training_level="intermediate", weekly_frequency=4,
+            description="Off-season strength", deload_weeks=[4, 8],
+        ))
+        app.dependency_overrides[get_mesocycles_api] = lambda: MesocyclesApiImpl(repository)
+        
+        response = client.get("/mesocycles", headers=self.bearer(user_id))
+        item = response.json()["items"][0]
+        
+        assert response.status_code == 200
+        assert (item["description"], item["deload_weeks"]) == ("Off-season strength", [4, 8])
+        assert item["updated_at"] is not None
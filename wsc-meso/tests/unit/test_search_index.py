@@ -0,0 +1,100 @@
+"""
+Unit Tests for the Exercise Search Index
+
+Tests for folding, stemming and ranked search over the catalog.
+"""
+import pytest
+
+from domain.entities import Exercise, ExerciseType, MuscleGroup
+from infrastructure.catalog import SearchIndex
+from infrastructure.catalog.search_index import fold, stem, tokenize
+
+
+def make_exercise(exercise_id, name, execution=None, comments=None):
+    return Exercise(
+        id=exercise_id,
+        name=name,
+        number=str(exercise_id),
+        muscle_group=MuscleGroup.BACK,
+        primary_muscles=["dorsal ancho"],
+        type=ExerciseType.FREE_WEIGHT,
+        execution=execution,
+        comments=comments,
+    )
+
+
+@pytest.fixture
+def exercises():
+    return [
+        make_exercise(1, "Jalón al pecho", "Tirar de la barra hacia el pecho"),
+        make_exercise(2, "Curl de bíceps con barra", "Flexionar los codos"),
+        make_exercise(3, "Press de banca", "Empujar la barra desde el pecho"),
+        make_exercise(4, "Remo con barra", "Tirar de la barra hacia el abdomen"),
+        make_exercise(5, "Sentadilla trasera", "Bajar con la barra en la espalda"),
+        make_exercise(6, "Dominadas", "Subir hasta pasar la barbilla", comments="Evitar el balanceo"),
+    ]
+
+
+@pytest.fixture
+def index(exercises):
+    return SearchIndex(exercises)
+
+
+def names(exercises, positions):
+    return [exercises[p].name for p in positions]
+
+
+class TestAnalysis:
+    """Test text analysis"""
+    
+    def test_fold_strips_accents_and_case(self):
+        """Test diacritics and case are folded"""
+        assert fold("Jalón BÍCEPS Pequeño") == "jalon biceps pequeno"
+    
+    def test_stem_conflates_plural_and_gender(self):
+        """Test inflected forms share a stem"""
+        assert stem("sentadillas") == stem("sentadilla")
+        assert stem("extensiones") == stem("extension")
+        assert stem("jalones") == stem("jalon")
+    
+    def test_tokenize_drops_stopwords(self):
+        """Test Spanish stopwords are not indexed"""
+        assert tokenize("Press de banca con la barra") == ["pres", "banc", "barr"]
+
+
+class TestSearchIndex:
+    """Test SearchIndex"""
+    
+    def test_accent_insensitive(self, index, exercises):
+        """Test unaccented queries find accented names"""
+        assert names(exercises, index.search("jalon")) == ["Jalón al pecho"]
+        assert names(exercises, index.search("biceps")) == ["Curl de bíceps con barra"]
+    
+    def test_name_outranks_description(self, index, exercises):
+        """Test a name hit ranks above description-only hits"""
+        results = names(exercises, index.search("pecho"))
+        
+        assert results[0] == "Jalón al pecho"
+        assert set(results) == {"Jalón al pecho", "Press de banca"}
+    
+    def test_prefix_of_last_word(self, index, exercises):
+        """Test the word being typed matches as a prefix"""
+        assert names(exercises, index.search("sentad")) == ["Sentadilla trasera"]
+    
+    def test_typo_tolerance(self, index, exercises):
+        """Test one-edit typos still match"""
+        assert names(exercises, index.search("sentdilla")) == ["Sentadilla trasera"]
+        assert names(exercises, index.search("curl bicpes"))[0] == "Curl de bíceps con barra"
+    
+    def test_more_matched_words_rank_first(self, index, exercises):
+        """Test results matching every word come before partial matches"""
+        results = names(exercises, index.search("remo barra"))
+        
+        assert results[0] == "Remo con barra"
+        assert len(results) == 5
+    
+    def test_limit_and_no_match(self, index):
+        """Test the limit and queries without results"""
+        assert len(index.search("barra", limit=2)) == 2
+        assert index.search("zzzz") == []
+        assert index.search("de la") == []
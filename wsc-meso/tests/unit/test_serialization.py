@@ -0,0 +1,150 @@
+"""
+Unit Tests for Response Serialization
+
+Tests that list bodies rendered from domain entities match what FastAPI
+emits for the generated response models.
+"""
+import json
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+from domain.entities import ExerciseSummary, MesocycleSummary, MetricType, Progress, WorkoutSummary
+from domain.entities.exercise import ExerciseType, MuscleGroup
+from domain.entities.mesocycle import MesocycleStatus, PeriodizationModel, TrainingGoal
+from domain.entities.workout import TrainingSplit
+from openapi_server.models.exercise_summary import ExerciseSummary as ExerciseSummaryModel
+from openapi_server.models.list_exercises200_response import ListExercises200Response
+from openapi_server.models.list_mesocycles200_response import ListMesocycles200Response
+from openapi_server.models.list_progress200_response import ListProgress200Response
+from openapi_server.models.list_workouts200_response import ListWorkouts200Response
+from openapi_server.models.mesocycle import Mesocycle as MesocycleModel
+from openapi_server.models.progress import Progress as ProgressModel
+from openapi_server.models.workout import Workout as WorkoutModel
+from openapi_server.utils.serialization import dumps, field_map, render
+
+
+def expected(model):
+    """Body FastAPI writes for a response_model"""
+    return model.model_dump(mode="json", by_alias=True)
+
+
+def rendered(model, **values):
+    body = dumps(model, **values)
+    return json.loads(body)
+
+
+def assert_same(actual, model):
+    assert actual == expected(model)
+    assert list(actual) == list(expected(model))
+
+
+class TestSerialization:
+    """Test list bodies against the generated models"""
+    
+    def test_progress_page(self):
+        """Test aliases, day fields stored as datetimes and numbers"""
+        entries = [
+            Progress(uuid4(), uuid4(), datetime(2024, 3, 4), MetricType.WEIGHT, 81.5, "kg", None, datetime(2024, 3, 4, 7, 30, 1, 250000)),
+            Progress(uuid4(), uuid4(), date(2024, 3, 5), MetricType.STRENGTH, 140, None, "PR", datetime(2024, 3, 5, tzinfo=timezone.utc)),
+        ]
+        model = ListProgress200Response(
+            items=[
+                ProgressModel.from_dict({**e.__dict__, "id": str(e.id), "user_id": str(e.user_id)})
+                for e in entries
+            ],
+            total=42,
+            page=2,
+            total_pages=3,
+        )
+        
+        actual = rendered(ListProgress200Response, items=entries, total=42, page=2, total_pages=3)
+        
+        assert actual["items"][0]["date"] == "2024-03-04"
+        assert actual["items"][1]["created_at"] == "2024-03-05T00:00:00Z"
+        assert_same(actual, model)
+    
+    def test_workout_summaries(self):
+        """Test summaries leave the detail fields null"""
+        summary = WorkoutSummary(uuid4(), uuid4(), "Upper A", datetime(2024, 5, 6, 18), microcycle_id=2, split=TrainingSplit.UPPER)
+        model = ListWorkouts200Response(
+            items=[WorkoutModel(
+                id=str(summary.id),
+                mesocycle_id=str(summary.mesocycle_id),
+                microcycle_id=2,
+                name="Upper A",
+                scheduled_date=summary.scheduled_date,
+                completed=False,
+                split="upper",
+            )],
+            next_cursor="abc",
+        )
+        
+        actual = rendered(ListWorkouts200Response, items=[summary], next_cursor="abc")
+        
+        assert actual["items"][0]["notes"] is None
+        assert_same(actual, model)
+    
+    def test_mesocycle_summaries(self):
+        """Test enums and days of mesocycle summaries"""
+        summary = MesocycleSummary(
+            uuid4(), uuid4(), "Bloque 1", PeriodizationModel.BLOCK, TrainingGoal.STRENGTH, 8,
+            datetime(2024, 1, 1), datetime(2024, 2, 25), MesocycleStatus.ACTIVE, "advanced", 4,
+            datetime(2023, 12, 20, 9, 15),
+        )
+        model = ListMesocycles200Response(items=[MesocycleModel(
+            id=str(summary.id),
+            user_id=str(summary.user_id),
+            name="Bloque 1",
+            periodization_model="block",
+            goal="strength",
+            duration_weeks=8,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 2, 25),
+            status="active",
+            training_level="advanced",
+            weekly_frequency=4,
+            deload_weeks=[],
+            created_at=summary.created_at,
+        )], total=1, page=1, total_pages=1)
+        
+        actual = rendered(ListMesocycles200Response, items=[summary], total=1, page=1, total_pages=1)
+        
+        assert_same(actual, model)
+    
+    def test_exercise_summaries(self):
+        """Test the exercises envelope and lists of strings"""
+        summary = ExerciseSummary(12, "Press de banca", MuscleGroup.PECTORALS, ["pectoral mayor"], ExerciseType.FREE_WEIGHT)
+        model = ListExercises200Response(
+            exercises=[ExerciseSummaryModel(
+                id=12,
+                name="Press de banca",
+                muscle_group="pectorals",
+                primary_muscles=["pectoral mayor"],
+                type="free_weight",
+            )],
+            total_count=1,
+            page=1,
+            total_pages=1,
+        )
+        
+        actual = rendered(ListExercises200Response, exercises=[summary], total_count=1, page=1, total_pages=1)
+        
+        assert_same(actual, model)
+    
+    def test_empty_page(self):
+        """Test an empty list and absent envelope fields"""
+        actual = rendered(ListProgress200Response, items=[])
+        
+        assert_same(actual, ListProgress200Response(items=[]))
+    
+    def test_field_map_is_built_once(self):
+        """Test the field map is cached per model"""
+        assert field_map(ProgressModel) is field_map(ProgressModel)
+        assert ("date", "var_date") == field_map(ProgressModel).fields[2][:2]
+    
+    def test_render_response(self):
+        """Test the response carries the JSON body"""
+        response = render(ListProgress200Response, items=[])
+        
+        assert response.media_type == "application/json"
+        assert json.loads(response.body)["items"] == []
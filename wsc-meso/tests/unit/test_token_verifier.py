@@ -0,0 +1,116 @@
+"""
+Unit Tests for the Token Verifier
+
+Tests for the cache of verified JWTs and the bearer-auth dependency.
+"""
+import time
+from datetime import timedelta
+
+from fastapi import FastAPI, Security
+from fastapi.testclient import TestClient
+
+from infrastructure.security import TokenVerifier
+from infrastructure.security import token_verifier
+from openapi_server.security_api import get_token_bearerAuth
+from openapi_server.utils.auth import ALGORITHM, SECRET_KEY, create_access_token, current_user_id
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+    
+    def __init__(self):
+        self.now = time.time()
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def counting_decode(monkeypatch) -> list:
+    """Count calls to jwt.decode made by the verifier"""
+    calls = []
+    decode = token_verifier.jwt.decode
+    
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return decode(*args, **kwargs)
+    
+    monkeypatch.setattr(token_verifier.jwt, "decode", counted)
+    return calls
+
+
+class TestTokenVerifier:
+    """Test TokenVerifier"""
+    
+    def test_token_is_decoded_once(self, monkeypatch):
+        """Test repeated verification is served from the cache"""
+        calls = counting_decode(monkeypatch)
+        verifier = TokenVerifier(SECRET_KEY, ALGORITHM)
+        token = create_access_token({"user_id": "u1"})
+        
+        assert verifier.verify(token)["user_id"] == "u1"
+        assert verifier.verify(token)["user_id"] == "u1"
+        assert len(calls) == 1
+    
+    def test_entry_expires_at_exp(self, monkeypatch):
+        """Test a cached token is verified again once its exp has passed"""
+        calls = counting_decode(monkeypatch)
+        clock = FakeClock()
+        verifier = TokenVerifier(SECRET_KEY, ALGORITHM, clock=clock)
+        token = create_access_token({"user_id": "u1"}, timedelta(minutes=5))
+        verifier.verify(token)
+        
+        clock.now += 4 * 60
+        verifier.verify(token)
+        assert len(calls) == 1
+        
+        clock.now += 2 * 60
+        verifier.verify(token)
+        assert len(calls) == 2
+    
+    def test_invalid_token_is_not_cached(self):
+        """Test tokens signed with another key are rejected every time"""
+        verifier = TokenVerifier(SECRET_KEY, ALGORITHM)
+        forged = TokenVerifier("other-key", ALGORITHM)
+        token = create_access_token({"user_id": "u1"})
+        
+        assert forged.verify(token) is None
+        assert forged.verify("not-a-jwt") is None
+        assert len(forged) == 0
+        assert verifier.verify(token) is not None
+    
+    def test_size_bound(self):
+        """Test the least recently used token is evicted"""
+        verifier = TokenVerifier(SECRET_KEY, ALGORITHM, max_entries=2)
+        for user_id in ("u1", "u2", "u3"):
+            verifier.verify(create_access_token({"user_id": user_id}))
+        
+        assert len(verifier) == 2
+
+
+class TestBearerAuth:
+    """Test the bearer-auth dependency"""
+    
+    @staticmethod
+    def _client() -> TestClient:
+        app = FastAPI()
+        
+        @app.get("/me")
+        async def me(token=Security(get_token_bearerAuth)):
+            return {"sub": token.sub, "current": current_user_id()}
+        
+        return TestClient(app)
+    
+    def test_user_id_reaches_the_endpoint(self):
+        """Test the resolved user id is available for the rest of the request"""
+        token = create_access_token({"user_id": "u1"})
+        response = self._client().get("/me", headers={"Authorization": f"Bearer {token}"})
+        
+        assert response.status_code == 200
+        assert response.json() == {"sub": "u1", "current": "u1"}
+    
+    def test_invalid_token_is_401(self):
+        """Test a token that does not verify is rejected"""
+        response = self._client().get("/me", headers={"Authorization": "Bearer special-key"})
+        
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
@@ -0,0 +1,341 @@
+"""
+Unit Tests for Training Session Persistence
+
+Tests for the weekly bucket repository (over an in-memory collection) and
+the log session endpoint implementation.
+"""
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from api.dependencies import get_tracking_api
+from domain.entities.mesocycle import Mesocycle, PeriodizationModel, TrainingGoal
+from domain.entities.training_session import (
+    ExercisePerformed,
+    SetColumns,
+    SetPerformed,
+    TrainingSession,
+)
+from domain.entities.weekly_rollup import DailyRollup
+from domain.repositories import DuplicateSessionError
+from infrastructure.persistence.models import decode_sets, encode_sets
+from infrastructure.persistence.models.training_session_model import SET_RECORD_BYTES
+from infrastructure.persistence.repositories import TrainingSessionRepository
+from openapi_server.impl.tracking_impl import TrackingApiImpl
+from openapi_server.models.training_session import TrainingSession as TrainingSessionModel
+from openapi_server.utils.auth import create_access_token, set_current_user_id
+
+
+class FakeBucketCollection:
+    """Collection applying the bucket update operators to in-memory documents"""
+    
+    name = "training_sessions"
+    
+    def __init__(self):
+        self.docs = {}
+        self.bulk_requests = 0
+    
+    def _matches(self, doc, query):
+        stored = {session["id"] for session in doc["sessions"]}
+        condition = query["sessions.id"]
+        excluded = condition["$nin"] if "$nin" in condition else [condition["$ne"]]
+        return not stored & set(excluded)
+    
+    async def update_one(self, query, update, upsert=False):
+        doc = self.docs.get(query["_id"])
+        if doc is not None and not self._matches(doc, query):
+            raise DuplicateKeyError("E11000 duplicate key error", 11000)
+        if doc is None:
+            doc = self.docs[query["_id"]] = {"_id": query["_id"], "sessions": []}
+            doc.update(update["$setOnInsert"])
+        doc["date"] = min(doc.get("date", update["$min"]["date"]), update["$min"]["date"])
+        doc["last_date"] = max(doc.get("last_date", update["$max"]["last_date"]), update["$max"]["last_date"])
+        for field, value in update["$push"].items():
+            doc[field].extend(value["$each"])
+        for field, value in update["$inc"].items():
+            doc[field] = doc.get(field, 0) + value
+    
+    async def bulk_write(self, requests, ordered=True):
+        assert ordered is False
+        self.bulk_requests += len(requests)
+        errors = []
+        for index, request in enumerate(requests):
+            try:
+                await self.update_one(request._filter, request._doc, upsert=request._upsert)
+            except DuplicateKeyError:
+                errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"})
+        details = {"nUpserted": len(requests) - len(errors), "writeErrors": errors}
+        if errors:
+            raise BulkWriteError(details)
+        return SimpleNamespace(bulk_api_result=details)
+    
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+
+class FakeMesocycleRepository:
+    """Repository stand-in holding a single mesocycle"""
+    
+    def __init__(self, mesocycle):
+        self.mesocycle = mesocycle
+    
+    async def find_by_id(self, mesocycle_id):
+        return self.mesocycle if mesocycle_id == self.mesocycle.id else None
+
+
+def make_session(session_id, user_id, mesocycle_id, week_number=1, day=date(2025, 1, 6)):
+    return TrainingSession(
+        id=session_id,
+        mesocycle_id=mesocycle_id,
+        date=day,
+        week_number=week_number,
+        user_id=user_id,
+        exercises_performed=[
+            ExercisePerformed(exercise_id=1, planned_sets=2, sets_performed=[
+                SetPerformed(100.0, 5, 8, 2), SetPerformed(100.0, 4, 9, 1),
+            ]),
+            ExercisePerformed(exercise_id=2, planned_sets=1, sets_performed=[SetPerformed(40.0, 10, 7, 3)]),
+        ],
+    )
+
+
+@pytest.fixture
+def repository():
+    return TrainingSessionRepository(SimpleNamespace(training_sessions=FakeBucketCollection()))
+
+
+class TestTrainingSessionRepository:
+    """Test TrainingSessionRepository bucketing"""
+    
+    @pytest.mark.asyncio
+    async def test_sessions_of_a_week_share_one_bucket(self, repository):
+        """Test a week's sessions are appended to one document and read back intact"""
+        user_id, mesocycle_id = uuid4(), uuid4()
+        await repository.append(make_session(1, user_id, mesocycle_id))
+        await repository.append(make_session(2, user_id, mesocycle_id, day=date(2025, 1, 8)))
+        
+        (doc,) = repository.collection.docs.values()
+        sessions = await repository.find_week(user_id, mesocycle_id, 1)
+        
+        assert (doc["session_count"], doc["set_count"]) == (2, 6)
+        assert doc["date"].date() == date(2025, 1, 6)
+        assert doc["last_date"].date() == date(2025, 1, 8)
+        assert [s.id for s in sessions] == [1, 2]
+        assert [len(e.sets_performed) for e in sessions[0].exercises_performed] == [2, 1]
+        assert sessions[1].get_total_session_volume() == make_session(2, user_id, mesocycle_id).get_total_session_volume()
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_append_is_rejected(self, repository):
+        """Test logging the same session twice does not store it twice"""
+        user_id, mesocycle_id = uuid4(), uuid4()
+        await repository.append(make_session(1, user_id, mesocycle_id))
+        
+        with pytest.raises(DuplicateSessionError):
+            await repository.append(make_session(1, user_id, mesocycle_id))
+        assert len(await repository.find_week(user_id, mesocycle_id, 1)) == 1
+    
+    @pytest.mark.asyncio
+    async def test_append_many_groups_by_bucket(self, repository):
+        """Test one update per bucket and per-session error positions"""
+        user_id, mesocycle_id = uuid4(), uuid4()
+        await repository.append(make_session(3, user_id, mesocycle_id, week_number=2))
+        sessions = [
+            make_session(1, user_id, mesocycle_id),
+            make_session(2, user_id, mesocycle_id, week_number=2),
+            make_session(4, user_id, mesocycle_id),
+            make_session(3, user_id, mesocycle_id, week_number=2),
+        ]
+        
+        result = await repository.append_many(sessions)
+        
+        assert repository.collection.bulk_requests == 2 + 1  # retry of the failed bucket
+        assert result.written == 2
+        assert [(e.index, e.message) for e in result.errors] == [
+            (1, "Session already logged"), (3, "Session already logged"),
+        ]
+        assert [s.id for s in await repository.find_week(user_id, mesocycle_id, 1)] == [1, 4]
+    
+    def test_sets_are_packed_with_their_aggregates(self, repository):
+        """Test the binary set column round trip and the stored per-exercise totals"""
+        session = make_session(1, uuid4(), uuid4())
+        columns = session.exercises_performed[0].sets
+        
+        data = encode_sets(columns)
+        (entry,) = repository._to_update(session, [session])["$push"]["sessions"]["$each"]
+        
+        assert len(data) == len(columns) * SET_RECORD_BYTES == 24
+        assert decode_sets(data) == columns
+        assert decode_sets(b"") == SetColumns()
+        assert entry["exercises"][0]["volume"] == columns.total_volume()
+        assert entry["exercises"][0]["rpe_sum"] == int(columns.actual_rpe.sum())
+        with pytest.raises(ValueError):
+            decode_sets(data[:-1])
+
+
+class TestLogSession:
+    """Test TrackingApiImpl.log_session"""
+    
+    @staticmethod
+    def make_api():
+        user_id = uuid4()
+        set_current_user_id(str(user_id))
+        mesocycle = Mesocycle.create(
+            user_id=user_id,
+            name="Block",
+            goal=TrainingGoal.STRENGTH,
+            periodization_model=PeriodizationModel.LINEAR,
+            start_date=date(2025, 1, 6),
+            end_date=date(2025, 3, 30),
+            duration_weeks=12,
+            training_level="intermediate",
+            weekly_frequency=4,
+        )
+        repository = TrainingSessionRepository(SimpleNamespace(training_sessions=FakeBucketCollection()))
+        return TrackingApiImpl(repository, FakeMesocycleRepository(mesocycle), rollups=FakeRollupRepository()), mesocycle
+    
+    @staticmethod
+    def make_request(mesocycle_id, **overrides):
+        return TrainingSessionModel.from_dict({
+            "id": 7,
+            "mesocycle_id": str(mesocycle_id),
+            "date": "2025-01-22",
+            "exercises_performed": [{"exercise_id": 1, "planned_sets": 1, "sets_performed": [
+                {"weight_kg": 80, "reps_achieved": 8, "actual_rpe": 8, "reps_in_reserve": 2},
+            ]}],
+            **overrides,
+        })
+    
+    @pytest.mark.asyncio
+    async def test_persists_in_week_of_date(self):
+        """Test the session is stored for the owner in the week its date falls in"""
+        api, mesocycle = self.make_api()
+        
+        result = await api.log_session(self.make_request(mesocycle.id))
+        
+        assert result.week_number == 3
+        (stored,) = await api.sessions.find_week(mesocycle.user_id, mesocycle.id, 3)
+        assert stored.get_total_sets() == 1
+    
+    @pytest.mark.asyncio
+    async def test_rejects_duplicates_and_invalid_sets(self):
+        """Test repeated sessions and out-of-range RPE map to 400"""
+        api, mesocycle = self.make_api()
+        await api.log_session(self.make_request(mesocycle.id))
+        
+        with pytest.raises(HTTPException) as duplicate:
+            await api.log_session(self.make_request(mesocycle.id))
+        with pytest.raises(HTTPException) as invalid:
+            await api.log_session(self.make_request(mesocycle.id, id=8, exercises_performed=[
+                {"exercise_id": 1, "sets_performed": [{"weight_kg": 80, "reps_achieved": 8, "actual_rpe": 11}]},
+            ]))
+        assert duplicate.value.status_code == invalid.value.status_code == 400
+        assert duplicate.value.detail == "Session already logged"
+
+
+class FakeRollupRepository:
+    """Rollup repository stand-in folding increments in memory"""
+    
+    def __init__(self, increments=()):
+        self.rollups = {}
+        self.calls = []
+        for increment in increments:
+            self._add(increment)
+    
+    def _add(self, increment):
+        if increment.key in self.rollups:
+            self.rollups[increment.key].add(increment)
+        else:
+            self.rollups[increment.key] = increment
+    
+    async def record(self, increments):
+        for increment in increments:
+            self._add(increment)
+    
+    async def find_daily_by_user(self, user_id, start, end, exercise_id=None):
+        self.calls.append((user_id, start, end, exercise_id))
+        return sorted(
+            (r for r in self.rollups.values()
+             if isinstance(r, DailyRollup) and r.user_id == user_id and r.exercise_id == exercise_id),
+            key=lambda r: r.day,
+        )
+
+
+class TestUserProgressStats:
+    """Test TrackingApiImpl.get_user_progress_stats"""
+    
+    @pytest.mark.asyncio
+    async def test_totals_and_velocity_from_daily_rollups(self):
+        """Test one point per training day, overlapping mesocycle days merge and velocity is the weekly e1RM slope"""
+        user_id, first, second = uuid4(), uuid4(), uuid4()
+        rollups = FakeRollupRepository([
+            DailyRollup(date(2025, 1, 6), user_id, first, 1, date(2025, 1, 6), 1, sessions=1, sets=4, volume=2000.0, rpe_sum=30, max_1rm=100.0),
+            DailyRollup(date(2025, 1, 8), user_id, first, 1, date(2025, 1, 6), 1, sessions=1, sets=2, volume=500.0, rpe_sum=16, max_1rm=100 + 4 / 7),
+            DailyRollup(date(2025, 1, 13), user_id, first, 2, date(2025, 1, 13), 1, sessions=1, sets=4, volume=1500.0, rpe_sum=32, max_1rm=102.0),
+            DailyRollup(date(2025, 1, 13), user_id, second, 1, date(2025, 1, 13), 1, sessions=1, sets=4, volume=1000.0, rpe_sum=32, max_1rm=101.0),
+            DailyRollup(date(2025, 1, 20), user_id, first, 3, date(2025, 1, 20), 1, sessions=1, sets=4, volume=2100.0, rpe_sum=33, max_1rm=104.0),
+            DailyRollup(date(2025, 1, 22), user_id, first, 3, date(2025, 1, 20), 1, sessions=1),
+        ])
+        set_current_user_id(str(user_id))
+        
+        result = await TrackingApiImpl(rollups=rollups).get_user_progress_stats(str(user_id), 1, 4)
+        
+        (_, start, end, exercise_id), = rollups.calls
+        assert (end - start).days == 27 and exercise_id == 1
+        assert result.total_sessions == 5
+        assert result.total_volume == 7100.0
+        assert [row.var_date for row in result.progression_data] == [
+            date(2025, 1, 6), date(2025, 1, 8), date(2025, 1, 13), date(2025, 1, 20),
+        ]
+        assert result.progression_data[2].avg_rpe == 8.0
+        assert result.strength_velocity == 2.0
+    
+    @pytest.mark.asyncio
+    async def test_log_session_updates_rollups(self):
+        """Test a logged session adds to its week, day and exercise rollups"""
+        api, mesocycle = TestLogSession.make_api()
+        
+        await api.log_session(TestLogSession.make_request(mesocycle.id))
+        
+        week = api.rollups.rollups[(mesocycle.user_id, mesocycle.id, 3, None)]
+        day = api.rollups.rollups[(mesocycle.user_id, mesocycle.id, date(2025, 1, 22), None)]
+        assert (week.sessions, week.sets, week.week_start) == (1, 1, date(2025, 1, 20))
+        assert (day.sessions, day.sets, day.week_number) == (1, 1, 3)
+        assert (mesocycle.user_id, mesocycle.id, 3, 1) in api.rollups.rollups
+        assert (mesocycle.user_id, mesocycle.id, date(2025, 1, 22), 1) in api.rollups.rollups
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("weeks_back, days", [(None, 12 * 7), (0, 7), (-3, 7), (80, 52 * 7)])
+    async def test_weeks_back_is_clamped(self, weeks_back, days):
+        """Test a missing window uses the default and others are kept within 1 to 52 weeks"""
+        user_id, rollups = uuid4(), FakeRollupRepository()
+        set_current_user_id(str(user_id))
+        
+        await TrackingApiImpl(rollups=rollups).get_user_progress_stats(str(user_id), None, weeks_back)
+        
+        (_, start, end, _), = rollups.calls
+        assert (end - start).days + 1 == days
+    
+    @pytest.mark.parametrize("weeks_back, status", [(4, 200), (0, 422), (-1, 422), (53, 422)])
+    def test_weeks_back_bounds(self, app, client, weeks_back, status):
+        """Test the endpoint accepts windows of 1 to 52 weeks and rejects the rest"""
+        user_id = uuid4()
+        app.dependency_overrides[get_tracking_api] = lambda: TrackingApiImpl(rollups=FakeRollupRepository())
+        
+        response = client.get(
+            f"/stats/progress/{user_id}",
+            params={"weeks_back": weeks_back},
+            headers={"Authorization": "Bearer " + create_access_token({"user_id": str(user_id)})},
+        )
+        
+        assert response.status_code == status, response.text
+    
+    @pytest.mark.asyncio
+    async def test_invalid_user_id(self):
+        """Test a malformed user id maps to 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            await TrackingApiImpl(rollups=FakeRollupRepository()).get_user_progress_stats("nope", None, None)
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,74 @@
+"""
+Unit Tests for TTL Cache
+
+Tests for expiry and size bound of the in-process cache.
+"""
+from infrastructure.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test TTLCache"""
+    
+    def test_entry_expires(self):
+        """Test values disappear once their TTL has passed"""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("k", 42)
+        
+        clock.now = 9.9
+        assert cache.get("k") == 42
+        
+        clock.now = 10.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+    
+    def test_per_entry_ttl(self):
+        """Test a per-entry TTL overrides the default"""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("short", 1, ttl_seconds=1)
+        
+        clock.now = 2
+        assert "short" not in cache
+    
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted at capacity"""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+    
+    def test_falsy_values_are_cached(self):
+        """Test a cached zero is distinguishable from a miss"""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("empty", 0)
+        
+        assert "empty" in cache
+        assert cache.get("empty", default=-1) == 0
+    
+    def test_invalidate(self):
+        """Test invalidate drops a single key"""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        
+        assert "a" not in cache
+        assert cache.get("b") == 2
@@ -0,0 +1,139 @@
+"""
+Unit Tests for the User Cache
+
+Tests for read-through, write-through and version checks of cached users.
+"""
+import copy
+
+import pytest
+
+from domain.entities.user import User
+from infrastructure.cache import CachedUserRepository
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeUserRepository:
+    """In-memory users shared by every "worker", counting reads"""
+    
+    def __init__(self):
+        self.users = {}
+        self.reads = []
+    
+    async def find_by_id(self, user_id):
+        self.reads.append("user")
+        user = self.users.get(user_id)
+        return copy.copy(user) if user else None
+    
+    async def find_version(self, user_id):
+        self.reads.append("version")
+        user = self.users.get(user_id)
+        return user.version if user else None
+    
+    async def save(self, user):
+        self.users[user.id] = copy.copy(user)
+        return user
+    
+    async def update(self, user):
+        user.version = self.users[user.id].version + 1
+        self.users[user.id] = copy.copy(user)
+        return user
+    
+    async def delete(self, user_id):
+        return self.users.pop(user_id, None) is not None
+
+
+@pytest.fixture
+def stored():
+    repository = FakeUserRepository()
+    user = User.create(email="a@example.com", username="alice", hashed_password="x")
+    repository.users[user.id] = user
+    return repository, user
+
+
+class TestCachedUserRepository:
+    """Test CachedUserRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_hits_within_version_ttl(self, stored):
+        """Test repeated reads are served without a round trip"""
+        repository, user = stored
+        clock = FakeClock()
+        cache = CachedUserRepository(repository, version_ttl_seconds=5, clock=clock)
+        
+        await cache.find_by_id(user.id)
+        clock.now = 4.9
+        found = await cache.find_by_id(user.id)
+        
+        assert found.username == "alice"
+        assert repository.reads == ["user"]
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    @pytest.mark.asyncio
+    async def test_revalidates_with_version_only(self, stored):
+        """Test an unchanged user is confirmed by its version stamp"""
+        repository, user = stored
+        clock = FakeClock()
+        cache = CachedUserRepository(repository, version_ttl_seconds=5, clock=clock)
+        await cache.find_by_id(user.id)
+        
+        clock.now = 6
+        await cache.find_by_id(user.id)
+        clock.now = 7
+        await cache.find_by_id(user.id)
+        
+        assert repository.reads == ["user", "version"]
+        assert cache.revalidations == 1
+        assert cache.hit_rate == pytest.approx(2 / 3)
+    
+    @pytest.mark.asyncio
+    async def test_other_workers_update_after_version_ttl(self, stored):
+        """Test an update on another worker shows once the version is rechecked"""
+        repository, user = stored
+        clock = FakeClock()
+        worker = CachedUserRepository(repository, version_ttl_seconds=5, clock=clock)
+        other = CachedUserRepository(repository, version_ttl_seconds=5, clock=clock)
+        await worker.find_by_id(user.id)
+        
+        changed = await other.find_by_id(user.id)
+        changed.full_name = "Alice"
+        await other.update(changed)
+        assert (await worker.find_by_id(user.id)).full_name is None
+        
+        clock.now = 6
+        assert (await worker.find_by_id(user.id)).full_name == "Alice"
+        assert (await other.find_by_id(user.id)).full_name == "Alice"
+    
+    @pytest.mark.asyncio
+    async def test_write_through_and_copies(self, stored):
+        """Test updates are cached at once and returned users are copies"""
+        repository, user = stored
+        cache = CachedUserRepository(repository, clock=FakeClock())
+        
+        found = await cache.find_by_id(user.id)
+        found.full_name = "Not saved"
+        assert (await cache.find_by_id(user.id)).full_name is None
+        
+        found.full_name = "Saved"
+        await cache.update(found)
+        repository.reads.clear()
+        assert (await cache.find_by_id(user.id)).full_name == "Saved"
+        assert repository.reads == []
+    
+    @pytest.mark.asyncio
+    async def test_deleted_user_is_dropped(self, stored):
+        """Test a deleted user is not served from the cache"""
+        repository, user = stored
+        cache = CachedUserRepository(repository, clock=FakeClock())
+        await cache.find_by_id(user.id)
+        
+        assert await cache.delete(user.id)
+        assert await cache.find_by_id(user.id) is None
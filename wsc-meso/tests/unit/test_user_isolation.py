@@ -0,0 +1,99 @@
+"""
+Unit Tests for User Isolation
+
+Tests through the API that each bearer token only sees its own user's
+mesocycles and progress entries.
+"""
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_mesocycles_api, get_progress_api
+from domain.repositories import Page
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.impl.progress_impl import ProgressApiImpl
+from openapi_server.utils.auth import create_access_token
+
+
+class FakeRepository:
+    """In-memory repository of entities with a ``user_id``"""
+    
+    def __init__(self):
+        self.entities = {}
+    
+    async def save(self, entity):
+        self.entities[entity.id] = entity
+        return entity
+    
+    async def update(self, entity):
+        return await self.save(entity)
+    
+    async def find_by_id(self, entity_id):
+        return self.entities.get(entity_id)
+    
+    async def delete(self, entity_id):
+        return self.entities.pop(entity_id, None) is not None
+    
+    async def find_page_with_total(self, user_id, *args, limit=20, offset=0, **kwargs):
+        items = [e for e in self.entities.values() if e.user_id == user_id]
+        return Page(items[offset:offset + limit], total=len(items))
+    
+    async def find_by_mesocycle(self, mesocycle_id):
+        return []
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    mesocycles, progress = FakeRepository(), FakeRepository()
+    mesocycles_api = MesocyclesApiImpl(mesocycles, rollups=mesocycles)
+    progress_api = ProgressApiImpl(progress)
+    app.dependency_overrides[get_mesocycles_api] = lambda: mesocycles_api
+    app.dependency_overrides[get_progress_api] = lambda: progress_api
+    yield TestClient(app)
+    app.dependency_overrides = {}
+
+
+def bearer() -> dict:
+    return {"Authorization": "Bearer " + create_access_token({"user_id": str(uuid4())})}
+
+
+class TestUserIsolation:
+    """Test two users of the same API"""
+    
+    def test_progress_is_per_user(self, client):
+        """Test entries are listed and found only for the user who logged them"""
+        alice, bob = bearer(), bearer()
+        
+        created = client.post("/progress", headers=alice, json={"date": "2025-01-06", "metric_type": "weight", "value": 80.5})
+        entry_id = created.json()["id"]
+        
+        assert created.status_code == 200
+        assert client.get("/progress", headers=alice).json()["total"] == 1
+        assert client.get("/progress", headers=bob).json()["total"] == 0
+        assert client.get(f"/progress/{entry_id}", headers=alice).status_code == 200
+        assert client.get(f"/progress/{entry_id}", headers=bob).status_code == 404
+        assert client.delete(f"/progress/{entry_id}", headers=bob).status_code == 404
+    
+    def test_mesocycles_are_per_user(self, client):
+        """Test mesocycles and their dashboards are only visible to their owner"""
+        alice, bob = bearer(), bearer()
+        
+        created = client.post("/mesocycles", headers=alice, json={
+            "name": "Block", "goal": "strength", "periodization_model": "linear",
+            "start_date": "2025-01-06", "end_date": "2025-03-30", "weekly_frequency": 4, "duration_weeks": 12,
+        })
+        mesocycle_id = created.json()["id"]
+        
+        assert created.status_code == 200
+        assert [m["id"] for m in client.get("/mesocycles", headers=alice).json()["items"]] == [mesocycle_id]
+        assert client.get("/mesocycles", headers=bob).json()["items"] == []
+        assert client.get(f"/mesocycles/{mesocycle_id}", headers=bob).status_code == 404
+        assert client.get(f"/mesocycles/{mesocycle_id}/dashboard", headers=alice).status_code == 200
+        assert client.get(f"/mesocycles/{mesocycle_id}/dashboard", headers=bob).status_code == 404
+    
+    def test_invalid_token_is_rejected(self, client):
+        """Test a token that does not verify gets 401"""
+        response = client.get("/progress", headers={"Authorization": "Bearer not-a-jwt"})
+        
+        assert response.status_code == 401
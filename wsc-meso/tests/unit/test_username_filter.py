@@ -0,0 +1,172 @@
+"""
+Unit Tests for Username Availability
+
+Tests for the Bloom filter, the username filter and single-insert registration.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+
+from domain.repositories.user_repository import DuplicateUserError
+from infrastructure.cache import BloomFilter, UsernameFilter
+from infrastructure.persistence.repositories.user_repository_impl import _duplicate_field
+from infrastructure.security import PasswordHasher
+from openapi_server.impl.authentication_impl import AuthenticationApiImpl
+from openapi_server.models.user_create import UserCreate
+
+
+class FakeUserRepository:
+    """In-memory users with a unique username and email, counting lookups"""
+    
+    def __init__(self, usernames=()):
+        self.users = {name: f"{name}@example.com" for name in usernames}
+        self.lookups = 0
+        self.gate = None
+    
+    async def usernames(self):
+        for name in list(self.users):
+            if self.gate is not None:
+                await self.gate.wait()
+            yield name
+    
+    async def exists_by_username(self, username: str) -> bool:
+        self.lookups += 1
+        return username in self.users
+    
+    async def save(self, user):
+        if user.username in self.users:
+            raise DuplicateUserError("username")
+        if user.email in self.users.values():
+            raise DuplicateUserError("email")
+        self.users[user.username] = user.email
+        return user
+
+
+class TestBloomFilter:
+    """Test BloomFilter"""
+    
+    def test_no_false_negatives(self):
+        """Test every added item is reported as present"""
+        bloom = BloomFilter(1000, 0.01)
+        names = [f"user{i}" for i in range(1000)]
+        for name in names:
+            bloom.add(name)
+        
+        assert all(name in bloom for name in names)
+        assert bloom.count == 1000
+    
+    def test_false_positive_rate(self):
+        """Test the false-positive rate stays near the configured one at capacity"""
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add(f"user{i}")
+        
+        false_positives = sum(f"other{i}" in bloom for i in range(20_000))
+        assert false_positives / 20_000 < 0.02
+        assert bloom.nbytes < 6500
+
+
+class TestUsernameFilter:
+    """Test UsernameFilter"""
+    
+    @pytest.mark.asyncio
+    async def test_unseen_usernames_skip_the_source(self):
+        """Test only possible matches are confirmed against the source"""
+        source = FakeUserRepository(["alice", "bob"])
+        usernames = UsernameFilter(source, capacity=100)
+        assert await usernames.rebuild() == 2
+        
+        assert await usernames.is_available("carol")
+        assert source.lookups == 0
+        assert not await usernames.is_available("alice")
+        assert source.lookups == 1
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_before_first_rebuild(self):
+        """Test lookups go to the source until the filter is loaded"""
+        source = FakeUserRepository(["alice"])
+        usernames = UsernameFilter(source, capacity=100)
+        
+        assert not usernames.ready
+        assert await usernames.is_available("carol")
+        assert source.lookups == 1
+    
+    @pytest.mark.asyncio
+    async def test_add_during_rebuild_is_kept(self):
+        """Test a username taken while the filter loads ends up in it"""
+        source = FakeUserRepository(["alice"])
+        source.gate = asyncio.Event()
+        usernames = UsernameFilter(source, capacity=100)
+        rebuild = asyncio.ensure_future(usernames.rebuild())
+        await asyncio.sleep(0)
+        
+        usernames.add("carol")
+        source.users["carol"] = "carol@example.com"
+        source.gate.set()
+        await rebuild
+        
+        assert not await usernames.is_available("carol")
+    
+    @pytest.mark.asyncio
+    async def test_watch_picks_up_other_workers(self):
+        """Test a username taken elsewhere is seen after the next rebuild"""
+        source = FakeUserRepository(["alice"])
+        usernames = UsernameFilter(source, capacity=100)
+        watcher = asyncio.ensure_future(usernames.watch(0.01))
+        await asyncio.sleep(0)
+        assert usernames.ready
+        
+        source.users["carol"] = "carol@example.com"
+        await asyncio.sleep(0.05)
+        watcher.cancel()
+        
+        assert not await usernames.is_available("carol")
+        assert source.lookups == 1
+
+
+class TestRegistration:
+    """Test single-insert registration"""
+    
+    @staticmethod
+    def _request(username: str, email: str) -> UserCreate:
+        return UserCreate(email=email, username=username, password="s3cret-pass")
+    
+    @pytest.mark.asyncio
+    async def test_duplicates_map_to_400(self):
+        """Test a taken username or email gives its own 400 message"""
+        source = FakeUserRepository(["alice"])
+        api = AuthenticationApiImpl(source, PasswordHasher(rounds=4))
+        
+        with pytest.raises(HTTPException) as e:
+            await api.register_user(self._request("alice", "new@example.com"))
+        assert (e.value.status_code, e.value.detail) == (400, "Username already taken")
+        
+        with pytest.raises(HTTPException) as e:
+            await api.register_user(self._request("carol", "alice@example.com"))
+        assert (e.value.status_code, e.value.detail) == (400, "Email already registered")
+        api.hasher.close()
+    
+    @pytest.mark.asyncio
+    async def test_registered_username_is_taken(self):
+        """Test registering adds the username to the filter"""
+        source = FakeUserRepository()
+        usernames = UsernameFilter(source, capacity=100)
+        await usernames.rebuild()
+        api = AuthenticationApiImpl(source, PasswordHasher(rounds=4), usernames)
+        
+        await api.register_user(self._request("carol", "carol@example.com"))
+        response = await api.check_username_availability("carol")
+        
+        assert response.available is False
+        assert (await api.check_username_availability("dave")).available is True
+        api.hasher.close()
+    
+    def test_duplicate_field_from_error(self):
+        """Test the colliding field is read from the duplicate-key error"""
+        error = DuplicateKeyError("E11000", 11000, {"keyPattern": {"username": 1}, "keyValue": {"username": "a"}})
+        legacy = DuplicateKeyError("E11000 duplicate key error index: db.users.$email_1 dup key", 11000, {})
+        
+        assert _duplicate_field(error) == "username"
+        assert _duplicate_field(legacy) == "email"
@@ -0,0 +1,240 @@
+"""
+Unit Tests for Weekly Rollups
+
+Tests for session increments, the rollup writes and the dashboard read.
+"""
+import json
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from domain.entities.mesocycle import Mesocycle, PeriodizationModel, TrainingGoal
+from domain.entities.training_session import ExercisePerformed, SetPerformed, TrainingSession
+from domain.entities.weekly_rollup import DailyRollup, WeeklyRollup
+from domain.entities.workout import Workout
+from infrastructure.persistence.repositories import WeeklyRollupRepository
+from openapi_server.impl.mesocycles_impl import MesocyclesApiImpl
+from openapi_server.impl.workouts_impl import WorkoutsApiImpl
+from openapi_server.utils.auth import set_current_user_id
+
+
+def make_mesocycle():
+    """A mesocycle of the authenticated user"""
+    user_id = uuid4()
+    set_current_user_id(str(user_id))
+    return Mesocycle.create(
+        user_id=user_id,
+        name="Block",
+        goal=TrainingGoal.STRENGTH,
+        periodization_model=PeriodizationModel.LINEAR,
+        start_date=date(2025, 1, 6),
+        end_date=date(2025, 3, 30),
+        duration_weeks=12,
+        training_level="intermediate",
+        weekly_frequency=4,
+    )
+
+
+class FakeRollupCollection:
+    """Collection stand-in recording bulk writes, failing the first with duplicate keys"""
+    
+    def __init__(self, duplicates=0):
+        self.duplicates = duplicates
+        self.batches = []
+    
+    async def bulk_write(self, requests, ordered=True):
+        assert ordered is False
+        self.batches.append(requests)
+        if self.duplicates:
+            errors = [{"index": i, "code": 11000} for i in range(self.duplicates)]
+            self.duplicates = 0
+            raise BulkWriteError({"writeErrors": errors})
+
+
+class FakeRollupRepository:
+    """Rollup repository stand-in folding increments in memory"""
+    
+    def __init__(self):
+        self.rollups = {}
+    
+    async def record(self, increments):
+        for increment in increments:
+            if increment.key in self.rollups:
+                self.rollups[increment.key].add(increment)
+            else:
+                self.rollups[increment.key] = increment
+    
+    async def find_by_mesocycle(self, mesocycle_id):
+        return sorted(
+            (r for r in self.rollups.values() if r.mesocycle_id == mesocycle_id),
+            key=lambda r: (r.week_number, r.exercise_id or 0),
+        )
+
+
+class FakeRepository:
+    """Repository stand-in holding one entity by id"""
+    
+    def __init__(self, entity):
+        self.entity = entity
+    
+    async def find_by_id(self, entity_id):
+        return self.entity if entity_id == self.entity.id else None
+    
+    async def update(self, entity):
+        return entity
+
+
+class TestWeeklyRollup:
+    """Test WeeklyRollup increments"""
+    
+    def test_session_increments(self):
+        """Test one increment per exercise plus the week total"""
+        mesocycle = make_mesocycle()
+        session = TrainingSession(
+            id=1, mesocycle_id=mesocycle.id, date=date(2025, 1, 7), week_number=1, user_id=mesocycle.user_id,
+            exercises_performed=[
+                ExercisePerformed(1, 2, [SetPerformed(100.0, 5, 8, 2), SetPerformed(100.0, 5, 9, 1)]),
+                ExercisePerformed(2, 1, [SetPerformed(60.0, 10, 7, 3)]),
+                ExercisePerformed(1, 1, [SetPerformed(110.0, 1, 10, 0)]),
+            ],
+        )
+        
+        week, first, second = WeeklyRollup.from_session(session, mesocycle.week_start(1))
+        
+        assert (week.exercise_id, week.sessions, week.sets, week.volume, week.rpe_sum) == (None, 1, 4, 1710.0, 34)
+        assert (first.exercise_id, first.sessions, first.sets, first.avg_rpe) == (1, 1, 3, 9.0)
+        assert first.max_1rm == week.max_1rm == pytest.approx(100.0 * (1 + 5 / 30))
+        assert (second.exercise_id, second.volume) == (2, 600.0)
+        assert week.week_start == date(2025, 1, 6)
+    
+    def test_daily_increments(self):
+        """Test the day gets the same increments as the week, keyed by the session date"""
+        mesocycle = make_mesocycle()
+        session = TrainingSession(
+            id=1, mesocycle_id=mesocycle.id, date=datetime(2025, 1, 7, 18), week_number=1, user_id=mesocycle.user_id,
+            exercises_performed=[ExercisePerformed(1, 1, [SetPerformed(100.0, 5, 8, 2)])],
+        )
+        
+        weekly = WeeklyRollup.from_session(session, mesocycle.week_start(1))
+        daily = DailyRollup.from_session(session, mesocycle.week_start(1))
+        
+        assert [r.key for r in daily] == [
+            (mesocycle.user_id, mesocycle.id, date(2025, 1, 7), None),
+            (mesocycle.user_id, mesocycle.id, date(2025, 1, 7), 1),
+        ]
+        assert [(r.sessions, r.sets, r.volume, r.week_number) for r in daily] == [
+            (r.sessions, r.sets, r.volume, r.week_number) for r in weekly
+        ]
+        assert daily[0] != weekly[0]
+    
+    def test_mesocycle_weeks(self):
+        """Test dates and datetimes map to mesocycle weeks"""
+        mesocycle = make_mesocycle()
+        
+        assert mesocycle.week_of(date(2025, 1, 12)) == 1
+        assert mesocycle.week_of(datetime(2025, 1, 13, 18)) == 2
+        assert mesocycle.week_start(3) == date(2025, 1, 20)
+
+
+class TestWeeklyRollupRepository:
+    """Test WeeklyRollupRepository writes"""
+    
+    @pytest.mark.asyncio
+    async def test_record_increments_in_one_bulk_write(self):
+        """Test counters are $inc'ed, e1RM $max'ed and upsert races retried"""
+        collection = FakeRollupCollection(duplicates=1)
+        repository = WeeklyRollupRepository(SimpleNamespace(weekly_rollups=collection, daily_rollups=FakeRollupCollection()))
+        user_id, mesocycle_id = uuid4(), uuid4()
+        increments = [
+            WeeklyRollup(user_id, mesocycle_id, 2, date(2025, 1, 13), sessions=1, sets=3, volume=900.0, max_1rm=120.0),
+            WeeklyRollup(user_id, mesocycle_id, 2, date(2025, 1, 13), 4, sessions=1, sets=3, volume=900.0),
+        ]
+        
+        await repository.record(increments)
+        
+        first, retry = collection.batches
+        assert len(first) == 2 and len(retry) == 1
+        assert first[0]._filter == {"_id": f"{user_id}:{mesocycle_id}:2:all"}
+        assert first[1]._filter == {"_id": f"{user_id}:{mesocycle_id}:2:4"}
+        assert first[0]._doc["$inc"] == {"sessions": 1, "sets": 3, "volume": 900.0, "rpe_sum": 0, "workouts_completed": 0}
+        assert first[0]._doc["$max"] == {"max_1rm": 120.0}
+        assert first[0]._doc["$setOnInsert"]["week_start"] == datetime(2025, 1, 13)
+        assert retry[0]._filter == first[0]._filter
+        assert repository.daily.batches == []
+    
+    @pytest.mark.asyncio
+    async def test_daily_increments_go_to_daily_rollups(self):
+        """Test daily increments are written to their own collection, keyed by day"""
+        weekly, daily = FakeRollupCollection(), FakeRollupCollection()
+        repository = WeeklyRollupRepository(SimpleNamespace(weekly_rollups=weekly, daily_rollups=daily))
+        user_id, mesocycle_id = uuid4(), uuid4()
+        
+        await repository.record([
+            WeeklyRollup(user_id, mesocycle_id, 2, date(2025, 1, 13), sessions=1, sets=3),
+            DailyRollup(date(2025, 1, 15), user_id, mesocycle_id, 2, date(2025, 1, 13), sessions=1, sets=3),
+        ])
+        
+        (week,), = weekly.batches
+        (day,), = daily.batches
+        assert week._filter == {"_id": f"{user_id}:{mesocycle_id}:2:all"}
+        assert day._filter == {"_id": f"{user_id}:{mesocycle_id}:2025-01-15:all"}
+        assert day._doc["$setOnInsert"]["day"] == datetime(2025, 1, 15)
+        assert "day" not in week._doc["$setOnInsert"]
+    
+    def test_documents_round_trip(self):
+        """Test weekly and daily rollups map back to their own types"""
+        repository = WeeklyRollupRepository(SimpleNamespace(weekly_rollups=None, daily_rollups=None))
+        user_id, mesocycle_id = uuid4(), uuid4()
+        rollups = [
+            WeeklyRollup(user_id, mesocycle_id, 2, date(2025, 1, 13), 4, sessions=1, sets=3, volume=900.0),
+            DailyRollup(date(2025, 1, 15), user_id, mesocycle_id, 2, date(2025, 1, 13), 4, sessions=1, sets=3),
+        ]
+        
+        assert [repository._to_entity(repository._to_document(r)) for r in rollups] == rollups
+
+
+class TestRollupReads:
+    """Test the dashboard and workout completion against rollups"""
+    
+    @pytest.mark.asyncio
+    async def test_dashboard_from_rollups(self):
+        """Test chart series, adherence and averages come from the weekly rollups"""
+        mesocycle = make_mesocycle()
+        rollups = FakeRollupRepository()
+        await rollups.record([
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 1, date(2025, 1, 6), sessions=4, sets=40, volume=20000.0, rpe_sum=320),
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 1, date(2025, 1, 6), 1, sessions=2, sets=8, max_1rm=120.0),
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 1, date(2025, 1, 6), 2, sessions=2, sets=8, max_1rm=80.0),
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 3, date(2025, 1, 20), workouts_completed=2),
+            WeeklyRollup(mesocycle.user_id, mesocycle.id, 3, date(2025, 1, 20), 1, sessions=1, sets=4, max_1rm=130.0),
+        ])
+        api = MesocyclesApiImpl(FakeRepository(mesocycle), rollups=rollups)
+        
+        response = await api.get_mesocycle_dashboard(str(mesocycle.id))
+        
+        result = json.loads(response.body)
+        chart = result["chart_data"]
+        assert len(chart["weekly_volume"]) == 12  # the mesocycle is over
+        assert chart["weekly_volume"][:3] == [20000.0, 0.0, 0.0]
+        assert chart["weekly_intensity"][0] == 8.0
+        assert chart["adherence_trend"][:3] == [100.0, 0.0, 50.0]
+        assert result["completion_percentage"] == 12.5
+        assert result["avg_1rm_estimate"] == 105.0
+        assert result["current_phase"]["week_end"] == 12
+    
+    @pytest.mark.asyncio
+    async def test_completed_workout_counts_for_its_week(self):
+        """Test completing a workout adds to the week rollup"""
+        mesocycle = make_mesocycle()
+        workout = Workout.create(mesocycle_id=mesocycle.id, name="Day 2", scheduled_date=datetime(2025, 1, 15, 7))
+        rollups = FakeRollupRepository()
+        api = WorkoutsApiImpl(FakeRepository(workout), mesocycles=FakeRepository(mesocycle), rollups=rollups)
+        
+        await api.complete_workout(workout.id, SimpleNamespace(duration_minutes=60, notes=None))
+        
+        (week,) = rollups.rollups.values()
+        assert (week.week_number, week.exercise_id, week.workouts_completed) == (2, None, 1)
+        assert week.week_start == date(2025, 1, 13)